@@ -14,7 +14,11 @@
 //        [1] ... 1 = signature accepted
 //        [2] ... 1 = signature rejected
 //  - slv_reg2 is cycle count
-//  - slv_reg3 is unused
+//  - slv_reg3 is done interrupt control/status:
+//        [0] ... 1 = done interrupt enabled
+//        [1] ... interrupt mode (0 = level: done_interrupt is high while pending, 1 = edge: one cycle pulse when pending is set)
+//        [2] ... 1 = interrupt pending. Set when done rises, cleared by writing 1 (acknowledge) or by reset. Writing 0 keeps it.
+//        After the acknowledge, the interrupt is re-armed for the next rising edge of done (done stays high until reset).
 //////////////////////////////////////////////////////////////////////////////////
 
 module axi_wrapper #
@@ -39,6 +43,9 @@ module axi_wrapper #
     input logic[127:0] ext_bram_din,
     output logic [127:0] ext_bram_dout,
 
+    // Done interrupt (slv_reg3), to be connected to pl_ps_irq of the PS
+    output logic done_interrupt,
+
     // User ports ends
     // Do not modify the ports beyond this line
 
@@ -108,6 +115,7 @@ module axi_wrapper #
   logic start, start_i;
   logic reset;
   logic [1:0] algorithm_select;
+  logic done, done_i;
   logic signature_accepted;
   logic signature_rejected;
 
@@ -270,13 +278,13 @@ module axi_wrapper #
           //       // Slave register 2
           //       slv_reg2[(byte_index*8) +: 8] <= S_AXI_WDATA[(byte_index*8) +: 8];
           //     end
-          // 2'h3:
-          //   for ( byte_index = 0; byte_index <= (C_S_AXI_DATA_WIDTH/8)-1; byte_index = byte_index+1 )
-          //     if ( S_AXI_WSTRB[byte_index] == 1 ) begin
-          //       // Respective byte enables are asserted as per write strobes
-          //       // Slave register 3
-          //       slv_reg3[(byte_index*8) +: 8] <= S_AXI_WDATA[(byte_index*8) +: 8];
-          //     end
+          2'h3:
+            if ( S_AXI_WSTRB[0] == 1 ) begin
+              // Slave register 3, enable and mode are written, pending is only cleared by writing 1 (acknowledge)
+              slv_reg3[1:0] <= S_AXI_WDATA[1:0];
+              if (S_AXI_WDATA[2] == 1'b1)
+                slv_reg3[2] <= 1'b0;
+            end
           default : begin
             slv_reg0 <= slv_reg0;
             // slv_reg1 <= slv_reg1;
@@ -285,6 +293,12 @@ module axi_wrapper #
           end
         endcase
       end
+
+      // Done interrupt pending is set when done rises, this wins over an acknowledge in the same cycle
+      if (reset)
+        slv_reg3[2] <= 1'b0;
+      else if (done == 1'b1 && done_i == 1'b0)
+        slv_reg3[2] <= 1'b1;
     end
   end
 
@@ -445,6 +459,24 @@ module axi_wrapper #
       start_i <= start;
   end
 
+  // Done interrupt
+  always @( posedge S_AXI_ACLK ) begin
+    if(S_AXI_ARESETN == 1'b0) begin
+      done_i <= 0;
+      done_interrupt <= 0;
+    end
+    else begin
+      done_i <= done;
+      if (slv_reg3[0] == 1'b0)
+        done_interrupt <= 1'b0;
+      else if (slv_reg3[1] == 1'b1)
+        // Pulse only when pending gets set, an interrupt that is not acknowledged yet is not raised again
+        done_interrupt <= done == 1'b1 && done_i == 1'b0 && slv_reg3[2] == 1'b0;
+      else
+        done_interrupt <= slv_reg3[2];
+    end
+  end
+
   // User logic ends
 
 endmodule
@@ -28,3 +28,7 @@
 // `define DEBUG_BRAMS
 // Uncomment this to print the start and end cycle of each operation
 `define PRINT_CYCLES
+// File the cycles are appended to (analyze with utilities/calculate_cycles.py), can be overridden with a define of the simulator
+`ifndef CYCLES_OUTPUT_FILE
+`define CYCLES_OUTPUT_FILE "/home/vid/Downloads/cycles_output.txt"
+`endif
@@ -304,7 +304,7 @@ module control_unit#(
 `ifdef PRINT_CYCLES
     if(modules_running_i != modules_running) begin
       int fd;
-      fd = $fopen ("/home/vid/Downloads/cycles_output.txt", "a");
+      fd = $fopen (`CYCLES_OUTPUT_FILE, "a");
       $fdisplay(fd, "Time %0d: Modules running changed from %b to %b", $time, modules_running_i, modules_running);
       $fclose(fd);
     end
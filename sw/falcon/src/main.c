@@ -40,38 +40,54 @@
 #include "utilities.h"
 #include "xil_io.h"
 #include "xil_printf.h"
+#include "xtime_l.h"
+#ifdef DONE_INTERRUPT_ID
+#include "xparameters.h"
+#include "xscugic.h"
+#endif
 #include <stdio.h>
+#include <stdlib.h>
 
-uint128_t signature[SIGNATURE_BLOCK_COUNT];
+uint128_t signature[SIGNATURE_BLOCK_COUNT] BRAM_BUFFER_ALIGNED;
 
 void load_public_key(unsigned int bram_id) {
+    enable_bram_access();
     for (unsigned int i = 0; i < N / 2; i++) {
-        uint128_t temp = createUint128_t(public_key[i], public_key[i + N / 2]);
-        bram_write(&temp, bram_id, i, 1);
+        bram_store(bram_id, i, createUint128_t(public_key[i], public_key[i + N / 2]));
     }
+    disable_bram_access();
 }
 
 void load_message(unsigned int bram_id) {
+    enable_bram_access();
     for (unsigned int i = 0; i < MESSAGE_BLOCK_COUNT; i++) {
-        uint128_t temp = createUint128_t(0, message_blocks[i]);
-        bram_write(&temp, bram_id, i, 1);
+        bram_store(bram_id, i, createUint128_t(0, message_blocks[i]));
     }
+    disable_bram_access();
 }
 
 // Loads seed into BRAM. Seed is 4x128 bit, loaded to bram_addr, bram_addr+1, +2, +3
 void load_seed(uint128_t *seed) { bram_write(seed, BRAM3, SEED_BASE_ADDR, 4); }
 
 void load_into_bram(uint64_t *src, unsigned int bram_id, unsigned int start_addr, unsigned int count) {
+    enable_bram_access();
     for (unsigned int i = 0; i < count / 2; i++) {
-        uint128_t temp = createUint128_t(src[i * 2], src[i * 2 + 1]);
-        bram_write(&temp, bram_id, start_addr + i, 1);
+        bram_store(bram_id, start_addr + i, createUint128_t(src[i * 2], src[i * 2 + 1]));
     }
+    disable_bram_access();
 }
 
 void verify() {
     print("Preparing for verification...\n");
     print("Loading keys, signature, and message...\n");
+#ifdef PUBLIC_KEY_IMAGE_ADDR
+    if (load_image((const uint8_t *)PUBLIC_KEY_IMAGE_ADDR, PUBLIC_KEY_IMAGE_SIZE) < 0) {
+        print("Invalid public key image, not verifying\n");
+        return;
+    }
+#else
     load_public_key(BRAM0);
+#endif
     bram_write(signature, BRAM1, 0, SIGNATURE_BLOCK_COUNT);
     load_message(BRAM6);
     print("Keys, signature, and message loaded.\n");
@@ -92,15 +108,50 @@ void verify() {
     xil_printf("%d\n", cycle_count);
 }
 
-void sign() {
-    print("Preparing for signing...\n");
-    print("Loading b00, b01, b10, b11, tree and seed...\n");
+// Returns 1 if b00, b01, b10, b11 and the tree of key are resident in BRAM
+int sign_key_resident(const void *key) {
+    return is_resident(BRAM0, key) && is_resident(BRAM1, key) && is_resident(BRAM2, key) && is_resident(BRAM3, key) && is_resident(BRAM6, key);
+}
+
+// Loads b00, b01, b10, b11 and the tree of the sign key image key_image (utilities/row_image.py), or of constants_<N>.h if
+// key_image is NULL, unless they are still resident from a previous signature with the same key. Residency is keyed on
+// key_image, call invalidate_residency() after writing a new image to the same address.
+// Returns 0, or -1 if key_image is malformed or doesn't contain all of the key (nothing must be signed with it then).
+int load_sign_key(const uint8_t *key_image) {
+    const void *key = key_image ? (const void *)key_image : (const void *)tree;
+    if (sign_key_resident(key)) {
+        if (verbose)
+            print("b00, b01, b10, b11 and tree already resident.\n");
+        return 0;
+    }
+    if (key_image) {
+        if (load_image(key_image, SIGN_KEY_IMAGE_SIZE) < 0 || !sign_key_resident(key)) {
+            print("Invalid sign key image\n");
+            return -1;
+        }
+        return 0;
+    }
     load_into_bram(b00, BRAM0, 0, N);
     load_into_bram(b01, BRAM1, 0, N);
     load_into_bram(b10, BRAM2, 0, N);
     load_into_bram(b11, BRAM3, 0, N);
-    load_message(BRAM4);
     load_into_bram(tree, BRAM6, 0, TREE_SIZE);
+    for (unsigned int bram_id = BRAM0; bram_id <= BRAM3; bram_id++)
+        set_resident(bram_id, key, 0, N / 2);
+    set_resident(BRAM6, key, 0, TREE_SIZE / 2);
+    return 0;
+}
+
+void sign() {
+    print("Preparing for signing...\n");
+    print("Loading b00, b01, b10, b11, tree and seed...\n");
+#ifdef SIGN_KEY_IMAGE_ADDR
+    if (load_sign_key((const uint8_t *)SIGN_KEY_IMAGE_ADDR) < 0)
+        return;
+#else
+    load_sign_key(NULL);
+#endif
+    load_message(BRAM4);
 
     uint128_t seed[4] = {createUint128_t(0x1111111111111111, 0x1111111111111111), createUint128_t(0x1111111111111111, 0x1111111111111111),
                          createUint128_t(0x1111111111111111, 0x1111111111111111), createUint128_t(0x1111111111111111, 0x1111111111111111)};
@@ -127,14 +178,182 @@ void sign() {
     xil_printf("%d\n", cycle_count);
 }
 
+const char *stage_names[STAGE_COUNT] = {"key", "transfer", "start", "staging", "wait", "signature", "reset"};
+
+// Adds the host time since *stage_start to stage of report and starts the next stage
+void end_stage(batch_report_t *report, batch_stage_t stage, XTime *stage_start) {
+    XTime now;
+    XTime_GetTime(&now);
+    report->stage_ticks[stage] += now - *stage_start;
+    *stage_start = now;
+}
+
+// Message rows as written by load_message()
+void stage_message(uint128_t *rows, const uint64_t *message) {
+    for (unsigned int i = 0; i < MESSAGE_BLOCK_COUNT; i++) {
+        rows[i] = createUint128_t(0, message[i]);
+    }
+}
+
+// Signs count messages with the sign key image key_image (NULL = key of constants_<N>.h), message i with seeds[i].
+// The key is only loaded if it isn't resident, after that only message and seed are transferred per signature. Software
+// can't reach BRAM while the accelerator runs, so the rows of the next message are prepared during the run and written
+// right after done. Fills signatures, statuses (get_status()), cycle_counts and report.
+// Returns 0, or -1 without signing anything if the key can't be loaded (all statuses are -1 then).
+int sign_batch(const uint8_t *key_image, const uint64_t messages[][MESSAGE_BLOCK_COUNT], const uint128_t seeds[][SEED_BLOCK_COUNT], unsigned int count,
+                uint128_t signatures[][SIGNATURE_BLOCK_COUNT], int *statuses, uint32_t *cycle_counts, batch_report_t *report) {
+    static uint128_t message_rows[2][MESSAGE_BLOCK_COUNT] BRAM_BUFFER_ALIGNED;
+    XTime start, stage_start;
+
+    memset(report, 0, sizeof(*report));
+    report->count = count;
+    verbose = 0;
+    XTime_GetTime(&start);
+    stage_start = start;
+
+    reset_algorithm(); // done stays set after a previous run until reset
+    if (load_sign_key(key_image) < 0) {
+        for (unsigned int i = 0; i < count; i++) {
+            statuses[i] = -1;
+            cycle_counts[i] = 0;
+        }
+        verbose = 1;
+        return -1;
+    }
+    end_stage(report, STAGE_KEY, &stage_start);
+
+    if (count > 0)
+        stage_message(message_rows[0], messages[0]);
+    end_stage(report, STAGE_STAGING, &stage_start);
+
+    for (unsigned int i = 0; i < count; i++) {
+        bram_write_burst(message_rows[i % 2], BRAM4, 0, MESSAGE_BLOCK_COUNT);
+        bram_write_burst(seeds[i], BRAM3, SEED_BASE_ADDR, SEED_BLOCK_COUNT);
+        end_stage(report, STAGE_TRANSFER, &stage_start);
+
+        start_algorithm(SIGN);
+        end_stage(report, STAGE_START, &stage_start);
+
+        if (i + 1 < count)
+            stage_message(message_rows[(i + 1) % 2], messages[i + 1]);
+        end_stage(report, STAGE_STAGING, &stage_start);
+
+        wait_until_done();
+        end_stage(report, STAGE_WAIT, &stage_start);
+
+        bram_read_burst(BRAM0, GENERATED_SIGNATURE_ADDR, signatures[i], SIGNATURE_BLOCK_COUNT);
+        statuses[i] = get_status();
+        cycle_counts[i] = get_cycle_count();
+        if (statuses[i] == 0)
+            report->accepted++;
+        end_stage(report, STAGE_SIGNATURE, &stage_start);
+
+        reset_algorithm();
+        end_stage(report, STAGE_RESET, &stage_start);
+    }
+
+    report->total_ticks = stage_start - start;
+    verbose = 1;
+    return 0;
+}
+
+int compare_cycle_counts(const void *a, const void *b) {
+    uint32_t x = *(const uint32_t *)a, y = *(const uint32_t *)b;
+    return (x > y) - (x < y);
+}
+
+// Prints signatures/s, the host time per stage and the distribution of the cycle counts of a sign_batch() run.
+// cycle_counts is sorted in place.
+void print_batch_report(const batch_report_t *report, uint32_t *cycle_counts) {
+    if (report->count == 0 || report->total_ticks == 0)
+        return;
+
+    uint64_t rate = (uint64_t)report->count * 100 * COUNTS_PER_SECOND / report->total_ticks; // Signatures per 100 s
+    xil_printf("%d signatures (%d accepted) in %d us, %d.%02d signatures/s\n", report->count, report->accepted,
+               (uint32_t)(report->total_ticks * 1000000 / COUNTS_PER_SECOND), (uint32_t)(rate / 100), (uint32_t)(rate % 100));
+
+    print("Host time per stage:\n");
+    for (int stage = 0; stage < STAGE_COUNT; stage++) {
+        uint32_t us = report->stage_ticks[stage] * 1000000 / COUNTS_PER_SECOND;
+        xil_printf("  %s: %d us (%d us per signature)\n", stage_names[stage], us, us / report->count);
+    }
+
+    uint64_t sum = 0;
+    for (unsigned int i = 0; i < report->count; i++)
+        sum += cycle_counts[i];
+    qsort(cycle_counts, report->count, sizeof(uint32_t), compare_cycle_counts);
+    xil_printf("Cycle count: min %d, median %d, p90 %d, max %d, mean %d\n", cycle_counts[0], cycle_counts[report->count / 2],
+               cycle_counts[report->count * 9 / 10], cycle_counts[report->count - 1], (uint32_t)(sum / report->count));
+}
+
+// Signs BATCH_SIZE copies of the message of constants_<N>.h with different seeds and reports the throughput
+void sign_throughput() {
+    static uint64_t messages[BATCH_SIZE][MESSAGE_BLOCK_COUNT];
+    static uint128_t seeds[BATCH_SIZE][SEED_BLOCK_COUNT];
+    static uint128_t signatures[BATCH_SIZE][SIGNATURE_BLOCK_COUNT] BRAM_BUFFER_ALIGNED;
+    static int statuses[BATCH_SIZE];
+    static uint32_t cycle_counts[BATCH_SIZE];
+    batch_report_t report;
+
+    for (unsigned int i = 0; i < BATCH_SIZE; i++) {
+        memcpy(messages[i], message_blocks, sizeof(message_blocks));
+        for (unsigned int j = 0; j < SEED_BLOCK_COUNT; j++)
+            seeds[i][j] = createUint128_t(0x1111111111111111, 0x1111111111111111);
+        seeds[i][0] += i; // Row 0 low is the initial ChaCha20 counter
+    }
+
+    print("Signing batch...\n");
+#ifdef SIGN_KEY_IMAGE_ADDR
+    const uint8_t *key_image = (const uint8_t *)SIGN_KEY_IMAGE_ADDR;
+#else
+    const uint8_t *key_image = NULL;
+#endif
+    if (sign_batch(key_image, messages, seeds, BATCH_SIZE, signatures, statuses, cycle_counts, &report) < 0) {
+        print("Batch not signed\n");
+        return;
+    }
+    print_batch_report(&report, cycle_counts);
+}
+
+#ifdef DONE_INTERRUPT_ID
+XScuGic interrupt_controller;
+
+// Connects done_interrupt_handler() to DONE_INTERRUPT_ID in the GIC and enables the done interrupt
+int setup_done_interrupt() {
+    XScuGic_Config *config = XScuGic_LookupConfig(XPAR_SCUGIC_SINGLE_DEVICE_ID);
+    if (config == NULL || XScuGic_CfgInitialize(&interrupt_controller, config, config->CpuBaseAddress) != XST_SUCCESS)
+        return -1;
+
+    Xil_ExceptionInit();
+    Xil_ExceptionRegisterHandler(XIL_EXCEPTION_ID_INT, (Xil_ExceptionHandler)XScuGic_InterruptHandler, &interrupt_controller);
+
+    // Trigger type 0b11 = rising edge, 0b01 = level high
+    XScuGic_SetPriorityTriggerType(&interrupt_controller, DONE_INTERRUPT_ID, 0xA0, DONE_INTERRUPT_EDGE ? 0b11 : 0b01);
+    if (XScuGic_Connect(&interrupt_controller, DONE_INTERRUPT_ID, (Xil_InterruptHandler)done_interrupt_handler, NULL) != XST_SUCCESS)
+        return -1;
+    XScuGic_Enable(&interrupt_controller, DONE_INTERRUPT_ID);
+    Xil_ExceptionEnable();
+
+    enable_done_interrupt(DONE_INTERRUPT_EDGE);
+    return 0;
+}
+#endif
+
 int main() {
     init_platform();
 
     print("Starting Falcon\n");
+#ifdef DONE_INTERRUPT_ID
+    if (setup_done_interrupt() < 0)
+        print("Done interrupt setup failed, polling\n");
+#endif
 
     sign();
     reset_algorithm();
     verify();
+#ifdef RUN_SIGN_THROUGHPUT
+    sign_throughput();
+#endif
 
     print("Done\n");
 
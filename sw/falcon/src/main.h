@@ -1,3 +1,7 @@
+#ifndef __MAIN_H_
+#define __MAIN_H_
+
+#include <stdint.h>
 #include <stdio.h>
 
 #define N 1024
@@ -7,6 +11,7 @@
 #define CONTROL_REG AXI_LITE_BASE
 #define OUTPUT_REG (AXI_LITE_BASE + 4)
 #define CYCLE_COUNT_REG (AXI_LITE_BASE + 8)
+#define INTERRUPT_REG (AXI_LITE_BASE + 12)
 
 // Base address for accessing device BRAM
 #define BRAM_BASE 0xB0000000
@@ -28,7 +33,72 @@
 #define SIGNATURE_ACCEPTED_MASK 0b10
 #define SIGNATURE_REJECTED_MASK 0b100
 
+#define INTERRUPT_ENABLE_MASK 0b1
+#define INTERRUPT_EDGE_MASK 0b10
+#define INTERRUPT_PENDING_MASK 0b100
+
+// Done interrupt of the accelerator (done_interrupt of axi_wrapper.sv), connected to pl_ps_irq0[0] in the block design.
+// Only bitstreams built after repackaging the IP with that port have it, the .xsa files in bd/ don't. Define DONE_INTERRUPT_ID
+// to its GIC interrupt id from xparameters.h (121 for pl_ps_irq0[0]) to make wait_until_done() sleep on it instead of polling
+// OUTPUT_REG. If the bitstream doesn't raise it, the first wait_until_done() falls back to polling.
+// #define DONE_INTERRUPT_ID XPAR_FABRIC_FALCON_0_DONE_INTERRUPT_INTR
+#define DONE_INTERRUPT_EDGE 0 // 1 = edge mode (rising edge trigger in the GIC), 0 = level mode (level high)
+#define DONE_INTERRUPT_POLLS 1000 // INTERRUPT_REG reads after done before the done interrupt is considered missing
+
+// Binary row images (utilities/row_image.py). Define SIGN_KEY_IMAGE_ADDR / PUBLIC_KEY_IMAGE_ADDR to load the key material
+// from an image placed in memory (e.g. with xsct: dow -data sign_key_1024.bin <address>) instead of constants_<N>.h
+// The driver keeps a loaded key resident by its image address. After writing a new image to the same address, call
+// invalidate_residency() so the next signature loads it.
+#define IMAGE_MAGIC 0x49524246 // "FBRI"
+#define IMAGE_VERSION 1
+#define BRAM_ROWS (1 << 13)
+#define SIGN_KEY_IMAGE_SIZE (5 * 16 + (4 * N / 2 + TREE_SIZE / 2) * 16) // b00, b01, b10, b11, tree
+#define PUBLIC_KEY_IMAGE_SIZE (16 + N / 2 * 16)
+// #define SIGN_KEY_IMAGE_ADDR 0x10000000
+// #define PUBLIC_KEY_IMAGE_ADDR 0x10100000
+
+// Optional DMA for bram_write_burst/bram_read_burst: define BRAM_DMA_COPY(dst, src, bytes) to a blocking DMA copy between
+// physical addresses (e.g. XAxiCdma_SimpleTransfer on an AXI CDMA + polling). Buffers used with DMA should be declared with
+// BRAM_BUFFER_ALIGNED, caches are flushed/invalidated around every transfer.
+#define CACHE_LINE_SIZE 64 // Cortex-A53
+#define BRAM_BUFFER_ALIGNED __attribute__((aligned(CACHE_LINE_SIZE)))
+#define BRAM_DMA_MIN_BYTES 1024
+// #define BRAM_DMA_COPY(dst, src, bytes) ...
+
+#define SEED_BLOCK_COUNT 4
+// Define RUN_SIGN_THROUGHPUT to also sign a batch of BATCH_SIZE messages in main() and report the throughput (sign_throughput())
+// #define RUN_SIGN_THROUGHPUT
+#define BATCH_SIZE 16 // Signatures of the sign_batch() run in main()
+
 #define SEED_BASE_ADDR (N == 512) ? 324 : 648
 #define GENERATED_SIGNATURE_ADDR (N == 512) ? 256 : 512
 
 typedef unsigned __int128 uint128_t;
+
+// Header of a section of a binary row image
+typedef struct {
+    uint32_t magic;
+    uint16_t version;
+    uint16_t bank;
+    uint32_t first_row;
+    uint32_t row_count;
+} image_section_t;
+
+// Key material resident in rows [first_row, first_row + row_count) of a BRAM (utilities.h)
+typedef struct {
+    const void *key; // Any pointer identifying the key (e.g. its image), NULL = nothing resident
+    unsigned int first_row;
+    unsigned int row_count;
+} bram_residency_t;
+
+// Stages of sign_batch(), the host time of each is reported
+typedef enum { STAGE_KEY, STAGE_TRANSFER, STAGE_START, STAGE_STAGING, STAGE_WAIT, STAGE_SIGNATURE, STAGE_RESET, STAGE_COUNT } batch_stage_t;
+
+typedef struct {
+    unsigned int count;    // Signed messages
+    unsigned int accepted; // Signatures with status 0
+    uint64_t stage_ticks[STAGE_COUNT];
+    uint64_t total_ticks;
+} batch_report_t;
+
+#endif
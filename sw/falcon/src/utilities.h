@@ -1,78 +1,270 @@
 #include "main.h"
 #include "xil_io.h"
+#include <string.h>
+#ifdef BRAM_DMA_COPY
+#include "xil_cache.h"
+#endif
+
+// All register and BRAM accesses go through these macros. They can be defined before including this file to redirect them,
+// e.g. to a mocked register file in host-side tests (sw/falcon/test).
+#ifndef MMIO_READ32
+#define MMIO_READ32(addr) (*(volatile uint32_t *)(uintptr_t)(addr))
+#define MMIO_WRITE32(addr, value) (*(volatile uint32_t *)(uintptr_t)(addr) = (value))
+#define MMIO_READ128(addr) (*(volatile uint128_t *)(uintptr_t)(addr))
+#define MMIO_WRITE128(addr, value) (*(volatile uint128_t *)(uintptr_t)(addr) = (value))
+#endif
+
+// Sleeping until an interrupt, overridable like the MMIO macros. WAIT_FOR_INTERRUPT() also wakes up on interrupts that are
+// pending while interrupts are disabled, so the check before it can't miss one.
+#ifndef WAIT_FOR_INTERRUPT
+#include "xil_exception.h"
+#define WAIT_FOR_INTERRUPT() __asm__ volatile("wfi")
+#define INTERRUPTS_DISABLE() Xil_ExceptionDisable()
+#define INTERRUPTS_ENABLE() Xil_ExceptionEnable()
+#endif
 
 typedef enum { SIGN = 0b00, VERIFY = 0b01 } algorithm_t;
 
+// start_algorithm() and reset_algorithm() print what they do unless verbose is 0 (sign_batch() in main.c)
+int verbose = 1;
+
+// Set by done_interrupt_handler(), cleared by start_algorithm()
+volatile int done_interrupt_received;
+int done_interrupt_enabled;
+int done_interrupt_confirmed; // A done interrupt arrived on a polled run, wait_until_done() sleeps from then on
+
 // Creates an uint128_t from 2 uint64_t values
 uint128_t createUint128_t(uint64_t high, uint64_t low) { return ((uint128_t)high << 64) | low; }
 
+// Address of row bram_addr of BRAM bram_id in the BRAM window
+uintptr_t bram_row_address(unsigned int bram_id, unsigned int bram_addr) {
+    unsigned int bank_offset = bram_id << 13; // Top 3 bits are BRAM id
+    return BRAM_BASE + (uintptr_t)(bank_offset + bram_addr) * sizeof(uint128_t);
+}
+
+// Key residency: which key's material is resident in which rows of which BRAM. Software writes clear the entries of the rows
+// they overwrite, writes of the hardware are accounted for in start_algorithm().
+bram_residency_t bram_residency[BRAM6 + 1];
+
+// Marks rows [first_row, first_row + row_count) of BRAM bram_id as holding material of key
+void set_resident(unsigned int bram_id, const void *key, unsigned int first_row, unsigned int row_count) {
+    bram_residency[bram_id] = (bram_residency_t){key, first_row, row_count};
+}
+
+// Returns 1 if BRAM bram_id holds material of key
+int is_resident(unsigned int bram_id, const void *key) { return key != NULL && bram_residency[bram_id].key == key; }
+
+// Forgets the resident key material of BRAM bram_id if it overlaps rows [bram_addr, bram_addr + count)
+void invalidate_rows(unsigned int bram_id, unsigned int bram_addr, unsigned int count) {
+    if (bram_id > BRAM6)
+        return;
+    bram_residency_t *residency = &bram_residency[bram_id];
+    if (bram_addr < residency->first_row + residency->row_count && residency->first_row < bram_addr + count)
+        residency->key = NULL;
+}
+
+// Forgets all resident key material
+void invalidate_residency() { memset(bram_residency, 0, sizeof(bram_residency)); }
+
 // Enables BRAM access, this allows software to access (read/write) BRAM instead of hardware
 void enable_bram_access() {
     // CONTROL_REG[31] controls BRAM access
-    *((int *)CONTROL_REG) |= (1 << 31);
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) | (1u << 31));
 }
 
 // Disables BRAM access, this allows hardware to access BRAM instead of software
 void disable_bram_access() {
     // CONTROL_REG[31] controls BRAM access
-    *((int *)CONTROL_REG) &= ~(1 << 31);
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) & ~(1u << 31));
 }
 
-// Writes count*128bit of data from src to BRAM bram_id at address bram_addr
-void bram_write(uint128_t *src, unsigned int bram_id, unsigned int bram_addr, unsigned int count) {
-    volatile uint128_t *bram_ptr = (volatile uint128_t *)BRAM_BASE;
-    unsigned int bank_offset = bram_id << 13; // Top 3 bits are BRAM id
+// Writes a single 128-bit word to BRAM, BRAM access has to be enabled by the caller (enable_bram_access)
+void bram_store(unsigned int bram_id, unsigned int bram_addr, uint128_t value) {
+    invalidate_rows(bram_id, bram_addr, 1);
+    MMIO_WRITE128(bram_row_address(bram_id, bram_addr), value);
+}
 
+// Writes count*128bit of data from src to BRAM bram_id at address bram_addr.
+// BRAM access is enabled once for the whole transfer. With BRAM_DMA_COPY, transfers of at least BRAM_DMA_MIN_BYTES bytes are
+// done by DMA, src should then be a cache-aligned buffer (BRAM_BUFFER_ALIGNED).
+void bram_write_burst(const uint128_t *src, unsigned int bram_id, unsigned int bram_addr, unsigned int count) {
+    invalidate_rows(bram_id, bram_addr, count);
+    enable_bram_access();
+#ifdef BRAM_DMA_COPY
+    if (count * sizeof(uint128_t) >= BRAM_DMA_MIN_BYTES) {
+        Xil_DCacheFlushRange((UINTPTR)src, count * sizeof(uint128_t));
+        BRAM_DMA_COPY(bram_row_address(bram_id, bram_addr), (uintptr_t)src, count * sizeof(uint128_t));
+        disable_bram_access();
+        return;
+    }
+#endif
     for (unsigned int i = 0; i < count; i++) {
-        enable_bram_access();
-        bram_ptr[bank_offset + bram_addr + i] = src[i];
+        MMIO_WRITE128(bram_row_address(bram_id, bram_addr + i), src[i]);
+    }
+    disable_bram_access();
+}
+
+// Reads count*128 bit of data from BRAM bram_id at address bram_addr to dest, BRAM access is enabled once for the whole transfer
+void bram_read_burst(unsigned int bram_id, unsigned int bram_addr, uint128_t *dest, unsigned int count) {
+    enable_bram_access();
+#ifdef BRAM_DMA_COPY
+    if (count * sizeof(uint128_t) >= BRAM_DMA_MIN_BYTES) {
+        BRAM_DMA_COPY((uintptr_t)dest, bram_row_address(bram_id, bram_addr), count * sizeof(uint128_t));
+        Xil_DCacheInvalidateRange((UINTPTR)dest, count * sizeof(uint128_t));
         disable_bram_access();
+        return;
     }
+#endif
+    for (unsigned int i = 0; i < count; i++) {
+        dest[i] = MMIO_READ128(bram_row_address(bram_id, bram_addr + i));
+    }
+    disable_bram_access();
 }
 
+// Writes count*128bit of data from src to BRAM bram_id at address bram_addr
+void bram_write(uint128_t *src, unsigned int bram_id, unsigned int bram_addr, unsigned int count) { bram_write_burst(src, bram_id, bram_addr, count); }
+
 // Reads count*128 bit of data from BRAM bram_id at address bram_addr to dest
-void bram_read(unsigned int bram_id, unsigned int bram_addr, uint128_t *dest, unsigned int count) {
-    volatile uint128_t *bram_ptr = (volatile uint128_t *)BRAM_BASE;
-    unsigned int bank_offset = bram_id << 13; // Top 3 bits are BRAM id
+void bram_read(unsigned int bram_id, unsigned int bram_addr, uint128_t *dest, unsigned int count) { bram_read_burst(bram_id, bram_addr, dest, count); }
 
-    for (unsigned int i = 0; i < count; i++) {
-        enable_bram_access();
-        dest[i] = bram_ptr[bank_offset + bram_addr + i];
-        disable_bram_access();
+// Returns the number of sections of a binary row image (utilities/row_image.py) or -1 if any of its headers is malformed.
+int image_sections(const uint8_t *image, size_t size) {
+    size_t offset = 0;
+    int sections = 0;
+
+    while (offset < size) {
+        image_section_t header;
+        if (size - offset < sizeof(header))
+            return -1;
+        memcpy(&header, image + offset, sizeof(header));
+        offset += sizeof(header);
+
+        if (header.magic != IMAGE_MAGIC || header.version != IMAGE_VERSION || header.bank > BRAM6)
+            return -1;
+        if ((size - offset) / sizeof(uint128_t) < header.row_count || header.first_row + header.row_count > BRAM_ROWS)
+            return -1;
+
+        offset += header.row_count * sizeof(uint128_t);
+        sections++;
+    }
+    return sections;
+}
+
+// Loads all sections of a binary row image (utilities/row_image.py) into BRAM. Every section is a 16-byte header followed by
+// row_count 128-bit little-endian rows, which are copied to BRAM as they are. image has to be 16-byte aligned.
+// All headers are checked before anything is written, a malformed image leaves BRAM and the residency unchanged.
+// The sections are marked as resident material of the key identified by image. Residency is keyed on the address of the
+// image, call invalidate_residency() after writing a new image to the same address (e.g. with xsct dow).
+// Returns the number of loaded sections or -1 if the image is malformed.
+int load_image(const uint8_t *image, size_t size) {
+    int sections = image_sections(image, size);
+    if (sections < 0)
+        return -1;
+
+    size_t offset = 0;
+    for (int section = 0; section < sections; section++) {
+        image_section_t header;
+        memcpy(&header, image + offset, sizeof(header));
+        offset += sizeof(header);
+
+        bram_write((uint128_t *)(image + offset), header.bank, header.first_row, header.row_count);
+        set_resident(header.bank, image, header.first_row, header.row_count);
+        offset += header.row_count * sizeof(uint128_t);
     }
+    return sections;
 }
 
 // Starts selected algorithm
 void start_algorithm(algorithm_t algorithm) {
 
-    if (algorithm == SIGN)
+    if (verbose && algorithm == SIGN)
         print("Starting signing...\n");
-    else if (algorithm == VERIFY)
+    else if (verbose && algorithm == VERIFY)
         print("Starting verification...\n");
 
+    // The sign program only writes BRAM4, BRAM5 and the rows behind the key material in BRAM0..3 and BRAM6 (checked on
+    // utilities/isa_simulator.py by host_driver.py), so a sign key stays resident. Other programs may write anywhere.
+    if (algorithm == SIGN) {
+        for (unsigned int bram_id = BRAM0; bram_id <= BRAM3; bram_id++)
+            invalidate_rows(bram_id, N / 2, BRAM_ROWS - N / 2);
+        invalidate_rows(BRAM4, 0, BRAM_ROWS);
+        invalidate_rows(BRAM5, 0, BRAM_ROWS);
+        invalidate_rows(BRAM6, TREE_SIZE / 2, BRAM_ROWS - TREE_SIZE / 2);
+    } else
+        invalidate_residency();
+
+    done_interrupt_received = 0;
+
     // CONTROL_REG[2:1] controls algorithm selection
-    *((int *)CONTROL_REG) &= ~(0b11 << 1);     // Clear bits 2:1
-    *((int *)CONTROL_REG) |= (algorithm << 1); // Set algorithm
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) & ~(0b11u << 1));     // Clear bits 2:1
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) | (algorithm << 1)); // Set algorithm
 
     // CONTROL_REG[0] controls algorithm start
     // Write 1 into it to start the algorithm and then immediately clear it
-    *((int *)CONTROL_REG) |= (1 << 0);
-    *((int *)CONTROL_REG) &= ~(1 << 0);
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) | (1u << 0));
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) & ~(1u << 0));
 }
 
 // Resets hardware
 void reset_algorithm() {
-    print("Resetting algorithm...\n");
+    if (verbose)
+        print("Resetting algorithm...\n");
     // CONTROL_REG[3] controls algorithm reset
     // Write 1 into it to reset the algorithm and then immediately clear it
-    *((int *)CONTROL_REG) |= (1 << 3);
-    *((int *)CONTROL_REG) &= ~(1 << 3);
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) | (1u << 3));
+    MMIO_WRITE32(CONTROL_REG, MMIO_READ32(CONTROL_REG) & ~(1u << 3));
+}
+
+// Enables the done interrupt in slv_reg3 (INTERRUPT_REG), edge = 1 for edge mode. The handler has to be connected first.
+void enable_done_interrupt(int edge) {
+    // Writing 0 to the pending bit keeps it, so a pending interrupt is not lost
+    MMIO_WRITE32(INTERRUPT_REG, INTERRUPT_ENABLE_MASK | (edge ? INTERRUPT_EDGE_MASK : 0));
+    done_interrupt_enabled = 1;
+    done_interrupt_confirmed = 0;
+}
+
+void disable_done_interrupt() {
+    MMIO_WRITE32(INTERRUPT_REG, 0);
+    done_interrupt_enabled = 0;
 }
 
-// Waits until algorithm execution is done
+// Interrupt handler of the done interrupt. Acknowledges it, which re-arms it for the next run.
+void done_interrupt_handler(void *data) {
+    (void)data;
+    // INTERRUPT_REG[2] is write 1 to clear, enable and mode are written back unchanged
+    MMIO_WRITE32(INTERRUPT_REG, (MMIO_READ32(INTERRUPT_REG) & (INTERRUPT_ENABLE_MASK | INTERRUPT_EDGE_MASK)) | INTERRUPT_PENDING_MASK);
+    done_interrupt_received = 1;
+}
+
+// Waits until algorithm execution is done. With the done interrupt enabled, the CPU sleeps until it arrives, otherwise
+// OUTPUT_REG is polled. The first run after enable_done_interrupt() is polled too and has to deliver the interrupt within
+// DONE_INTERRUPT_POLLS register reads after done. If it doesn't (bitstream without the done_interrupt connection), the
+// interrupt is disabled and all later runs are polled, so waiting can't hang on an interrupt that never comes.
 void wait_until_done() {
+    if (done_interrupt_enabled && done_interrupt_confirmed) {
+        INTERRUPTS_DISABLE();
+        while (!done_interrupt_received) {
+            WAIT_FOR_INTERRUPT();
+            INTERRUPTS_ENABLE(); // done_interrupt_handler() runs here
+            INTERRUPTS_DISABLE();
+        }
+        INTERRUPTS_ENABLE();
+        return;
+    }
+
     // OUTPUT_REG[0] will be 1 when the algorithm is done
-    while ((*((volatile int *)OUTPUT_REG) & ALGORITHM_DONE_MASK) == 0) {
+    while ((MMIO_READ32(OUTPUT_REG) & ALGORITHM_DONE_MASK) == 0) {
+    }
+
+    if (done_interrupt_enabled) {
+        for (unsigned int i = 0; i < DONE_INTERRUPT_POLLS && !done_interrupt_received; i++)
+            MMIO_READ32(INTERRUPT_REG);
+        if (done_interrupt_received)
+            done_interrupt_confirmed = 1;
+        else {
+            disable_done_interrupt();
+            print("No done interrupt after done, polling\n");
+        }
     }
 }
 
@@ -83,8 +275,8 @@ void wait_until_done() {
 int get_status() {
     // OUTPUT_REG[1] == 1 ... signature accepted
     // OUTPUT_REG[2] == 1 ... signature rejected
-    int accepted = *((volatile int *)OUTPUT_REG) & SIGNATURE_ACCEPTED_MASK;
-    int rejected = *((volatile int *)OUTPUT_REG) & SIGNATURE_REJECTED_MASK;
+    int accepted = MMIO_READ32(OUTPUT_REG) & SIGNATURE_ACCEPTED_MASK;
+    int rejected = MMIO_READ32(OUTPUT_REG) & SIGNATURE_REJECTED_MASK;
 
     if (accepted && !rejected)
         return 0;
@@ -104,4 +296,4 @@ void print_array(uint8_t *array, size_t size) {
     xil_printf("\n");
 }
 
-uint32_t get_cycle_count() { return *((volatile uint32_t *)CYCLE_COUNT_REG); }
+uint32_t get_cycle_count() { return MMIO_READ32(CYCLE_COUNT_REG); }
@@ -0,0 +1,302 @@
+// Host-side test of the BRAM transfers, the key residency tracking and the done interrupt wait of utilities.h against a
+// mocked register file
+//
+// The MMIO macros of utilities.h are redirected to functions that decode the addresses into the AXI-lite registers and the
+// BRAM window of main.h and count every access. Like control_unit.sv, the mock only lets software reach BRAM while
+// CONTROL_REG[31] is set, any other BRAM access is counted as a violation. A rising start bit starts a mocked run that
+// finishes at the next WAIT_FOR_INTERRUPT() or OUTPUT_REG read, which then delivers the done interrupt like the GIC if slv_reg3
+// raises it and interrupt_connected is set (0 = bitstream without the done_interrupt connection).
+//
+// Usage: gcc -I../src -I. -o test_utilities test_utilities.c && ./test_utilities
+
+#include <stdint.h>
+#include <stdlib.h>
+
+typedef unsigned __int128 uint128_t;
+
+uint32_t mmio_read32(uintptr_t addr);
+void mmio_write32(uintptr_t addr, uint32_t value);
+uint128_t mmio_read128(uintptr_t addr);
+void mmio_write128(uintptr_t addr, uint128_t value);
+void mock_wait_for_interrupt();
+
+#define MMIO_READ32(addr) mmio_read32(addr)
+#define MMIO_WRITE32(addr, value) mmio_write32(addr, value)
+#define MMIO_READ128(addr) mmio_read128(addr)
+#define MMIO_WRITE128(addr, value) mmio_write128(addr, value)
+#define WAIT_FOR_INTERRUPT() mock_wait_for_interrupt()
+#define INTERRUPTS_DISABLE()
+#define INTERRUPTS_ENABLE()
+
+#include "utilities.h"
+
+#define BRAM_BANKS 8
+
+uint32_t registers[4];
+uint128_t bram[BRAM_BANKS * BRAM_ROWS];
+unsigned int register_operations, bram_operations, violations;
+unsigned int running, interrupts, sleeps;
+int interrupt_connected = 1;
+int failures;
+
+// Finishes the mocked run: done rises and sets the pending interrupt, the handler is called if the interrupt line is raised
+void mock_finish() {
+    int edge = 0;
+    if (running) {
+        running = 0;
+        registers[1] |= ALGORITHM_DONE_MASK;
+        registers[3] |= INTERRUPT_PENDING_MASK;
+        edge = 1;
+    }
+    int line = (registers[3] & INTERRUPT_ENABLE_MASK) && ((registers[3] & INTERRUPT_EDGE_MASK) ? edge : (registers[3] & INTERRUPT_PENDING_MASK) != 0);
+    if (line && interrupt_connected) {
+        interrupts++;
+        done_interrupt_handler(NULL);
+    }
+}
+
+uint32_t mmio_read32(uintptr_t addr) {
+    if (addr < AXI_LITE_BASE || addr >= AXI_LITE_BASE + sizeof(registers) || addr % 4) {
+        violations++;
+        return 0;
+    }
+    register_operations++;
+    if (addr == OUTPUT_REG && running)
+        mock_finish();
+    return registers[(addr - AXI_LITE_BASE) / 4];
+}
+
+void mmio_write32(uintptr_t addr, uint32_t value) {
+    register_operations++;
+    if (addr == CONTROL_REG) {
+        if ((value & 1) && !(registers[0] & 1))
+            running = 1;
+        if (value & (1u << 3)) { // Reset aborts the run and clears done and the pending interrupt
+            running = 0;
+            registers[1] = 0;
+            registers[3] &= ~INTERRUPT_PENDING_MASK;
+        }
+        registers[0] = value;
+    } else if (addr == INTERRUPT_REG) {
+        // Enable and mode are written, pending is write 1 to clear
+        uint32_t pending = registers[3] & INTERRUPT_PENDING_MASK & ~value;
+        registers[3] = (value & (INTERRUPT_ENABLE_MASK | INTERRUPT_EDGE_MASK)) | pending;
+    } else {
+        register_operations--;
+        violations++;
+    }
+}
+
+void mock_wait_for_interrupt() {
+    sleeps++;
+    mock_finish();
+}
+
+uint128_t *bram_row(uintptr_t addr) {
+    if (addr < BRAM_BASE || addr >= BRAM_BASE + sizeof(bram) || addr % sizeof(uint128_t) || !(registers[0] & (1u << 31))) {
+        violations++;
+        return NULL;
+    }
+    bram_operations++;
+    return &bram[(addr - BRAM_BASE) / sizeof(uint128_t)];
+}
+
+uint128_t mmio_read128(uintptr_t addr) {
+    uint128_t *row = bram_row(addr);
+    return row ? *row : 0;
+}
+
+void mmio_write128(uintptr_t addr, uint128_t value) {
+    uint128_t *row = bram_row(addr);
+    if (row)
+        *row = value;
+}
+
+void reset_counters() { register_operations = bram_operations = violations = 0; }
+
+void check(int condition, const char *message) {
+    if (!condition) {
+        printf("FAIL: %s\n", message);
+        failures++;
+    }
+}
+
+// A burst of count rows costs count BRAM accesses plus one read-modify-write of CONTROL_REG on each side
+void test_write_burst(unsigned int count) {
+    uint128_t *src = malloc(count * sizeof(uint128_t));
+    for (unsigned int i = 0; i < count; i++)
+        src[i] = createUint128_t(i, ~(uint64_t)i);
+
+    registers[0] = 0b110; // Algorithm bits must survive the transfer
+    reset_counters();
+    bram_write_burst(src, BRAM6, 100, count);
+    check(bram_operations == count && register_operations == 4, "bram_write_burst costs count + 4 MMIO operations");
+    check(violations == 0, "bram_write_burst only touches BRAM while access is enabled");
+    check(registers[0] == 0b110, "bram_write_burst restores CONTROL_REG");
+    check(memcmp(&bram[(BRAM6 << 13) + 100], src, count * sizeof(uint128_t)) == 0, "bram_write_burst writes the rows");
+
+    uint128_t *dest = calloc(count, sizeof(uint128_t));
+    reset_counters();
+    bram_read_burst(BRAM6, 100, dest, count);
+    check(bram_operations == count && register_operations == 4, "bram_read_burst costs count + 4 MMIO operations");
+    check(violations == 0 && registers[0] == 0b110, "bram_read_burst only touches BRAM while access is enabled");
+    check(memcmp(dest, src, count * sizeof(uint128_t)) == 0, "bram_read_burst reads the rows");
+
+    free(src);
+    free(dest);
+}
+
+// load_image claims the BRAM window once per section
+void test_load_image() {
+    unsigned int rows[] = {3, 5};
+    unsigned int banks[] = {BRAM0, BRAM6};
+    size_t size = 2 * sizeof(image_section_t) + (rows[0] + rows[1]) * sizeof(uint128_t);
+    uint8_t *image = aligned_alloc(CACHE_LINE_SIZE, size + CACHE_LINE_SIZE);
+    size_t offset = 0;
+    for (int s = 0; s < 2; s++) {
+        image_section_t header = {IMAGE_MAGIC, IMAGE_VERSION, banks[s], 10, rows[s]};
+        memcpy(image + offset, &header, sizeof(header));
+        offset += sizeof(header);
+        for (unsigned int i = 0; i < rows[s]; i++, offset += sizeof(uint128_t)) {
+            uint128_t row = createUint128_t(s, i);
+            memcpy(image + offset, &row, sizeof(row));
+        }
+    }
+
+    registers[0] = 0;
+    reset_counters();
+    check(load_image(image, size) == 2, "load_image loads both sections");
+    check(bram_operations == 8 && register_operations == 8, "load_image costs rows + 4 MMIO operations per section");
+    check(violations == 0 && registers[0] == 0, "load_image only touches BRAM while access is enabled");
+    check(bram[(BRAM6 << 13) + 14] == createUint128_t(1, 4), "load_image writes the rows");
+    check(is_resident(BRAM0, image) && is_resident(BRAM6, image), "load_image marks the sections resident");
+
+    // A corrupt second header: nothing is written and nothing becomes resident
+    invalidate_residency();
+    bram[(BRAM0 << 13) + 10] = 0;
+    image[sizeof(image_section_t) + rows[0] * sizeof(uint128_t)] ^= 1;
+    reset_counters();
+    check(load_image(image, size) == -1, "load_image rejects a corrupt header");
+    check(bram_operations == 0 && bram[(BRAM0 << 13) + 10] == 0, "a malformed image writes nothing");
+    check(!is_resident(BRAM0, image) && !is_resident(BRAM6, image), "a malformed image marks nothing resident");
+    image[sizeof(image_section_t) + rows[0] * sizeof(uint128_t)] ^= 1;
+    reset_counters();
+    check(load_image(image, size - 1) == -1 && bram_operations == 0, "load_image rejects a truncated image without writing");
+    free(image);
+}
+
+// bram_store inside one enable/disable pair, like the loaders of main.c
+void test_store() {
+    registers[0] = 0;
+    reset_counters();
+    enable_bram_access();
+    for (unsigned int i = 0; i < 8; i++)
+        bram_store(BRAM4, i, createUint128_t(0, i));
+    disable_bram_access();
+    check(bram_operations == 8 && register_operations == 4 && violations == 0, "bram_store costs one MMIO operation per row");
+    check(bram[(BRAM4 << 13) + 7] == 7, "bram_store writes the row");
+
+    reset_counters();
+    bram_store(BRAM4, 0, 1);
+    check(violations == 1 && bram[BRAM4 << 13] == 0, "BRAM is not reachable without enable_bram_access");
+}
+
+// Software writes and non-sign programs clear the residency of the rows they overwrite, the sign program keeps it
+void test_residency() {
+    uint128_t rows[4] = {0};
+    int key, other_key;
+
+    invalidate_residency();
+    set_resident(BRAM0, &key, 0, N / 2);
+    set_resident(BRAM6, &key, 0, TREE_SIZE / 2);
+    check(is_resident(BRAM0, &key) && !is_resident(BRAM0, &other_key) && !is_resident(BRAM1, &key), "set_resident marks the key");
+
+    bram_write_burst(rows, BRAM0, N / 2, 4);
+    bram_write_burst(rows, BRAM6, TREE_SIZE / 2, 4);
+    registers[0] = 0;
+    start_algorithm(SIGN);
+    check(is_resident(BRAM0, &key) && is_resident(BRAM6, &key), "writes behind the key and signing keep it resident");
+
+    enable_bram_access();
+    bram_store(BRAM0, N / 2 - 1, 0);
+    disable_bram_access();
+    check(!is_resident(BRAM0, &key) && is_resident(BRAM6, &key), "bram_store into the key clears its residency");
+
+    bram_write_burst(rows, BRAM6, TREE_SIZE / 2 - 2, 4);
+    check(!is_resident(BRAM6, &key), "bram_write_burst into the key clears its residency");
+
+    set_resident(BRAM3, &key, 0, N / 2);
+    start_algorithm(VERIFY);
+    check(!is_resident(BRAM3, &key), "verification clears all residency");
+}
+
+// The handler acknowledges the interrupt, so it is re-armed and raised again by the next run only. The first run is polled
+// until its interrupt confirms the connection, later runs sleep.
+void test_done_interrupt(int edge) {
+    registers[0] = registers[1] = registers[3] = 0;
+    interrupts = sleeps = 0;
+    interrupt_connected = 1;
+    enable_done_interrupt(edge);
+
+    for (unsigned int run = 1; run <= 3; run++) {
+        reset_algorithm();
+        start_algorithm(SIGN);
+        wait_until_done();
+        check(interrupts == run && done_interrupt_received, "wait_until_done returns after the done interrupt");
+        check((registers[3] & INTERRUPT_PENDING_MASK) == 0, "done_interrupt_handler acknowledges the interrupt");
+        check((registers[3] & INTERRUPT_ENABLE_MASK) && !(registers[3] & INTERRUPT_EDGE_MASK) == !edge, "the acknowledge keeps enable and mode");
+    }
+    check(done_interrupt_confirmed && sleeps == 2, "the first run is polled, later runs sleep once each");
+
+    // Done stays high until reset, but the acknowledged interrupt doesn't fire again
+    mock_wait_for_interrupt();
+    check(interrupts == 3, "an acknowledged interrupt is not raised again without a new run");
+
+    disable_done_interrupt();
+    reset_algorithm();
+    start_algorithm(SIGN);
+    wait_until_done();
+    check(sleeps == 3 && interrupts == 3 && (registers[1] & ALGORITHM_DONE_MASK), "without the interrupt, wait_until_done polls OUTPUT_REG");
+}
+
+// A bitstream without the done_interrupt connection never delivers the interrupt, wait_until_done falls back to polling
+void test_missing_done_interrupt() {
+    registers[0] = registers[1] = registers[3] = 0;
+    interrupts = sleeps = 0;
+    interrupt_connected = 0;
+    enable_done_interrupt(0);
+
+    for (int run = 0; run < 2; run++) {
+        reset_algorithm();
+        start_algorithm(SIGN);
+        wait_until_done();
+        check(registers[1] & ALGORITHM_DONE_MASK, "wait_until_done returns after done without the interrupt");
+    }
+    check(sleeps == 0 && interrupts == 0, "wait_until_done never sleeps on a missing interrupt");
+    check(!done_interrupt_enabled && !(registers[3] & INTERRUPT_ENABLE_MASK), "a missing interrupt disables the interrupt");
+    interrupt_connected = 1;
+}
+
+int main() {
+    verbose = 0;
+    test_write_burst(1);
+    test_write_burst(SIGNATURE_BLOCK_COUNT);
+    test_write_burst(TREE_SIZE / 2);
+    test_load_image();
+    test_store();
+    test_residency();
+    test_done_interrupt(0);
+    test_done_interrupt(1);
+    test_missing_done_interrupt();
+
+    // Tree of sign() before and after: one access toggle per row (2 read-modify-writes + 1 write) vs one per burst
+    unsigned int rows = TREE_SIZE / 2;
+    printf("Tree of N=%d (%u rows): %u MMIO operations with per-row access, %u with a burst\n", N, rows, 5 * rows, rows + 4);
+
+    if (failures) {
+        printf("%d checks failed\n", failures);
+        return 1;
+    }
+    printf("All checks passed\n");
+    return 0;
+}
@@ -0,0 +1,5 @@
+// Host stand-in for the Xilinx BSP header, only what utilities.h uses
+#include <stdio.h>
+
+#define print(string) fputs(string, stdout)
+#define xil_printf printf
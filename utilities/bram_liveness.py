@@ -0,0 +1,172 @@
+# Liveness analysis of BRAM rows for generated instruction streams
+#
+# Follows every write of a program to its last read (live range, per row, so partially overwritten buffers free rows early)
+# and reports for every bank how many rows the program uses and how many hold data needed later at the same time. The
+# second number is a lower bound for any placement of the buffers. copy_elimination.py uses the same tracing.
+#
+# - A value is the data written by one BRAM access (or data preloaded by the host, read before being written).
+# - Accesses whose extent isn't known (host inputs read by whole-bank accesses) don't count into the numbers.
+#
+# The hand placement of the generator already reaches the lower bound in banks 0, 1, 3 and 6. The rest of banks 2, 4 and 5
+# is held by accesses that can't move: modules with fixed rows in the prologue and the epilogue, whose address field is
+# shared with the compressed signature at the row the host reads. A reallocation of rows can't lower the footprint of the
+# sign program, so this is a report only.
+#
+# Usage: python bram_liveness.py [N]
+
+import sys
+
+from instruction_set import BANK_COUNT, BANK_ROWS, instruction_access_fields, instruction_accesses
+
+
+class Value:
+
+    def __init__(self, bank, first_row, row_count, start, access):
+        self.bank = bank
+        self.first_row = first_row
+        self.row_count = row_count
+        self.start = start  # Index of instruction that writes the value (-1 for data loaded by the host)
+        self.end = start  # Index of the last instruction that reads the value
+        self.access = access  # Index of the access that writes the value within the instruction
+        self.row_ends = [start] * row_count  # Index of the last instruction that reads each row
+
+    # Returns (first_row, end_row, start, end) rectangles of rows and instructions during which the value must not be overwritten.
+    # Rows overwritten before the last read of the rest of the value are freed earlier.
+    def pieces(self):
+        pieces = []
+        first_row = self.first_row
+        for row in range(1, self.row_count + 1):
+            if row == self.row_count or self.row_ends[row] != self.row_ends[row - 1]:
+                pieces.append((first_row, self.first_row + row, self.start, self.row_ends[row - 1]))
+                first_row = self.first_row + row
+        return pieces
+
+
+# Returns list of accesses of every instruction as tuples (bank, first_row, row_count, is_write, address_field, module)
+def program_accesses(instructions, N):
+    accesses = []
+    for instruction in instructions:
+        access_fields = instruction_access_fields(instruction, N)
+        accesses.append(
+            [
+                (bank, first_row, row_count, is_write, address_field, module)
+                for (module, bank, _, first_row, row_count, is_write), (_, address_field) in zip(instruction_accesses(instruction, N), access_fields)
+            ]
+        )
+    return accesses
+
+
+# Accesses whose extent is not known (whole bank, see module_accesses) are host inputs and don't count into the footprint
+def is_unknown_extent(bank, first_row, row_count):
+    return first_row == 0 and row_count == BANK_ROWS[bank]
+
+
+# Follows data through the program. Returns list of values and for every instruction and access the ids of values it touches.
+# Callback provenance(instruction_index, access_index, row, value_id, row_in_value) is called for every row that is read.
+def trace_values(accesses, provenance=None):
+    values = []
+    owners = [[None] * rows for rows in BANK_ROWS]  # (value id, row in value) that currently holds each row
+    access_values = []
+
+    for i, instruction_accesses in enumerate(accesses):
+        touched = [set() for _ in instruction_accesses]
+
+        # Reads see the state before the instruction
+        for j, (bank, first_row, row_count, is_write, address_field, module) in enumerate(instruction_accesses):
+            if is_write:
+                continue
+            external = None
+            for row in range(first_row, first_row + row_count):
+                owner = owners[bank][row]
+                if owner is None:  # Loaded by the host
+                    if external is None or values[external].first_row + values[external].row_count != row:
+                        external = len(values)
+                        values.append(Value(bank, row, 0, -1, None))
+                    values[external].row_count += 1
+                    values[external].row_ends.append(-1)
+                    owner = owners[bank][row] = (external, row - values[external].first_row)
+                value, row_in_value = owner
+                values[value].end = i
+                values[value].row_ends[row_in_value] = i
+                touched[j].add(value)
+                if provenance is not None:
+                    provenance(i, j, row, value, row_in_value)
+
+        for j, (bank, first_row, row_count, is_write, address_field, module) in enumerate(instruction_accesses):
+            if not is_write:
+                continue
+            value = len(values)
+            values.append(Value(bank, first_row, row_count, i, j))
+            touched[j].add(value)
+            for row in range(first_row, first_row + row_count):
+                owners[bank][row] = (value, row - first_row)
+
+        access_values.append(touched)
+
+    return values, access_values
+
+
+# Values loaded by the host whose size isn't known (see module_accesses) don't count into the footprint
+def counted_values(values):
+    for value in values:
+        if value.row_count and not (value.start == -1 and is_unknown_extent(value.bank, value.first_row, value.row_count)):
+            yield value
+
+
+# Number of rows used in each bank (highest used row + 1)
+def bank_footprints(values):
+    footprints = [0] * BANK_COUNT
+    for value in counted_values(values):
+        footprints[value.bank] = max(footprints[value.bank], value.first_row + value.row_count)
+    return footprints
+
+
+# Highest number of rows in each bank that hold data needed by a later instruction at the same time (between two instructions).
+# No allocation can use fewer rows.
+def bank_live_rows(values, instruction_count):
+    live = [[0] * (instruction_count + 2) for _ in range(BANK_COUNT)]
+    for value in counted_values(values):
+        for first_row, end_row, start, end in value.pieces():
+            live[value.bank][start + 1] += end_row - first_row
+            live[value.bank][end + 1] -= end_row - first_row
+
+    peaks = []
+    for bank_live in live:
+        rows = peak = 0
+        for change in bank_live:
+            rows += change
+            peak = max(peak, rows)
+        peaks.append(peak)
+    return peaks
+
+
+# Returns a report of rows used in every bank ("used", highest used row + 1) and the lower bound given by data that is live at
+# the same time ("live")
+def liveness_report(instructions, N):
+    values, _ = trace_values(program_accesses(instructions, N))
+    return {"used": bank_footprints(values), "live": bank_live_rows(values, len(instructions))}
+
+
+def print_report(report):
+    print(f"{'Bank':<6} {'Rows':<8} {'Live':<16} {'Used':<16}")
+    print("-" * 46)
+    for bank in range(BANK_COUNT):
+        live = report["live"][bank]
+        used = report["used"][bank]
+        print(f"{bank:<6} {BANK_ROWS[bank]:<8} {live:<6} {live / BANK_ROWS[bank] * 100:6.2f}%   {used:<6} {used / BANK_ROWS[bank] * 100:6.2f}%")
+    print(f"{'Total':<6} {sum(BANK_ROWS):<8} {sum(report['live']):<16} {sum(report['used']):<16}")
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    from generate_instruction_list import InstructionGenerator
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+
+    generator = InstructionGenerator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.sign(N)
+
+    print_report(liveness_report(generator.instructions, N))
@@ -1,73 +1,304 @@
+import argparse
+import contextlib
+import gzip
+import itertools
+import json
+import mmap
+import os
 import re
-import sys
+
+from instruction_set import MODULE_NAMES, decode_instruction, module_fields
 
 # Run simulation with PRINT_CYCLES to output a file that can be analyzed by this script
+#
+# Logs are analyzed in a single pass without keeping the transitions in memory: plain files are memory-mapped, gzip files
+# (detected by their magic bytes) are decompressed while reading. control_unit.sv appends to the log, so a file can contain
+# several simulation runs, a new run starts where the time goes backwards.
+#
+# With the program sidecar written by generate_instruction_list.py (write_sidecar), cycles are also attributed to every
+# instruction (the k-th time modules_running leaves 0 is the start of instruction k), to the ffsampling size n and to the step
+# of the generator that emitted the instruction (the name of its debug print, e.g. copy_t1 or "COMPLEX_MUL, ADD_SUB").
+#
+# --timeline follows modules_running as a timeline instead of crediting every module on its own (without the +2 per interval):
+# wall-clock cycles, cycles with k modules active at the same time, idle gaps between the end of an instruction
+# (instruction_done) and the start of the next one (dispatch and handshake in instruction_dispatch.sv) and the critical path,
+# i.e. the module that finishes last in each instruction and so decides how long the instruction takes.
+#
+# --trace writes a Chrome trace-event JSON (open in ui.perfetto.dev or chrome://tracing) with one track per module and a
+# slice for every activation, plus a track with one slice per instruction. Every run of the log is a separate process. With a
+# program sidecar the slices carry the instruction index, the instruction fields the module uses (banks, addresses,
+# element_count, ...) and the generator source.
+#
+# Usage: python calculate_cycles.py [log ...] [--program <sidecar.json>] [--top <count>] [--timeline] [--trace <trace.json>]
+#   Without logs the log is read from $CYCLES_OUTPUT_FILE or the CYCLES_OUTPUT_FILE path of common_definitions.vh
+
+PATTERN = rb"Time (\d+): Modules running changed from ([01]+) to ([01]+)"
+GZIP_MAGIC = b"\x1f\x8b"
+RUNNING_MODULES = {}
+COMMON_DEFINITIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ip", "falcon_ip.srcs", "sources_1", "common_definitions.vh")
+
+
+# Path the simulation writes the log to ($fopen in control_unit.sv)
+def default_cycles_file():
+    if "CYCLES_OUTPUT_FILE" in os.environ:
+        return os.environ["CYCLES_OUTPUT_FILE"]
+    with open(COMMON_DEFINITIONS_FILE) as f:
+        return re.search(r'`define CYCLES_OUTPUT_FILE "([^"]*)"', f.read()).group(1)
+
+
+# Yields (time, from_state, to_state) of every line of the log
+def iter_changes(filename):
+    pattern = re.compile(PATTERN)
+    with open(filename, "rb") as f:
+        if f.read(2) == GZIP_MAGIC:
+            with gzip.open(filename, "rb") as lines:
+                for line in lines:
+                    match = pattern.match(line.strip())
+                    if match:
+                        yield int(match.group(1)), match.group(2).decode(), match.group(3).decode()
+            return
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in re.compile(rb"^[ \t]*" + PATTERN, re.MULTILINE).finditer(data):
+                yield int(match.group(1)), match.group(2).decode(), match.group(3).decode()
 
 
 def parse_cycles_file(filename):
-    changes = []
-    pattern = r"Time (\d+): Modules running changed from (\d+) to (\d+)"
+    return list(iter_changes(filename))
+
+
+# Names of the modules whose bits are set in a modules_running state (first bit is the first module), cached per state
+def running_modules(state):
+    if state not in RUNNING_MODULES:
+        RUNNING_MODULES[state] = [MODULE_NAMES[i] for i, bit in enumerate(state) if bit == "1" and i < len(MODULE_NAMES)]
+    return RUNNING_MODULES[state]
+
 
-    with open(filename, "r") as f:
-        for line in f:
-            line = line.strip()
-            match = re.match(pattern, line)
-            if match:
-                time = int(match.group(1))
-                from_state = match.group(2)
-                to_state = match.group(3)
-                changes.append((time, from_state, to_state))
+class CycleCounter:
 
-    return changes
+    def __init__(self):
+        self.module_cycles = {module: 0 for module in MODULE_NAMES}
+        self.running = []  # Modules running since the last change (all modules off initially)
+        self.changes = 0
+        self.last_time = 0
+
+    def add(self, time, from_state, to_state):
+        # Add cycles for modules that were running since the last change
+        cycles = (time - self.last_time) // 10 + 2  # +2 to account for delay in detecting modules_running change
+        for module_name in self.running:
+            self.module_cycles[module_name] += cycles
+
+        self.running = running_modules(to_state)
+        self.changes += 1
+        self.last_time = time
+
+    def total_time(self):
+        return self.last_time // 10
 
 
 def calculate_module_cycles(changes):
-    # Module names corresponding to bit positions (from left to right, 0-indexed)
-    module_names = [
-        "COPY",
-        "HASH_TO_POINT",
-        "INT_TO_DOUBLE",
-        "FFT_IFFT",
-        "NTT_INTT",
-        "COMPLEX_MUL",
-        "MUL_CONST",
-        "SPLIT",
-        "MERGE",
-        "MULT_MOD_Q",
-        "CHECK_BOUND",
-        "DECOMPRESS",
-        "COMPRESS",
-        "ADD_SUB",
-        "SAMPLERZ",
-    ]
-
-    # Initialize cycle counters
-    module_cycles = {module: 0 for module in module_names}
-
-    # Track current state and when modules started running
-    current_state = "000000000000000"  # Initial state (all modules off)
-    module_start_times = {}  # Track when each module started running
+    counter = CycleCounter()
+    for change in changes:
+        counter.add(*change)
+    return counter.module_cycles
 
+
+# Yields (start_cycle, end_cycle) of every instruction, an instruction runs while modules_running is not 0
+def iter_instruction_intervals(changes):
+    start = None
     for time, from_state, to_state in changes:
-        # First, add cycles for modules that were running until this time
-        for i, bit in enumerate(current_state):
-            if bit == "1" and i < len(module_names):
-                module_name = module_names[i]
-                if module_name in module_start_times:
-                    cycles = time - module_start_times[module_name]
-                    module_cycles[module_name] += cycles // 10 + 2  # +2 to account for delay in detecting modules_running change
+        if int(from_state, 2) == 0 and int(to_state, 2) != 0:
+            start = time // 10
+        elif int(from_state, 2) != 0 and int(to_state, 2) == 0 and start is not None:
+            yield start, time // 10
+            start = None
+
+
+def read_program_sidecar(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+class InstructionAttribution:
+
+    def __init__(self, program):
+        self.program = program
+        self.busy = []  # Cycles from start to end of each instruction
+        self.total = []  # Cycles from start of each instruction to start of the next one (including dispatch)
+        self.start = None
+
+    def add(self, time, from_state, to_state):
+        if int(from_state, 2) == 0 and int(to_state, 2) != 0:
+            cycle = time // 10
+            if self.start is not None:
+                self.total.append(cycle - self.start)
+            self.start = cycle
+        elif int(from_state, 2) != 0 and int(to_state, 2) == 0 and self.start is not None:
+            self.busy.append(time // 10 - self.start)
+
+    def instruction_cycles(self):
+        total = self.total[: len(self.busy)]
+        return self.busy, total + self.busy[len(total) :]
+
+    # Returns {key(source): [busy cycles, total cycles, instruction count]}
+    def group(self, key):
+        groups = {}
+        busy, total = self.instruction_cycles()
+        for instruction, busy_cycles, total_cycles in zip(self.program["instructions"], busy, total):
+            group = groups.setdefault(key(instruction["source"]), [0, 0, 0])
+            group[0] += busy_cycles
+            group[1] += total_cycles
+            group[2] += 1
+        return groups
+
+
+class Timeline:
+
+    def __init__(self):
+        self.first_cycle = None
+        self.cycle = None
+        self.active = 0  # Number of modules running since the last change
+        self.concurrency = {}  # Number of active modules -> cycles
+        self.instruction_start = None
+        self.instruction_end = None
+        self.gaps = []  # Cycles between the end of an instruction and the start of the next one
+        self.critical_path = {}  # Module(s) finishing last in an instruction -> cycles of those instructions
+        self.instructions = 0
+
+    def add(self, time, from_state, to_state):
+        cycle = time // 10
+        if self.first_cycle is None:
+            self.first_cycle = cycle
+        else:
+            self.concurrency[self.active] = self.concurrency.get(self.active, 0) + cycle - self.cycle
+        self.cycle = cycle
+        self.active = to_state.count("1")
+
+        if int(from_state, 2) == 0 and int(to_state, 2) != 0:
+            if self.instruction_end is not None:
+                self.gaps.append(cycle - self.instruction_end)
+            self.instruction_start = cycle
+        elif int(from_state, 2) != 0 and int(to_state, 2) == 0 and self.instruction_start is not None:
+            critical = "+".join(running_modules(from_state))
+            self.critical_path[critical] = self.critical_path.get(critical, 0) + cycle - self.instruction_start
+            self.instruction_end = cycle
+            self.instructions += 1
+
+    def wall_clock_cycles(self):
+        return self.cycle - self.first_cycle if self.first_cycle is not None else 0
+
+
+# Writes trace events of all runs into one file without keeping them in memory
+class TraceFile:
+
+    def __init__(self, filename):
+        self.file = open(filename, "w")
+        self.file.write('{"displayTimeUnit": "ns", "traceEvents": [\n')
+        self.first = True
+
+    def write(self, event):
+        if not self.first:
+            self.file.write(",\n")
+        self.file.write(json.dumps(event))
+        self.first = False
+
+    def close(self):
+        self.file.write("\n]}\n")
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
-        # Update current state
-        current_state = to_state
 
-        # Track start times for newly activated modules
-        module_start_times.clear()
-        for i, bit in enumerate(current_state):
-            if bit == "1" and i < len(module_names):
-                module_name = module_names[i]
-                module_start_times[module_name] = time
+class TraceExport:
+    INSTRUCTION_TRACK = len(MODULE_NAMES)
 
-    return module_cycles
+    def __init__(self, trace, pid, name, program=None):
+        self.trace = trace
+        self.pid = pid
+        self.program = program
+        self.starts = {}  # Module -> time it started running
+        self.instruction = -1  # Index of the current instruction
+        self.instruction_start = None
+
+        trace.write({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+        for tid, module in enumerate(MODULE_NAMES + ["Instructions"]):
+            trace.write({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": module}})
+            trace.write({"name": "thread_sort_index", "ph": "M", "pid": pid, "tid": tid, "args": {"sort_index": tid}})
+
+    # Trace event timestamps are in microseconds, the log in ns
+    def slice(self, name, tid, start, end, args):
+        self.trace.write({"name": name, "ph": "X", "pid": self.pid, "tid": tid, "ts": start / 1000, "dur": (end - start) / 1000, "args": args})
+
+    def slice_args(self, start, end, module=None):
+        args = {"cycles": (end - start) // 10, "instruction": self.instruction}
+        if self.program is not None and self.instruction < len(self.program["instructions"]):
+            instruction = self.program["instructions"][self.instruction]
+            if module is not None:
+                fields = decode_instruction(int(instruction["instruction"], 16))
+                args.update({field: fields[field] for field in module_fields(module, fields)})
+            source = instruction["source"]
+            args["source"] = source["step"] + (f" n={source['n']}" if source["n"] is not None else "")
+        return args
+
+    def add(self, time, from_state, to_state):
+        if int(from_state, 2) == 0 and int(to_state, 2) != 0:
+            self.instruction += 1
+            self.instruction_start = time
+
+        for i, (before, after) in enumerate(zip(from_state, to_state)):
+            if i >= len(MODULE_NAMES) or before == after:
+                continue
+            module = MODULE_NAMES[i]
+            if after == "1":
+                self.starts[module] = time
+            elif module in self.starts:
+                start = self.starts.pop(module)
+                self.slice(module, i, start, time, self.slice_args(start, time, module))
+
+        if int(from_state, 2) != 0 and int(to_state, 2) == 0 and self.instruction_start is not None:
+            name = "+".join(running_modules(from_state))
+            self.slice(f"#{self.instruction} {name}", self.INSTRUCTION_TRACK, self.instruction_start, time, self.slice_args(self.instruction_start, time))
+            self.instruction_start = None
+
+
+# Yields (run index, analyzers) of every run in the log, a run ends when the time goes backwards. make_analyzers(run) returns
+# a dict of new objects with add(time, from_state, to_state) for every run.
+def iter_runs(filename, make_analyzers=lambda run: {"cycles": CycleCounter()}):
+    analyzers = make_analyzers(0)
+    run = 0
+    last_time = None
+    for time, from_state, to_state in iter_changes(filename):
+        if last_time is not None and time < last_time:
+            yield run, analyzers
+            run += 1
+            analyzers = make_analyzers(run)
+        for analyzer in analyzers.values():
+            analyzer.add(time, from_state, to_state)
+        last_time = time
+    if last_time is not None:
+        yield run, analyzers
+
+
+# Aggregates per-module cycles over runs without keeping the runs
+class RunSummary:
+
+    def __init__(self):
+        self.runs = 0
+        self.total = {module: 0 for module in MODULE_NAMES}
+        self.minimum = {}
+        self.maximum = {}
+
+    def add(self, counter):
+        self.runs += 1
+        for module, cycles in list(counter.module_cycles.items()) + [("Total time", counter.total_time())]:
+            self.total[module] = self.total.get(module, 0) + cycles
+            self.minimum[module] = min(self.minimum.get(module, cycles), cycles)
+            self.maximum[module] = max(self.maximum.get(module, cycles), cycles)
 
 
 def print_results(module_cycles, total_time=None):
@@ -88,21 +319,122 @@ def print_results(module_cycles, total_time=None):
     print("-" * 50)
 
 
+def print_summary(summary):
+    print(f"Summary of {summary.runs} runs")
+    print("=" * 50)
+    print(f"{'Module Name':<15} {'Mean':<12} {'Min':<10} {'Max':<10}")
+    print("-" * 50)
+    for module, total in summary.total.items():
+        if module == "Total time":
+            print("-" * 50)
+        print(f"{module:<15} {total / summary.runs:<12.1f} {summary.minimum[module]:<10} {summary.maximum[module]:<10}")
+
+
+def print_attribution(attribution, top):
+    busy, total = attribution.instruction_cycles()
+    instructions = attribution.program["instructions"]
+    if len(busy) != len(instructions):
+        print(f"Warning: log contains {len(busy)} instructions, program has {len(instructions)}")
+
+    print(f"Top {top} instructions")
+    print("=" * 80)
+    print(f"{'Index':<8} {'Busy':<10} {'Total':<10} {'Source'}")
+    print("-" * 80)
+    for index in sorted(range(len(busy)), key=lambda i: -total[i])[:top]:
+        source = instructions[index]["source"]
+        print(f"{index:<8} {busy[index]:<10} {total[index]:<10} {source['step']}" + (f" (n={source['n']})" if source["n"] is not None else ""))
+    print("-" * 80)
+
+    wall_time = sum(total)
+    for title, key, label in [
+        ("Cycles per ffsampling size n", lambda source: source["n"] if source["n"] is not None else -1, lambda n: "outside" if n == -1 else f"n={n}"),
+        ("Cycles per generator step", lambda source: source["step"], lambda step: step),
+    ]:
+        groups = attribution.group(key)
+        print(title)
+        print("=" * 80)
+        print(f"{'Group':<24} {'Instructions':<14} {'Busy':<12} {'Total':<12} {'Percentage':<10}")
+        print("-" * 80)
+        for group_key, (busy_cycles, total_cycles, count) in sorted(groups.items(), key=lambda item: -item[1][1])[:top]:
+            percentage = total_cycles / wall_time * 100 if wall_time else 0
+            print(f"{label(group_key):<24} {count:<14} {busy_cycles:<12.0f} {total_cycles:<12.0f} {percentage:<7.2f}%")
+        print("-" * 80)
+
+
+def print_timeline(timeline):
+    wall_clock = timeline.wall_clock_cycles()
+    gap_cycles = sum(timeline.gaps)
+
+    def percentage(cycles):
+        return cycles / wall_clock * 100 if wall_clock else 0
+
+    print("Timeline")
+    print("=" * 50)
+    print(f"{'Wall-clock cycles':<28} {wall_clock}")
+    print(f"{'Instructions':<28} {timeline.instructions}")
+    print(f"{'Dispatch gaps':<28} {gap_cycles} ({percentage(gap_cycles):.2f}%)")
+    if timeline.gaps:
+        print(f"{'Gap min/mean/max':<28} {min(timeline.gaps)} / {gap_cycles / len(timeline.gaps):.2f} / {max(timeline.gaps)}")
+    print("-" * 50)
+    print(f"{'Active modules':<15} {'Cycles':<12} {'Percentage':<10}")
+    print("-" * 50)
+    for active, cycles in sorted(timeline.concurrency.items()):
+        print(f"{active:<15} {cycles:<12} {percentage(cycles):<7.2f}%")
+    print("-" * 50)
+    print("Critical path (module finishing last in each instruction)")
+    print("-" * 50)
+    for modules, cycles in sorted(timeline.critical_path.items(), key=lambda item: -item[1]):
+        print(f"{modules:<28} {cycles:<12} {percentage(cycles):<7.2f}%")
+    print(f"{'(dispatch gaps)':<28} {gap_cycles:<12} {percentage(gap_cycles):<7.2f}%")
+    print("-" * 50)
+
+
 def main():
 
-    filename = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Analyze cycle logs written by simulations with PRINT_CYCLES")
+    parser.add_argument("logs", nargs="*", help="plain or gzip logs (default: $CYCLES_OUTPUT_FILE or CYCLES_OUTPUT_FILE of common_definitions.vh)")
+    parser.add_argument("--program", help="program sidecar of generate_instruction_list.py for per-instruction attribution")
+    parser.add_argument("--top", type=int, default=20, help="number of rows in per-instruction and per-line tables")
+    parser.add_argument("--timeline", action="store_true", help="report concurrency, dispatch gaps and the critical path")
+    parser.add_argument("--trace", help="write a Chrome trace-event JSON file")
+    args = parser.parse_args()
 
-    changes = parse_cycles_file(filename)
+    program = read_program_sidecar(args.program) if args.program else None
+    # The trace file is closed (and its JSON terminated) even if reading a log fails or the output pipe is closed
+    with TraceFile(args.trace) if args.trace else contextlib.nullcontext() as trace:
+        trace_pids = itertools.count(1)
 
-    if not changes:
-        print("No state changes found in the file!")
-        return
+        def make_analyzers(run):
+            analyzers = {"cycles": CycleCounter()}
+            if trace:
+                analyzers["trace"] = TraceExport(trace, next(trace_pids), f"{filename}, run {run + 1}", program)
+            if program:
+                analyzers["attribution"] = InstructionAttribution(program)
+            if args.timeline:
+                analyzers["timeline"] = Timeline()
+            return analyzers
 
-    module_cycles = calculate_module_cycles(changes)
+        summary = RunSummary()
+        for filename in args.logs or [default_cycles_file()]:
+            for run, analyzers in iter_runs(filename, make_analyzers):
+                counter = analyzers["cycles"]
+                print(f"{filename}, run {run + 1}")
+                print_results(counter.module_cycles, counter.total_time())
+                print()
+                if "attribution" in analyzers:
+                    print_attribution(analyzers["attribution"], args.top)
+                    print()
+                if "timeline" in analyzers:
+                    print_timeline(analyzers["timeline"])
+                    print()
+                summary.add(counter)
 
-    total_time = changes[-1][0] // 10 if changes else 0
+    if not summary.runs:
+        print("No state changes found in the file!")
+        return
 
-    print_results(module_cycles, total_time)
+    if summary.runs > 1:
+        print_summary(summary)
 
 
 if __name__ == "__main__":
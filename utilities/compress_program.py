@@ -0,0 +1,253 @@
+# Compact program format for the unrolled sign program
+#
+# ffsampling is fully unrolled by the generator, so the sign program contains thousands of instructions that differ only in BRAM
+# banks and row addresses. This script stores every ffsampling subtree of size n once (template) and replaces the other subtrees
+# of the same size with a call record: the template id and a relocation that maps the template instructions to the subtree.
+#
+# Program format:
+#   {"N": N, "templates": [body, ...], "body": body}
+#   body  = list of items
+#   item  = ["literal", instruction] or ["call", template_id, relocation]
+#   relocation = {"bank_map": [new bank for bank 0..7], "segments": [[bank, first_row, delta], ...]}
+#
+# A relocated instruction gets its data bank fields mapped with bank_map. The row address belonging to a bank field is increased
+# by the delta of the segment of that (original) bank with the largest first_row that is <= address (0 if there is none).
+#
+# expand() is the reference expander, it reproduces the flat instruction stream bit for bit.
+#
+# Usage:
+#   python compress_program.py                       ... compress sign programs for N=512 and N=1024 and check the expansion
+#   python compress_program.py compress <N> <file>   ... write the compressed sign program to a JSON file
+#   python compress_program.py expand <file>         ... print the expanded program in the format of instruction_dispatch.sv
+
+import contextlib
+import io
+import json
+import sys
+
+from instruction_set import INSTRUCTION_WIDTH, decode_instruction, encode_instruction, instruction_modules
+
+# Data bank fields of each module and the address field holding the row in that bank (None if the module always starts at row 0
+# or the row is fixed). Banks that are not data (like the samplerz seed in bank4) are not listed and never relocated.
+RELOCATION_FIELDS = {
+    "COPY": {"bank3": "addr1", "bank4": "addr2"},
+    "HASH_TO_POINT": {"bank3": None, "bank4": None},
+    "INT_TO_DOUBLE": {"bank1": None, "bank2": None},
+    "FFT_IFFT": {"bank1": "addr1", "bank2": "addr2"},
+    "NTT_INTT": {"bank1": None, "bank2": None},
+    "COMPLEX_MUL": {"bank1": "addr1", "bank2": "addr2"},
+    "MUL_CONST": {"bank3": None, "bank4": None},
+    "SPLIT": {"bank1": "addr1", "bank2": "addr2"},
+    "MERGE": {"bank1": "addr1", "bank2": "addr2"},
+    "MULT_MOD_Q": {"bank1": None, "bank2": None, "bank3": None},
+    "CHECK_BOUND": {"bank1": None, "bank2": None, "bank3": None},
+    "DECOMPRESS": {"bank5": None, "bank6": None, "bank7": None},
+    "COMPRESS": {"bank1": "addr1", "bank2": None, "bank3": "addr2", "bank4": None},
+    "ADD_SUB": {"bank3": "addr1", "bank4": "addr2"},
+    "SAMPLERZ": {"bank1": "addr1", "bank2": "addr2", "bank3": None},
+}
+
+ROTATING_BANKS = 4  # ffsampling rotates its working buffers through banks 0..3
+TREE_BANK = 6
+
+# Estimated size of records in a binary encoding, used to compare against the flat program
+ITEM_TAG_BITS = 1
+TEMPLATE_ID_BITS = 4
+BANK_BITS = 3
+ROW_BITS = 13
+DELTA_BITS = 14
+SEGMENT_COUNT_BITS = 3
+
+
+def segment_delta(segments, bank, row):
+    delta = 0
+    for segment_bank, first_row, segment_delta in segments:  # Segments are sorted by first_row
+        if segment_bank == bank and first_row <= row:
+            delta = segment_delta
+    return delta
+
+
+def relocate_instruction(instruction, relocation):
+    fields = decode_instruction(instruction)
+    relocated = dict(fields)
+    done = set()
+    for module in instruction_modules(instruction):
+        for bank_field, addr_field in RELOCATION_FIELDS[module].items():
+            if bank_field in done:
+                continue
+            done.add(bank_field)
+            bank = fields[bank_field]
+            relocated[bank_field] = relocation["bank_map"][bank]
+            if addr_field is not None and addr_field not in done:
+                done.add(addr_field)
+                relocated[addr_field] = fields[addr_field] + segment_delta(relocation["segments"], bank, fields[addr_field])
+    return encode_instruction(**relocated)
+
+
+def expand_body(program, body, cache):
+    instructions = []
+    for item in body:
+        if item[0] == "literal":
+            instructions.append(item[1])
+        else:
+            _, template_id, relocation = item
+            instructions.extend(relocate_instruction(instruction, relocation) for instruction in expand_template(program, template_id, cache))
+    return instructions
+
+
+def expand_template(program, template_id, cache):
+    if template_id not in cache:
+        cache[template_id] = expand_body(program, program["templates"][template_id], cache)
+    return cache[template_id]
+
+
+# Reference expander: returns the flat instruction stream of a compressed program
+def expand(program):
+    return expand_body(program, program["body"], {})
+
+
+# Relocation that maps instructions of the ffsampling subtree `template` to the subtree `subtree` of the same size
+def subtree_relocation(template, subtree):
+    rotation = (subtree["curr_bram"] - template["curr_bram"]) % ROTATING_BANKS
+    bank_map = [(bank + rotation) % ROTATING_BANKS if bank < ROTATING_BANKS else bank for bank in range(8)]
+
+    segments = []
+    # Inputs t0, t1 of the subtree (n rows in the previous bank, below the free space of that bank)
+    segments.append([(template["curr_bram"] - 1) % ROTATING_BANKS, template["t0"], subtree["t0"] - template["t0"]])
+    # Buffers allocated by the subtree
+    for bank in range(ROTATING_BANKS):
+        first_row = template["next_free_addr"][bank]
+        segments.append([bank, first_row, subtree["next_free_addr"][bank_map[bank]] - first_row])
+    # Tree of the subtree, stored with 2 elements per row
+    segments.append([TREE_BANK, 0, (subtree["tree"] - template["tree"]) // 2])
+
+    segments.sort(key=lambda segment: segment[1])
+    return {"bank_map": bank_map, "segments": segments}
+
+
+# Builds the compressed program from flat instructions and subtree ranges recorded by the generator (InstructionGenerator.subtrees).
+# A subtree is replaced with a call only if the relocated template reproduces it exactly, otherwise its instructions are inlined.
+def compress(instructions, subtrees, N):
+    if not any(subtree["n"] == N for subtree in subtrees):
+        raise ValueError(
+            "No ffsampling subtrees recorded, the program would not be compressed at all "
+            "(not a sign program, or generated with remove_copies, which discards the subtree ranges)"
+        )
+
+    program = {"N": N, "templates": [], "body": []}
+    cache = {}
+
+    # Subtrees that are not the first of their size are used as templates, the first ones contain the first samplerz call
+    template_subtrees = {}
+    template_ids = {}
+    for subtree in subtrees:
+        if 2 <= subtree["n"] < N:
+            template_subtrees[subtree["n"]] = subtree
+
+    children = {}
+    for subtree in subtrees:
+        children[(subtree["start"], subtree["end"])] = sorted(
+            (child for child in subtrees if child["n"] == subtree["n"] // 2 and subtree["start"] <= child["start"] and child["end"] <= subtree["end"]),
+            key=lambda child: child["start"],
+        )
+
+    def encode_range(start, end, nested):
+        body = []
+        position = start
+        for child in nested:
+            body.extend(["literal", instruction] for instruction in instructions[position : child["start"]])
+            body.extend(encode_subtree(child))
+            position = child["end"]
+        body.extend(["literal", instruction] for instruction in instructions[position:end])
+        return body
+
+    def encode_subtree(subtree):
+        n = subtree["n"]
+        if n in template_ids:
+            template = template_subtrees[n]
+            relocation = subtree_relocation(template, subtree)
+            template_instructions = expand_template(program, template_ids[n], cache)
+            relocated = [relocate_instruction(instruction, relocation) for instruction in template_instructions]
+            if relocated == instructions[subtree["start"] : subtree["end"]]:
+                return [["call", template_ids[n], relocation]]
+        return encode_range(subtree["start"], subtree["end"], children[(subtree["start"], subtree["end"])])
+
+    for n in sorted(template_subtrees):
+        template = template_subtrees[n]
+        template_ids[n] = len(program["templates"])
+        program["templates"].append(encode_range(template["start"], template["end"], children[(template["start"], template["end"])]))
+
+    top_level = [subtree for subtree in subtrees if subtree["n"] == N]
+    program["body"] = encode_range(0, len(instructions), top_level)
+
+    return program
+
+
+def body_bits(body):
+    bits = 0
+    for item in body:
+        if item[0] == "literal":
+            bits += ITEM_TAG_BITS + INSTRUCTION_WIDTH
+        else:
+            relocation = item[2]
+            bits += ITEM_TAG_BITS + TEMPLATE_ID_BITS + 8 * BANK_BITS + SEGMENT_COUNT_BITS
+            bits += len(relocation["segments"]) * (BANK_BITS + ROW_BITS + DELTA_BITS)
+    return bits
+
+
+# Estimated size of the compressed program in bits
+def program_bits(program):
+    return body_bits(program["body"]) + sum(body_bits(body) for body in program["templates"])
+
+
+def program_records(program):
+    return len(program["body"]) + sum(len(body) for body in program["templates"])
+
+
+def write_program(program, filename):
+    with open(filename, "w") as f:
+        json.dump(program, f)
+
+
+def read_program(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def generate_sign(N):
+    from generate_instruction_list import InstructionGenerator
+
+    generator = InstructionGenerator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.sign(N)
+    return generator
+
+
+def print_compression_stats(instructions, program):
+    flat_bits = len(instructions) * INSTRUCTION_WIDTH
+    compressed_bits = program_bits(program)
+    calls = sum(item[0] == "call" for body in [program["body"]] + program["templates"] for item in body)
+    print(f"N={program['N']}")
+    print(f"  Flat program:       {len(instructions)} instructions, {flat_bits} bits")
+    print(f"  Compressed program: {program_records(program)} records ({calls} calls, {len(program['templates'])} templates), ~{compressed_bits} bits")
+    print(f"  Compression ratio:  {flat_bits / compressed_bits:.2f}x")
+    print(f"  Expansion bit-exact: {expand(program) == instructions}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "compress":
+        N = int(sys.argv[2])
+        generator = generate_sign(N)
+        write_program(compress(generator.instructions, generator.subtrees, N), sys.argv[3])
+
+    elif len(sys.argv) > 1 and sys.argv[1] == "expand":
+        from generate_instruction_list import InstructionGenerator
+
+        generator = InstructionGenerator()
+        generator.instructions = expand(read_program(sys.argv[2]))
+        generator.print_verilog(algorithm="sign")
+
+    else:
+        for N in [512, 1024]:
+            generator = generate_sign(N)
+            print_compression_stats(generator.instructions, compress(generator.instructions, generator.subtrees, N))
@@ -0,0 +1,283 @@
+# COPY elimination pass for generated instruction streams
+#
+# Many COPY instructions of the sign program only move data so that the next module finds it at the address it expects
+# (copy_split/copy_merge at n == 2, copy of t1, ...). This pass removes a COPY by moving the copied data back to the source rows:
+# every instruction that reads the copy, and every instruction that updates it in place (writes its result through the same
+# fields it reads the copy with, e.g. the ADD_SUB/COMPLEX_MUL chain on t1), gets the source bank and rows instead. A COPY is
+# removed when
+# - the moved accesses get their rows only through bank and address fields that no other access of the instruction uses,
+# - every moved read only reads the copied data or results of its in-place updates,
+# - the source rows are not overwritten until the last reader, and, if the data is updated in place, nothing else uses the
+#   source rows meanwhile and the old source data is not read afterwards,
+# - the source bank port is not used by another access of a moved instruction.
+# Copies whose data is never read are removed too. The pass repeats until no COPY can be removed and checks that every
+# remaining read gets the same data as before (following removed copies back to their source).
+#
+# At N = 1024 this removes 513 of 3073 COPY instructions. At N = 512 it removes only 1 of 1537 (copy_t1 of the top level
+# ffsampling call). The remaining n == 2 copies are needed at N = 512: their readers either use the source bank port for another
+# operand (SAMPLERZ reads its tree rows of bank 3 on both ports, ADD_SUB reads its other input from the source bank) or read two
+# copies that come from the same rows at different times (MERGE of z1 after SAMPLERZ).
+#
+# Usage: python copy_elimination.py [N]
+
+import bisect
+import sys
+
+from bram_liveness import program_accesses, trace_values
+from cost_model import DISPATCH_CYCLES, instruction_cycles
+from instruction_set import BANK_ROWS, decode_instruction, encode_instruction, instruction_access_fields, instruction_accesses, instruction_modules
+
+
+def is_copy(instruction):
+    return instruction_modules(instruction) == ["COPY"]
+
+
+def trace_reads(instructions, N):
+    accesses = program_accesses(instructions, N)
+    reads = {}  # (instruction, access, row) -> (value id, row in value)
+
+    def provenance(i, j, row, value, row_in_value):
+        reads[(i, j, row)] = (value, row_in_value)
+
+    values, _ = trace_values(accesses, provenance)
+    return accesses, values, reads
+
+
+# Returns the instructions that access each row of each bank as sorted lists of (instruction index, is_write). An instruction that
+# reads and writes a row appears once as a read, because it sees the data before writing it.
+def row_touches(accesses):
+    touches = {}
+    for i, instruction_accesses in enumerate(accesses):
+        rows = {}
+        for bank, first_row, row_count, is_write, _, _ in instruction_accesses:
+            for row in range(first_row, first_row + row_count):
+                rows[(bank, row)] = rows.get((bank, row), True) and is_write
+        for location, is_write in rows.items():
+            touches.setdefault(location, []).append((i, is_write))
+    return touches
+
+
+# Touches of a row by instructions after and until (inclusive)
+def touches_between(touches, bank, row, after, until):
+    row_touches = touches.get((bank, row), [])
+    index = bisect.bisect_right(row_touches, (after, True))
+    while index < len(row_touches) and row_touches[index][0] <= until:
+        yield row_touches[index]
+        index += 1
+
+
+# Values that live in the rows written by the COPY at index c: its output and the results of instructions that update it in
+# place (write through the fields they read it with). Returns {instruction: set of accesses} of all reads and writes of them.
+def copy_web(c, value, accesses, access_fields, readers, written_values):
+    members = {}
+    web = {value}
+    pending = [value]
+    while pending:
+        for i, reader_accesses in readers.get(pending.pop(), {}).items():
+            members.setdefault(i, set()).update(reader_accesses)
+            fields = {access_fields(i)[j] for j in reader_accesses}
+            for j, access in enumerate(accesses[i]):
+                if access[3] and access_fields(i)[j] in fields:
+                    members[i].add(j)
+                    written = written_values[(i, j)]
+                    if written not in web:
+                        web.add(written)
+                        pending.append(written)
+    return web, members
+
+
+# Returns the new fields of instruction i when its accesses of the web are moved by delta rows to source_bank, or None
+def move_accesses(instructions, accesses, access_fields, i, members, source_bank, delta, N):
+    moved_fields = {access_fields[j] for j in members}
+    bank_fields = {bank_field for bank_field, _ in moved_fields}
+    address_fields = {address_field for _, address_field in moved_fields}
+    if None in address_fields:
+        return None
+    for j in range(len(accesses[i])):
+        if j not in members and (access_fields[j][0] in bank_fields or access_fields[j][1] in address_fields):
+            return None
+
+    fields = decode_instruction(instructions[i])
+    for bank_field in bank_fields:
+        fields[bank_field] = source_bank
+    for address_field in address_fields:
+        fields[address_field] += delta
+        if not 0 <= fields[address_field] < BANK_ROWS[source_bank]:
+            return None
+
+    # The moved accesses have to end up at the source rows and everything else has to stay, with no bank port shared between them
+    moved = instruction_accesses(encode_instruction(**fields), N)
+    if len(moved) != len(accesses[i]):
+        return None
+    for j, ((_, bank, _, first_row, row_count, is_write), access) in enumerate(zip(moved, accesses[i])):
+        expected = (source_bank, access[1] + delta) if j in members else access[:2]
+        if (bank, first_row) != expected or (row_count, is_write) != access[2:4]:
+            return None
+    ports = [(bank, port) for _, bank, port, _, _, _ in moved]
+    if {ports[j] for j in members} & {ports[j] for j in range(len(ports)) if j not in members}:
+        return None
+
+    return fields
+
+
+# Returns {instruction: new fields} that let the program work without the COPY at index c, or None. The web of the copied data
+# moves to the source rows: readers read the source directly, in-place updates happen in the source rows. Updates are only
+# possible when nothing else reads the source rows afterwards.
+def eliminate_copy(instructions, accesses, access_fields, touches, reads, readers, written_values, c, N):
+    source_bank, source_first_row, row_count, _, _, _ = accesses[c][0]
+    copy_bank, copy_first_row, _, _, _, _ = accesses[c][1]
+    delta = source_first_row - copy_first_row
+    web, members = copy_web(c, written_values[(c, 1)], accesses, access_fields, readers, written_values)
+    if not members:
+        return {}, (c, c, set())
+
+    end = max(members)
+    rows = set()
+    written_rows = set()
+    for i, member_accesses in members.items():
+        for j in member_accesses:
+            bank, first_row, count, is_write, _, _ = accesses[i][j]
+            if bank != copy_bank:
+                return None
+            for row in range(first_row, first_row + count):
+                if not is_write and reads.get((i, j, row), (None,))[0] not in web:
+                    return None  # The access reads other data too
+                rows.add(row + delta)
+                if is_write:
+                    written_rows.add(row + delta)
+
+    for row in rows:
+        for i, is_write in touches_between(touches, source_bank, row, c, end):
+            if i not in members and (is_write or written_rows):
+                return None  # Source overwritten before the last reader, or used by others while the web writes into it
+        if row in written_rows:
+            later = next(touches_between(touches, source_bank, row, end, len(instructions)), None)
+            if later is not None and not later[1]:
+                return None  # Data overwritten by the web is read later
+
+    new_fields = {}
+    for i, member_accesses in members.items():
+        fields = move_accesses(instructions, accesses, access_fields(i), i, member_accesses, source_bank, delta, N)
+        if fields is None:
+            return None
+        new_fields[i] = fields
+    return new_fields, (c, end, rows)
+
+
+def elimination_round(instructions, N):
+    accesses, values, reads = trace_reads(instructions, N)
+    touches = row_touches(accesses)
+    fields_cache = {}
+
+    def access_fields(i):
+        if i not in fields_cache:
+            fields_cache[i] = instruction_access_fields(instructions[i], N)
+        return fields_cache[i]
+
+    readers = {}  # value id -> {instruction: set of accesses}
+    for (i, j, _), (value, _) in reads.items():
+        readers.setdefault(value, {}).setdefault(i, set()).add(j)
+
+    written_values = {}  # (instruction, access) -> value id
+    for value_id, value in enumerate(values):
+        if value.start != -1:
+            written_values[(value.start, value.access)] = value_id
+
+    removed = set()
+    changed = {}
+    claims = []  # (bank, rows, first instruction, last instruction) of source rows used by the eliminated copies of this round
+    for c, instruction in enumerate(instructions):
+        if not is_copy(instruction) or c in changed:
+            continue
+        result = eliminate_copy(instructions, accesses, access_fields, touches, reads, readers, written_values, c, N)
+        if result is None:
+            continue
+        new_fields, (start, end, rows) = result
+        source_bank = accesses[c][0][0]
+        if any(i in removed or i in changed for i in new_fields):
+            continue
+        # Decisions of one round are based on the same analysis, copies whose source rows are in use at the same time wait
+        if any(bank == source_bank and start <= claim_end and claim_start <= end and rows & claim_rows for bank, claim_rows, claim_start, claim_end in claims):
+            continue
+        claims.append((source_bank, rows, start, end))
+        removed.add(c)
+        for i, fields in new_fields.items():
+            changed[i] = encode_instruction(**fields)
+
+    return removed, changed
+
+
+# Follows every read back through copies and returns {(reader index, access, row in access): origin of the data}
+def read_origins(instructions, indices, N):
+    accesses, values, reads = trace_reads(instructions, N)
+
+    def origin(value, row_in_value):
+        while True:
+            written = values[value]
+            if written.start == -1:
+                return ("host", written.bank, written.first_row + row_in_value)
+            if not is_copy(instructions[written.start]):
+                return (indices[written.start], written.access, row_in_value)
+            copy_source = accesses[written.start][0][1]
+            value, row_in_value = reads[(written.start, 0, copy_source + row_in_value)]
+
+    origins = {}
+    for (i, j, row), (value, row_in_value) in reads.items():
+        if not is_copy(instructions[i]):
+            origins[(indices[i], j, row - accesses[i][j][1])] = origin(value, row_in_value)
+    return origins
+
+
+# Returns instructions without removable copies and a report with the number of removed COPY instructions and their cycles
+def eliminate_copies(instructions, N):
+    original = list(instructions)
+    indices = list(range(len(instructions)))  # Index of each instruction in the original program
+    removed_cycles = 0
+    removed_count = 0
+
+    while True:
+        removed, changed = elimination_round(instructions, N)
+        if not removed:
+            break
+        for i, instruction in changed.items():
+            instructions[i] = instruction
+        removed_count += len(removed)
+        removed_cycles += sum(instruction_cycles(instructions[c], N) + DISPATCH_CYCLES for c in removed)
+        instructions = [instruction for i, instruction in enumerate(instructions) if i not in removed]
+        indices = [index for i, index in enumerate(indices) if i not in removed]
+
+    if read_origins(instructions, indices, N) != read_origins(original, list(range(len(original))), N):
+        raise ValueError("Copy elimination changed data flow of the program")
+
+    report = {
+        "copies_before": sum(is_copy(instruction) for instruction in original),
+        "copies_removed": removed_count,
+        "cycles_removed": removed_cycles,
+        "indices": indices,  # Index of each remaining instruction in the original program
+    }
+    return instructions, report
+
+
+def print_report(report):
+    print(f"COPY instructions:         {report['copies_before']}")
+    print(f"Removed COPY instructions: {report['copies_removed']}")
+    print(f"Removed cycles (estimate): {report['cycles_removed']}")
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    from cost_model import program_cycles
+    from generate_instruction_list import InstructionGenerator
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+
+    generator = InstructionGenerator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.sign(N)
+
+    instructions, report = eliminate_copies(list(generator.instructions), N)
+    print_report(report)
+    print(f"Instructions: {len(generator.instructions)} -> {len(instructions)}")
+    print(f"Cycles (estimate): {program_cycles(generator.instructions, N):.0f} -> {program_cycles(instructions, N):.0f}")
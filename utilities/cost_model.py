@@ -0,0 +1,228 @@
+# Static cycle-cost model for generated instruction streams
+#
+# Predicts how many clock cycles a program takes on the FPGA without running a simulation. Every module has a latency
+# scale * work + offset, where work is derived from the structure of the module in the RTL (pipeline length, number of
+# butterflies, ...). An instruction takes as long as its slowest module plus the dispatch overhead of instruction_dispatch.sv.
+#
+# The parameters in this file are estimates: the work terms follow the RTL, but no PRINT_CYCLES log has been fitted yet, so
+# every scale is 1 and the offsets of HASH_TO_POINT, DECOMPRESS and SAMPLERZ are guesses. Predictions are only useful to
+# compare programs with each other until the parameters are calibrated against a simulation log produced with PRINT_CYCLES
+# (see calculate_cycles.py) and the printed COST_PARAMETERS and DISPATCH_CYCLES are pasted below:
+#   python cost_model.py                                   ... predict sign/verify cycles for N=512 and N=1024
+#   python cost_model.py calibrate <log> <sign|verify> <N> ... fit parameters to a simulation log
+
+import contextlib
+import io
+import math
+import sys
+
+from instruction_set import MODULE_NAMES, decode_instruction, instruction_modules
+
+# Cycles between one instruction finishing and the next one starting (instruction_done -> INSTRUCTIONS_DONE -> next instruction)
+DISPATCH_CYCLES = 3
+
+# Cycles between the last pipelined_inst_index and done for pipelined modules (done delay registers in control_unit.sv)
+PIPELINED_DONE_DELAY = {
+    "COPY": 1,
+    "INT_TO_DOUBLE": 2,
+    "COMPLEX_MUL": 15,
+    "MUL_CONST": 8,
+    "MULT_MOD_Q": 6,
+    "CHECK_BOUND": 7,
+    "COMPRESS": 8,
+    "ADD_SUB": 9,
+}
+
+FFT_STAGE_OVERHEAD = 28  # Butterfly pipeline is drained after every FFT stage
+NTT_STAGE_OVERHEAD = 8  # Twiddle ROM + mult_mod_q pipeline is drained after every NTT stage
+SPLIT_MERGE_OVERHEAD = 30  # Butterfly pipeline + twiddle address delay
+SHAKE256_RATE_COEFFICIENTS = 68  # 136 byte rate, 16 bits per coefficient candidate
+SHAKE256_ROUNDS = 24
+HASH_TO_POINT_REJECTION = 1.07  # Expected number of candidates per accepted coefficient (5*q / 2^16)
+SAMPLERZ_ATTEMPT_CYCLES = 30  # Estimate, one iteration of the rejection loop of samplerz.sv (base sample + BerExp)
+
+# Parameters (scale, offset) of latency = scale * work + offset for every module. Use calibrate() to refit them.
+# Not calibrated: pipelined modules use their done delay + 2 cycles of handshake, the others are estimates (see the header).
+COST_PARAMETERS = {
+    "COPY": (1, PIPELINED_DONE_DELAY["COPY"] + 2),
+    "HASH_TO_POINT": (1, 20),  # Estimate, offset not derived from the RTL
+    "INT_TO_DOUBLE": (1, PIPELINED_DONE_DELAY["INT_TO_DOUBLE"] + 2),
+    "FFT_IFFT": (1, 4),
+    "NTT_INTT": (1, 4),
+    "COMPLEX_MUL": (1, PIPELINED_DONE_DELAY["COMPLEX_MUL"] + 2),
+    "MUL_CONST": (1, PIPELINED_DONE_DELAY["MUL_CONST"] + 2),
+    "SPLIT": (1, SPLIT_MERGE_OVERHEAD + 2),
+    "MERGE": (1, SPLIT_MERGE_OVERHEAD + 2),
+    "MULT_MOD_Q": (1, PIPELINED_DONE_DELAY["MULT_MOD_Q"] + 2),
+    "CHECK_BOUND": (1, PIPELINED_DONE_DELAY["CHECK_BOUND"] + 2),
+    "DECOMPRESS": (1, 20),  # Estimate, offset not derived from the RTL
+    "COMPRESS": (1, PIPELINED_DONE_DELAY["COMPRESS"] + 2),
+    "ADD_SUB": (1, PIPELINED_DONE_DELAY["ADD_SUB"] + 2),
+    "SAMPLERZ": (0, 60),  # Estimate, data dependent (rejection sampling), 60 is a guess of the average
+}
+
+
+# Amount of work (in cycles, before scaling) a module has to do for the given instruction fields
+def module_work(module, fields, N):
+    element_count = 1 << fields["element_count"]
+
+    if module in PIPELINED_DONE_DELAY:
+        return element_count + 1
+
+    if module == "FFT_IFFT":
+        stages = int(math.log2(N)) - 1
+        return stages * (N // 4 + FFT_STAGE_OVERHEAD)
+
+    if module == "NTT_INTT":
+        stages = int(math.log2(N))
+        return stages * (N // 2 + NTT_STAGE_OVERHEAD)
+
+    if module in ["SPLIT", "MERGE"]:
+        return element_count // 4
+
+    if module == "HASH_TO_POINT":
+        blocks = math.ceil(N * HASH_TO_POINT_REJECTION / SHAKE256_RATE_COEFFICIENTS)
+        return blocks * (SHAKE256_ROUNDS + SHAKE256_RATE_COEFFICIENTS)
+
+    if module == "DECOMPRESS":
+        return 2 * N
+
+    if module == "SAMPLERZ":
+        return 1
+
+    raise ValueError(f"Unknown module '{module}'")
+
+
+def module_cycles(module, fields, N, parameters=None):
+    scale, offset = (parameters or COST_PARAMETERS)[module]
+    return scale * module_work(module, fields, N) + offset
+
+
+# Cycles needed to execute a single instruction (without dispatch overhead)
+def instruction_cycles(instruction, N, parameters=None):
+    fields = decode_instruction(instruction)
+    return max((module_cycles(module, fields, N, parameters) for module in instruction_modules(instruction)), default=0)
+
+
+def program_cycles(instructions, N, parameters=None):
+    return sum(instruction_cycles(instruction, N, parameters) + DISPATCH_CYCLES for instruction in instructions)
+
+
+# Cycles of a run whose SAMPLERZ instructions took samplerz_attempts iterations of the rejection loop in total (counted by
+# isa_simulator.Simulator), instead of the average SAMPLERZ latency of the parameters
+def run_cycles(instructions, N, samplerz_attempts, parameters=None):
+    parameters = dict(parameters or COST_PARAMETERS, SAMPLERZ=(0, 0))
+    return program_cycles(instructions, N, parameters) + SAMPLERZ_ATTEMPT_CYCLES * samplerz_attempts
+
+
+# Returns cycles attributed to each module. Instructions running multiple modules are attributed to the slowest one.
+def program_cycles_per_module(instructions, N, parameters=None):
+    per_module = {module: 0 for module in MODULE_NAMES}
+    for instruction in instructions:
+        fields = decode_instruction(instruction)
+        modules = instruction_modules(instruction)
+        if modules:
+            slowest = max(modules, key=lambda module: module_cycles(module, fields, N, parameters))
+            per_module[slowest] += module_cycles(slowest, fields, N, parameters)
+    return per_module
+
+
+def generate_program(algorithm, N):
+    from generate_instruction_list import InstructionGenerator
+
+    generator = InstructionGenerator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(generator, algorithm)(N)
+    return generator.instructions
+
+
+# Splits the modules_running transitions from calculate_cycles.parse_cycles_file() into (start_cycle, end_cycle) of each instruction
+def measured_instruction_intervals(changes):
+    from calculate_cycles import iter_instruction_intervals
+
+    return list(iter_instruction_intervals(changes))
+
+
+# Fits (scale, offset) of every module to the measured latencies of instructions that run only that module.
+# Returns new parameters and the measured dispatch overhead. The log has to be a run of exactly this program.
+def calibrate(instructions, changes, N):
+    intervals = measured_instruction_intervals(changes)
+    if len(intervals) != len(instructions):
+        raise ValueError(
+            f"Log contains {len(intervals)} instructions, program has {len(instructions)}: the log is not a run of this program "
+            "(different algorithm, N or generate_instruction_list.py toggles)"
+        )
+
+    samples = {module: [] for module in MODULE_NAMES}
+    for instruction, (start, end) in zip(instructions, intervals):
+        modules = instruction_modules(instruction)
+        if len(modules) == 1:
+            samples[modules[0]].append((module_work(modules[0], decode_instruction(instruction), N), end - start))
+
+    parameters = dict(COST_PARAMETERS)
+    for module, points in samples.items():
+        if not points:
+            continue
+        works = [work for work, _ in points]
+        cycles = [cycle for _, cycle in points]
+        mean_work = sum(works) / len(works)
+        mean_cycles = sum(cycles) / len(cycles)
+        variance = sum((work - mean_work) ** 2 for work in works)
+        if variance == 0:  # All samples have the same amount of work, keep the scale and fit the offset
+            scale = parameters[module][0]
+        else:
+            scale = sum((work - mean_work) * (cycle - mean_cycles) for work, cycle in points) / variance
+        parameters[module] = (scale, mean_cycles - scale * mean_work)
+
+    gaps = [next_start - end for (_, end), (next_start, _) in zip(intervals, intervals[1:])]
+    dispatch_cycles = sum(gaps) / len(gaps) if gaps else DISPATCH_CYCLES
+
+    return parameters, dispatch_cycles
+
+
+def print_predictions():
+    print("Estimated cycles, COST_PARAMETERS are not calibrated against a PRINT_CYCLES log yet")
+    print()
+    print(f"{'Algorithm':<10} {'N':<6} {'Instructions':<14} {'Cycles':<10}")
+    print("-" * 42)
+    for algorithm in ["sign", "verify"]:
+        for N in [512, 1024]:
+            instructions = generate_program(algorithm, N)
+            print(f"{algorithm:<10} {N:<6} {len(instructions):<14} {program_cycles(instructions, N):<10.0f}")
+
+    for N in [512, 1024]:
+        print()
+        print(f"Estimated sign cycles per module (N={N})")
+        per_module = program_cycles_per_module(generate_program("sign", N), N)
+        total = sum(per_module.values())
+        for module, cycles in per_module.items():
+            if cycles:
+                print(f"{module:<15} {cycles:<10.0f} {cycles / total * 100:6.2f}%")
+
+
+def print_calibration(filename, algorithm, N):
+    from calculate_cycles import parse_cycles_file
+
+    instructions = generate_program(algorithm, N)
+    changes = parse_cycles_file(filename)
+    parameters, dispatch_cycles = calibrate(instructions, changes, N)
+
+    print("COST_PARAMETERS = {")
+    for module, (scale, offset) in parameters.items():
+        print(f'    "{module}": ({scale:.4f}, {offset:.2f}),')
+    print("}")
+    print(f"DISPATCH_CYCLES = {dispatch_cycles:.2f}")
+
+    measured = changes[-1][0] // 10 - changes[0][0] // 10
+    before = program_cycles(instructions, N)
+    after = sum(instruction_cycles(instruction, N, parameters) + dispatch_cycles for instruction in instructions)
+    print(f"Measured cycles:              {measured}")
+    print(f"Predicted before calibration: {before:.0f} ({(before - measured) / measured * 100:+.2f}%)")
+    print(f"Predicted after calibration:  {after:.0f} ({(after - measured) / measured * 100:+.2f}%)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "calibrate":
+        print_calibration(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        print_predictions()
@@ -0,0 +1,231 @@
+import argparse
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import time
+
+from calculate_cycles import default_cycles_file, iter_runs
+from instruction_set import MODULE_NAMES
+
+# Cycle-count history of simulation runs and bitstreams, to catch performance regressions between revisions
+#
+# Every run of a cycle log (see calculate_cycles.py) is stored in an SQLite database together with the git revision of the
+# tree, the algorithm, N, the cycles of every module, the total time and, if given, the value main.c read from
+# CYCLE_COUNT_REG (the cycle counter of the bitstream, slv_reg2 of axi_wrapper.sv). The cycle count is taken from the UART
+# output of main.c ("Cycle count: <value>" lines, one per run) or given on the command line.
+#
+# diff compares two runs (by id) or two revisions (by a prefix of the git hash, runs of the same algorithm and N are
+# averaged) and flags every module, the total time and the cycle count that got slower by more than the threshold.
+# It exits with status 1 if there is a regression, so it can be used in scripts.
+#
+# Usage:
+#   python cycle_history.py add [log ...] --algorithm <sign|verify> --N <N> [--uart <file>] [--cycle-count <value> ...]
+#   python cycle_history.py list [--algorithm <algorithm>] [--N <N>]
+#   python cycle_history.py diff <run or revision> <run or revision> [--threshold <percent>]
+#   The database is $CYCLE_HISTORY_DB or cycle_history.sqlite next to this script, --db overrides both
+
+DEFAULT_DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cycle_history.sqlite")
+TOTAL = "Total time"
+CYCLE_COUNT = "CYCLE_COUNT_REG"
+UART_PATTERN = re.compile(r"Cycle count: (\d+)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL,
+    revision TEXT,
+    dirty INTEGER,
+    algorithm TEXT,
+    N INTEGER,
+    log TEXT,
+    log_run INTEGER,
+    total INTEGER,
+    cycle_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS module_cycles (
+    run INTEGER REFERENCES runs(id),
+    module TEXT,
+    cycles INTEGER,
+    PRIMARY KEY (run, module)
+);
+"""
+
+
+def default_database():
+    return os.environ.get("CYCLE_HISTORY_DB", DEFAULT_DATABASE)
+
+
+def connect(filename):
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+# (revision, dirty) of the git tree this script is in, ("unknown", False) outside of git
+def git_revision():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    try:
+        revision = subprocess.run(["git", "rev-parse", "HEAD"], cwd=directory, capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=directory, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return revision, bool(status.strip())
+
+
+# Cycle counts printed by main.c, in the order of the runs
+def read_uart_cycle_counts(filename):
+    with open(filename, errors="replace") as f:
+        return [int(value) for value in UART_PATTERN.findall(f.read())]
+
+
+def add_run(connection, revision, dirty, algorithm, N, log, log_run, counter, cycle_count):
+    cursor = connection.execute(
+        "INSERT INTO runs (created, revision, dirty, algorithm, N, log, log_run, total, cycle_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (time.time(), revision, int(dirty), algorithm, N, os.path.abspath(log), log_run, counter.total_time(), cycle_count),
+    )
+    connection.executemany(
+        "INSERT INTO module_cycles (run, module, cycles) VALUES (?, ?, ?)", [(cursor.lastrowid, module, cycles) for module, cycles in counter.module_cycles.items()]
+    )
+    return cursor.lastrowid
+
+
+# Adds every run of the logs, cycle_counts are assigned to the runs in order. Returns the ids of the new runs.
+def add_logs(connection, logs, algorithm, N, cycle_counts=()):
+    revision, dirty = git_revision()
+    cycle_counts = list(cycle_counts)
+    ids = []
+    with connection:
+        for log in logs:
+            for log_run, analyzers in iter_runs(log):
+                cycle_count = cycle_counts[len(ids)] if len(ids) < len(cycle_counts) else None
+                ids.append(add_run(connection, revision, dirty, algorithm, N, log, log_run, analyzers["cycles"], cycle_count))
+    return ids
+
+
+# {module: cycles} of a run, with the total time and the cycle count as extra entries
+def run_cycles(connection, run):
+    cycles = dict(connection.execute("SELECT module, cycles FROM module_cycles WHERE run = ?", (run,)))
+    total, cycle_count = connection.execute("SELECT total, cycle_count FROM runs WHERE id = ?", (run,)).fetchone()
+    cycles[TOTAL] = total
+    if cycle_count is not None:
+        cycles[CYCLE_COUNT] = cycle_count
+    return cycles
+
+
+# Averages {module: cycles} over runs, entries missing in some runs (cycle count) are averaged over the runs that have them
+def average_cycles(runs):
+    sums, counts = {}, {}
+    for cycles in runs:
+        for module, value in cycles.items():
+            sums[module] = sums.get(module, 0) + value
+            counts[module] = counts.get(module, 0) + 1
+    return {module: sums[module] / counts[module] for module in sums}
+
+
+# Resolves a run id or a revision prefix to {(algorithm, N): [run ids]}
+def resolve(connection, reference):
+    if reference.isdigit():
+        row = connection.execute("SELECT algorithm, N FROM runs WHERE id = ?", (int(reference),)).fetchone()
+        if row:
+            return {tuple(row): [int(reference)]}
+    rows = connection.execute("SELECT id, algorithm, N, revision FROM runs WHERE revision LIKE ? ORDER BY id", (reference + "%",)).fetchall()
+    if len({revision for _, _, _, revision in rows}) > 1:
+        raise ValueError(f"Revision {reference} is ambiguous")
+    if not rows:
+        raise ValueError(f"No run or revision {reference} in the database")
+    groups = {}
+    for run, algorithm, N, _ in rows:
+        groups.setdefault((algorithm, N), []).append(run)
+    return groups
+
+
+# Returns [(algorithm, N, module, old, new, change in %, regression)] for the (algorithm, N) present in both references
+def compare(connection, old_reference, new_reference, threshold):
+    old_groups = resolve(connection, old_reference)
+    new_groups = resolve(connection, new_reference)
+    rows = []
+    for key in sorted(old_groups.keys() & new_groups.keys()):
+        old = average_cycles(run_cycles(connection, run) for run in old_groups[key])
+        new = average_cycles(run_cycles(connection, run) for run in new_groups[key])
+        for module in MODULE_NAMES + [TOTAL, CYCLE_COUNT]:
+            if module not in old or module not in new or (old[module] == 0 and new[module] == 0):
+                continue
+            change = (new[module] - old[module]) / old[module] * 100 if old[module] else float("inf")
+            rows.append((*key, module, old[module], new[module], change, change > threshold))
+    return rows
+
+
+def print_runs(connection, algorithm=None, N=None):
+    query = "SELECT id, created, revision, dirty, algorithm, N, total, cycle_count, log, log_run FROM runs WHERE 1"
+    parameters = []
+    if algorithm:
+        query += " AND algorithm = ?"
+        parameters.append(algorithm)
+    if N:
+        query += " AND N = ?"
+        parameters.append(N)
+    print(f"{'Id':<6} {'Date':<20} {'Revision':<13} {'Algorithm':<10} {'N':<6} {'Total time':<12} {'Cycle count':<12} {'Log'}")
+    for run, created, revision, dirty, algorithm, N, total, cycle_count, log, log_run in connection.execute(query + " ORDER BY id", parameters):
+        date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        revision = revision[:10] + ("+" if dirty else "")
+        cycle_count = "" if cycle_count is None else cycle_count
+        print(f"{run:<6} {date:<20} {revision:<13} {algorithm:<10} {N:<6} {total:<12} {cycle_count:<12} {log}, run {log_run + 1}")
+
+
+def print_comparison(rows, threshold):
+    print(f"{'Algorithm':<10} {'N':<6} {'Module':<28} {'Old':>12} {'New':>12} {'Change':>9}")
+    for algorithm, N, module, old, new, change, regression in rows:
+        flag = "  REGRESSION" if regression else ""
+        print(f"{algorithm:<10} {N:<6} {module:<28} {old:>12.0f} {new:>12.0f} {change:>+8.2f}%{flag}")
+    regressions = sum(1 for row in rows if row[-1])
+    print(f"{regressions} regression(s) above {threshold}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store cycle counts of runs and compare runs or revisions")
+    parser.add_argument("--db", default=default_database(), help="SQLite database (default: $CYCLE_HISTORY_DB or cycle_history.sqlite)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="store every run of cycle logs")
+    add.add_argument("logs", nargs="*", help="cycle logs (default: $CYCLES_OUTPUT_FILE or CYCLES_OUTPUT_FILE of common_definitions.vh)")
+    add.add_argument("--algorithm", required=True, choices=["sign", "verify"])
+    add.add_argument("--N", type=int, required=True)
+    add.add_argument("--uart", help="UART output of main.c to read the CYCLE_COUNT_REG values from")
+    add.add_argument("--cycle-count", type=int, nargs="+", default=[], help="CYCLE_COUNT_REG values of the runs, in order")
+
+    listing = commands.add_parser("list", help="list stored runs")
+    listing.add_argument("--algorithm")
+    listing.add_argument("--N", type=int)
+
+    diff = commands.add_parser("diff", help="compare two runs or revisions")
+    diff.add_argument("old", help="run id or git revision (prefix)")
+    diff.add_argument("new", help="run id or git revision (prefix)")
+    diff.add_argument("--threshold", type=float, default=1.0, help="flag modules that are slower by more than this many percent")
+
+    args = parser.parse_args()
+    connection = connect(args.db)
+
+    if args.command == "add":
+        cycle_counts = args.cycle_count + (read_uart_cycle_counts(args.uart) if args.uart else [])
+        ids = add_logs(connection, args.logs or [default_cycles_file()], args.algorithm, args.N, cycle_counts)
+        print(f"Added {len(ids)} run(s): {', '.join(map(str, ids))}" if ids else "No state changes found in the logs!")
+
+    elif args.command == "list":
+        print_runs(connection, args.algorithm, args.N)
+
+    elif args.command == "diff":
+        try:
+            rows = compare(connection, args.old, args.new, args.threshold)
+        except ValueError as error:
+            sys.exit(str(error))
+        if not rows:
+            sys.exit(f"{args.old} and {args.new} have no runs of the same algorithm and N")
+        print_comparison(rows, args.threshold)
+        if any(row[-1] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
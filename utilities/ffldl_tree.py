@@ -0,0 +1,239 @@
+# Computes the Falcon LDL tree (tree_values() of generate_tree.py) from a secret key
+#
+# Same computation as expand_privkey() of the reference C implementation: FFT of f, g, F, G, basis B = [[g, -f], [G, -F]],
+# Gram matrix G = B * adj(B), ffLDL_fft() and ffLDL_binary_normalize() (leaves become sqrt(leaf) / sigma). Every
+# floating-point operation is done in the same order as in the C code and NumPy float64 arithmetic is IEEE-754 without
+# FMA, so the tree is bit-exact with the tree the C implementation computes before ffSampling_fft. The trees of
+# generate_tree.py (data/tree_values_<N>.npy, the tree of constants_<N>.h) were dumped with 15 decimals, dumped_tree_values() rounds the same way
+# and reproduces them bit for bit.
+#
+# Polynomials in FFT form use the layout of the C code: N/2 real parts followed by N/2 imaginary parts. All functions work on
+# batches (shape (batch, N)), every level of the tree is computed for all subtrees of that level at once.
+#
+# Usage: python ffldl_tree.py [N]   ... compute the tree from the key of constants_<N>.h and compare with the tree of
+#                                       constants_<N>.h and data/tree_values_<N>.npy
+
+import math
+import sys
+
+import numpy as np
+
+MAX_N = 1024
+# fpr_inv_sigma of the reference C implementation, 1 / sigma for logn = 9 and 10
+INV_SIGMA = {512: 0.0060336696681577241031668062510953022, 1024: 0.0059386453095331159950250124336477482}
+
+GM_TABLE = []
+
+
+# fpr_gm_tab of the reference C implementation as an array of shape (MAX_N, 2), from the FFT twiddle factor ROM generator
+def gm_table():
+    if not GM_TABLE:
+        from generate_fft_twiddle_factors import rom_table
+
+        GM_TABLE.append(np.array(rom_table(MAX_N), dtype=np.float64))
+    return GM_TABLE[0]
+
+
+def treesize(n):
+    logn = int(math.log2(n))
+    return (logn + 1) << logn
+
+
+def as_batch(polynomials):
+    return np.array(polynomials, dtype=np.float64, ndmin=2)
+
+
+# FPC_MUL of the C code
+def complex_mul(a_re, a_im, b_re, b_im):
+    return a_re * b_re - a_im * b_im, a_re * b_im + a_im * b_re
+
+
+# FPC_DIV of the C code (multiplication with the inverse of b)
+def complex_div(a_re, a_im, b_re, b_im):
+    m = 1.0 / (b_re * b_re + b_im * b_im)
+    return complex_mul(a_re, a_im, b_re * m, -b_im * m)
+
+
+# Zf(FFT): polynomials with real coefficients to FFT form
+def fft(polynomials):
+    f = as_batch(polynomials)
+    batch, n = f.shape
+    hn = n >> 1
+    re, im = f[:, :hn], f[:, hn:]
+    t, m = hn, 2
+    while m < n:
+        ht, hm = t >> 1, m >> 1
+        s = gm_table()[m : m + hm]
+        x_re, y_re = re.reshape(batch, hm, 2, ht)[:, :, 0], re.reshape(batch, hm, 2, ht)[:, :, 1]
+        x_im, y_im = im.reshape(batch, hm, 2, ht)[:, :, 0], im.reshape(batch, hm, 2, ht)[:, :, 1]
+        y_re, y_im = complex_mul(y_re, y_im, s[:, 0, None], s[:, 1, None])
+        re = np.stack([x_re + y_re, x_re - y_re], axis=2).reshape(batch, hn)
+        im = np.stack([x_im + y_im, x_im - y_im], axis=2).reshape(batch, hn)
+        t, m = ht, m << 1
+    return np.concatenate([re, im], axis=1)
+
+
+# Zf(iFFT): FFT form back to polynomials
+def ifft(polynomials):
+    f = as_batch(polynomials)
+    batch, n = f.shape
+    hn = n >> 1
+    re, im = f[:, :hn], f[:, hn:]
+    t, m = 1, n
+    while m > 2:
+        hm, dt = m >> 1, t << 1
+        s = gm_table()[hm : hm + hn // dt]
+        x_re, y_re = re.reshape(batch, -1, 2, t)[:, :, 0], re.reshape(batch, -1, 2, t)[:, :, 1]
+        x_im, y_im = im.reshape(batch, -1, 2, t)[:, :, 0], im.reshape(batch, -1, 2, t)[:, :, 1]
+        d_re, d_im = complex_mul(x_re - y_re, x_im - y_im, s[:, 0, None], -s[:, 1, None])
+        re = np.stack([x_re + y_re, d_re], axis=2).reshape(batch, hn)
+        im = np.stack([x_im + y_im, d_im], axis=2).reshape(batch, hn)
+        t, m = dt, hm
+    return np.concatenate([re, im], axis=1) * (2.0 / n) if n > 1 else f
+
+
+# poly_mulselfadj_fft: a * adj(a), imaginary parts are 0
+def mul_self_adj(a):
+    hn = a.shape[1] >> 1
+    return np.concatenate([a[:, :hn] * a[:, :hn] + a[:, hn:] * a[:, hn:], np.zeros_like(a[:, hn:])], axis=1)
+
+
+# poly_muladj_fft: a * adj(b)
+def mul_adj(a, b):
+    hn = a.shape[1] >> 1
+    return np.concatenate(complex_mul(a[:, :hn], a[:, hn:], b[:, :hn], -b[:, hn:]), axis=1)
+
+
+# Gram matrix (g00, g01, g11) of the basis [[b00, b01], [b10, b11]]
+def gram(b00, b01, b10, b11):
+    g00 = mul_self_adj(b00) + mul_self_adj(b01)
+    g01 = mul_adj(b00, b10) + mul_adj(b01, b11)
+    g11 = mul_self_adj(b10) + mul_self_adj(b11)
+    return g00, g01, g11
+
+
+# poly_LDLmv_fft: returns (d11, l10) of the LDL decomposition of [[g00, g01], [adj(g01), g11]]
+def ldl(g00, g01, g11):
+    hn = g00.shape[1] >> 1
+    g00_re, g00_im = g00[:, :hn], g00[:, hn:]
+    g01_re, g01_im = g01[:, :hn], g01[:, hn:]
+    mu_re, mu_im = complex_div(g01_re, g01_im, g00_re, g00_im)
+    product_re, product_im = complex_mul(mu_re, mu_im, g01_re, -g01_im)
+    d11 = np.concatenate([g11[:, :hn] - product_re, g11[:, hn:] - product_im], axis=1)
+    l10 = np.concatenate([mu_re, -mu_im], axis=1)
+    return d11, l10
+
+
+# poly_split_fft: f(x) = f0(x^2) + x f1(x^2), returns (f0, f1)
+def split(f):
+    batch, n = f.shape
+    hn, qn = n >> 1, n >> 2
+    if qn == 0:
+        return f[:, :1], f[:, hn:]
+    a_re, b_re = f[:, 0:hn:2], f[:, 1:hn:2]
+    a_im, b_im = f[:, hn::2], f[:, hn + 1 :: 2]
+    s = gm_table()[hn : hn + qn]
+    t_re, t_im = complex_mul(a_re - b_re, a_im - b_im, s[:, 0], -s[:, 1])
+    f0 = np.concatenate([(a_re + b_re) * 0.5, (a_im + b_im) * 0.5], axis=1)
+    f1 = np.concatenate([t_re * 0.5, t_im * 0.5], axis=1)
+    return f0, f1
+
+
+# ffLDL_fft: tree of the Gram matrix, shape (batch, treesize(N)). The subtrees of d00 and d11 of all nodes of a level are
+# computed as one batch: rows [0, batch) are the d00 subtrees, rows [batch, 2 * batch) the d11 subtrees.
+def ffldl(g00, g01, g11):
+    batch, n = g00.shape
+    if n == 1:
+        return g00
+    d11, l10 = ldl(g00, g01, g11)
+    d00_0, d00_1 = split(g00)
+    d11_0, d11_1 = split(d11)
+    g0 = np.concatenate([d00_0, d11_0])
+    g1 = np.concatenate([d00_1, d11_1])
+    subtrees = ffldl(g0, g1, g0)
+    return np.concatenate([l10, subtrees[:batch], subtrees[batch:]], axis=1)
+
+
+# Indices of the leaves in a tree of size N
+def leaf_indices(n):
+    if n == 1:
+        return [0]
+    left = leaf_indices(n // 2)
+    return [n + i for i in left] + [n + treesize(n // 2) + i for i in left]
+
+
+# ffLDL_binary_normalize: leaves become sqrt(leaf) / sigma
+def normalize(tree, N):
+    tree = tree.copy()
+    leaves = leaf_indices(N)
+    tree[:, leaves] = np.sqrt(tree[:, leaves]) * INV_SIGMA[N]
+    return tree
+
+
+# Trees from the basis in FFT form (b00 = FFT(g), b01 = -FFT(f), b10 = FFT(G), b11 = -FFT(F), like in constants_<N>.h)
+def tree_from_basis(b00, b01, b10, b11):
+    basis = [as_batch(b) for b in [b00, b01, b10, b11]]
+    N = basis[0].shape[1]
+    return normalize(ffldl(*gram(*basis)), N)
+
+
+# Trees from secret keys f, g, F, G (integer polynomials, shape (N,) or (batch, N))
+def tree_from_key(f, g, F, G):
+    return tree_from_basis(fft(g), -fft(f), fft(G), -fft(F))
+
+
+# tree_values of a single key as a list, like generate_tree.py expects
+def tree_values(f, g, F, G):
+    return tree_from_key(f, g, F, G)[0].tolist()
+
+
+# Tree values printed with 15 decimals and read back, like the trees dumped from the C implementation
+def dumped_tree_values(tree):
+    return [float(f"{value:.15f}") for value in tree]
+
+
+# Basis (b00, b01, b10, b11) of constants_<N>.h in FFT form. The header stores a BRAM row (real, imaginary part) per
+# complex value, i.e. real and imaginary parts interleaved.
+def read_basis(N):
+    from isa_simulator import read_host_constants
+
+    constants = read_host_constants(N)
+    rows = [np.array(constants[name], dtype=np.uint64).view(np.float64).reshape(-1, 2) for name in ["b00", "b01", "b10", "b11"]]
+    return [np.concatenate([row[:, 0], row[:, 1]]) for row in rows]
+
+
+if __name__ == "__main__":
+    import time
+
+    from generate_tree import generate_rows, order_for_FPGA
+    from generate_tree import tree_values as stored_tree_values
+    from isa_simulator import read_host_constants
+
+    for N in [int(sys.argv[1])] if len(sys.argv) > 1 else [512, 1024]:
+        basis = read_basis(N)
+        key = [np.rint(ifft(b)[0]).astype(np.int64) for b in basis]  # g, -f, G, -F
+        g, f, G, F = key[0], -key[1], key[2], -key[3]
+        fft_exact = all(np.array_equal(fft(p)[0].view(np.uint64), b.view(np.uint64)) for p, b in zip([g, -f, G, -F], basis))
+
+        start = time.perf_counter()
+        tree = tree_from_key(f, g, F, G)[0]
+        elapsed = time.perf_counter() - start
+
+        # The tree of constants_<N>.h is in the FPGA order of generate_tree.py
+        dumped = np.array(dumped_tree_values(tree))
+        header_tree = np.array(read_host_constants(N)["tree"], dtype=np.uint64)
+        header_equal = np.array_equal(generate_rows(order_for_FPGA(dumped, N)).reshape(-1), header_tree)
+        stored_equal = np.array_equal(dumped.view(np.uint64), stored_tree_values(N).view(np.uint64))
+        error = np.max(np.abs(tree - dumped))
+
+        batch = 64
+        start = time.perf_counter()
+        tree_from_key(*[np.repeat(p[None], batch, axis=0) for p in [f, g, F, G]])
+        batch_elapsed = time.perf_counter() - start
+
+        print(f"N={N}")
+        print(f"  FFT of the key equals b00..b11 of constants_{N}.h:     {fft_exact}")
+        print(f"  Dumped tree equals data/tree_values_{N}.npy:           {stored_equal}")
+        print(f"  Dumped tree equals the tree of constants_{N}.h:        {header_equal}")
+        print(f"  Largest difference of the exact and the dumped tree:   {error:.1e}")
+        print(f"  {elapsed * 1000:.1f} ms per key, {batch_elapsed / batch * 1000:.2f} ms per key in batches of {batch}")
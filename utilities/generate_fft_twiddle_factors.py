@@ -0,0 +1,140 @@
+# Generates the FFT twiddle factor ROM (coefficients/fft_twiddle_factors.mem, rom_memory of fft_twiddle_factor_rom.sv)
+#
+# Row k of the ROM is {real, imag} of exp(i*pi*bitreverse(k)/N) as IEEE-754 doubles (fpr_gm_tab of the reference C
+# implementation), row 0 is unused and 0. Values are correctly rounded: cos and sin are computed with Decimal arithmetic to 60
+# digits and converted to the nearest double, so the output doesn't depend on the libm of the machine.
+#
+# Octant-compressed layout: all angles are pi*j/N with 0 <= j < N, so the ROM only needs {cos, sin} of the N/4 + 1 angles in
+# [0, pi/4] (1/8 of the unit circle, N/4 + 1 rows instead of N). Row k is reconstructed from j = bitreverse(k) with
+#   j <= N/4:          { c[j],         s[j]       }
+#   N/4 < j < N/2:     { s[N/2 - j],   c[N/2 - j] }
+#   N/2 <= j <= 3N/4:  {-s[j - N/2],   c[j - N/2] }
+#   3N/4 < j < N:      {-c[N - j],     s[N - j]   }
+# which only swaps halves and flips sign bits. j = N/2 gives {-0.0, 1.0} like the reference table.
+#
+# Usage:
+#   python generate_fft_twiddle_factors.py                     ... check the generator and the compressed layout for N = 8..1024
+#   python generate_fft_twiddle_factors.py mem <N> <file>      ... write the ROM in the format of fft_twiddle_factors.mem
+#   python generate_fft_twiddle_factors.py sv <N>              ... print the rom_memory initializer of fft_twiddle_factor_rom.sv
+#   python generate_fft_twiddle_factors.py octant <N> <file>   ... write the octant-compressed ROM (.mem format)
+
+import math
+import os
+import struct
+import sys
+from decimal import Decimal, localcontext
+
+PRECISION = 60
+PI = Decimal("3.14159265358979323846264338327950288419716939937510582097494459230781640628620899863")
+
+SOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ip", "falcon_ip.srcs", "sources_1")
+MEM_FILE = os.path.join(SOURCES_DIR, "coefficients", "fft_twiddle_factors.mem")
+ROM_FILE = os.path.join(SOURCES_DIR, "fft", "fft_twiddle_factor_rom.sv")
+
+
+def bit_reverse(value, bits):
+    return int(format(value, f"0{bits}b")[::-1], 2) if bits else 0
+
+
+def double_to_hex(value):
+    return struct.pack(">d", value).hex()
+
+
+# Correctly rounded (cos, sin) of pi*j/N (Taylor series, converge quickly for angles up to pi)
+def decimal_cos_sin(j, N):
+    with localcontext() as context:
+        context.prec = PRECISION
+        x = PI * j / N
+        cos, sin = Decimal(0), Decimal(0)
+        term = Decimal(1)  # x^n / n!
+        n = 0
+        while abs(term) > Decimal(10) ** -PRECISION:
+            if n % 2 == 0:
+                cos += term if n % 4 == 0 else -term
+            else:
+                sin += term if n % 4 == 1 else -term
+            n += 1
+            term = term * x / n
+        return float(cos), float(sin)
+
+
+# Octant-compressed ROM: (cos, sin) of pi*j/N for j = 0..N/4
+def octant_table(N):
+    return [decimal_cos_sin(j, N) for j in range(N // 4 + 1)]
+
+
+# Row k of the ROM from the octant table
+def reconstruct(octant, k, N):
+    if k == 0:
+        return 0.0, 0.0
+    j = bit_reverse(k, int(math.log2(N)))
+    if j <= N // 4:
+        c, s = octant[j]
+        return c, s
+    if j < N // 2:
+        c, s = octant[N // 2 - j]
+        return s, c
+    if j <= 3 * N // 4:
+        c, s = octant[j - N // 2]
+        return -s, c
+    c, s = octant[N - j]
+    return -c, s
+
+
+def rom_table(N):
+    octant = octant_table(N)
+    return [reconstruct(octant, k, N) for k in range(N)]
+
+
+# Reference model without symmetries: every row from its own angle in (0, pi) (exact values where cos or sin is 0 or 1)
+def reference_row(k, N):
+    if k == 0:
+        return 0.0, 0.0
+    j = bit_reverse(k, int(math.log2(N)))
+    if j == 0:
+        return 1.0, 0.0
+    if 2 * j == N:
+        return -0.0, 1.0
+    return decimal_cos_sin(j, N)
+
+
+# Proves that the octant-compressed ROM gives the same bits as the reference model at every address
+def compressed_equals_reference(N):
+    octant = octant_table(N)
+    return all(
+        double_to_hex(a) == double_to_hex(b) for k in range(N) for a, b in zip(reconstruct(octant, k, N), reference_row(k, N))
+    )
+
+
+def mem_content(rows):
+    return "".join(double_to_hex(re) + double_to_hex(im) + "\n" for re, im in rows)
+
+
+def sv_initializer(rows):
+    return "{" + ", ".join(f"{{$realtobits({re!r}), $realtobits({im!r})}}" for re, im in rows) + "}"
+
+
+def write_file(filename, content):
+    with open(filename, "w") as f:
+        f.write(content)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "mem":
+        write_file(sys.argv[3], mem_content(rom_table(int(sys.argv[2]))))
+
+    elif len(sys.argv) > 1 and sys.argv[1] == "sv":
+        print(sv_initializer(rom_table(int(sys.argv[2]))))
+
+    elif len(sys.argv) > 1 and sys.argv[1] == "octant":
+        write_file(sys.argv[3], mem_content(octant_table(int(sys.argv[2]))))
+
+    else:
+        with open(MEM_FILE) as f:
+            print(f"Generated ROM equals fft_twiddle_factors.mem: {mem_content(rom_table(1024)) == f.read()}")
+        with open(ROM_FILE) as f:
+            print(f"Generated initializer equals fft_twiddle_factor_rom.sv: {sv_initializer(rom_table(1024)) in f.read()}")
+        print(f"{'N':<6} {'ROM rows':<10} {'Octant rows':<12} {'Saved bits':<12} {'Compressed == reference'}")
+        for N in [8, 16, 64, 512, 1024]:
+            rows = N // 4 + 1
+            print(f"{N:<6} {N:<10} {rows:<12} {(N - rows) * 128:<12} {compressed_equals_reference(N)}")
@@ -1,7 +1,13 @@
+import json
 import math
 
+from copy_elimination import eliminate_copies
+from instruction_set import encode_instruction
+
 debug_prints = False
 tree_index_print = False
+remove_copies = False  # Remove COPY instructions of the sign program whose data can stay in the source rows (copy_elimination.py)
+write_sidecar = False  # Write <algorithm>_<N>_program.json with the generator source of every instruction (for calculate_cycles.py)
 
 
 def dprint(*args, **kwargs):
@@ -11,14 +17,10 @@ def dprint(*args, **kwargs):
 
 class InstructionGenerator:
 
-    def pack_instruction(self, fields):
-        instruction = 0
-        for name, width, value in fields:
-            instruction = (instruction << width) | (value & ((1 << width) - 1))
-        return instruction
-
     def add_instruction(
         self,
+        step,
+        n=None,
         modules=0,
         bank1=0,
         bank2=0,
@@ -35,24 +37,28 @@ class InstructionGenerator:
         mul_const_constant=0,
         input_output_addr_same=0,
     ):
-        fields = [
-            ("modules", 16, modules),
-            ("input_output_addr_same", 1, input_output_addr_same),
-            ("mul_const_constant", 1, mul_const_constant),
-            ("element_count", 4, element_count),
-            ("mode2", 1, mode2),
-            ("mode1", 1, mode1),
-            ("addr2", 13, addr2),
-            ("addr1", 13, addr1),
-            ("bank7", 3, bank7),
-            ("bank6", 3, bank6),
-            ("bank5", 3, bank5),
-            ("bank4", 3, bank4),
-            ("bank3", 3, bank3),
-            ("bank2", 3, bank2),
-            ("bank1", 3, bank1),
-        ]
-        self.instructions.append(self.pack_instruction(fields))
+        # Source of the instruction: step of the generator and ffsampling size n (None outside of ffsampling)
+        self.instruction_sources.append({"step": step, "n": n})
+
+        self.instructions.append(
+            encode_instruction(
+                modules=modules,
+                bank1=bank1,
+                bank2=bank2,
+                bank3=bank3,
+                bank4=bank4,
+                bank5=bank5,
+                bank6=bank6,
+                bank7=bank7,
+                addr1=addr1,
+                addr2=addr2,
+                mode1=mode1,
+                mode2=mode2,
+                element_count=element_count,
+                mul_const_constant=mul_const_constant,
+                input_output_addr_same=input_output_addr_same,
+            )
+        )
 
     def sel_module(
         self,
@@ -108,13 +114,25 @@ class InstructionGenerator:
         print(",\n".join(formatted_instructions))
         print("};")
 
+    # Writes the program sidecar: every instruction word with the generator source that emitted it
+    def write_program_sidecar(self, algorithm, N, filename=None):
+        program = {
+            "algorithm": algorithm,
+            "N": N,
+            "instructions": [{"instruction": f"{instruction:018x}", "source": source} for instruction, source in zip(self.instructions, self.instruction_sources)],
+        }
+        with open(filename or f"{algorithm}_{N}_program.json", "w") as f:
+            json.dump(program, f)
+
     def verify(self, N):
         self.instructions = []
+        self.instruction_sources = []  # Generator sources of every instruction, see write_program_sidecar()
         log2N = int(math.log2(N))
 
         # timestep 1: NTT, DECOMPRESS, HASH_TO_POINT
         dprint("NTT DECOMPRESS HASH_TO_POINT")
         self.add_instruction(
+            step="NTT DECOMPRESS HASH_TO_POINT",
             modules=self.sel_module(NTT_INTT=1, DECOMPRESS=1, HASH_TO_POINT=1),
             mode1=0,  # NTT mode1: NTT
             bank1=0,  # NTT bank1
@@ -129,6 +147,7 @@ class InstructionGenerator:
         # timestep 2: NTT
         dprint("NTT")
         self.add_instruction(
+            step="NTT",
             modules=self.sel_module(NTT_INTT=1),
             mode1=0,  # NTT mode1: NTT
             bank1=4,  # NTT bank1
@@ -140,6 +159,7 @@ class InstructionGenerator:
         mult_mod_q_ntt_input1 = 1 if N == 512 else 4
         mult_mod_q_ntt_input2 = 2 if N == 512 else 0
         self.add_instruction(
+            step="MULT_MOD_Q",
             modules=self.sel_module(MULT_MOD_Q=1),
             bank1=mult_mod_q_ntt_input1,  # MULT_MOD_Q input 1
             bank2=mult_mod_q_ntt_input2,  # MULT_MOD_Q input 2
@@ -150,6 +170,7 @@ class InstructionGenerator:
         # timestep 4: INTT
         dprint("INTT")
         self.add_instruction(
+            step="INTT",
             modules=self.sel_module(NTT_INTT=1),
             mode1=1,  # NTT mode1: INTT
             bank1=6,  # NTT bank1
@@ -160,6 +181,7 @@ class InstructionGenerator:
         CHECK_BOUND_intt_input = 4 if N == 512 else 6
         dprint("CHECK_BOUND")
         self.add_instruction(
+            step="CHECK_BOUND",
             modules=self.sel_module(CHECK_BOUND=1),
             bank1=5,  # CHECK_BOUND input 1
             bank2=CHECK_BOUND_intt_input,  # CHECK_BOUND input 2
@@ -169,6 +191,9 @@ class InstructionGenerator:
 
         self.print_verilog(algorithm="verify")
 
+        if write_sidecar:
+            self.write_program_sidecar("verify", N)
+
     def ffsampling(self, N, n, curr_bram, next_free_addr, t0, t1, tree):
 
         tree_bram = 6
@@ -182,6 +207,16 @@ class InstructionGenerator:
 
         tmp = next_free_addr[next_bram]  # Located in next_bram (future z0 and z1)
 
+        # Instructions emitted by this call form a subtree of the program, see compress_program.py
+        subtree = {
+            "n": n,
+            "curr_bram": curr_bram,
+            "next_free_addr": list(next_free_addr),
+            "t0": t0,
+            "tree": tree,
+            "start": len(self.instructions),
+        }
+
         next_free_addr[curr_bram] += n
 
         if n == 1:
@@ -191,6 +226,8 @@ class InstructionGenerator:
                 f"n={n},\tsamplerz\tin_bram={prev_bram},\tin_addr={t0}\ttree_bram={tree_bram},\ttree_addr={tree//2},{'high' if tree % 2 == 0 else 'low'},\tout_bram={curr_bram},\tout_addr={z0}"
             )
             self.add_instruction(
+                step="samplerz",
+                n=n,
                 modules=self.sel_module(SAMPLERZ=1),
                 mode1=1 if self.first_samplerz_call else 0,
                 mode2=1 if tree % 2 == 1 else 0,
@@ -203,6 +240,8 @@ class InstructionGenerator:
             )
             self.first_samplerz_call = False
             self.samplerz_tree_addrs.append(tree)
+            subtree["end"] = len(self.instructions)
+            self.subtrees.append(subtree)
             return
 
         tree0 = tree + n
@@ -211,6 +250,8 @@ class InstructionGenerator:
         if n > 2:
             dprint(f"n={n},\tsplit_fft1 \tin_bram={prev_bram},\tin_addr={t1},\tout_bram={curr_bram},\tout_addr={z1}\tsm_size={element_count_log2}")
             self.add_instruction(
+                step="split_fft1",
+                n=n,
                 modules=self.sel_module(SPLIT=1),
                 bank1=prev_bram,  # Input
                 addr1=t1,
@@ -222,6 +263,8 @@ class InstructionGenerator:
         else:  # Replace last split with a copy
             dprint(f"n={n},\tcopy_split1 \tin_bram={prev_bram},\tin_addr={t1},\tout_bram={curr_bram},\tout_addr={z1}")
             self.add_instruction(
+                step="copy_split1",
+                n=n,
                 modules=self.sel_module(COPY=1),
                 bank3=prev_bram,  # Input
                 addr1=t1,
@@ -243,6 +286,8 @@ class InstructionGenerator:
         if n > 2:
             dprint(f"n={n},\tmerge_fft1 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z1}\tsm_size={element_count_log2}")
             self.add_instruction(
+                step="merge_fft1",
+                n=n,
                 modules=self.sel_module(MERGE=1),
                 bank1=next_bram,  # Input
                 addr1=tmp,
@@ -253,6 +298,8 @@ class InstructionGenerator:
         else:  # Replace first merge with a copy
             dprint(f"n={n},\tcopy_merge1 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z1}")
             self.add_instruction(
+                step="copy_merge1",
+                n=n,
                 modules=self.sel_module(COPY=1),
                 bank3=next_bram,  # Input
                 addr1=tmp,
@@ -263,6 +310,8 @@ class InstructionGenerator:
 
         dprint(f"n={n},\tcopy_t1\tin_bram={prev_bram}\tin_addr={t1}\tout_bram={next_bram}\tout_addr={tmp}")
         self.add_instruction(
+            step="copy_t1",
+            n=n,
             modules=self.sel_module(COPY=1),
             bank3=prev_bram,  # Input
             addr1=t1,
@@ -273,6 +322,8 @@ class InstructionGenerator:
 
         dprint(f"n={n},\tsub_z1\tin_bram={curr_bram}\tin_addr={z1}\tout_bram={next_bram}\tout_addr={tmp}")
         self.add_instruction(
+            step="sub_z1",
+            n=n,
             modules=self.sel_module(ADD_SUB=1),
             mode2=1,  # Subtract mode1
             bank3=curr_bram,  # Input1
@@ -285,6 +336,8 @@ class InstructionGenerator:
         # tree // 2 here because "tree" refers to the address in original array (1 element per row), but our BRAM has 2 per row
         dprint(f"n={n},\tmul_tree\tin_bram={tree_bram}\tin_addr={tree//2}\tout_bram={next_bram}\tout_addr={tmp}")
         self.add_instruction(
+            step="mul_tree",
+            n=n,
             modules=self.sel_module(COMPLEX_MUL=1),
             bank1=next_bram,  # Input1, output
             addr1=tmp,
@@ -298,6 +351,8 @@ class InstructionGenerator:
         t0_bram = prev_bram if n < N else (4 if N == 512 else 5)  # On top level of recursion this BRAM is different
         dprint(f"n={n},\tadd_t0\tin_bram={t0_bram}\tin_addr={t0}\tout_bram={next_bram}\tout_addr={tmp}")
         self.add_instruction(
+            step="add_t0",
+            n=n,
             modules=self.sel_module(ADD_SUB=1),
             mode2=0,  # Add mode1
             bank3=t0_bram,  # Input1
@@ -310,6 +365,8 @@ class InstructionGenerator:
         if n > 2:
             dprint(f"n={n},\tsplit_fft2 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z0}\tsm_size={element_count_log2}")
             self.add_instruction(
+                step="split_fft2",
+                n=n,
                 modules=self.sel_module(SPLIT=1),
                 bank1=next_bram,  # Input
                 addr1=tmp,
@@ -321,6 +378,8 @@ class InstructionGenerator:
         else:  # Replace last split with a copy
             dprint(f"n={n},\tcopy_split2 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z0}")
             self.add_instruction(
+                step="copy_split2",
+                n=n,
                 modules=self.sel_module(COPY=1),
                 bank3=next_bram,  # Input
                 addr1=tmp,
@@ -342,6 +401,8 @@ class InstructionGenerator:
         if n > 2:
             dprint(f"n={n},\tmerge_fft2 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z0}\tsm_size={element_count_log2}")
             self.add_instruction(
+                step="merge_fft2",
+                n=n,
                 modules=self.sel_module(MERGE=1),
                 bank1=next_bram,  # Input
                 addr1=tmp,
@@ -353,6 +414,8 @@ class InstructionGenerator:
         else:  # Replace first merge with a copy
             dprint(f"n={n},\tcopy_merge2 \tin_bram={next_bram},\tin_addr={tmp},\tout_bram={curr_bram},\tout_addr={z0}")
             self.add_instruction(
+                step="copy_merge2",
+                n=n,
                 modules=self.sel_module(COPY=1),
                 bank3=next_bram,  # Input
                 addr1=tmp,
@@ -361,14 +424,20 @@ class InstructionGenerator:
                 element_count=element_count_log2 - 1,
             )
 
+        subtree["end"] = len(self.instructions)
+        self.subtrees.append(subtree)
+
     def sign(self, N):
         self.instructions = []
+        self.instruction_sources = []  # Generator sources of every instruction, see write_program_sidecar()
+        self.subtrees = []  # Instruction ranges emitted by each ffsampling call
         self.samplerz_tree_addrs = []  # Addresses of tree where samplerz will access
         self.mul_tree_addrs = []  # Addresses of tree where mul with tree will access
 
         # timestep 1: HASH_TO_POINT
         dprint("HASH_TO_POINT")
         self.add_instruction(
+            step="HASH_TO_POINT",
             modules=self.sel_module(HASH_TO_POINT=1),
             bank3=4,  # HASH_TO_POINT input
             bank4=5,  # HASH_TO_POINT output
@@ -378,6 +447,7 @@ class InstructionGenerator:
         dprint("INT_TO_DOUBLE, COPY")
         saved_hm_address = 2560 if N == 512 else 5632
         self.add_instruction(
+            step="INT_TO_DOUBLE, COPY",
             modules=self.sel_module(INT_TO_DOUBLE=1, COPY=1),
             bank1=5,  # INT_TO_DOUBLE input
             bank2=5,  # INT_TO_DOUBLE output
@@ -391,6 +461,7 @@ class InstructionGenerator:
         # timestep 3: FFT
         dprint("FFT")
         self.add_instruction(
+            step="FFT",
             modules=self.sel_module(FFT_IFFT=1),
             mode1=0,  # FFT mode1: FFT
             bank1=5,  # FFT bank1
@@ -403,6 +474,7 @@ class InstructionGenerator:
         dprint("COPY COMPLEX_MUL")
         if N == 512:
             self.add_instruction(
+                step="COPY COMPLEX_MUL",
                 modules=self.sel_module(COPY=1, COMPLEX_MUL=1),
                 bank1=5,  # COMPLEX_MUL input 1, output
                 bank2=1,  # COMPLEX_MUL input 2
@@ -414,6 +486,7 @@ class InstructionGenerator:
             )
         else:
             self.add_instruction(
+                step="COPY COMPLEX_MUL",
                 modules=self.sel_module(COPY=1, COMPLEX_MUL=1),
                 bank1=4,  # COMPLEX_MUL input 1, output
                 bank2=1,  # COMPLEX_MUL input 2
@@ -428,6 +501,7 @@ class InstructionGenerator:
         dprint("COMPLEX_MUL MUL_CONST")
         if N == 512:
             self.add_instruction(
+                step="COMPLEX_MUL MUL_CONST",
                 modules=self.sel_module(COMPLEX_MUL=1, MUL_CONST=1),
                 bank1=4,  # COMPLEX_MUL input 1, output
                 bank2=3,  # COMPLEX_MUL input 2
@@ -440,6 +514,7 @@ class InstructionGenerator:
             )
         else:
             self.add_instruction(
+                step="COMPLEX_MUL MUL_CONST",
                 modules=self.sel_module(COMPLEX_MUL=1, MUL_CONST=1),
                 bank1=5,  # COMPLEX_MUL input 1, output
                 bank2=3,  # COMPLEX_MUL input 2
@@ -455,6 +530,7 @@ class InstructionGenerator:
         timestep6_bank = 4 if N == 512 else 5
         dprint("MUL_CONST")
         self.add_instruction(
+            step="MUL_CONST",
             modules=self.sel_module(MUL_CONST=1),
             bank3=timestep6_bank,  # MUL_CONST input
             bank4=timestep6_bank,  # MUL_CONST output
@@ -467,6 +543,7 @@ class InstructionGenerator:
 
         dprint("COPY b00")
         self.add_instruction(
+            step="COPY b00",
             modules=self.sel_module(COPY=1),
             bank3=0,  # COPY input
             bank4=3,  # COPY output
@@ -477,6 +554,7 @@ class InstructionGenerator:
 
         dprint("COPY b10")
         self.add_instruction(
+            step="COPY b10",
             modules=self.sel_module(COPY=1),
             bank3=2,  # COPY input
             bank4=2,  # COPY output
@@ -487,6 +565,7 @@ class InstructionGenerator:
 
         dprint("COMPLEX_MUL, COPY (1)")
         self.add_instruction(
+            step="COMPLEX_MUL, COPY (1)",
             modules=self.sel_module(COMPLEX_MUL=1, COPY=1),
             bank1=3,  # COMPLEX_MUL input1, output
             bank2=0,  # COMPLEX_MUL input2
@@ -499,6 +578,7 @@ class InstructionGenerator:
 
         dprint("COMPLEX_MUL, COPY (2)")
         self.add_instruction(
+            step="COMPLEX_MUL, COPY (2)",
             modules=self.sel_module(COMPLEX_MUL=1, COPY=1),
             bank1=2,  # COMPLEX_MUL input1, output
             bank2=0,  # COMPLEX_MUL input2
@@ -512,6 +592,7 @@ class InstructionGenerator:
 
         dprint("COMPLEX_MUL, ADD_SUB")
         self.add_instruction(
+            step="COMPLEX_MUL, ADD_SUB",
             modules=self.sel_module(COMPLEX_MUL=1, ADD_SUB=1),
             mode2=0,  # Add mode1
             bank1=4,  # COMPLEX_MUL input1, output
@@ -526,6 +607,7 @@ class InstructionGenerator:
 
         dprint("COMPLEX_MUL")
         self.add_instruction(
+            step="COMPLEX_MUL",
             modules=self.sel_module(COMPLEX_MUL=1),
             bank1=5,  # COMPLEX_MUL input1, output
             bank2=3,  # COMPLEX_MUL input2
@@ -536,6 +618,7 @@ class InstructionGenerator:
 
         dprint("IFFT, ADD_SUB")
         self.add_instruction(
+            step="IFFT, ADD_SUB",
             modules=self.sel_module(FFT_IFFT=1, ADD_SUB=1),
             mode1=1,  # IFFT mode1: IFFT
             mode2=0,  # add
@@ -550,6 +633,7 @@ class InstructionGenerator:
 
         dprint("IFFT")
         self.add_instruction(
+            step="IFFT",
             modules=self.sel_module(FFT_IFFT=1),
             mode1=1,  # IFFT mode1: IFFT
             bank1=5,  # FFT bank1
@@ -562,6 +646,7 @@ class InstructionGenerator:
         compress_t0_bank = 2 if N == 512 else 3
         compress_t1_bank = 5 if N == 512 else 4
         self.add_instruction(
+            step="compress",
             modules=self.sel_module(COMPRESS=1),
             bank1=compress_t0_bank,  # bank with t0
             bank2=compress_t1_bank,  # bank with t1
@@ -572,7 +657,15 @@ class InstructionGenerator:
             element_count=int(math.log2(N)),
         )
 
-        generator.print_verilog(algorithm="sign")
+        if remove_copies:
+            self.instructions, report = eliminate_copies(self.instructions, N)
+            self.instruction_sources = [self.instruction_sources[i] for i in report["indices"]]
+            self.subtrees = []  # Subtree instruction ranges no longer match the instructions
+
+        self.print_verilog(algorithm="sign")
+
+        if write_sidecar:
+            self.write_program_sidecar("sign", N)
 
         if tree_index_print:
             print(f"Indices where samplerz will read tree:")
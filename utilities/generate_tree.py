@@ -1,55 +1,82 @@
 # This script can take the tree values from C implementation and generates either a .coe file for the FPGA implementation or an array that can be loaded into BRAM from software
 # Values that are used in the "multiply with tmp" step are reordered in the way we need them on FPGA (real and imag part in the same memory location)
+# The reordering is a permutation of the tree that only depends on N, it's computed once per N and applied to a tree (or a
+# stack of trees) with one NumPy gather. Rows are packed by viewing the float64 values as uint64.
+# The tree can also be written as a binary row image (see row_image.py) that the driver loads with load_image().
 # Input tree values can be extracted from C implementation by dumpling the tree before first ffSampling_fft call.
+# The trees of constants_512.h and constants_1024.h are stored in data/tree_values_<N>.npy (float64, C tree order) and only
+# loaded when used, importing this module doesn't compute or write anything.
+#
+# Usage:
+#   python generate_tree.py [--N <512|1024>] [--key <key.json>] [--formats coe array image] [--coe-file <file>]
+#                           [--array-file <file>] [--image-file <file>]
+#   python generate_tree.py batch <keys> <output directory> [--processes <count>]
+#
+# Without --key the tree of constants_<N>.h is written, with --key the tree is computed from the key (ffldl_tree.py).
+#
+# Batch provisioning computes the trees directly from secret keys (ffldl_tree.py) across a process pool. keys is a
+# directory of <name>.json key files or - for a stream of JSON lines on stdin. A key is a JSON object with the integer
+# polynomials "f", "g", "F", "G" (N is their length), lines of the stream also need a "name". For every key, the sign key
+# image <name>_sign_key.bin (b00..b11 and the tree, as loaded by sign() in main.c) and the public key image
+# <name>_public_key.bin are written, plus manifest.json with the SHA-256 of the key and of both images. Chunks of keys are
+# submitted while the keys are read, so a stream on stdin is processed as it arrives and only a few chunks per process are
+# held in memory. The manifest is updated after every finished chunk, keys whose images are present and match the
+# manifest are skipped, so an interrupted run continues where it stopped. A key that can't be provisioned (e.g. f not
+# invertible modulo q) and a name that appears twice are listed in "failed" of the manifest, the other keys are provisioned.
 
-import struct
+import argparse
+import concurrent.futures
+import hashlib
+import json
 import math
+import os
+import sys
 
-N = 1024
-toggle_write_coe_file = True
-toggle_write_array = True
+import numpy as np
+
+import ffldl_tree
+from NTT_negative_compute_twiddle_factors import Q, intt_twiddle_factor, ntt_twiddle_factor
+from ntt_numpy import intt, ntt
+from row_image import PUBLIC_KEY_BANK, TREE_BANK, public_key_rows, write_image as write_row_image
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TREE_VALUES_FILE = os.path.join(DATA_DIR, "tree_values_{N}.npy")
+OUTPUT_FILES = {"coe": "tree_FPGA.coe", "array": "tree_arr.h", "image": "tree_FPGA.bin"}
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 16  # Keys per task, trees of a chunk are computed as one batch
+MAX_CHUNKS_PER_PROCESS = 2  # Chunks submitted but not finished per worker process, bounds the keys held in memory
+
+FPGA_PERMUTATIONS = {}
+TREE_VALUES = {}
 
 
 def write_coe_file(rows, filename):
     with open(filename, "w") as f:
         f.write(f"memory_initialization_radix=16;\n")
         f.write("memory_initialization_vector=\n")
-        for i, row in enumerate(rows):
+        for i, (high, low) in enumerate(rows):
             sep = "," if i < len(rows) - 1 else ";"
-            f.write(f"{row}{sep}\n")
+            f.write(f"{high:016x}{low:016x}{sep}\n")
 
 
 def write_array(rows, filename):
     with open(filename, "w") as f:
         f.write("uint64_t tree[TREE_SIZE] = {")
-        for i, row in enumerate(rows):
-            high = row[:16]
-            low = row[16:]
-            f.write(f"0x{high}, ")
-            f.write(f"0x{low}")
-            if i < len(rows) - 1:
-                f.write(", ")
+        f.write(", ".join(f"0x{word:016x}" for word in rows.reshape(-1)))
         f.write("};\n")
 
 
-def format_for_coe(value1, value2):
-    value1 = struct.pack(">d", value1).hex()
-    value2 = struct.pack(">d", value2).hex()
-
-    # Padd with zeros
-    if len(value1) < 16:
-        value1 = "0" * (16 - len(value1)) + value1
-    if len(value2) < 16:
-        value2 = "0" * (16 - len(value2)) + value2
-
-    return f"{value1}{value2}"
+# Binary row image (row_image.py) with the tree in BRAM6
+def write_image(rows, filename):
+    write_row_image(filename, [(TREE_BANK, 0, rows)])
 
 
+# Rows (high, low) as uint64 of a reordered tree (or a stack of trees): row i holds values 2i and 2i + 1
 def generate_rows(values):
-    rows = []
-    for i in range(0, len(values), 2):
-        rows.append(format_for_coe(values[i], values[i + 1]))
-    return rows
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return values.view(np.uint64).reshape(values.shape[:-1] + (-1, 2))
 
 
 def treesize(n):
@@ -57,16426 +84,295 @@ def treesize(n):
     return (logn + 1) << logn
 
 
-tree_values512 = [
-    -5.439508405878996,
-    4.023591126237180,
-    -3.025627021860480,
-    4.021186417815040,
-    7.572320680994848,
-    1.993663097762301,
-    1.109762102166763,
-    -7.441455430257556,
-    -0.387524067738489,
-    0.079668802913788,
-    1.811298266825568,
-    5.670090983391684,
-    -5.840003966408874,
-    -2.461318510071707,
-    -2.449351766955418,
-    0.923934159330745,
-    0.909437963002503,
-    5.107406066282021,
-    -2.956482455656327,
-    7.807959555246350,
-    2.264239292210966,
-    5.087151549983073,
-    4.391962507222591,
-    2.358773893200008,
-    1.682234504700665,
-    5.930341630022898,
-    -0.316856699156339,
-    -5.319701219201709,
-    -6.171138136088855,
-    9.822461988714599,
-    2.760756208589424,
-    3.613962195837115,
-    6.267659507520547,
-    1.780953085074265,
-    -2.676141816576557,
-    -10.608049833981953,
-    0.995942546093571,
-    3.307678389863000,
-    -3.170219656842781,
-    0.359417259497238,
-    -3.812834508797614,
-    -8.847784698794859,
-    -5.738950959154661,
-    0.115914139540367,
-    -6.051593275943953,
-    -0.137703274816442,
-    2.773304184307126,
-    6.191112168565012,
-    7.126026613202502,
-    5.835884013990124,
-    -7.186900399943049,
-    -0.582145731785185,
-    -4.580604939156713,
-    -8.112903327292370,
-    6.421221621755358,
-    5.216310251173834,
-    10.916605331181399,
-    1.600552448727327,
-    -0.297788817168680,
-    4.977794822457028,
-    4.727174732863178,
-    -4.958102301005484,
-    1.710976709481328,
-    -0.653317890284078,
-    6.062240716087000,
-    -2.094489085390536,
-    1.114854633341232,
-    12.135009055394871,
-    1.578518931494735,
-    -2.940067382184910,
-    -0.005803050530961,
-    -3.899045179107253,
-    -4.508692481821945,
-    -7.063840040501201,
-    1.646561037494896,
-    8.044278527621612,
-    7.888824085337536,
-    8.530314296697272,
-    3.635815718571238,
-    -2.792535448021825,
-    2.840076933315669,
-    -2.313449514788055,
-    0.305069886894560,
-    4.179654648713134,
-    -2.679162890138632,
-    -3.928363771557158,
-    -3.420656003905983,
-    5.369200483114559,
-    5.529666568509731,
-    -1.204139492740918,
-    0.251992523795697,
-    0.319013441446375,
-    1.803343771396514,
-    -3.195482522478418,
-    4.166235179921181,
-    0.244712615271597,
-    6.230102337426829,
-    5.256537784041821,
-    5.875813937880725,
-    11.545541208268450,
-    4.357850392125350,
-    1.368212115157683,
-    8.876526232396373,
-    -1.680048317056852,
-    -1.875351950449839,
-    -2.722240899794241,
-    3.113060772852895,
-    2.369463467697457,
-    3.323007696208748,
-    -2.079983543258022,
-    -6.013223140910322,
-    -5.724605313653277,
-    -7.933163691820180,
-    9.480559791711624,
-    0.962796872688437,
-    6.343504452556306,
-    8.016921758013460,
-    -5.846383758882554,
-    7.401172610350398,
-    0.954363992248592,
-    0.698414657507482,
-    -1.619758703066850,
-    1.976906007130086,
-    -5.696977510126409,
-    0.459665039360196,
-    -0.253787506291740,
-    -5.109385565885876,
-    -5.219788424923064,
-    5.583007624184226,
-    3.026190002370698,
-    -2.495872221718565,
-    0.578051004616798,
-    -2.958444298067291,
-    4.438484867304571,
-    -3.896672523031796,
-    -3.874309405705311,
-    -2.049548677745720,
-    -2.002172051707885,
-    0.913867139591652,
-    3.813320106860985,
-    0.402158206679078,
-    3.923096192228029,
-    3.906973473135859,
-    -5.170156894687951,
-    -10.914950247232825,
-    -1.931358765579464,
-    0.947329858335034,
-    -1.216938755815422,
-    -0.509054519117875,
-    2.799243122896960,
-    6.974399078771806,
-    -2.206431641491036,
-    4.003446311953686,
-    -1.805105760881646,
-    7.739461460603526,
-    -6.215047572476954,
-    -2.724786671583030,
-    -2.945761638619175,
-    9.655785086848141,
-    -4.373709406281961,
-    -9.098919127139428,
-    -4.292441663064891,
-    -0.874169896593344,
-    0.940031112387817,
-    1.839713329079768,
-    -4.459006667406061,
-    -2.758206543794592,
-    -4.702156977001613,
-    5.608001278947747,
-    0.582782140460758,
-    -2.382928402110997,
-    -4.558722303542106,
-    2.201493292274035,
-    -4.436994542465728,
-    6.588940568325501,
-    -2.625076226096960,
-    0.309477071708784,
-    -2.405752641198949,
-    1.263285691182441,
-    2.254151840062499,
-    -3.648451557845464,
-    -0.877182390604694,
-    5.328979148187075,
-    1.952702694144471,
-    -2.371521637479750,
-    3.734922695476496,
-    -9.594198094420911,
-    4.755793287827752,
-    -1.622117344712872,
-    -0.003357789780515,
-    2.800591149503608,
-    8.649526559796717,
-    8.027928155407967,
-    3.203806112679229,
-    6.577366769249772,
-    5.239423807876460,
-    -0.897294328456108,
-    1.900548979007996,
-    1.298694343214342,
-    -5.438348530053577,
-    -4.846133402411091,
-    -4.613678579485545,
-    -4.037390187748901,
-    4.422070984320169,
-    2.735632859251778,
-    -0.438234624436979,
-    -0.801592584348941,
-    -1.277304055773901,
-    5.378142333464526,
-    -2.111665930526813,
-    -3.139151548466903,
-    -4.639881275312086,
-    -2.856703359522149,
-    -0.556987427150856,
-    -0.446911063045010,
-    -1.680035599182584,
-    4.939022745302228,
-    0.663855593294139,
-    1.086247187125372,
-    -2.288017954498273,
-    -3.322003117743085,
-    2.686140899493844,
-    -2.538428603186439,
-    0.315573513262320,
-    2.479163814054014,
-    -0.985131599119371,
-    1.455634418809296,
-    -3.772159685121083,
-    -3.527868195776735,
-    2.772694987302620,
-    3.585224328737784,
-    -3.327829629206895,
-    3.609530860652340,
-    7.345772725497201,
-    1.294053211049197,
-    -5.130092048375110,
-    -3.667060413514400,
-    9.984232661294520,
-    -1.331878280827429,
-    2.136657488908212,
-    0.419809400759628,
-    1.852090923323893,
-    4.187352683710929,
-    1.974652939589736,
-    -2.131578876246436,
-    7.599086845411087,
-    -7.676809303524102,
-    1.980939718392319,
-    -2.533242036218865,
-    1.572973451083573,
-    -0.840442958947396,
-    2.161155994359174,
-    -3.960154565422608,
-    3.325486033111522,
-    -1.203523526987683,
-    -2.893095966023982,
-    -6.144103946273771,
-    1.850573199434340,
-    2.022765190360378,
-    -1.275286565671695,
-    -3.584849531410750,
-    1.008567856581945,
-    -3.025905948698238,
-    -0.617148824606059,
-    -2.243029619561351,
-    5.500600433698836,
-    -5.021657107233094,
-    -0.890714573555801,
-    3.073707314081213,
-    -2.603394574414466,
-    -4.697645284308074,
-    0.312983843847127,
-    -2.721137655691105,
-    3.031111291882302,
-    2.589037352654096,
-    -0.789844560371742,
-    4.925938791321473,
-    -1.406087166653756,
-    0.470100751730801,
-    1.706232010320730,
-    4.304207421612984,
-    5.281706384625020,
-    -9.367574394010582,
-    3.633883323685966,
-    -2.073136077460917,
-    -1.353171973885203,
-    -3.526785031103175,
-    -4.676942594815654,
-    12.167973467853733,
-    -4.001040535646884,
-    -4.167511347766100,
-    -1.268016740946190,
-    -1.504416413395163,
-    7.397601228385962,
-    -1.122010693906905,
-    -8.205264759709220,
-    -6.412758435838510,
-    3.733005691645870,
-    -5.233783750110014,
-    -8.043731406221916,
-    -5.173094195833960,
-    4.684964420902425,
-    -2.673469581358697,
-    -2.460615241050884,
-    0.006108261837736,
-    -7.421392438898625,
-    2.094674541802366,
-    2.558044137054050,
-    0.065578414199757,
-    3.710835005240031,
-    -0.470802646148423,
-    4.628875743850053,
-    3.767162817195056,
-    -12.258331931622710,
-    8.659062429882706,
-    1.318718691610661,
-    -2.732554308836545,
-    -5.722692937791146,
-    2.932095193097650,
-    1.167408584549431,
-    7.244398087564613,
-    2.594497868041353,
-    3.050344020943375,
-    3.079362523011487,
-    2.483387534873785,
-    -4.130418863205103,
-    0.535137323074883,
-    -5.975930763971094,
-    3.231543048180838,
-    10.608260731792067,
-    -9.217685796957760,
-    -2.167887960992535,
-    -5.801251091073840,
-    -3.441017359119542,
-    1.874733684510720,
-    -1.052779195094443,
-    1.450592056319111,
-    4.869505016080724,
-    -11.556978012694190,
-    -2.695432493215568,
-    0.404135823411982,
-    0.890068903865357,
-    -4.432699868561774,
-    7.539847798431002,
-    4.190239004727497,
-    5.612072871737460,
-    -2.272237947481662,
-    2.840480064861248,
-    3.387644761819228,
-    -0.443044850975537,
-    -3.930961317817836,
-    -7.151133390724202,
-    3.526682560194190,
-    -0.610848121826452,
-    3.796598718322240,
-    6.521829977498282,
-    -1.566574810237845,
-    -2.301516579537110,
-    3.227694568129980,
-    -4.187618707193496,
-    1.766478625991248,
-    -3.447368119544405,
-    2.378949713931090,
-    0.594765070278810,
-    -4.236772691289928,
-    6.244411125373367,
-    2.947221741951823,
-    -3.107805889841747,
-    -5.789119540321142,
-    1.517641784431897,
-    -1.211551211953656,
-    -4.562846174374081,
-    -2.577133013501287,
-    0.112251611146328,
-    -9.295897102576349,
-    2.198396174310472,
-    6.778854093509091,
-    0.539598301175543,
-    4.657259180884630,
-    -3.358223482473786,
-    -2.467284794937811,
-    4.260253738478295,
-    -2.468735456533996,
-    -3.476471530917884,
-    1.109618723067850,
-    -5.252369991443564,
-    -1.397138982956464,
-    0.215332999232333,
-    -13.916787243387954,
-    1.138885808490585,
-    0.554667525540716,
-    -1.798138651787420,
-    -5.727739649660801,
-    -5.660872574705828,
-    -3.388860184507311,
-    -5.817315061706552,
-    6.579928139263399,
-    -2.254708608928181,
-    -3.357718807554820,
-    -0.425886941606784,
-    -7.504559446633461,
-    1.925405766625472,
-    2.207848095206757,
-    -1.266814076867916,
-    6.725483643327252,
-    -10.384927682551565,
-    -1.198279512401919,
-    -4.105433059976116,
-    -4.486387391878124,
-    -6.548724506456795,
-    -8.124122475356682,
-    -9.821929895721402,
-    1.947746319767140,
-    -3.244546002409515,
-    3.602638864015833,
-    0.368251271279797,
-    3.415280453120524,
-    -0.279726528247920,
-    4.023911776836552,
-    -6.620239968212905,
-    -0.902798629400344,
-    2.768347308184501,
-    -8.057125163819800,
-    1.432664429329116,
-    1.447022464436407,
-    -3.567671043069340,
-    0.873148361919976,
-    -2.338257627836390,
-    4.650157273839043,
-    -5.356580398751286,
-    -1.417137099472283,
-    7.552781015130855,
-    -0.289371565778469,
-    -3.328960921579027,
-    -10.801729282783496,
-    -1.616537622291836,
-    -1.245939516802643,
-    2.083128290478493,
-    6.214649511687770,
-    15.347155541945407,
-    1.469831619708782,
-    6.816897713441641,
-    1.024611696071211,
-    3.189919474816386,
-    -2.002070390726569,
-    1.291678825959605,
-    8.831285383406986,
-    5.134404385859149,
-    -1.533059145173528,
-    -0.216987791482511,
-    4.579180284724812,
-    -2.681128311986019,
-    1.438965430044882,
-    -2.797039977758683,
-    16.509176919658689,
-    4.866550414397280,
-    1.798228151041880,
-    -6.367503485020233,
-    -4.964094309200179,
-    2.437146417992333,
-    -0.752295637815186,
-    -0.677471097810444,
-    -3.977858036215493,
-    0.540270203262573,
-    0.814689663218205,
-    2.657199636538052,
-    -6.490278419525750,
-    0.871774761940916,
-    3.261154971800592,
-    -0.067001538661681,
-    -3.905844963592560,
-    3.277611246130455,
-    0.563355271881017,
-    3.667006715324926,
-    -0.889071322901176,
-    -2.487708400414706,
-    -9.764402342235591,
-    -6.951614734133911,
-    -4.872140249049758,
-    9.201081479901209,
-    2.353753866979484,
-    0.576665765195359,
-    -1.927961959690102,
-    0.696541675744615,
-    9.905223667334495,
-    -4.883461685025843,
-    0.343228130210311,
-    -9.065999299424863,
-    -10.541350978167497,
-    0.854191545671057,
-    -0.585267455188569,
-    0.478475065103246,
-    -9.445227753180330,
-    0.513647537518692,
-    -3.484833097209970,
-    -0.350979104019973,
-    -10.862611366299774,
-    4.638712639905943,
-    2.036018772720313,
-    -2.577398233004852,
-    3.162365751325026,
-    1.719802793063774,
-    -2.451345690732085,
-    -0.107641373233540,
-    1.044559822810113,
-    -0.644402574012972,
-    -5.475615518742152,
-    -3.146505234390448,
-    4.385175455594878,
-    -3.510020587046998,
-    0.149263563223109,
-    9.356198417599943,
-    -0.379061191828635,
-    0.004351892142769,
-    0.191385206633544,
-    0.188823773325368,
-    -0.176839476982300,
-    -0.081107822261314,
-    0.221243047108428,
-    -0.117669828753949,
-    0.290494180805437,
-    -0.114127282592336,
-    0.144798318989001,
-    -0.126499281504601,
-    0.289810673231914,
-    0.037428792829009,
-    0.056051636274898,
-    -0.651533391144007,
-    -0.051559473108509,
-    0.079695094263819,
-    0.239638774325125,
-    0.105485215945853,
-    -0.300852490575452,
-    0.112944852247195,
-    -0.068581611623721,
-    -0.019274866913328,
-    -0.232937457552696,
-    0.132459905147413,
-    0.348125231825587,
-    0.107974462577135,
-    -0.219285030836498,
-    -0.006629880232993,
-    0.054535686518989,
-    0.568276588299668,
-    -0.436164022944499,
-    0.042290663991760,
-    -0.184771903914424,
-    -0.469917790706786,
-    0.274879414136917,
-    -0.155281645879584,
-    0.075434644037722,
-    -0.557247544898741,
-    0.486730837283893,
-    -0.132960502005969,
-    -0.406170975616794,
-    0.156445896274672,
-    0.560069021278581,
-    0.088139614185953,
-    0.060868268480060,
-    -0.666759745552655,
-    -0.440600878641596,
-    -0.144486906964035,
-    0.108885219803055,
-    0.245720787776416,
-    0.125193800297567,
-    0.069272479722661,
-    -0.111111538026793,
-    0.394522984887928,
-    -0.014548738094715,
-    0.049526152252637,
-    -0.327178017551558,
-    -0.342140576377976,
-    0.062106772737626,
-    -0.149688218896113,
-    0.014187578848869,
-    0.529729345194360,
-    0.218740896289451,
-    -0.003490517453235,
-    0.522008015317181,
-    0.091157797026872,
-    -0.615173955027676,
-    0.154077358007850,
-    0.006751240908657,
-    0.113109738075067,
-    0.092085662303669,
-    -0.058225681285962,
-    0.190315024580867,
-    0.609323610785848,
-    -0.070692182386751,
-    -0.089101994317471,
-    0.013268047959049,
-    0.028662349339452,
-    0.243186485642863,
-    0.060950628205985,
-    0.005917480628597,
-    -0.328534769325694,
-    -0.322285311019621,
-    0.473719462193471,
-    -0.096197631153672,
-    -0.075259855586034,
-    -0.135731633097757,
-    -0.051865732790834,
-    0.214057663579416,
-    0.405380570325007,
-    -0.125692805330772,
-    0.102200920366480,
-    -0.049530334740905,
-    0.310385624656625,
-    -0.484763354631788,
-    0.032927008056141,
-    -0.313862450351936,
-    0.118787139527844,
-    0.238212688728243,
-    0.007696405726040,
-    0.172400879227373,
-    0.029477655552596,
-    0.002879975756267,
-    0.025363619163880,
-    0.305150303149924,
-    -0.344372228673704,
-    -0.659979895028735,
-    0.437437718760890,
-    0.052223869260721,
-    -0.342399704048546,
-    0.927674086506059,
-    0.148802445268857,
-    -0.264867486128045,
-    -0.378589254858563,
-    -0.638630962527889,
-    0.114988687385715,
-    -0.034033884508058,
-    -0.410163495137441,
-    0.268238400235939,
-    0.049575131740428,
-    0.055160284462826,
-    0.432498135162779,
-    -0.311931708766640,
-    -0.078027070534096,
-    -0.002242083013902,
-    0.019474069880190,
-    -0.002325919532809,
-    -0.709239248855301,
-    0.193748386421235,
-    -0.186520659824398,
-    -0.074523807576411,
-    0.192462856291367,
-    0.543537263938880,
-    0.047896681963609,
-    0.059638147481769,
-    0.555907801702696,
-    0.219611208898366,
-    0.083405958225290,
-    0.196228103511491,
-    -0.055278848716987,
-    0.291114775015335,
-    0.125447128746493,
-    -0.005397795919552,
-    -0.761243502128665,
-    0.295681850616469,
-    -0.085491712818972,
-    -0.163190262383290,
-    -0.208221615677263,
-    -0.231180333764428,
-    0.005718053154538,
-    -0.072224543605222,
-    -0.427207594434409,
-    0.661020883686923,
-    -0.056864519326913,
-    -0.182225738389523,
-    0.007978200577936,
-    0.590854924600598,
-    -0.052451714600739,
-    -0.024110935000676,
-    -0.765033215805293,
-    -0.206395444645367,
-    0.420685664944505,
-    0.132078246488949,
-    0.323170007024342,
-    0.214975176837591,
-    0.195537786309572,
-    0.125098583381785,
-    0.517319818638929,
-    -0.687182490005734,
-    -0.092470025423082,
-    0.420726708771986,
-    -0.117330957183779,
-    0.428436536949166,
-    0.094727007862102,
-    -0.068122497896394,
-    0.934508570977265,
-    0.148713212730548,
-    -0.179912473787334,
-    0.076086293734737,
-    -0.113982224219665,
-    -0.455420003731870,
-    -0.096254128669384,
-    -0.005306543281787,
-    -0.135783876565293,
-    -0.702886244034346,
-    0.159258879304264,
-    0.056988316582641,
-    0.163132598924893,
-    0.330113401205739,
-    -0.022766651781036,
-    0.006712992957361,
-    0.113737482086504,
-    0.555062496123150,
-    -0.085729266594381,
-    -0.277216569336351,
-    -0.341914546929195,
-    0.017826932239579,
-    -0.042835810480308,
-    0.021272876184282,
-    0.252046332515295,
-    0.304660135846271,
-    -0.380632135025784,
-    -0.050438788491551,
-    0.124880367306385,
-    0.079353195778232,
-    -0.004792414746820,
-    0.031510231557243,
-    -0.470398608280969,
-    0.007679238796967,
-    0.253162870006513,
-    -0.185193649634455,
-    -0.824395569234818,
-    -0.356099513143198,
-    0.020330889431552,
-    -0.045765293216553,
-    0.153824440284926,
-    0.431837152039166,
-    -0.200943381861671,
-    -0.109775647622683,
-    -0.117019764095614,
-    -0.732720722480562,
-    -0.020981396344247,
-    -0.038750340421175,
-    -0.411913978297872,
-    -0.368400216780511,
-    -0.101201956416652,
-    0.121743882668988,
-    -0.015059331617739,
-    0.532819314392053,
-    -0.009537893236148,
-    0.000816053868933,
-    -0.089511993097610,
-    0.546456998930949,
-    0.192302944571627,
-    -0.521600729654176,
-    -0.553488680701867,
-    0.445924875304868,
-    0.040099663350056,
-    0.166836562385100,
-    -0.827397607042657,
-    -0.381027847498867,
-    0.263172324195478,
-    -0.409920013318993,
-    -0.179145525270588,
-    -0.156032157341930,
-    0.089465256782538,
-    0.105366272909956,
-    -0.126206931898431,
-    0.126529568844656,
-    -0.188546601265275,
-    -0.300654096669066,
-    0.080953885915435,
-    -0.121787149357628,
-    -0.000358514683365,
-    0.046633925976268,
-    -0.000838879054936,
-    0.521667398088790,
-    0.330576023440530,
-    0.682482932853661,
-    0.303530833274149,
-    -0.019030530902153,
-    0.050763041243614,
-    0.041461603891031,
-    0.015841959502422,
-    0.145807541705870,
-    -0.343729806554950,
-    -0.155194014929742,
-    -0.209219146058298,
-    0.036249300070998,
-    -0.409361540972223,
-    -0.153634453639514,
-    0.044293080288031,
-    -0.281851886413049,
-    -0.216921322719356,
-    0.045854928043630,
-    0.186351938913520,
-    0.082645669979312,
-    0.531584436029672,
-    0.230776598797224,
-    -0.037340463095356,
-    0.029823141335020,
-    -0.141287498562896,
-    -0.133823167573681,
-    -0.013833102224791,
-    0.024703457382105,
-    -0.800569115236645,
-    -0.284786255545027,
-    -0.003652821696802,
-    0.020465650739525,
-    -0.353133019537174,
-    -0.017468589721564,
-    -0.244902326928826,
-    0.107826612027311,
-    -0.153202491604422,
-    0.368732556554139,
-    -0.086071621555025,
-    -0.071304547317511,
-    0.007378046652243,
-    -0.374265492079591,
-    0.363810867735841,
-    0.012549697405972,
-    -0.246311006008983,
-    0.491166233177378,
-    0.048370784276999,
-    0.315502872409339,
-    -0.186716225112218,
-    0.184411163640763,
-    0.079228269864428,
-    -0.143081406677237,
-    0.273642160113175,
-    -0.635340704256779,
-    -0.031803143411360,
-    0.179210972189781,
-    0.592867729659552,
-    -0.135352462366080,
-    0.340958059154289,
-    0.007507235885915,
-    -0.110130349193767,
-    0.000572313102155,
-    0.068354583537593,
-    0.534630777712921,
-    -0.322560430876205,
-    0.292556621279751,
-    -0.708083831424788,
-    -0.047587248705683,
-    -0.020300556374853,
-    0.008777488878370,
-    -0.074831544516767,
-    0.224122287276312,
-    0.223620768438001,
-    -0.106475054663511,
-    0.304949918829078,
-    0.194694643956908,
-    0.076217142057141,
-    -0.017037740057801,
-    -0.399404097431747,
-    -0.352162789941980,
-    0.173611993537810,
-    0.025238279812303,
-    -0.338579127152115,
-    0.284990349949522,
-    -0.154156629773705,
-    0.073109686554092,
-    0.117868171467043,
-    0.057480948341469,
-    0.073304932505310,
-    -0.112602277076336,
-    0.016440072129599,
-    0.286866400377474,
-    0.068940890232020,
-    -0.017496228806056,
-    0.059457007835071,
-    0.023144925476200,
-    0.312254064065709,
-    -0.008525898318841,
-    0.501776834650039,
-    0.313428860569621,
-    0.052705119732195,
-    0.097186714525002,
-    0.326561189128170,
-    -0.122344582640444,
-    -0.004300053711179,
-    -0.284759209529482,
-    -0.478164880644397,
-    0.092402011932790,
-    0.033453044241306,
-    0.079029316109388,
-    -0.300623832759535,
-    0.436501381421548,
-    0.134958348027408,
-    0.113630826005561,
-    -0.128579347282300,
-    -0.602487478192949,
-    -0.064985757567316,
-    -0.236162761682365,
-    0.085558922958942,
-    0.391261557165329,
-    -0.271553389967573,
-    -0.125736004691739,
-    -0.367034987179965,
-    0.203822735530263,
-    0.004056340954530,
-    -0.137851788036496,
-    -0.001759152089959,
-    -0.197504058732948,
-    0.002665971487450,
-    0.211352741237736,
-    0.062070192456313,
-    0.063978686425577,
-    0.185975136568879,
-    -0.267086791016419,
-    0.025754142013559,
-    -0.162740389601017,
-    -0.139330667153263,
-    -0.164486133818214,
-    0.049493465983826,
-    -0.045792490952367,
-    -0.031459423865611,
-    -0.210816521939724,
-    0.002023255729546,
-    -0.065855758430018,
-    -0.134263035619512,
-    0.433918564067459,
-    -0.066500980960511,
-    0.048302957750606,
-    -0.279010493593866,
-    -0.171729170115863,
-    0.057873165694550,
-    -0.080171255428442,
-    0.019112346214753,
-    0.180120679031297,
-    0.139430591395899,
-    -0.009395739511194,
-    -0.100272476969488,
-    -0.003384071451548,
-    0.071659911589083,
-    -0.207445000152902,
-    -0.002538215858900,
-    0.093686226867953,
-    -0.140028110463728,
-    0.165858507771239,
-    -0.071738526442702,
-    -0.059976344562152,
-    -0.114688402502665,
-    -0.256995158957082,
-    0.088230171914165,
-    -0.115844205645267,
-    -0.070275322132828,
-    -0.263908628126611,
-    0.005458727867137,
-    -0.026001737964528,
-    -0.016404124081224,
-    -0.084386355791562,
-    0.104779901405857,
-    0.245811830299014,
-    0.117390648498735,
-    0.174544461344501,
-    0.077212602337696,
-    -0.056731654794655,
-    -0.175184572928044,
-    -0.159272929490120,
-    -0.009620346628426,
-    0.155373166254509,
-    -0.161638804211702,
-    -0.127374932840563,
-    0.007396542261002,
-    0.028678416089098,
-    -0.018857817722130,
-    -0.189577122138151,
-    0.103272732786540,
-    -0.045687067214890,
-    0.002899351040731,
-    0.090721793589007,
-    0.158243133069527,
-    -0.118750676323377,
-    0.027513110702324,
-    0.039016560276965,
-    -0.049840541636849,
-    0.046948299143825,
-    0.039589307195458,
-    -0.022933619614234,
-    0.226764616787761,
-    0.001408880238835,
-    0.383859698120719,
-    -0.209166121568308,
-    -0.093600948997951,
-    -0.021608373506422,
-    -0.006130162727800,
-    0.253550427465801,
-    -0.056620298371012,
-    -0.029745495932904,
-    -0.109838494911317,
-    0.065095198170690,
-    0.029873271019341,
-    0.034819231706561,
-    -0.053380001396152,
-    -0.154605905113248,
-    -0.033637353369967,
-    0.026682990145684,
-    0.014349559456269,
-    0.005798983519486,
-    -0.024197069703253,
-    0.019590724658851,
-    0.020615733203305,
-    0.044092411276437,
-    0.059516966181028,
-    0.002628045145214,
-    -0.145693522146623,
-    0.007066081863321,
-    0.019858021905663,
-    0.010471460491501,
-    -0.038569324035940,
-    0.145353200345221,
-    -0.018054274309385,
-    -0.041136074560132,
-    0.023413384043763,
-    -0.088264550394657,
-    -0.049468566770004,
-    -0.008182473975462,
-    -0.117707030247519,
-    -0.132097234759722,
-    0.033053839564201,
-    0.044686453129921,
-    -0.033806968634052,
-    0.018509734940763,
-    0.081617242179050,
-    0.035443192948090,
-    0.035443192948090,
-    0.771177574646980,
-    0.770208196752114,
-    0.037379993786346,
-    0.037379993786346,
-    0.769272368330060,
-    0.768196739799029,
-    0.050559218837464,
-    -0.029622921946319,
-    0.020942314145467,
-    0.071516059919923,
-    0.038144715981207,
-    0.038144715981207,
-    0.766780065997403,
-    0.765663573307569,
-    0.039206002897502,
-    0.039206002897502,
-    0.765086450001434,
-    0.763909522230499,
-    -0.030878064286215,
-    0.023327164877340,
-    -0.087879774703140,
-    -0.041399983528578,
-    -0.006142028867272,
-    -0.117273577227182,
-    -0.131521377242464,
-    0.027662584604006,
-    0.039619769353946,
-    -0.036240193368042,
-    0.016411045804498,
-    0.087491566332151,
-    0.035728790792329,
-    0.035728790792329,
-    0.768592098225396,
-    0.767610327640651,
-    0.038256066296848,
-    0.038256066296848,
-    0.766582108175762,
-    0.765459372684126,
-    0.045800551719367,
-    -0.031901446733026,
-    0.018971209686332,
-    0.077016905362194,
-    0.038387982722328,
-    0.038387982722328,
-    0.764391921124722,
-    0.763264653536369,
-    0.039978648790081,
-    0.039978648790081,
-    0.762638869822784,
-    0.761418974289238,
-    0.105407970741623,
-    0.017376340629394,
-    0.005002398397034,
-    -0.006182565534742,
-    0.018623015009723,
-    0.021178914973787,
-    0.044234782377614,
-    0.045562861832546,
-    0.010381778963373,
-    -0.176424947123369,
-    0.006095440083181,
-    0.005073900407271,
-    0.009954208907676,
-    -0.039622963020432,
-    0.145822534967523,
-    -0.013821343032562,
-    -0.055246455418532,
-    0.018485278288632,
-    -0.090834872656736,
-    -0.064494090578377,
-    -0.010989203236635,
-    -0.092931769563375,
-    -0.135943993869057,
-    0.043093573596504,
-    0.030714543844037,
-    -0.036131334743598,
-    0.012722380622303,
-    0.087228758364637,
-    0.024395301577183,
-    0.024395301577183,
-    0.759547912057983,
-    0.759095747159066,
-    0.027166454286634,
-    0.027166454286634,
-    0.757694222230568,
-    0.757134825092425,
-    0.033409291889541,
-    -0.032133617797891,
-    0.013838581809929,
-    0.077577415895783,
-    0.028458105338305,
-    0.028458105338305,
-    0.755179595494369,
-    0.754567755054000,
-    0.030493593874180,
-    0.030493593874180,
-    0.753643626618188,
-    0.752942517989817,
-    -0.045146403773920,
-    0.018485105219911,
-    -0.090409119923608,
-    -0.055716228721263,
-    -0.008980178053348,
-    -0.092930899488161,
-    -0.135306809875187,
-    0.037228393816974,
-    0.020526383267087,
-    -0.038460136567800,
-    0.008502306335695,
-    0.092850983312705,
-    0.022806563619963,
-    0.022806563619963,
-    0.756050238370725,
-    0.755656884569581,
-    0.026217107624537,
-    0.026217107624537,
-    0.754103879637630,
-    0.753585378087402,
-    0.023710693673508,
-    -0.034224474588489,
-    0.009821290892841,
-    0.082625190716624,
-    0.026776694991252,
-    0.026776694991252,
-    0.751936603409727,
-    0.751397277920525,
-    0.029378809522847,
-    0.029378809522847,
-    0.750359839196389,
-    0.749711913039255,
-    0.021668267766110,
-    -0.017039338771326,
-    -0.199171937526373,
-    0.100207917403662,
-    -0.074473455944763,
-    0.017751324196449,
-    0.085401545516281,
-    0.191613866599154,
-    -0.140612124141132,
-    0.025362977494287,
-    -0.029660000633299,
-    -0.072956398719083,
-    0.047498777278183,
-    0.049024263206180,
-    -0.023763774778186,
-    0.229708288076801,
-    0.001064493735310,
-    0.346843708710913,
-    -0.219752368997762,
-    -0.090823162252113,
-    -0.035223321400767,
-    -0.037532021624646,
-    0.238681330199329,
-    -0.068560537752375,
-    -0.035221503542155,
-    -0.101254681979919,
-    -0.049484721494203,
-    0.043728382556720,
-    0.035227494115618,
-    -0.066101566907224,
-    -0.160202356640145,
-    -0.034074005757616,
-    0.049594598683901,
-    0.014249476901300,
-    0.011418926806605,
-    -0.025013311745583,
-    0.020163924697773,
-    0.042874889926462,
-    0.041436691443819,
-    0.078052295859206,
-    0.004884641623313,
-    -0.144677366913195,
-    0.013914002572279,
-    0.020527894437986,
-    0.010777842295433,
-    -0.080213277222366,
-    0.136598465330365,
-    -0.023676905096829,
-    -0.040406241992360,
-    0.025592100013962,
-    -0.065939410030492,
-    -0.051423637009663,
-    -0.008037301251616,
-    -0.128660175086628,
-    -0.098685301038396,
-    0.034360175733973,
-    0.046732943723039,
-    -0.026331939684874,
-    0.019357419099701,
-    0.063570925910814,
-    0.039650527255205,
-    0.039650527255205,
-    0.754750682013136,
-    0.753563155698504,
-    0.040420184600729,
-    0.040420184600729,
-    0.753396331704756,
-    0.752164432158308,
-    0.053945166240803,
-    -0.024359366541017,
-    0.022344819481412,
-    0.058808713074141,
-    0.039738894093818,
-    0.039738894093818,
-    0.751279232743745,
-    0.750091889571968,
-    0.039966168443244,
-    0.039966168443244,
-    0.749883353430889,
-    0.748684610646274,
-    -0.031162692860797,
-    0.025522731042030,
-    -0.063806629534506,
-    -0.045659831004633,
-    -0.006198645010866,
-    -0.128311433714505,
-    -0.095493369457603,
-    0.030508923688301,
-    0.041416631050831,
-    -0.028077208633062,
-    0.017155330289057,
-    0.067784377875518,
-    0.040479202489863,
-    0.040479202489863,
-    0.751780962717993,
-    0.750548109232990,
-    0.041672268842438,
-    0.041672268842438,
-    0.750426616123327,
-    0.749122308277087,
-    0.048906715685257,
-    -0.026124299362688,
-    0.020257824927959,
-    0.063069637828897,
-    0.040399159392183,
-    0.040399159392183,
-    0.748543123072297,
-    0.747320433183095,
-    0.041056338764814,
-    0.041056338764814,
-    0.747165218434145,
-    0.745904716329914,
-    0.112857054131434,
-    0.017760489637416,
-    0.009806477034236,
-    -0.015696823427667,
-    0.015632444526026,
-    0.041956772945510,
-    0.041904738403153,
-    0.064322286679391,
-    0.011115449640160,
-    -0.180325277456050,
-    0.011949226839814,
-    0.012882050070469,
-    0.008355715681294,
-    -0.078495601164374,
-    0.138141409376325,
-    -0.019511952346234,
-    -0.045303113320185,
-    0.020748647754799,
-    -0.068875062298094,
-    -0.066796995801611,
-    -0.009011349520187,
-    -0.104310496265909,
-    -0.103078815139271,
-    0.044632325671821,
-    0.036796911673667,
-    -0.028614160999254,
-    0.015241779868678,
-    0.069080695560327,
-    0.029775767023057,
-    0.029775767023057,
-    0.743351444219494,
-    0.742692099161973,
-    0.031194062327887,
-    0.031194062327887,
-    0.742047836644061,
-    0.741325420856922,
-    0.041057552191255,
-    -0.026898569901360,
-    0.017006594955459,
-    0.064938892264303,
-    0.031451065720076,
-    0.031451065720076,
-    0.740076039234397,
-    0.739343616138210,
-    0.032501066987585,
-    0.032501066987585,
-    0.738819872263306,
-    0.738039029904634,
-    -0.035296473608689,
-    0.020731920448902,
-    -0.066784630947934,
-    -0.059964480129248,
-    -0.007020905125658,
-    -0.104226402420378,
-    -0.099950263534167,
-    0.040066984656300,
-    0.026069955087923,
-    -0.030292488729593,
-    0.010798528967875,
-    0.073132537129017,
-    0.028476077025753,
-    0.028476077025753,
-    0.739425998563952,
-    0.738826164364229,
-    0.030413417773973,
-    0.030413417773973,
-    0.738160130556712,
-    0.737477034095885,
-    0.030713238998856,
-    -0.028515723310354,
-    0.012721840137733,
-    0.068843045956736,
-    0.029913306629667,
-    0.029913306629667,
-    0.736428559676906,
-    0.735769303961784,
-    0.031487966659672,
-    0.031487966659672,
-    0.735236510195595,
-    0.734507167296747,
-    -0.136622484246607,
-    0.005229584905478,
-    -0.165863699760032,
-    0.002534409453422,
-    0.213112974300850,
-    0.040155024586586,
-    0.083114233596235,
-    0.117703669914307,
-    -0.197198241675053,
-    0.041486117122090,
-    -0.123265643289627,
-    -0.248621618565341,
-    -0.182048867759633,
-    0.043355280106617,
-    -0.048210741252054,
-    -0.461046598541966,
-    -0.249017697785619,
-    -0.013246507856752,
-    0.048602649974445,
-    -0.099658625119579,
-    0.422034614561000,
-    -0.061610855851852,
-    0.073298869912492,
-    -0.303115210164478,
-    -0.255955738113412,
-    0.100101086412498,
-    -0.085596400673341,
-    0.195114331803301,
-    -0.046029122668661,
-    0.027621019765241,
-    -0.000095569214881,
-    -0.085309141946603,
-    -0.003353893737353,
-    -0.213029671574800,
-    -0.174212091856828,
-    -0.002412958389804,
-    0.094466484522174,
-    -0.090588283940664,
-    0.215465548434751,
-    -0.045403315692274,
-    -0.044282345992267,
-    -0.184746069050408,
-    -0.194657722454948,
-    0.157437903627266,
-    -0.128213278436846,
-    -0.061559767841823,
-    -0.277845348007625,
-    0.079999173737601,
-    -0.030713403611710,
-    0.107399848349272,
-    0.062278540418218,
-    0.077774354393901,
-    0.239079656058804,
-    0.108758370456306,
-    0.264868081828300,
-    0.083883275798955,
-    -0.084556354447904,
-    -0.303010313369778,
-    -0.170050841990638,
-    -0.098212301254386,
-    -0.039704994270560,
-    -0.032020437991864,
-    -0.001295600235894,
-    0.006292780359359,
-    0.273193025258235,
-    0.001246744111907,
-    -0.147843597821790,
-    0.086056515989559,
-    -0.034696698172130,
-    -0.017174056690433,
-    0.088007564990093,
-    -0.041427887228851,
-    -0.077683398142934,
-    0.040785063911137,
-    0.004003904007965,
-    0.077847153455655,
-    0.043927256512882,
-    -0.027510772230769,
-    -0.018425008872571,
-    0.291819381967112,
-    0.013421112709928,
-    -0.025378059406567,
-    -0.163120273197065,
-    -0.077997079642788,
-    -0.016410316075150,
-    0.036311492030391,
-    0.245964666710099,
-    0.014823135072456,
-    -0.019458678258154,
-    -0.162823102168626,
-    0.006680110266121,
-    -0.046659788134117,
-    0.032578673789010,
-    0.037093982292676,
-    -0.124211320383787,
-    -0.043287316206922,
-    0.172155793385141,
-    0.013367003826989,
-    0.011744914613137,
-    -0.105427831864416,
-    0.039028052842127,
-    -0.001078418240887,
-    0.041396108531178,
-    0.197350524839573,
-    0.016955865686569,
-    -0.135717467427237,
-    0.014311219863837,
-    0.086522385574176,
-    0.020860928858593,
-    0.002017578621573,
-    0.136464681396555,
-    -0.059865627218253,
-    -0.163254678019013,
-    0.024990399773720,
-    -0.081119557111874,
-    -0.070135587695510,
-    -0.032473374490566,
-    -0.125635223706437,
-    -0.121403996638502,
-    0.046863101456056,
-    0.007778139133399,
-    -0.045698825745876,
-    0.003221810719079,
-    0.110326724900219,
-    0.026435551651342,
-    0.026435551651342,
-    0.711921270340652,
-    0.711423578461586,
-    0.031480091209325,
-    0.031480091209325,
-    0.709460753465294,
-    0.708757331878407,
-    0.002441603466240,
-    -0.042978755758035,
-    0.001011345269654,
-    0.103759895044970,
-    0.023902645894032,
-    0.023902645894032,
-    0.705227327887918,
-    0.704824290620427,
-    0.028381864986542,
-    0.028381864986542,
-    0.703074131166522,
-    0.702507555389814,
-    -0.168784503527879,
-    0.023219763759476,
-    -0.081650987728841,
-    -0.079585311231243,
-    -0.033573325173731,
-    -0.116733635345847,
-    -0.122199338762312,
-    0.053177204856875,
-    0.001820878273686,
-    -0.051371625116105,
-    0.000754232476391,
-    0.124022074076446,
-    0.025310936390624,
-    0.025310936390624,
-    0.706373681259973,
-    0.705921002502488,
-    0.031728382919534,
-    0.031728382919534,
-    0.703297879962916,
-    0.702589520092174,
-    -0.005475659087114,
-    -0.048996097854190,
-    -0.002268092256814,
-    0.118287043942945,
-    0.023262389393331,
-    0.023262389393331,
-    0.699573003433305,
-    0.699194334881645,
-    0.029085578287750,
-    0.029085578287750,
-    0.696788504896700,
-    0.696198792577636,
-    0.134700842187390,
-    0.015098797976449,
-    0.011789474991031,
-    -0.079238785472091,
-    0.048768965625269,
-    -0.003013644703640,
-    0.041273764150683,
-    0.162665134230046,
-    0.013266874980428,
-    -0.153300668502969,
-    0.014365516841402,
-    0.065029590647967,
-    0.026067555215508,
-    0.005638132680396,
-    0.136061366024718,
-    -0.049343929007228,
-    -0.170939807417918,
-    0.021251774293587,
-    -0.084598078865884,
-    -0.093978086384019,
-    -0.034002041772921,
-    -0.106839884183895,
-    -0.126609972341111,
-    0.062794149754336,
-    0.002040883297193,
-    -0.049302883460199,
-    0.000845361540918,
-    0.119027689913713,
-    0.022355994206425,
-    0.022355994206425,
-    0.703446737518507,
-    0.703095073636947,
-    0.028264311827686,
-    0.028264311827686,
-    0.700613417819805,
-    0.700053494108830,
-    -0.006694332213360,
-    -0.047306477722685,
-    -0.002772883193805,
-    0.114207940106206,
-    0.021458542466665,
-    0.021458542466665,
-    0.696399423799469,
-    0.696078679558591,
-    0.026878095725197,
-    0.026878095725197,
-    0.693805430101708,
-    0.693304021654313,
-    -0.168311472448907,
-    0.020266363915287,
-    -0.085417821898749,
-    -0.097627800491949,
-    -0.033479233441968,
-    -0.101885891673118,
-    -0.127836804488002,
-    0.065232810755768,
-    -0.005226521617086,
-    -0.053631375921232,
-    -0.002164896137833,
-    0.129477595117768,
-    0.021451779163070,
-    0.021451779163070,
-    0.699025352303063,
-    0.698703601586340,
-    0.028444851815079,
-    0.028444851815079,
-    0.695683380164958,
-    0.695120268165240,
-    -0.014021686676485,
-    -0.051746745105389,
-    -0.005807972788746,
-    0.124927693842095,
-    0.021212177445225,
-    0.021212177445225,
-    0.692089683285213,
-    0.691778202960970,
-    0.027647428753598,
-    0.027647428753598,
-    0.688972865328752,
-    0.688446026602174,
-    0.285905032479425,
-    0.002706230149256,
-    -0.162466180095204,
-    0.100190561949045,
-    -0.037041161464404,
-    -0.024858424935164,
-    0.080877879082599,
-    -0.118162706870409,
-    -0.103280692385678,
-    0.039621224343589,
-    -0.060615110613626,
-    0.066936527719972,
-    0.056713320375611,
-    -0.031068599645646,
-    -0.018563067802723,
-    0.288500363624051,
-    0.014045613578951,
-    -0.055086580188941,
-    -0.179253806541952,
-    -0.090807432184955,
-    -0.017519164630766,
-    0.052558723613863,
-    0.226038529471989,
-    0.042279292564243,
-    -0.025870466682142,
-    -0.158176794166566,
-    -0.101130202394130,
-    -0.040120210736112,
-    0.042061465037473,
-    0.041891157232763,
-    -0.125142038090551,
-    -0.042794986343346,
-    0.172063615523862,
-    0.013105520406461,
-    0.022101094112844,
-    -0.152046531591657,
-    0.028497062501794,
-    0.008960513768659,
-    0.034576150044699,
-    0.196377077658844,
-    0.016946786959653,
-    -0.133062581705079,
-    0.026930261095852,
-    0.124781363696333,
-    0.015231997249094,
-    -0.016763942163188,
-    0.113982291263337,
-    -0.059570335244312,
-    -0.162338745003576,
-    0.022036115999433,
-    -0.056746094466284,
-    -0.042935421239044,
-    -0.032291184086104,
-    -0.110783036217017,
-    -0.084926531987000,
-    0.028688531281996,
-    0.027304040230773,
-    -0.038989052282050,
-    0.011309703771167,
-    0.094127898803399,
-    0.029310808932908,
-    0.029310808932908,
-    0.692786056552563,
-    0.692190611866607,
-    0.032684509036066,
-    0.032684509036066,
-    0.690902659459742,
-    0.690164189292634,
-    0.020408072167509,
-    -0.037508203381116,
-    0.008453300273671,
-    0.090552813302939,
-    0.024533063207485,
-    0.024533063207485,
-    0.687955680578203,
-    0.687541495193173,
-    0.027768960878388,
-    0.027768960878388,
-    0.686271869173764,
-    0.685742470319658,
-    -0.168203972405652,
-    0.018345829571513,
-    -0.056933906129715,
-    -0.054840447801882,
-    -0.033457850353871,
-    -0.092230713520680,
-    -0.085207612004787,
-    0.036643215715146,
-    0.026915333841225,
-    -0.044121538588504,
-    0.011148696312835,
-    0.106518816853133,
-    0.025787060839351,
-    0.025787060839351,
-    0.686595542378287,
-    0.686138823316028,
-    0.030211191153468,
-    0.030211191153468,
-    0.684242000018118,
-    0.683617196083770,
-    0.017233704847471,
-    -0.042951018807605,
-    0.007138434277758,
-    0.103692932123062,
-    0.021617256831975,
-    0.021617256831975,
-    0.681835954918488,
-    0.681517254544247,
-    0.025971270790691,
-    0.025971270790691,
-    0.679689822470310,
-    0.679231212270716,
-    0.132003157900498,
-    0.015114258534673,
-    0.022641465866498,
-    -0.135822051346289,
-    0.035344416537768,
-    0.010819421211210,
-    0.034250705903125,
-    0.162790775751885,
-    0.013001176269197,
-    -0.153457642184911,
-    0.027588705982808,
-    0.111466276866741,
-    0.018891984233121,
-    -0.020241713377896,
-    0.112909445706880,
-    -0.049382041946201,
-    -0.169103251865634,
-    0.018256668659014,
-    -0.059197714197461,
-    -0.065846956448133,
-    -0.033636728160192,
-    -0.091782471344118,
-    -0.088595640204544,
-    0.043997529670645,
-    0.018920041337878,
-    -0.041996131327093,
-    0.007836937722809,
-    0.101387629817069,
-    0.024953527798291,
-    0.024953527798291,
-    0.683331926956430,
-    0.682906298267061,
-    0.029082907183548,
-    0.029082907183548,
-    0.681269882852564,
-    0.680693410334726,
-    0.009045084183807,
-    -0.041026638338854,
-    0.003746596541739,
-    0.099047066696236,
-    0.021239597176605,
-    0.021239597176605,
-    0.678374430514908,
-    0.678068332851571,
-    0.025288409838868,
-    0.025288409838868,
-    0.676464321727672,
-    0.676031581896202,
-    -0.166097111154874,
-    0.015343902743756,
-    -0.059494436290005,
-    -0.072183231408098,
-    -0.033038769594738,
-    -0.077139008227022,
-    -0.089039716198156,
-    0.048231293242877,
-    0.017149156086839,
-    -0.045781387417911,
-    0.007103413034422,
-    0.110526046408578,
-    0.021533439671507,
-    0.021533439671507,
-    0.678265337284104,
-    0.677950760141886,
-    0.026502435543472,
-    0.026502435543472,
-    0.675847905806403,
-    0.675373037542145,
-    0.006575347940749,
-    -0.045032701184734,
-    0.002723598294380,
-    0.108718557950481,
-    0.018702342543382,
-    0.018702342543382,
-    0.673565698378260,
-    0.673330058955744,
-    0.023610121327927,
-    0.023610121327927,
-    0.671282921015598,
-    0.670908618167005,
-    0.308335243683376,
-    -0.000814371057252,
-    0.522757206967288,
-    0.433762204234629,
-    0.737212957423863,
-    0.307341018324198,
-    -0.042294250456266,
-    -0.173780293437189,
-    0.437989097200803,
-    0.029939566040293,
-    0.128738548483568,
-    -0.322735119618219,
-    -0.089960493285890,
-    0.007163949803941,
-    0.028744947605190,
-    -0.393003520371197,
-    0.177514632161460,
-    0.023043907641304,
-    -0.271812734207645,
-    -0.344090228088944,
-    0.065396062178927,
-    0.344870310123558,
-    -0.005717260232793,
-    0.385195048376699,
-    0.811114165031696,
-    -0.046635210782176,
-    0.028964180215367,
-    -0.111756411395456,
-    -0.126068436604635,
-    0.222942203735533,
-    0.026389585544111,
-    -0.835300274138819,
-    -0.301223876839806,
-    0.021541543202658,
-    -0.128869853228348,
-    -0.357306293636401,
-    0.009619074301421,
-    -0.319290971565841,
-    0.110172365080167,
-    -0.150600474772421,
-    0.445365171785611,
-    -0.106656566085617,
-    0.373642945639084,
-    0.067784551906351,
-    -0.372411311721195,
-    0.370569750110119,
-    0.012295521932470,
-    0.081815455074618,
-    0.459858304991483,
-    0.065126432290138,
-    0.299816339787490,
-    -0.037994011425403,
-    0.187931147005806,
-    0.160566602241947,
-    -0.175425206910533,
-    0.317172162138611,
-    -0.809693070354859,
-    -0.031199189913675,
-    0.022731427430573,
-    0.546533013395888,
-    -0.159305392537658,
-    0.278309435842622,
-    0.004006499227639,
-    -0.102933611653230,
-    0.003784032678399,
-    0.066357592475359,
-    0.535747668226694,
-    -0.423244620222448,
-    0.316017473265992,
-    -0.716972320279689,
-    -0.105759898430110,
-    0.069496164085794,
-    0.092723003182208,
-    -0.141423412211996,
-    0.197885360449829,
-    0.209962226361126,
-    -0.061719831428473,
-    -0.010441902437546,
-    0.154388838642157,
-    0.073171517456058,
-    0.019686001984423,
-    -0.207793882767344,
-    -0.339619266127752,
-    0.275391048268169,
-    0.035993603878827,
-    -0.626587999368771,
-    -0.019715055790629,
-    -0.111704494034428,
-    0.256959772672433,
-    0.147207789224199,
-    0.055825391698678,
-    0.057983163957940,
-    -0.106077245715468,
-    -0.264957624875741,
-    0.306446393126186,
-    0.071931758812802,
-    -0.018506096303525,
-    -0.350631870178953,
-    -0.145740938661610,
-    0.315944236680130,
-    0.004694783650111,
-    0.654190652468585,
-    0.320247462144046,
-    0.051809967132263,
-    0.117384746858802,
-    0.404661773764539,
-    0.641097825601562,
-    -0.039506013952471,
-    -0.283348459822775,
-    -0.487048233150878,
-    0.090530546480216,
-    -0.011111870649150,
-    0.073991827808682,
-    -0.404759980257865,
-    0.414798906553847,
-    0.027462043075395,
-    0.115799776135255,
-    -0.260583109374140,
-    -0.738680817986520,
-    -0.075323456105289,
-    -0.300971353368214,
-    0.083934127255234,
-    0.049628287734850,
-    -0.250330529209392,
-    -0.147987138419095,
-    -0.299594913432844,
-    0.108777137802381,
-    0.003791269414865,
-    -0.282363384537740,
-    -0.002634392276448,
-    -0.227753187226427,
-    -0.090085266725471,
-    0.100000305022587,
-    0.073414269521746,
-    0.120163424653034,
-    0.014862778803077,
-    -0.348187612376103,
-    0.020683940060730,
-    -0.178527155292901,
-    -0.182843849131428,
-    -0.367068877851352,
-    -0.007699907124627,
-    -0.007589062778209,
-    -0.086657010872998,
-    -0.039132177933761,
-    0.023550813565848,
-    -0.003904489258226,
-    -0.130874026144227,
-    0.414324223887818,
-    0.123454786290177,
-    0.074896418077002,
-    -0.459064304062719,
-    -0.237800593732634,
-    0.033615837245686,
-    -0.015372735329654,
-    0.281870960724034,
-    -0.222607683757888,
-    0.254858699806245,
-    -0.004192484568906,
-    -0.042173267123930,
-    -0.006931632024414,
-    0.107313244089981,
-    -0.239216653379733,
-    0.085768303874312,
-    0.044327086596300,
-    -0.165619938256844,
-    0.311511964610554,
-    -0.005733206437419,
-    -0.078188143010256,
-    -0.092109767888095,
-    -0.281925186274521,
-    0.115784590513502,
-    -0.258519071393487,
-    0.010933028084007,
-    -0.043736846476579,
-    0.015036417772810,
-    -0.004826493802539,
-    -0.190944951894228,
-    -0.005003140614941,
-    0.102135092452705,
-    0.234711773694130,
-    -0.217928175096882,
-    0.270640879123367,
-    0.127040202325226,
-    -0.078558704875251,
-    -0.101756591692007,
-    -0.030540379805024,
-    -0.141881918430267,
-    -0.192022708575486,
-    -0.295452060177104,
-    -0.056836126604324,
-    0.003110887074841,
-    -0.033042984401023,
-    -0.021328957715014,
-    -0.238125960870707,
-    0.111456718251822,
-    -0.165902158932454,
-    -0.033084164522609,
-    0.070720180510074,
-    0.249540845650855,
-    -0.147590958516191,
-    0.043769449334938,
-    0.123733060020411,
-    -0.073581815135276,
-    0.041996825362657,
-    -0.034458703640649,
-    -0.054929750705179,
-    0.251234837089567,
-    -0.001623297730604,
-    0.434160908242682,
-    -0.262731510628988,
-    -0.101018481055704,
-    -0.078465877419374,
-    0.069950588730969,
-    0.197649663762388,
-    -0.089287142275540,
-    -0.036969610550442,
-    -0.174737436637460,
-    0.206436139042470,
-    0.044103242730532,
-    0.031146968471906,
-    0.046462183320512,
-    -0.370306300020275,
-    -0.037267167663717,
-    0.009327508937170,
-    0.007331072117412,
-    0.030685526662554,
-    -0.006296860438853,
-    -0.034274538289620,
-    0.047147743745547,
-    0.063176529222643,
-    0.236479587856271,
-    0.000918679445048,
-    -0.074433624331930,
-    0.037390422422846,
-    0.005167699810974,
-    -0.018320122395374,
-    -0.088207224460684,
-    0.208265106021134,
-    -0.071735298717031,
-    0.000849804886688,
-    0.035907468854195,
-    -0.072965319481399,
-    -0.066966342524750,
-    0.000169036701822,
-    -0.180519036232972,
-    -0.109200317610591,
-    0.044745479534625,
-    0.079035749035305,
-    -0.046773668268005,
-    0.032737679162739,
-    0.112921624294559,
-    0.034333461768648,
-    0.034333461768648,
-    0.700317845821981,
-    0.699491833398203,
-    0.037051163114665,
-    0.037051163114665,
-    0.696475260125845,
-    0.695518489593897,
-    0.094814169596134,
-    -0.044719482490951,
-    0.039273314951861,
-    0.107962381131961,
-    0.033272973094270,
-    0.033272973094270,
-    0.695370326505325,
-    0.694600061844284,
-    0.034388289495573,
-    0.034388289495573,
-    0.691178368204525,
-    0.690360528290019,
-    0.003557720207862,
-    0.036121918326130,
-    -0.070632035656936,
-    -0.072947131085768,
-    0.000707674549020,
-    -0.181597146532298,
-    -0.105708311592965,
-    0.048741714689009,
-    0.078188109117930,
-    -0.055947038542681,
-    0.032386575212954,
-    0.135068099224352,
-    0.043312253076884,
-    0.043312253076884,
-    0.695420815879393,
-    0.694115014358016,
-    0.048388028354686,
-    0.048388028354686,
-    0.690594317850032,
-    0.688975462005198,
-    0.094155668263083,
-    -0.054341598449410,
-    0.039000554768871,
-    0.131192223977598,
-    0.042187201097791,
-    0.042187201097791,
-    0.690458767812825,
-    0.689228821479771,
-    0.045684367877276,
-    0.045684367877276,
-    0.685266436804885,
-    0.683834748055558,
-    0.112508792721089,
-    0.012735896234034,
-    0.021738577187679,
-    -0.017025431526888,
-    -0.030062339868749,
-    0.059313280456736,
-    0.063261438747553,
-    0.273942540084679,
-    0.011081148885120,
-    -0.129309724503056,
-    0.026488532944453,
-    0.013972410558823,
-    -0.016068655432584,
-    -0.110967342806113,
-    0.208545015212495,
-    -0.083099561033659,
-    -0.011877272582196,
-    0.032311991227765,
-    -0.072365313352682,
-    -0.105867995614098,
-    -0.002362536407338,
-    -0.162443349568565,
-    -0.108302344980717,
-    0.070738733108674,
-    0.059390099767244,
-    -0.049738314688644,
-    0.024600184794284,
-    0.120078913890905,
-    0.023907744405396,
-    0.023907744405396,
-    0.682385606887770,
-    0.681995457224266,
-    0.028460986580202,
-    0.028460986580202,
-    0.678863295221604,
-    0.678313174212229,
-    0.072106355413138,
-    -0.049594054464037,
-    0.029867430345417,
-    0.119730638900148,
-    0.025243151891964,
-    0.025243151891964,
-    0.677347312022785,
-    0.676915557387559,
-    0.029065636460519,
-    0.029065636460519,
-    0.673525728692428,
-    0.672956486045005,
-    -0.009835551230522,
-    0.032377417596892,
-    -0.068321153344918,
-    -0.120900704969870,
-    -0.001956412779747,
-    -0.162772270137905,
-    -0.102249831807957,
-    0.080783268370251,
-    0.052856841567017,
-    -0.060058153801985,
-    0.021894020641264,
-    0.144993209439842,
-    0.032654779433441,
-    0.032654779433441,
-    0.675529410673146,
-    0.674808685803783,
-    0.040292240321990,
-    0.040292240321990,
-    0.670968217421091,
-    0.669878038599266,
-    0.065659050121809,
-    -0.061201879216335,
-    0.027196869052988,
-    0.147754406846797,
-    0.034311247172426,
-    0.034311247172426,
-    0.670361473621269,
-    0.669571817655149,
-    0.041660167784512,
-    0.041660167784512,
-    0.665376935988258,
-    0.664221124151203,
-    -0.068678113265768,
-    -0.019298194938709,
-    -0.231839834328775,
-    0.153738989050780,
-    -0.220773648487729,
-    -0.018156758083114,
-    0.033784871858401,
-    0.247003218884559,
-    -0.130412840113811,
-    0.040481083216882,
-    0.076194378585718,
-    -0.147414357248495,
-    0.020656061349501,
-    -0.065130608898054,
-    -0.050148202216499,
-    0.251911776810381,
-    -0.003373939352858,
-    0.392823782295584,
-    -0.255795838784020,
-    -0.139340897494040,
-    -0.104418159179708,
-    0.038389239555730,
-    0.094422391386814,
-    -0.088379164899999,
-    -0.032666715890023,
-    -0.161609543211214,
-    0.127122640702341,
-    0.088356765428295,
-    0.015319579183686,
-    0.087818460089376,
-    -0.338071718459651,
-    -0.037367582185708,
-    0.029573295865146,
-    0.006246846263152,
-    0.038953979709470,
-    0.041778774185140,
-    -0.036834541640521,
-    0.052105930842544,
-    0.064488047311341,
-    0.297701216348574,
-    0.002912715411655,
-    -0.063425294494976,
-    0.047465561611672,
-    -0.034286953880565,
-    -0.019688472694502,
-    -0.097483340080199,
-    0.212588601742604,
-    -0.090306676685212,
-    -0.012476451527362,
-    0.036366569147070,
-    -0.032034561001481,
-    -0.070871457053009,
-    -0.002481720509805,
-    -0.182827089266191,
-    -0.047943108599275,
-    0.047354793641036,
-    0.086645007530147,
-    -0.036684100676001,
-    0.035889537230906,
-    0.088563253375461,
-    0.040485132598373,
-    0.040485132598373,
-    0.677025867155350,
-    0.675915279742931,
-    0.040625147800895,
-    0.040625147800895,
-    0.673978818064872,
-    0.672865562228867,
-    0.102736115641348,
-    -0.037434985536292,
-    0.042554692444177,
-    0.090376049788957,
-    0.036663783919356,
-    0.036663783919356,
-    0.673367911631821,
-    0.672462139034875,
-    0.035666757175686,
-    0.035666757175686,
-    0.669640636245877,
-    0.668788232104205,
-    -0.010913984613280,
-    0.036446800518061,
-    -0.029113546775514,
-    -0.091943000655946,
-    -0.002170926516973,
-    -0.183230439606079,
-    -0.043571501875865,
-    0.061434348944503,
-    0.087000377848845,
-    -0.049225246324654,
-    0.036036736436575,
-    0.118840257288137,
-    0.052428755184063,
-    0.052428755184063,
-    0.670726110751152,
-    0.668879895096382,
-    0.055162521631379,
-    0.055162521631379,
-    0.666547124368789,
-    0.664515790302417,
-    0.103180084317201,
-    -0.051021812432726,
-    0.042738590290984,
-    0.123177551551942,
-    0.049227400730141,
-    0.049227400730141,
-    0.666787521526173,
-    0.665169708031104,
-    0.051121582496761,
-    0.051121582496761,
-    0.661787966871811,
-    0.660056173567124,
-    0.110384882117599,
-    0.010280073791618,
-    0.020062289445770,
-    0.018163477360652,
-    -0.032471868243258,
-    0.050295614211472,
-    0.066054120943211,
-    0.322178207496026,
-    0.010871961949178,
-    -0.104375340803485,
-    0.024445970421037,
-    -0.014906380637584,
-    -0.017356575181148,
-    -0.094096475879788,
-    0.217751254629545,
-    -0.097731690774478,
-    -0.011831327731569,
-    0.035532308405139,
-    -0.031167967758012,
-    -0.104294923653587,
-    -0.002353397408331,
-    -0.178632977291548,
-    -0.046646160157213,
-    0.069687640028751,
-    0.066906819073278,
-    -0.039789714577282,
-    0.027713711875395,
-    0.096060868575430,
-    0.030200607770426,
-    0.030200607770426,
-    0.661059519890883,
-    0.660456307685596,
-    0.032180676184860,
-    0.032180676184860,
-    0.658440212915245,
-    0.657757981476221,
-    0.082321540837306,
-    -0.042193116161860,
-    0.034098698690263,
-    0.101863193276746,
-    0.027815043085494,
-    0.027815043085494,
-    0.656992335427597,
-    0.656483839034905,
-    0.029318587171801,
-    0.029318587171801,
-    0.653710666579642,
-    0.653148508542874,
-    -0.012477807484449,
-    0.035574589037007,
-    -0.028372479002110,
-    -0.131641891213457,
-    -0.002481990226439,
-    -0.178845536381891,
-    -0.042462415575663,
-    0.087960299564128,
-    0.061861051228894,
-    -0.053979632982040,
-    0.025623686401665,
-    0.130318362037163,
-    0.041873627297535,
-    0.041873627297535,
-    0.653725020466494,
-    0.652577771905632,
-    0.047368420358964,
-    0.047368420358964,
-    0.649878414875610,
-    0.648418599389003,
-    0.077318965547575,
-    -0.058243637325714,
-    0.032026564158464,
-    0.140612579153680,
-    0.040678235247821,
-    0.040678235247821,
-    0.649124545094832,
-    0.648049536335969,
-    0.046457340050318,
-    0.046457340050318,
-    0.644362222337888,
-    0.642970001347489,
-    -0.325673971156514,
-    0.001817702015235,
-    -0.255929369397239,
-    -0.098130523471572,
-    0.007808243773931,
-    0.053035955281504,
-    0.118270926130658,
-    -0.054651674282738,
-    -0.342950651644832,
-    0.020010093429250,
-    0.004536842169943,
-    -0.251803850503139,
-    -0.658799117549240,
-    -0.011158217660964,
-    0.000971589586253,
-    -0.560149009816666,
-    -0.021177510265191,
-    0.010386833040621,
-    0.218332402798802,
-    -0.093757845092554,
-    0.398717296338516,
-    0.282690138898909,
-    0.101250898694801,
-    -0.458489831179397,
-    -0.264530234684700,
-    0.079283244483628,
-    -0.004494921926919,
-    0.539863376068413,
-    -0.571690043575485,
-    0.122190216261971,
-    0.000751818234879,
-    -0.041549622988113,
-    -0.007994847248634,
-    -0.074044971125843,
-    -0.268811022995375,
-    0.093428025052130,
-    0.003461156422012,
-    -0.119647197967604,
-    0.306605846676331,
-    0.021081477088837,
-    -0.077012144152050,
-    -0.089108992569878,
-    0.007164456699939,
-    0.159453029777733,
-    -0.463978687325946,
-    0.015843451756010,
-    0.005599408756273,
-    0.097195073333113,
-    -0.002611996761876,
-    -0.084214217471908,
-    0.279767119271506,
-    0.073169340462877,
-    0.225870558443330,
-    -0.499017882897791,
-    0.365873735198106,
-    0.126881224267726,
-    -0.087388985498249,
-    -0.239993806430431,
-    -0.008929876167010,
-    -0.271744387183678,
-    -0.493143223000328,
-    -0.141652418204797,
-    0.010192151140630,
-    0.003064884319690,
-    0.262804045549122,
-    0.000339489411504,
-    -0.241476619949735,
-    0.078693631293019,
-    -0.089573967432894,
-    0.042530112493264,
-    0.032204093363801,
-    0.073480498253453,
-    -0.124084873979532,
-    0.070096618436772,
-    0.126098768241212,
-    0.060579990200836,
-    0.009692094876847,
-    -0.103762222544216,
-    -0.056331787059000,
-    0.299565394661627,
-    0.012910734864500,
-    -0.006910465724897,
-    -0.266428393229343,
-    -0.071323749942265,
-    -0.042365331432595,
-    -0.089922367713566,
-    0.090004411459627,
-    -0.026291742680127,
-    -0.031081642888854,
-    -0.279841387285138,
-    0.210383084758696,
-    -0.036310248769058,
-    0.007188147459934,
-    0.139907161217348,
-    -0.379758061370219,
-    -0.044436328649447,
-    0.154990437588538,
-    0.010337940472824,
-    0.062730277441223,
-    -0.068057223337939,
-    -0.022771753103884,
-    0.062024786933371,
-    0.064797063923504,
-    0.343987793884576,
-    0.015265225705036,
-    -0.104962871077537,
-    0.076437064223242,
-    0.055853119756136,
-    -0.012171755619148,
-    -0.116040214621610,
-    0.213607292992129,
-    -0.104347556476292,
-    -0.170687162166456,
-    0.032590128109229,
-    -0.062460443823641,
-    -0.052044569356437,
-    -0.033951787507845,
-    -0.163841638096970,
-    -0.093478660165105,
-    0.034775069463681,
-    0.060023902280018,
-    -0.042580157553557,
-    0.024862714390941,
-    0.102797593853781,
-    0.012601250383980,
-    0.012601250383980,
-    0.633887350600154,
-    0.633786686676873,
-    0.015509040169700,
-    0.015509040169700,
-    0.631274146628095,
-    0.631122287785663,
-    0.058895928062116,
-    -0.040917435513720,
-    0.024395492171879,
-    0.098783427754750,
-    0.005246715300245,
-    0.005246715300245,
-    0.627788293384821,
-    0.627771011377347,
-    0.007872010630711,
-    0.007872010630711,
-    0.625360083731101,
-    0.625321329871830,
-    -0.177036536579426,
-    0.032783939205830,
-    -0.057849192354275,
-    -0.088054316267211,
-    -0.035214756603709,
-    -0.164815992276923,
-    -0.086577434642953,
-    0.058836013106340,
-    0.056318669862696,
-    -0.057825856857513,
-    0.023327956871942,
-    0.139603967881253,
-    0.024007734352707,
-    0.024007734352707,
-    0.624875727833312,
-    0.624515463539315,
-    0.030847436829660,
-    0.030847436829660,
-    0.620816469950082,
-    0.620225441789238,
-    0.054256989207046,
-    -0.057896384356624,
-    0.022473980783089,
-    0.139774236326126,
-    0.016957635094749,
-    0.016957635094749,
-    0.618247043823032,
-    0.618069234275722,
-    0.023916756164363,
-    0.023916756164363,
-    0.614235279120586,
-    0.613883829100433,
-    0.119998991122503,
-    0.016448849936656,
-    0.062754552988045,
-    -0.066879445552469,
-    0.008264117890037,
-    0.075184896188791,
-    0.069011304350791,
-    0.370038350311655,
-    0.011818869037099,
-    -0.167007976087082,
-    0.076466644062630,
-    0.054886542507291,
-    0.004417263041035,
-    -0.140661047323273,
-    0.227499781867141,
-    -0.112249906374573,
-    -0.158602800364652,
-    0.032791408287371,
-    -0.068654381560293,
-    -0.094965601942472,
-    -0.031548058493576,
-    -0.164853541885522,
-    -0.102748543075370,
-    0.063453986555107,
-    0.038377342032802,
-    -0.046362103904818,
-    0.015896415557818,
-    0.111928020027161,
-    0.017826830355225,
-    0.017826830355225,
-    0.621134888622613,
-    0.620937463138276,
-    0.022440158860609,
-    0.022440158860609,
-    0.618633461673072,
-    0.618321863681683,
-    0.039373646484162,
-    -0.045936379201044,
-    0.016309098373823,
-    0.110900229673473,
-    0.013184365405615,
-    0.013184365405615,
-    0.614613782745603,
-    0.614506936686524,
-    0.017670894793230,
-    0.017670894793230,
-    0.612151858902554,
-    0.611960678189308,
-    -0.151947557495788,
-    0.033011269255474,
-    -0.061619117421533,
-    -0.137261371742827,
-    -0.030224248379044,
-    -0.165958857613247,
-    -0.092219526223428,
-    0.091715116410057,
-    0.031813309309007,
-    -0.062926815176220,
-    0.013177504179761,
-    0.151918770635375,
-    0.030698797608044,
-    0.030698797608044,
-    0.610828647449746,
-    0.610252721143362,
-    0.039947443926294,
-    0.039947443926294,
-    0.606675797505311,
-    0.605706891606397,
-    0.034007360278635,
-    -0.065762812212572,
-    0.014086309847919,
-    0.158765473143386,
-    0.027922649497862,
-    0.027922649497862,
-    0.603899419056980,
-    0.603428390470859,
-    0.038019246867667,
-    0.038019246867667,
-    0.599387513544511,
-    0.598520493915681,
-    0.212553928290147,
-    0.003515297250744,
-    -0.236431382366719,
-    0.119017727553880,
-    -0.144439720299325,
-    0.022778084123081,
-    -0.135936710017713,
-    -0.109644202497807,
-    -0.120853397017612,
-    0.083257773463361,
-    0.164661767850733,
-    0.017377657533938,
-    0.003758509076716,
-    -0.227979363948623,
-    -0.098155166547436,
-    0.298831704637650,
-    0.010442104903020,
-    -0.071555519379724,
-    -0.260861831369304,
-    -0.107871380431551,
-    -0.068314899941175,
-    -0.048160212523555,
-    -0.379917653407838,
-    0.039231322962684,
-    -0.030272200047735,
-    -0.332383663404170,
-    0.274721562672139,
-    -0.010415767087266,
-    0.002787500309915,
-    0.307394587780700,
-    -0.661708383625119,
-    -0.044327496015194,
-    0.159492447211781,
-    0.008408860029820,
-    0.058950707995287,
-    0.027754129362222,
-    -0.000219170381446,
-    0.081775518335369,
-    0.077091549374898,
-    0.432482809917735,
-    0.015708634950757,
-    -0.085376588648317,
-    0.071831645528164,
-    -0.022777225325491,
-    -0.000117149009554,
-    -0.152991234111346,
-    0.254136779931592,
-    -0.131192226105729,
-    -0.190562799413493,
-    0.007319700027007,
-    -0.003119498851691,
-    -0.035244175400332,
-    -0.037905297565833,
-    -0.036798617016288,
-    -0.004668659958069,
-    0.023549405113583,
-    0.128840531361159,
-    -0.032060975849634,
-    0.053367495473148,
-    0.077402042719102,
-    0.012794868368059,
-    0.012794868368059,
-    0.597424639546649,
-    0.597326827954557,
-    0.008342575719348,
-    0.008342575719348,
-    0.593424656178856,
-    0.593383353234238,
-    0.112006365116179,
-    -0.032396643320246,
-    0.046394555503234,
-    0.078212415679102,
-    0.005187303489531,
-    0.005187303489531,
-    0.593928644745326,
-    0.593912663028549,
-    0.002495276577565,
-    0.002495276577565,
-    0.590664970510590,
-    0.590661292779697,
-    -0.199339253135773,
-    0.008038714822183,
-    0.005368191331004,
-    -0.099366107418371,
-    -0.039651042752929,
-    -0.040413348491500,
-    0.008034066081072,
-    0.066394310310150,
-    0.124300651486322,
-    -0.056455353371045,
-    0.051487015657446,
-    0.136295279776943,
-    0.034642883931554,
-    0.034642883931554,
-    0.585469792412651,
-    0.584766730761868,
-    0.035960653179800,
-    0.035960653179800,
-    0.579631983800302,
-    0.578881936649876,
-    0.105889248300299,
-    -0.059127523451089,
-    0.043860762755476,
-    0.142746469025151,
-    0.028184041985961,
-    0.028184041985961,
-    0.580886368007360,
-    0.580424763191944,
-    0.032044482941082,
-    0.032044482941082,
-    0.575549502753682,
-    0.574958196640344,
-    0.139454874317836,
-    0.013546571195630,
-    0.051704772784052,
-    0.090754841671606,
-    0.047909313677416,
-    0.106173484218625,
-    0.097970964866300,
-    0.599696843635959,
-    0.013735106276561,
-    -0.137540645517103,
-    0.063002447927093,
-    -0.074480573724900,
-    0.025608061676339,
-    -0.198636617794244,
-    0.322966988467608,
-    -0.181916048686759,
-    -0.169502144828256,
-    0.000101652564307,
-    -0.010124344270353,
-    -0.098836363424965,
-    -0.033716072903718,
-    -0.000511041951016,
-    -0.015152151978220,
-    0.066040346690190,
-    0.127904273235945,
-    -0.045330371501477,
-    0.052979684659803,
-    0.109437197666278,
-    0.024549581981085,
-    0.024549581981085,
-    0.576746913073081,
-    0.576399213296391,
-    0.022705497018074,
-    0.022705497018074,
-    0.571914294389987,
-    0.571619373885170,
-    0.114137682189544,
-    -0.047950237585503,
-    0.047277375940739,
-    0.115762113897933,
-    0.020765796119897,
-    0.020765796119897,
-    0.573307482040185,
-    0.573060208042965,
-    0.020922782817618,
-    0.020922782817618,
-    0.568854247982607,
-    0.568605170200553,
-    -0.169761866267377,
-    -0.000602116576396,
-    0.003515362321014,
-    -0.248562213809418,
-    -0.033767734710033,
-    0.003027044443379,
-    0.005261111507486,
-    0.166083961461382,
-    0.123713364510817,
-    -0.090217089930806,
-    0.051243753427187,
-    0.217803322068784,
-    0.063934641932810,
-    0.063934641932810,
-    0.557481042383511,
-    0.555197584893661,
-    0.077615414823177,
-    0.077615414823177,
-    0.547623415196053,
-    0.544314451110151,
-    0.109891596264281,
-    -0.106930307439572,
-    0.045518589563494,
-    0.258152598449341,
-    0.070113890663655,
-    0.070113890663655,
-    0.550523455201241,
-    0.547810420147390,
-    0.093498081510933,
-    0.093498081510933,
-    0.538573182447709,
-    0.533844273308784,
-    0.379061191828646,
-    -0.004351892142769,
-    -0.191385206633518,
-    -0.188823773325373,
-    0.176839476982278,
-    0.081107822261314,
-    -0.221243047108427,
-    0.117669828753950,
-    -0.290494180805432,
-    0.114127282592336,
-    -0.144798318989000,
-    0.126499281504501,
-    -0.289810673231915,
-    -0.037428792829000,
-    -0.056051636274901,
-    0.651533391144005,
-    0.051559473108528,
-    -0.079695094263820,
-    -0.239638774325124,
-    -0.105485215945853,
-    0.300852490575439,
-    -0.112944852247196,
-    0.068581611623706,
-    0.019274866913326,
-    0.232937457552701,
-    -0.132459905147413,
-    -0.348125231825579,
-    -0.107974462577139,
-    0.219285030836551,
-    0.006629880232991,
-    -0.054535686519010,
-    -0.568276588299668,
-    0.436164022944500,
-    -0.042290663991760,
-    0.184771903914426,
-    0.469917790706788,
-    -0.274879414136921,
-    0.155281645879597,
-    -0.075434644037726,
-    0.557247544898738,
-    -0.486730837283892,
-    0.132960502005968,
-    0.406170975616795,
-    -0.156445896274687,
-    -0.560069021278586,
-    -0.088139614185951,
-    -0.060868268480060,
-    0.666759745552660,
-    0.440600878641582,
-    0.144486906964035,
-    -0.108885219803072,
-    -0.245720787776378,
-    -0.125193800297567,
-    -0.069272479722661,
-    0.111111538026792,
-    -0.394522984887931,
-    0.014548738094713,
-    -0.049526152252638,
-    0.327178017551562,
-    0.342140576377964,
-    -0.062106772737656,
-    0.149688218896104,
-    -0.014187578848868,
-    -0.529729345194360,
-    -0.218740896289448,
-    0.003490517453235,
-    -0.522008015317221,
-    -0.091157797026873,
-    0.615173955027671,
-    -0.154077358007846,
-    -0.006751240908665,
-    -0.113109738075065,
-    -0.092085662303698,
-    0.058225681285962,
-    -0.190315024580863,
-    -0.609323610785849,
-    0.070692182386731,
-    0.089101994317466,
-    -0.013268047959049,
-    -0.028662349339446,
-    -0.243186485642781,
-    -0.060950628205977,
-    -0.005917480628598,
-    0.328534769325692,
-    0.322285311019614,
-    -0.473719462193472,
-    0.096197631153672,
-    0.075259855586023,
-    0.135731633097760,
-    0.051865732790801,
-    -0.214057663579417,
-    -0.405380570324958,
-    0.125692805330780,
-    -0.102200920366476,
-    0.049530334740905,
-    -0.310385624656617,
-    0.484763354631783,
-    -0.032927008056141,
-    0.313862450351936,
-    -0.118787139527916,
-    -0.238212688728241,
-    -0.007696405726040,
-    -0.172400879227370,
-    -0.029477655552596,
-    -0.002879975756265,
-    -0.025363619163881,
-    -0.305150303149925,
-    0.344372228673701,
-    0.659979895028735,
-    -0.437437718760892,
-    -0.052223869260721,
-    0.342399704048555,
-    -0.927674086506060,
-    -0.148802445268857,
-    0.264867486128047,
-    0.378589254858562,
-    0.638630962527882,
-    -0.114988687385714,
-    0.034033884508059,
-    0.410163495137447,
-    -0.268238400235942,
-    -0.049575131740428,
-    -0.055160284462825,
-    -0.432498135162777,
-    0.311931708766640,
-    0.078027070534092,
-    0.002242083013903,
-    -0.019474069880194,
-    0.002325919532809,
-    0.709239248855302,
-    -0.193748386421209,
-    0.186520659824401,
-    0.074523807576401,
-    -0.192462856291364,
-    -0.543537263938876,
-    -0.047896681963609,
-    -0.059638147481768,
-    -0.555907801702696,
-    -0.219611208898365,
-    -0.083405958225222,
-    -0.196228103511491,
-    0.055278848716975,
-    -0.291114775015345,
-    -0.125447128746493,
-    0.005397795919555,
-    0.761243502128670,
-    -0.295681850616468,
-    0.085491712818972,
-    0.163190262383271,
-    0.208221615677264,
-    0.231180333764407,
-    -0.005718053154536,
-    0.072224543605223,
-    0.427207594434408,
-    -0.661020883686909,
-    0.056864519326914,
-    0.182225738389568,
-    -0.007978200577932,
-    -0.590854924600635,
-    0.052451714600739,
-    0.024110935000677,
-    0.765033215805296,
-    0.206395444645366,
-    -0.420685664944506,
-    -0.132078246488951,
-    -0.323170007024367,
-    -0.214975176837610,
-    -0.195537786309570,
-    -0.125098583381785,
-    -0.517319818638926,
-    0.687182490005735,
-    0.092470025423091,
-    -0.420726708771990,
-    0.117330957183777,
-    -0.428436536949167,
-    -0.094727007862102,
-    0.068122497896393,
-    -0.934508570977266,
-    -0.148713212730577,
-    0.179912473787306,
-    -0.076086293734737,
-    0.113982224219666,
-    0.455420003731881,
-    0.096254128669387,
-    0.005306543281784,
-    0.135783876565294,
-    0.702886244034355,
-    -0.159258879304259,
-    -0.056988316582670,
-    -0.163132598924881,
-    -0.330113401205759,
-    0.022766651781036,
-    -0.006712992957361,
-    -0.113737482086504,
-    -0.555062496123193,
-    0.085729266594382,
-    0.277216569336349,
-    0.341914546929185,
-    -0.017826932239597,
-    0.042835810480307,
-    -0.021272876184288,
-    -0.252046332515296,
-    -0.304660135846264,
-    0.380632135025785,
-    0.050438788491536,
-    -0.124880367306378,
-    -0.079353195778231,
-    0.004792414746819,
-    -0.031510231557233,
-    0.470398608280927,
-    -0.007679238796968,
-    -0.253162870006511,
-    0.185193649634451,
-    0.824395569234822,
-    0.356099513143199,
-    -0.020330889431549,
-    0.045765293216553,
-    -0.153824440284834,
-    -0.431837152039166,
-    0.200943381861646,
-    0.109775647622692,
-    0.117019764095602,
-    0.732720722480562,
-    0.020981396344241,
-    0.038750340421174,
-    0.411913978297872,
-    0.368400216780511,
-    0.101201956416698,
-    -0.121743882668984,
-    0.015059331617740,
-    -0.532819314392046,
-    0.009537893236149,
-    -0.000816053868932,
-    0.089511993097614,
-    -0.546456998930951,
-    -0.192302944571625,
-    0.521600729654176,
-    0.553488680701870,
-    -0.445924875304865,
-    -0.040099663350057,
-    -0.166836562385100,
-    0.827397607042656,
-    0.381027847498869,
-    -0.263172324195478,
-    0.409920013318989,
-    0.179145525270586,
-    0.156032157341932,
-    -0.089465256782536,
-    -0.105366272909957,
-    0.126206931898432,
-    -0.126529568844654,
-    0.188546601265274,
-    0.300654096669066,
-    -0.080953885915430,
-    0.121787149357619,
-    0.000358514683365,
-    -0.308335243683376,
-    0.000814371057252,
-    -0.522757206967284,
-    -0.433762204234629,
-    -0.737212957423861,
-    -0.307341018324192,
-    0.042294250456268,
-    0.173780293437195,
-    -0.437989097200792,
-    -0.029939566040293,
-    -0.128738548483561,
-    0.322735119618213,
-    0.089960493285893,
-    -0.007163949803946,
-    -0.028744947605196,
-    0.393003520371197,
-    -0.177514632161457,
-    -0.023043907641304,
-    0.271812734207654,
-    0.344090228088954,
-    -0.065396062178929,
-    -0.344870310123557,
-    0.005717260232792,
-    -0.385195048376700,
-    -0.811114165031696,
-    0.046635210782180,
-    -0.028964180215366,
-    0.111756411395459,
-    0.126068436604630,
-    -0.222942203735530,
-    -0.026389585544113,
-    0.835300274138817,
-    0.301223876839807,
-    -0.021541543202657,
-    0.128869853228346,
-    0.357306293636410,
-    -0.009619074301433,
-    0.319290971565844,
-    -0.110172365080168,
-    0.150600474772418,
-    -0.445365171785599,
-    0.106656566085617,
-    -0.373642945639084,
-    -0.067784551906343,
-    0.372411311721161,
-    -0.370569750110110,
-    -0.012295521932472,
-    -0.081815455074617,
-    -0.459858304991478,
-    -0.065126432290133,
-    -0.299816339787491,
-    0.037994011425402,
-    -0.187931147005805,
-    -0.160566602241946,
-    0.175425206910533,
-    -0.317172162138608,
-    0.809693070354859,
-    0.031199189913674,
-    -0.022731427430571,
-    -0.546533013395888,
-    0.159305392537658,
-    -0.278309435842621,
-    -0.004006499227638,
-    0.102933611653222,
-    -0.003784032678399,
-    -0.066357592475343,
-    -0.535747668226690,
-    0.423244620222448,
-    -0.316017473265992,
-    0.716972320279680,
-    0.105759898430114,
-    -0.069496164085796,
-    -0.092723003182206,
-    0.141423412211996,
-    -0.197885360449814,
-    -0.209962226361127,
-    0.061719831428476,
-    0.010441902437551,
-    -0.154388838642194,
-    -0.073171517456063,
-    -0.019686001984422,
-    0.207793882767342,
-    0.339619266127764,
-    -0.275391048268180,
-    -0.035993603878827,
-    0.626587999368768,
-    0.019715055790626,
-    0.111704494034428,
-    -0.256959772672432,
-    -0.147207789224209,
-    -0.055825391698678,
-    -0.057983163957938,
-    0.106077245715463,
-    0.264957624875737,
-    -0.306446393126200,
-    -0.071931758812802,
-    0.018506096303525,
-    0.350631870178939,
-    0.145740938661608,
-    -0.315944236680138,
-    -0.004694783650117,
-    -0.654190652468590,
-    -0.320247462144050,
-    -0.051809967132262,
-    -0.117384746858799,
-    -0.404661773764538,
-    -0.641097825601562,
-    0.039506013952467,
-    0.283348459822750,
-    0.487048233150866,
-    -0.090530546480212,
-    0.011111870649148,
-    -0.073991827808681,
-    0.404759980257807,
-    -0.414798906553850,
-    -0.027462043075394,
-    -0.115799776135254,
-    0.260583109374139,
-    0.738680817986520,
-    0.075323456105289,
-    0.300971353368214,
-    -0.083934127255233,
-    -0.049628287734846,
-    0.250330529209391,
-    0.147987138419094,
-    0.299594913432843,
-    -0.108777137802382,
-    -0.003791269414865,
-    0.325673971156509,
-    -0.001817702015234,
-    0.255929369397238,
-    0.098130523471573,
-    -0.007808243773929,
-    -0.053035955281503,
-    -0.118270926130659,
-    0.054651674282748,
-    0.342950651644831,
-    -0.020010093429250,
-    -0.004536842169943,
-    0.251803850503139,
-    0.658799117549244,
-    0.011158217660963,
-    -0.000971589586254,
-    0.560149009816671,
-    0.021177510265202,
-    -0.010386833040621,
-    -0.218332402798804,
-    0.093757845092556,
-    -0.398717296338504,
-    -0.282690138898908,
-    -0.101250898694799,
-    0.458489831179403,
-    0.264530234684685,
-    -0.079283244483627,
-    0.004494921926919,
-    -0.539863376068411,
-    0.571690043575485,
-    -0.122190216261973,
-    -0.000751818234880,
-    0.041549622988111,
-    0.007994847248634,
-    0.074044971125844,
-    0.268811022995373,
-    -0.093428025052131,
-    -0.003461156422011,
-    0.119647197967603,
-    -0.306605846676334,
-    -0.021081477088839,
-    0.077012144152049,
-    0.089108992569879,
-    -0.007164456699939,
-    -0.159453029777733,
-    0.463978687325949,
-    -0.015843451756008,
-    -0.005599408756279,
-    -0.097195073333114,
-    0.002611996761878,
-    0.084214217471912,
-    -0.279767119271509,
-    -0.073169340462878,
-    -0.225870558443323,
-    0.499017882897790,
-    -0.365873735198099,
-    -0.126881224267727,
-    0.087388985498246,
-    0.239993806430429,
-    0.008929876167010,
-    0.271744387183677,
-    0.493143223000328,
-    0.141652418204800,
-    -0.010192151140631,
-    -0.003064884319690,
-    -0.212553928290147,
-    -0.003515297250744,
-    0.236431382366719,
-    -0.119017727553883,
-    0.144439720299327,
-    -0.022778084123082,
-    0.135936710017714,
-    0.109644202497808,
-    0.120853397017607,
-    -0.083257773463361,
-    -0.164661767850731,
-    -0.017377657533945,
-    -0.003758509076708,
-    0.227979363948623,
-    0.098155166547436,
-    -0.298831704637648,
-    -0.010442104903020,
-    0.071555519379726,
-    0.260861831369301,
-    0.107871380431555,
-    0.068314899941176,
-    0.048160212523556,
-    0.379917653407840,
-    -0.039231322962684,
-    0.030272200047733,
-    0.332383663404170,
-    -0.274721562672135,
-    0.010415767087270,
-    -0.002787500309910,
-    -0.307394587780700,
-    0.661708383625119,
-    0.044327496015193,
-    -0.139454874317834,
-    -0.013546571195630,
-    -0.051704772784053,
-    -0.090754841671608,
-    -0.047909313677416,
-    -0.106173484218625,
-    -0.097970964866298,
-    -0.599696843635959,
-    -0.013735106276561,
-    0.137540645517107,
-    -0.063002447927094,
-    0.074480573724902,
-    -0.025608061676338,
-    0.198636617794243,
-    -0.322966988467604,
-    0.181916048686759,
-    0.169761866267378,
-    0.000602116576396,
-    -0.003515362321017,
-    0.248562213809417,
-    0.033767734710033,
-    -0.003027044443378,
-    -0.005261111507491,
-    -0.166083961461382,
-    -0.109891596264281,
-    0.106930307439573,
-    -0.045518589563493,
-    -0.258152598449342,
-    -0.093498081510934,
-    -0.093498081510934,
-    0.838040515511177,
-    0.830682151630937,
-    -0.070113890663655,
-    -0.070113890663655,
-    0.816675100641594,
-    0.812650443463567,
-    -0.123713364510816,
-    0.090217089930806,
-    -0.051243753427186,
-    -0.217803322068785,
-    -0.077615414823178,
-    -0.077615414823178,
-    0.821920360728854,
-    0.816953982594440,
-    -0.063934641932811,
-    -0.063934641932810,
-    0.805808854683819,
-    0.802508239730622,
-    0.169502144828258,
-    -0.000101652564307,
-    0.010124344270349,
-    0.098836363424962,
-    0.033716072903718,
-    0.000511041951017,
-    0.015152151978215,
-    -0.066040346690188,
-    -0.114137682189544,
-    0.047950237585503,
-    -0.047277375940739,
-    -0.115762113897935,
-    -0.020922782817618,
-    -0.020922782817618,
-    0.786808058478587,
-    0.786463547724201,
-    -0.020765796119897,
-    -0.020765796119897,
-    0.780691319563479,
-    0.780354598573030,
-    -0.127904273235945,
-    0.045330371501478,
-    -0.052979684659802,
-    -0.109437197666279,
-    -0.022705497018076,
-    -0.022705497018075,
-    0.782659144258215,
-    0.782255548418439,
-    -0.024549581981086,
-    -0.024549581981086,
-    0.776168876858501,
-    0.775700952819308,
-    -0.159492447211779,
-    -0.008408860029821,
-    -0.058950707995288,
-    -0.027754129362223,
-    0.000219170381447,
-    -0.081775518335370,
-    -0.077091549374896,
-    -0.432482809917735,
-    -0.015708634950757,
-    0.085376588648323,
-    -0.071831645528166,
-    0.022777225325491,
-    0.000117149009554,
-    0.152991234111346,
-    -0.254136779931588,
-    0.131192226105730,
-    0.199339253135774,
-    -0.008038714822184,
-    -0.005368191331008,
-    0.099366107418369,
-    0.039651042752929,
-    0.040413348491501,
-    -0.008034066081078,
-    -0.066394310310149,
-    -0.105889248300298,
-    0.059127523451089,
-    -0.043860762755475,
-    -0.142746469025152,
-    -0.032044482941083,
-    -0.032044482941083,
-    0.778114187467157,
-    0.777314771128993,
-    -0.028184041985963,
-    -0.028184041985962,
-    0.770785738957929,
-    0.770173229475261,
-    -0.124300651486321,
-    0.056455353371045,
-    -0.051487015657445,
-    -0.136295279776944,
-    -0.035960653179801,
-    -0.035960653179801,
-    0.772840024332930,
-    0.771839964856941,
-    -0.034642883931555,
-    -0.034642883931555,
-    0.765062556523191,
-    0.764143830824766,
-    0.190562799413494,
-    -0.007319700027008,
-    0.003119498851688,
-    0.035244175400330,
-    0.037905297565833,
-    0.036798617016289,
-    0.004668659958064,
-    -0.023549405113581,
-    -0.112006365116178,
-    0.032396643320247,
-    -0.046394555503233,
-    -0.078212415679104,
-    -0.002495276577567,
-    -0.002495276577566,
-    0.757427540072864,
-    0.757422824007409,
-    -0.005187303489533,
-    -0.005187303489532,
-    0.753281008902950,
-    0.753260739256345,
-    -0.128840531361158,
-    0.032060975849634,
-    -0.053367495473147,
-    -0.077402042719103,
-    -0.008342575719350,
-    -0.008342575719350,
-    0.753952950597485,
-    0.753900474724367,
-    -0.012794868368060,
-    -0.012794868368060,
-    0.748975450405216,
-    0.748852826602326,
-    -0.262804045549120,
-    -0.000339489411504,
-    0.241476619949735,
-    -0.078693631293022,
-    0.089573967432896,
-    -0.042530112493264,
-    -0.032204093363804,
-    -0.073480498253457,
-    0.124084873979527,
-    -0.070096618436772,
-    -0.126098768241206,
-    -0.060579990200849,
-    -0.009692094876836,
-    0.103762222544217,
-    0.056331787059000,
-    -0.299565394661625,
-    -0.012910734864500,
-    0.006910465724902,
-    0.266428393229341,
-    0.071323749942268,
-    0.042365331432596,
-    0.089922367713567,
-    -0.090004411459635,
-    0.026291742680129,
-    0.031081642888853,
-    0.279841387285136,
-    -0.210383084758687,
-    0.036310248769065,
-    -0.007188147459927,
-    -0.139907161217350,
-    0.379758061370219,
-    0.044436328649447,
-    -0.119998991122501,
-    -0.016448849936657,
-    -0.062754552988046,
-    0.066879445552470,
-    -0.008264117890036,
-    -0.075184896188793,
-    -0.069011304350789,
-    -0.370038350311655,
-    -0.011818869037099,
-    0.167007976087088,
-    -0.076466644062631,
-    -0.054886542507292,
-    -0.004417263041034,
-    0.140661047323275,
-    -0.227499781867136,
-    0.112249906374573,
-    0.151947557495789,
-    -0.033011269255476,
-    0.061619117421528,
-    0.137261371742824,
-    0.030224248379044,
-    0.165958857613251,
-    0.092219526223420,
-    -0.091715116410054,
-    -0.034007360278632,
-    0.065762812212572,
-    -0.014086309847917,
-    -0.158765473143387,
-    -0.038019246867668,
-    -0.038019246867668,
-    0.747481722938982,
-    0.746400483654987,
-    -0.027922649497863,
-    -0.027922649497863,
-    0.741402189673720,
-    0.740823911877570,
-    -0.031813309309004,
-    0.062926815176220,
-    -0.013177504179760,
-    -0.151918770635376,
-    -0.039947443926297,
-    -0.039947443926297,
-    0.738613240506274,
-    0.737433620800518,
-    -0.030698797608046,
-    -0.030698797608046,
-    0.733111241467587,
-    0.732420019712959,
-    0.158602800364655,
-    -0.032791408287372,
-    0.068654381560288,
-    0.094965601942467,
-    0.031548058493577,
-    0.164853541885527,
-    0.102748543075363,
-    -0.063453986555104,
-    -0.039373646484159,
-    0.045936379201045,
-    -0.016309098373822,
-    -0.110900229673476,
-    -0.017670894793232,
-    -0.017670894793232,
-    0.731065158189767,
-    0.730836839748290,
-    -0.013184365405616,
-    -0.013184365405616,
-    0.728035931406589,
-    0.727909367746089,
-    -0.038377342032800,
-    0.046362103904818,
-    -0.015896415557816,
-    -0.111928020027163,
-    -0.022440158860612,
-    -0.022440158860611,
-    0.723544089711665,
-    0.723179649539893,
-    -0.017826830355227,
-    -0.017826830355227,
-    0.720496276300141,
-    0.720267269157060,
-    -0.154990437588535,
-    -0.010337940472825,
-    -0.062730277441224,
-    0.068057223337941,
-    0.022771753103885,
-    -0.062024786933375,
-    -0.064797063923502,
-    -0.343987793884576,
-    -0.015265225705036,
-    0.104962871077543,
-    -0.076437064223243,
-    -0.055853119756137,
-    0.012171755619148,
-    0.116040214621616,
-    -0.213607292992123,
-    0.104347556476292,
-    0.177036536579428,
-    -0.032783939205831,
-    0.057849192354270,
-    0.088054316267208,
-    0.035214756603709,
-    0.164815992276928,
-    0.086577434642945,
-    -0.058836013106338,
-    -0.054256989207043,
-    0.057896384356624,
-    -0.022473980783088,
-    -0.139774236326127,
-    -0.023916756164365,
-    -0.023916756164365,
-    0.728774906258673,
-    0.728357919536813,
-    -0.016957635094751,
-    -0.016957635094751,
-    0.723839830873712,
-    0.723631652550923,
-    -0.056318669862693,
-    0.057825856857513,
-    -0.023327956871940,
-    -0.139603967881253,
-    -0.030847436829663,
-    -0.030847436829662,
-    0.721323408978136,
-    0.720636696449687,
-    -0.024007734352710,
-    -0.024007734352710,
-    0.716368378568131,
-    0.715955365329417,
-    0.170687162166459,
-    -0.032590128109231,
-    0.062460443823636,
-    0.052044569356433,
-    0.033951787507846,
-    0.163841638096974,
-    0.093478660165097,
-    -0.034775069463678,
-    -0.058895928062113,
-    0.040917435513721,
-    -0.024395492171877,
-    -0.098783427754751,
-    -0.007872010630713,
-    -0.007872010630713,
-    0.715445177758581,
-    0.715400841283555,
-    -0.005246715300247,
-    -0.005246715300247,
-    0.712653375033697,
-    0.712633756826279,
-    -0.060023902280015,
-    0.042580157553558,
-    -0.024862714390939,
-    -0.102797593853783,
-    -0.015509040169703,
-    -0.015509040169703,
-    0.708869166348187,
-    0.708698641305126,
-    -0.012601250383983,
-    -0.012601250383982,
-    0.705889125491327,
-    0.705777027389502,
-    0.282363384537733,
-    0.002634392276448,
-    0.227753187226417,
-    0.090085266725472,
-    -0.100000305022579,
-    -0.073414269521745,
-    -0.120163424653035,
-    -0.014862778803061,
-    0.348187612376103,
-    -0.020683940060729,
-    0.178527155292898,
-    0.182843849131428,
-    0.367068877851363,
-    0.007699907124625,
-    0.007589062778208,
-    0.086657010873015,
-    0.039132177933766,
-    -0.023550813565850,
-    0.003904489258229,
-    0.130874026144230,
-    -0.414324223887802,
-    -0.123454786290176,
-    -0.074896418076998,
-    0.459064304062725,
-    0.237800593732595,
-    -0.033615837245684,
-    0.015372735329654,
-    -0.281870960724029,
-    0.222607683757888,
-    -0.254858699806248,
-    0.004192484568906,
-    0.042173267123929,
-    0.006931632024414,
-    -0.107313244089971,
-    0.239216653379720,
-    -0.085768303874313,
-    -0.044327086596297,
-    0.165619938256846,
-    -0.311511964610557,
-    0.005733206437415,
-    0.078188143010255,
-    0.092109767888097,
-    0.281925186274517,
-    -0.115784590513502,
-    0.258519071393495,
-    -0.010933028084004,
-    0.043736846476572,
-    -0.015036417772812,
-    0.004826493802540,
-    0.190944951894239,
-    0.005003140614945,
-    -0.102135092452708,
-    -0.234711773694120,
-    0.217928175096878,
-    -0.270640879123350,
-    -0.127040202325228,
-    0.078558704875240,
-    0.101756591692003,
-    0.030540379805024,
-    0.141881918430264,
-    0.192022708575487,
-    0.295452060177106,
-    0.056836126604322,
-    -0.003110887074841,
-    0.068678113265765,
-    0.019298194938708,
-    0.231839834328775,
-    -0.153738989050785,
-    0.220773648487738,
-    0.018156758083113,
-    -0.033784871858401,
-    -0.247003218884561,
-    0.130412840113811,
-    -0.040481083216881,
-    -0.076194378585714,
-    0.147414357248472,
-    -0.020656061349483,
-    0.065130608898054,
-    0.050148202216498,
-    -0.251911776810379,
-    0.003373939352857,
-    -0.392823782295572,
-    0.255795838784017,
-    0.139340897494046,
-    0.104418159179712,
-    -0.038389239555727,
-    -0.094422391386813,
-    0.088379164900000,
-    0.032666715890023,
-    0.161609543211208,
-    -0.127122640702335,
-    -0.088356765428282,
-    -0.015319579183673,
-    -0.087818460089376,
-    0.338071718459650,
-    0.037367582185708,
-    -0.110384882117598,
-    -0.010280073791619,
-    -0.020062289445773,
-    -0.018163477360652,
-    0.032471868243261,
-    -0.050295614211469,
-    -0.066054120943207,
-    -0.322178207496027,
-    -0.010871961949177,
-    0.104375340803493,
-    -0.024445970421040,
-    0.014906380637584,
-    0.017356575181150,
-    0.094096475879781,
-    -0.217751254629536,
-    0.097731690774478,
-    0.012477807484451,
-    -0.035574589037007,
-    0.028372479002103,
-    0.131641891213454,
-    0.002481990226439,
-    0.178845536381892,
-    0.042462415575654,
-    -0.087960299564126,
-    -0.077318965547572,
-    0.058243637325715,
-    -0.032026564158462,
-    -0.140612579153681,
-    -0.046457340050319,
-    -0.046457340050319,
-    0.695807159072416,
-    0.694303785195817,
-    -0.040678235247822,
-    -0.040678235247822,
-    0.690353290792953,
-    0.689210003514849,
-    -0.061861051228891,
-    0.053979632982040,
-    -0.025623686401663,
-    -0.130318362037164,
-    -0.047368420358966,
-    -0.047368420358965,
-    0.689960359600955,
-    0.688410508436437,
-    -0.041873627297537,
-    -0.041873627297536,
-    0.685562930989748,
-    0.684359808788004,
-    0.011831327731572,
-    -0.035532308405139,
-    0.031167967758005,
-    0.104294923653582,
-    0.002353397408331,
-    0.178632977291549,
-    0.046646160157203,
-    -0.069687640028747,
-    -0.082321540837304,
-    0.042193116161861,
-    -0.034098698690261,
-    -0.101863193276748,
-    -0.029318587171803,
-    -0.029318587171803,
-    0.684963869862403,
-    0.684374835655032,
-    -0.027815043085496,
-    -0.027815043085495,
-    0.681483843782172,
-    0.680956391546348,
-    -0.066906819073276,
-    0.039789714577283,
-    -0.027713711875393,
-    -0.096060868575431,
-    -0.032180676184862,
-    -0.032180676184862,
-    0.680163741992628,
-    0.679459002094654,
-    -0.030200607770428,
-    -0.030200607770428,
-    0.677384900106604,
-    0.676766791105634,
-    -0.029573295865150,
-    -0.006246846263153,
-    -0.038953979709475,
-    -0.041778774185141,
-    0.036834541640524,
-    -0.052105930842540,
-    -0.064488047311337,
-    -0.297701216348575,
-    -0.002912715411655,
-    0.063425294494987,
-    -0.047465561611678,
-    0.034286953880566,
-    0.019688472694503,
-    0.097483340080189,
-    -0.212588601742594,
-    0.090306676685212,
-    0.010913984613285,
-    -0.036446800518061,
-    0.029113546775506,
-    0.091943000655943,
-    0.002170926516973,
-    0.183230439606079,
-    0.043571501875854,
-    -0.061434348944501,
-    -0.103180084317197,
-    0.051021812432725,
-    -0.042738590290982,
-    -0.123177551551942,
-    -0.051121582496763,
-    -0.051121582496763,
-    0.677795539110866,
-    0.676021856548871,
-    -0.049227400730143,
-    -0.049227400730143,
-    0.672584942766913,
-    0.670953063102312,
-    -0.087000377848841,
-    0.049225246324654,
-    -0.036036736436573,
-    -0.118840257288137,
-    -0.055162521631382,
-    -0.055162521631381,
-    0.673246800956803,
-    0.671195049307354,
-    -0.052428755184065,
-    -0.052428755184065,
-    0.668854204299142,
-    0.667013141184195,
-    0.012476451527368,
-    -0.036366569147070,
-    0.032034561001472,
-    0.070871457053004,
-    0.002481720509806,
-    0.182827089266190,
-    0.047943108599263,
-    -0.047354793641032,
-    -0.102736115641344,
-    0.037434985536292,
-    -0.042554692444175,
-    -0.090376049788958,
-    -0.035666757175689,
-    -0.035666757175689,
-    0.668945876333357,
-    0.668094356570850,
-    -0.036663783919358,
-    -0.036663783919358,
-    0.665291180033531,
-    0.664396271753146,
-    -0.086645007530143,
-    0.036684100676001,
-    -0.035889537230904,
-    -0.088563253375462,
-    -0.040625147800898,
-    -0.040625147800898,
-    0.664892298135200,
-    0.663794051111148,
-    -0.040485132598376,
-    -0.040485132598375,
-    0.661892316114730,
-    0.660806553649342,
-    0.033042984401022,
-    0.021328957715012,
-    0.238125960870708,
-    -0.111456718251826,
-    0.165902158932465,
-    0.033084164522607,
-    -0.070720180510076,
-    -0.249540845650859,
-    0.147590958516193,
-    -0.043769449334937,
-    -0.123733060020402,
-    0.073581815135245,
-    -0.041996825362630,
-    0.034458703640650,
-    0.054929750705179,
-    -0.251234837089565,
-    0.001623297730604,
-    -0.434160908242665,
-    0.262731510628985,
-    0.101018481055709,
-    0.078465877419379,
-    -0.069950588730965,
-    -0.197649663762394,
-    0.089287142275542,
-    0.036969610550442,
-    0.174737436637455,
-    -0.206436139042456,
-    -0.044103242730515,
-    -0.031146968471887,
-    -0.046462183320514,
-    0.370306300020275,
-    0.037267167663717,
-    -0.112508792721087,
-    -0.012735896234036,
-    -0.021738577187683,
-    0.017025431526890,
-    0.030062339868752,
-    -0.059313280456735,
-    -0.063261438747548,
-    -0.273942540084679,
-    -0.011081148885120,
-    0.129309724503066,
-    -0.026488532944457,
-    -0.013972410558824,
-    0.016068655432585,
-    0.110967342806109,
-    -0.208545015212481,
-    0.083099561033659,
-    0.009835551230526,
-    -0.032377417596893,
-    0.068321153344910,
-    0.120900704969865,
-    0.001956412779747,
-    0.162772270137907,
-    0.102249831807945,
-    -0.080783268370247,
-    -0.065659050121805,
-    0.061201879216336,
-    -0.027196869052986,
-    -0.147754406846798,
-    -0.041660167784514,
-    -0.041660167784513,
-    0.673545471138226,
-    0.672375469916017,
-    -0.034311247172427,
-    -0.034311247172427,
-    0.668163023308130,
-    0.667375957018586,
-    -0.052856841567013,
-    0.060058153801985,
-    -0.021894020641262,
-    -0.144993209439842,
-    -0.040292240321993,
-    -0.040292240321993,
-    0.667857586347920,
-    0.666772461631536,
-    -0.032654779433444,
-    -0.032654779433443,
-    0.662977728974389,
-    0.662270395541446,
-    0.011877272582201,
-    -0.032311991227765,
-    0.072365313352673,
-    0.105867995614090,
-    0.002362536407339,
-    0.162443349568567,
-    0.108302344980704,
-    -0.070738733108668,
-    -0.072106355413135,
-    0.049594054464038,
-    -0.029867430345415,
-    -0.119730638900151,
-    -0.029065636460522,
-    -0.029065636460521,
-    0.664802463879463,
-    0.664240593859609,
-    -0.025243151891966,
-    -0.025243151891966,
-    0.660914238303199,
-    0.660492958435679,
-    -0.059390099767240,
-    0.049738314688645,
-    -0.024600184794282,
-    -0.120078913890907,
-    -0.028460986580206,
-    -0.028460986580205,
-    0.659552470768331,
-    0.659017998403263,
-    -0.023907744405399,
-    -0.023907744405399,
-    0.655991363677467,
-    0.655616304755918,
-    -0.009327508937177,
-    -0.007331072117413,
-    -0.030685526662560,
-    0.006296860438854,
-    0.034274538289622,
-    -0.047147743745546,
-    -0.063176529222637,
-    -0.236479587856271,
-    -0.000918679445049,
-    0.074433624331941,
-    -0.037390422422852,
-    -0.005167699810976,
-    0.018320122395375,
-    0.088207224460681,
-    -0.208265106021119,
-    0.071735298717031,
-    -0.003557720207853,
-    -0.036121918326131,
-    0.070632035656926,
-    0.072947131085762,
-    -0.000707674549019,
-    0.181597146532300,
-    0.105708311592950,
-    -0.048741714689005,
-    -0.094155668263076,
-    0.054341598449410,
-    -0.039000554768868,
-    -0.131192223977598,
-    -0.045684367877278,
-    -0.045684367877278,
-    0.654226962403550,
-    0.652860122687968,
-    -0.042187201097792,
-    -0.042187201097792,
-    0.649106822094083,
-    0.647950537906218,
-    -0.078188109117923,
-    0.055947038542681,
-    -0.032386575212951,
-    -0.135068099224350,
-    -0.048388028354689,
-    -0.048388028354689,
-    0.649345520527419,
-    0.647823358001531,
-    -0.043312253076888,
-    -0.043312253076887,
-    0.644537462455221,
-    0.643327205327679,
-    -0.000849804886679,
-    -0.035907468854195,
-    0.072965319481389,
-    0.066966342524741,
-    -0.000169036701820,
-    0.180519036232974,
-    0.109200317610575,
-    -0.044745479534618,
-    -0.094814169596128,
-    0.044719482490952,
-    -0.039273314951858,
-    -0.107962381131963,
-    -0.034388289495577,
-    -0.034388289495576,
-    0.648042742412469,
-    0.647275942921293,
-    -0.033272973094272,
-    -0.033272973094272,
-    0.644087374277659,
-    0.643373915960388,
-    -0.079035749035298,
-    0.046773668268005,
-    -0.032737679162736,
-    -0.112921624294559,
-    -0.037051163114670,
-    -0.037051163114670,
-    0.643236860989282,
-    0.642353225763608,
-    -0.034333461768653,
-    -0.034333461768652,
-    0.639583063940792,
-    0.638828687110321,
-    -0.046633925976270,
-    0.000838879054935,
-    -0.521667398088785,
-    -0.330576023440533,
-    -0.682482932853658,
-    -0.303530833274140,
-    0.019030530902155,
-    -0.050763041243603,
-    -0.041461603891010,
-    -0.015841959502422,
-    -0.145807541705860,
-    0.343729806554939,
-    0.155194014929743,
-    0.209219146058280,
-    -0.036249300071008,
-    0.409361540972252,
-    0.153634453639520,
-    -0.044293080288030,
-    0.281851886413063,
-    0.216921322719373,
-    -0.045854928043633,
-    -0.186351938913518,
-    -0.082645669979315,
-    -0.531584436029677,
-    -0.230776598797204,
-    0.037340463095368,
-    -0.029823141335019,
-    0.141287498562903,
-    0.133823167573677,
-    0.013833102224812,
-    -0.024703457382108,
-    0.800569115236646,
-    0.284786255545029,
-    0.003652821696810,
-    -0.020465650739525,
-    0.353133019537183,
-    0.017468589721550,
-    0.244902326928828,
-    -0.107826612027312,
-    0.153202491604418,
-    -0.368732556554131,
-    0.086071621555025,
-    0.071304547317537,
-    -0.007378046652235,
-    0.374265492079547,
-    -0.363810867735820,
-    -0.012549697405975,
-    0.246311006008986,
-    -0.491166233177371,
-    -0.048370784276996,
-    -0.315502872409339,
-    0.186716225112212,
-    -0.184411163640761,
-    -0.079228269864425,
-    0.143081406677238,
-    -0.273642160113177,
-    0.635340704256776,
-    0.031803143411359,
-    -0.179210972189775,
-    -0.592867729659554,
-    0.135352462366079,
-    -0.340958059154288,
-    -0.007507235885915,
-    0.110130349193759,
-    -0.000572313102155,
-    -0.068354583537564,
-    -0.534630777712916,
-    0.322560430876207,
-    -0.292556621279749,
-    0.708083831424772,
-    0.047587248705686,
-    0.020300556374849,
-    -0.008777488878366,
-    0.074831544516766,
-    -0.224122287276289,
-    -0.223620768438001,
-    0.106475054663514,
-    -0.304949918829055,
-    -0.194694643956965,
-    -0.076217142057155,
-    0.017037740057802,
-    0.399404097431747,
-    0.352162789941998,
-    -0.173611993537826,
-    -0.025238279812304,
-    0.338579127152111,
-    -0.284990349949532,
-    0.154156629773707,
-    -0.073109686554087,
-    -0.117868171467074,
-    -0.057480948341469,
-    -0.073304932505309,
-    0.112602277076331,
-    -0.016440072129624,
-    -0.286866400377495,
-    -0.068940890232020,
-    0.017496228806056,
-    -0.059457007835193,
-    -0.023144925476200,
-    -0.312254064065718,
-    0.008525898318834,
-    -0.501776834650043,
-    -0.313428860569624,
-    -0.052705119732194,
-    -0.097186714525000,
-    -0.326561189128170,
-    0.122344582640481,
-    0.004300053711174,
-    0.284759209529450,
-    0.478164880644369,
-    -0.092402011932790,
-    -0.033453044241308,
-    -0.079029316109387,
-    0.300623832759484,
-    -0.436501381421550,
-    -0.134958348027403,
-    -0.113630826005560,
-    0.128579347282296,
-    0.602487478192954,
-    0.064985757567317,
-    0.236162761682364,
-    -0.085558922958943,
-    -0.391261557165317,
-    0.271553389967572,
-    0.125736004691738,
-    0.367034987179963,
-    -0.203822735530266,
-    -0.004056340954531,
-    0.136622484246593,
-    -0.005229584905478,
-    0.165863699760029,
-    -0.002534409453422,
-    -0.213112974300850,
-    -0.040155024586585,
-    -0.083114233596238,
-    -0.117703669914299,
-    0.197198241675052,
-    -0.041486117122089,
-    0.123265643289628,
-    0.248621618565342,
-    0.182048867759636,
-    -0.043355280106620,
-    0.048210741252054,
-    0.461046598541972,
-    0.249017697785673,
-    0.013246507856751,
-    -0.048602649974447,
-    0.099658625119580,
-    -0.422034614560972,
-    0.061610855851859,
-    -0.073298869912490,
-    0.303115210164486,
-    0.255955738113398,
-    -0.100101086412496,
-    0.085596400673341,
-    -0.195114331803298,
-    0.046029122668660,
-    -0.027621019765245,
-    0.000095569214881,
-    0.085309141946602,
-    0.003353893737352,
-    0.213029671574799,
-    0.174212091856824,
-    0.002412958389804,
-    -0.094466484522174,
-    0.090588283940665,
-    -0.215465548434761,
-    0.045403315692274,
-    0.044282345992266,
-    0.184746069050407,
-    0.194657722454950,
-    -0.157437903627266,
-    0.128213278436849,
-    0.061559767841829,
-    0.277845348007624,
-    -0.079999173737602,
-    0.030713403611716,
-    -0.107399848349263,
-    -0.062278540418221,
-    -0.077774354393901,
-    -0.239079656058788,
-    -0.108758370456323,
-    -0.264868081828295,
-    -0.083883275798958,
-    0.084556354447901,
-    0.303010313369774,
-    0.170050841990638,
-    0.098212301254384,
-    0.039704994270559,
-    0.032020437991869,
-    0.001295600235892,
-    -0.006292780359359,
-    -0.285905032479426,
-    -0.002706230149256,
-    0.162466180095202,
-    -0.100190561949057,
-    0.037041161464408,
-    0.024858424935163,
-    -0.080877879082599,
-    0.118162706870412,
-    0.103280692385655,
-    -0.039621224343588,
-    0.060615110613636,
-    -0.066936527719984,
-    -0.056713320375603,
-    0.031068599645647,
-    0.018563067802723,
-    -0.288500363624049,
-    -0.014045613578952,
-    0.055086580188946,
-    0.179253806541947,
-    0.090807432184968,
-    0.017519164630768,
-    -0.052558723613859,
-    -0.226038529471989,
-    -0.042279292564244,
-    0.025870466682136,
-    0.158176794166562,
-    0.101130202394145,
-    0.040120210736118,
-    -0.042061465037468,
-    -0.041891157232764,
-    0.125142038090548,
-    0.042794986343346,
-    -0.132003157900496,
-    -0.015114258534674,
-    -0.022641465866500,
-    0.135822051346288,
-    -0.035344416537774,
-    -0.010819421211209,
-    -0.034250705903123,
-    -0.162790775751885,
-    -0.013001176269197,
-    0.153457642184917,
-    -0.027588705982810,
-    -0.111466276866740,
-    -0.018891984233124,
-    0.020241713377893,
-    -0.112909445706875,
-    0.049382041946201,
-    0.166097111154876,
-    -0.015343902743756,
-    0.059494436289997,
-    0.072183231408097,
-    0.033038769594738,
-    0.077139008227023,
-    0.089039716198145,
-    -0.048231293242875,
-    -0.006575347940746,
-    0.045032701184735,
-    -0.002723598294379,
-    -0.108718557950483,
-    -0.023610121327928,
-    -0.023610121327928,
-    0.666831693455783,
-    0.666459872581784,
-    -0.018702342543382,
-    -0.018702342543382,
-    0.664433622197444,
-    0.664201177529593,
-    -0.017149156086837,
-    0.045781387417911,
-    -0.007103413034421,
-    -0.110526046408579,
-    -0.026502435543474,
-    -0.026502435543473,
-    0.662423734939916,
-    0.661958298846215,
-    -0.021533439671509,
-    -0.021533439671508,
-    0.659905049612677,
-    0.659598987909047,
-    0.169103251865638,
-    -0.018256668659015,
-    0.059197714197453,
-    0.065846956448131,
-    0.033636728160192,
-    0.091782471344119,
-    0.088595640204533,
-    -0.043997529670643,
-    -0.009045084183805,
-    0.041026638338855,
-    -0.003746596541738,
-    -0.099047066696239,
-    -0.025288409838869,
-    -0.025288409838869,
-    0.661778446432218,
-    0.661355101276854,
-    -0.021239597176606,
-    -0.021239597176605,
-    0.659790626300071,
-    0.659492914063411,
-    -0.018920041337876,
-    0.041996131327093,
-    -0.007836937722807,
-    -0.101387629817070,
-    -0.029082907183550,
-    -0.029082907183549,
-    0.657246159892140,
-    0.656690015611923,
-    -0.024953527798293,
-    -0.024953527798293,
-    0.655116421010701,
-    0.654708366985037,
-    -0.172063615523860,
-    -0.013105520406462,
-    -0.022101094112846,
-    0.152046531591656,
-    -0.028497062501798,
-    -0.008960513768658,
-    -0.034576150044697,
-    -0.196377077658843,
-    -0.016946786959653,
-    0.133062581705089,
-    -0.026930261095854,
-    -0.124781363696332,
-    -0.015231997249097,
-    0.016763942163184,
-    -0.113982291263332,
-    0.059570335244312,
-    0.168203972405654,
-    -0.018345829571514,
-    0.056933906129709,
-    0.054840447801881,
-    0.033457850353871,
-    0.092230713520681,
-    0.085207612004779,
-    -0.036643215715145,
-    -0.017233704847469,
-    0.042951018807606,
-    -0.007138434277756,
-    -0.103692932123065,
-    -0.025971270790693,
-    -0.025971270790692,
-    0.658661030182566,
-    0.658216608835460,
-    -0.021617256831976,
-    -0.021617256831976,
-    0.656451655513202,
-    0.656144820142063,
-    -0.026915333841223,
-    0.044121538588504,
-    -0.011148696312834,
-    -0.106518816853135,
-    -0.030211191153470,
-    -0.030211191153470,
-    0.654435161329033,
-    0.653837575002027,
-    -0.025787060839353,
-    -0.025787060839353,
-    0.652030048152986,
-    0.651596321841386,
-    0.162338745003580,
-    -0.022036115999434,
-    0.056746094466278,
-    0.042935421239042,
-    0.032291184086104,
-    0.110783036217019,
-    0.084926531986992,
-    -0.028688531281994,
-    -0.020408072167507,
-    0.037508203381117,
-    -0.008453300273670,
-    -0.090552813302942,
-    -0.027768960878390,
-    -0.027768960878389,
-    0.652406915671762,
-    0.651903640673789,
-    -0.024533063207486,
-    -0.024533063207486,
-    0.650699824133067,
-    0.650308068726714,
-    -0.027304040230772,
-    0.038989052282051,
-    -0.011309703771166,
-    -0.094127898803401,
-    -0.032684509036068,
-    -0.032684509036068,
-    0.648227098634192,
-    0.647534242169829,
-    -0.029310808932910,
-    -0.029310808932910,
-    0.646329381440093,
-    0.645773865935824,
-    -0.273193025258234,
-    -0.001246744111907,
-    0.147843597821788,
-    -0.086056515989568,
-    0.034696698172134,
-    0.017174056690432,
-    -0.088007564990093,
-    0.041427887228851,
-    0.077683398142896,
-    -0.040785063911136,
-    -0.004003904007943,
-    -0.077847153455671,
-    -0.043927256512872,
-    0.027510772230769,
-    0.018425008872571,
-    -0.291819381967110,
-    -0.013421112709928,
-    0.025378059406573,
-    0.163120273197060,
-    0.077997079642799,
-    0.016410316075152,
-    -0.036311492030388,
-    -0.245964666710099,
-    -0.014823135072455,
-    0.019458678258145,
-    0.162823102168622,
-    -0.006680110266085,
-    0.046659788134125,
-    -0.032578673789004,
-    -0.037093982292678,
-    0.124211320383784,
-    0.043287316206922,
-    -0.134700842187387,
-    -0.015098797976450,
-    -0.011789474991032,
-    0.079238785472090,
-    -0.048768965625281,
-    0.003013644703636,
-    -0.041273764150680,
-    -0.162665134230046,
-    -0.013266874980428,
-    0.153300668502977,
-    -0.014365516841404,
-    -0.065029590647966,
-    -0.026067555215514,
-    -0.005638132680392,
-    -0.136061366024711,
-    0.049343929007228,
-    0.168311472448911,
-    -0.020266363915288,
-    0.085417821898738,
-    0.097627800491946,
-    0.033479233441968,
-    0.101885891673120,
-    0.127836804487986,
-    -0.065232810755765,
-    0.014021686676488,
-    0.051746745105391,
-    0.005807972788748,
-    -0.124927693842098,
-    -0.027647428753599,
-    -0.027647428753599,
-    0.649844886482159,
-    0.649347967851983,
-    -0.021212177445225,
-    -0.021212177445225,
-    0.646714695680610,
-    0.646423636721102,
-    0.005226521617089,
-    0.053631375921232,
-    0.002164896137835,
-    -0.129477595117769,
-    -0.028444851815081,
-    -0.028444851815081,
-    0.643605359382262,
-    0.643084401269298,
-    -0.021451779163073,
-    -0.021451779163072,
-    0.640304599819784,
-    0.640009877370543,
-    0.170939807417923,
-    -0.021251774293588,
-    0.084598078865872,
-    0.093978086384015,
-    0.034002041772921,
-    0.106839884183897,
-    0.126609972341094,
-    -0.062794149754333,
-    0.006694332213363,
-    0.047306477722686,
-    0.002772883193806,
-    -0.114207940106210,
-    -0.026878095725198,
-    -0.026878095725197,
-    0.645291410453482,
-    0.644825062756859,
-    -0.021458542466666,
-    -0.021458542466665,
-    0.642719197045491,
-    0.642423176580928,
-    -0.002040883297191,
-    0.049302883460200,
-    -0.000845361540917,
-    -0.119027689913715,
-    -0.028264311827689,
-    -0.028264311827689,
-    0.639069919329384,
-    0.638559180608569,
-    -0.022355994206428,
-    -0.022355994206427,
-    0.636305311729998,
-    0.635987212883496,
-    -0.172155793385138,
-    -0.013367003826990,
-    -0.011744914613139,
-    0.105427831864415,
-    -0.039028052842136,
-    0.001078418240882,
-    -0.041396108531175,
-    -0.197350524839572,
-    -0.016955865686568,
-    0.135717467427247,
-    -0.014311219863839,
-    -0.086522385574175,
-    -0.020860928858598,
-    -0.002017578621567,
-    -0.136464681396548,
-    0.059865627218253,
-    0.168784503527882,
-    -0.023219763759477,
-    0.081650987728831,
-    0.079585311231240,
-    0.033573325173731,
-    0.116733635345850,
-    0.122199338762297,
-    -0.053177204856873,
-    0.005475659087117,
-    0.048996097854191,
-    0.002268092256816,
-    -0.118287043942949,
-    -0.029085578287751,
-    -0.029085578287751,
-    0.642608310695244,
-    0.642064452645798,
-    -0.023262389393332,
-    -0.023262389393332,
-    0.639855198600992,
-    0.639508854416558,
-    -0.001820878273683,
-    0.051371625116105,
-    -0.000754232476390,
-    -0.124022074076447,
-    -0.031728382919537,
-    -0.031728382919536,
-    0.636763169976817,
-    0.636121823700042,
-    -0.025310936390627,
-    -0.025310936390626,
-    0.633758067008081,
-    0.633351923883088,
-    0.163254678019018,
-    -0.024990399773721,
-    0.081119557111863,
-    0.070135587695507,
-    0.032473374490566,
-    0.125635223706439,
-    0.121403996638487,
-    -0.046863101456053,
-    -0.002441603466238,
-    0.042978755758037,
-    -0.001011345269652,
-    -0.103759895044974,
-    -0.028381864986544,
-    -0.028381864986543,
-    0.636837463987324,
-    0.636324265357477,
-    -0.023902645894034,
-    -0.023902645894033,
-    0.634744199313237,
-    0.634381443138696,
-    -0.007778139133397,
-    0.045698825745877,
-    -0.003221810719077,
-    -0.110326724900221,
-    -0.031480091209328,
-    -0.031480091209328,
-    0.631221872260132,
-    0.630596023558996,
-    -0.026435551651345,
-    -0.026435551651344,
-    0.628856202620982,
-    0.628416580097841,
-    0.137851788036480,
-    0.001759152089960,
-    0.197504058732927,
-    -0.002665971487449,
-    -0.211352741237736,
-    -0.062070192456312,
-    -0.063978686425584,
-    -0.185975136568874,
-    0.267086791016418,
-    -0.025754142013556,
-    0.162740389601016,
-    0.139330667153264,
-    0.164486133818225,
-    -0.049493465983830,
-    0.045792490952368,
-    0.031459423865622,
-    0.210816521939786,
-    -0.002023255729548,
-    0.065855758430018,
-    0.134263035619513,
-    -0.433918564067428,
-    0.066500980960522,
-    -0.048302957750605,
-    0.279010493593873,
-    0.171729170115837,
-    -0.057873165694547,
-    0.080171255428442,
-    -0.019112346214747,
-    -0.180120679031296,
-    -0.139430591395909,
-    0.009395739511194,
-    0.100272476969488,
-    0.003384071451547,
-    -0.071659911589069,
-    0.207445000152877,
-    0.002538215858899,
-    -0.093686226867953,
-    0.140028110463730,
-    -0.165858507771261,
-    0.071738526442704,
-    0.059976344562150,
-    0.114688402502658,
-    0.256995158957082,
-    -0.088230171914166,
-    0.115844205645275,
-    0.070275322132835,
-    0.263908628126612,
-    -0.005458727867138,
-    0.026001737964535,
-    0.016404124081242,
-    0.084386355791562,
-    -0.104779901405858,
-    -0.245811830298996,
-    -0.117390648498758,
-    -0.174544461344495,
-    -0.077212602337699,
-    0.056731654794649,
-    0.175184572928038,
-    0.159272929490120,
-    0.009620346628422,
-    -0.155373166254508,
-    0.161638804211712,
-    0.127374932840559,
-    -0.007396542261002,
-    -0.021668267766115,
-    0.017039338771325,
-    0.199171937526368,
-    -0.100207917403689,
-    0.074473455944776,
-    -0.017751324196452,
-    -0.085401545516280,
-    -0.191613866599157,
-    0.140612124141109,
-    -0.025362977494286,
-    0.029660000633311,
-    0.072956398719042,
-    -0.047498777278168,
-    -0.049024263206181,
-    0.023763774778185,
-    -0.229708288076799,
-    -0.001064493735311,
-    -0.346843708710895,
-    0.219752368997753,
-    0.090823162252141,
-    0.035223321400773,
-    0.037532021624653,
-    -0.238681330199327,
-    0.068560537752376,
-    0.035221503542149,
-    0.101254681979913,
-    0.049484721494221,
-    -0.043728382556697,
-    -0.035227494115608,
-    0.066101566907225,
-    0.160202356640140,
-    0.034074005757615,
-    -0.112857054131433,
-    -0.017760489637418,
-    -0.009806477034241,
-    0.015696823427664,
-    -0.015632444526035,
-    -0.041956772945502,
-    -0.041904738403149,
-    -0.064322286679393,
-    -0.011115449640160,
-    0.180325277456060,
-    -0.011949226839819,
-    -0.012882050070466,
-    -0.008355715681298,
-    0.078495601164357,
-    -0.138141409376316,
-    0.019511952346235,
-    0.035296473608694,
-    -0.020731920448903,
-    0.066784630947923,
-    0.059964480129246,
-    0.007020905125658,
-    0.104226402420377,
-    0.099950263534149,
-    -0.040066984656298,
-    -0.030713238998850,
-    0.028515723310356,
-    -0.012721840137729,
-    -0.068843045956740,
-    -0.031487966659674,
-    -0.031487966659674,
-    0.609092940036127,
-    0.608488729548219,
-    -0.029913306629669,
-    -0.029913306629668,
-    0.608048103661607,
-    0.607503774979428,
-    -0.026069955087917,
-    0.030292488729593,
-    -0.010798528967872,
-    -0.073132537129018,
-    -0.030413417773976,
-    -0.030413417773975,
-    0.606640084127984,
-    0.606078696866183,
-    -0.028476077025756,
-    -0.028476077025755,
-    0.605532331670149,
-    0.605041114155104,
-    0.045303113320192,
-    -0.020748647754799,
-    0.068875062298081,
-    0.066796995801607,
-    0.009011349520188,
-    0.104310496265909,
-    0.103078815139252,
-    -0.044632325671819,
-    -0.041057552191249,
-    0.026898569901361,
-    -0.017006594955456,
-    -0.064938892264306,
-    -0.032501066987588,
-    -0.032501066987587,
-    0.606178144893221,
-    0.605537488638289,
-    -0.031451065720079,
-    -0.031451065720078,
-    0.605108531731410,
-    0.604509680477155,
-    -0.036796911673662,
-    0.028614160999255,
-    -0.015241779868675,
-    -0.069080695560329,
-    -0.031194062327891,
-    -0.031194062327891,
-    0.603490879200175,
-    0.602903354626962,
-    -0.029775767023061,
-    -0.029775767023061,
-    0.602380354538839,
-    0.601846049382642,
-    -0.049594598683908,
-    -0.014249476901302,
-    -0.011418926806610,
-    0.025013311745580,
-    -0.020163924697780,
-    -0.042874889926452,
-    -0.041436691443815,
-    -0.078052295859208,
-    -0.004884641623314,
-    0.144677366913214,
-    -0.013914002572285,
-    -0.020527894437983,
-    -0.010777842295436,
-    0.080213277222344,
-    -0.136598465330354,
-    0.023676905096830,
-    0.031162692860807,
-    -0.025522731042031,
-    0.063806629534494,
-    0.045659831004632,
-    0.006198645010868,
-    0.128311433714504,
-    0.095493369457586,
-    -0.030508923688300,
-    -0.048906715685249,
-    0.026124299362689,
-    -0.020257824927955,
-    -0.063069637828899,
-    -0.041056338764817,
-    -0.041056338764816,
-    0.599785897865950,
-    0.598774031457162,
-    -0.040399159392185,
-    -0.040399159392185,
-    0.598649669059396,
-    0.597671819053201,
-    -0.041416631050823,
-    0.028077208633062,
-    -0.017155330289053,
-    -0.067784377875518,
-    -0.041672268842442,
-    -0.041672268842441,
-    0.597209728055388,
-    0.596171724715132,
-    -0.040479202489866,
-    -0.040479202489866,
-    0.596075220899004,
-    0.595097710892961,
-    0.040406241992371,
-    -0.025592100013963,
-    0.065939410030479,
-    0.051423637009659,
-    0.008037301251617,
-    0.128660175086627,
-    0.098685301038378,
-    -0.034360175733970,
-    -0.053945166240796,
-    0.024359366541018,
-    -0.022344819481408,
-    -0.058808713074144,
-    -0.039966168443248,
-    -0.039966168443247,
-    0.597558870109801,
-    0.596603629030439,
-    -0.039738894093822,
-    -0.039738894093821,
-    0.596437764793962,
-    0.595495137503664,
-    -0.046732943723033,
-    0.026331939684874,
-    -0.019357419099698,
-    -0.063570925910814,
-    -0.040420184600734,
-    -0.040420184600733,
-    0.594794317410935,
-    0.593821752481941,
-    -0.039650527255210,
-    -0.039650527255209,
-    0.593690292078690,
-    0.592756178521211,
-    -0.028678416089101,
-    0.018857817722128,
-    0.189577122138146,
-    -0.103272732786563,
-    0.045687067214902,
-    -0.002899351040735,
-    -0.090721793589006,
-    -0.158243133069530,
-    0.118750676323340,
-    -0.027513110702323,
-    -0.039016560276940,
-    0.049840541636804,
-    -0.046948299143806,
-    -0.039589307195460,
-    0.022933619614233,
-    -0.226764616787759,
-    -0.001408880238836,
-    -0.383859698120693,
-    0.209166121568299,
-    0.093600948997975,
-    0.021608373506428,
-    0.006130162727807,
-    -0.253550427465801,
-    0.056620298371013,
-    0.029745495932895,
-    0.109838494911311,
-    -0.065095198170649,
-    -0.029873271019316,
-    -0.034819231706548,
-    0.053380001396154,
-    0.154605905113246,
-    0.033637353369967,
-    -0.105407970741624,
-    -0.017376340629396,
-    -0.005002398397038,
-    0.006182565534740,
-    -0.018623015009739,
-    -0.021178914973784,
-    -0.044234782377609,
-    -0.045562861832547,
-    -0.010381778963374,
-    0.176424947123382,
-    -0.006095440083186,
-    -0.005073900407270,
-    -0.009954208907684,
-    0.039622963020422,
-    -0.145822534967510,
-    0.013821343032563,
-    0.045146403773928,
-    -0.018485105219912,
-    0.090409119923592,
-    0.055716228721260,
-    0.008980178053349,
-    0.092930899488162,
-    0.135306809875163,
-    -0.037228393816971,
-    -0.023710693673501,
-    0.034224474588491,
-    -0.009821290892837,
-    -0.082625190716629,
-    -0.029378809522849,
-    -0.029378809522848,
-    0.596740057381159,
-    0.596224779947600,
-    -0.026776694991253,
-    -0.026776694991253,
-    0.595401584690998,
-    0.594974533727555,
-    -0.020526383267079,
-    0.038460136567800,
-    -0.008502306335692,
-    -0.092850983312705,
-    -0.026217107624540,
-    -0.026217107624540,
-    0.593672784816820,
-    0.593264591373492,
-    -0.022806563619966,
-    -0.022806563619966,
-    0.592045330548681,
-    0.591737304349624,
-    0.055246455418543,
-    -0.018485278288632,
-    0.090834872656719,
-    0.064494090578372,
-    0.010989203236636,
-    0.092931769563376,
-    0.135943993869032,
-    -0.043093573596500,
-    -0.033409291889534,
-    0.032133617797893,
-    -0.013838581809926,
-    -0.077577415895788,
-    -0.030493593874183,
-    -0.030493593874182,
-    0.594179660886721,
-    0.593626900308198,
-    -0.028458105338307,
-    -0.028458105338307,
-    0.592899878122100,
-    0.592419515404822,
-    -0.030714543844031,
-    0.036131334743598,
-    -0.012722380622300,
-    -0.087228758364638,
-    -0.027166454286638,
-    -0.027166454286638,
-    0.590889647628837,
-    0.590453400435518,
-    -0.024395301577188,
-    -0.024395301577187,
-    0.589363241304837,
-    0.589012388690803,
-    -0.026682990145696,
-    -0.014349559456271,
-    -0.005798983519491,
-    0.024197069703251,
-    -0.019590724658862,
-    -0.020615733203301,
-    -0.044092411276431,
-    -0.059516966181029,
-    -0.002628045145215,
-    0.145693522146643,
-    -0.007066081863326,
-    -0.019858021905661,
-    -0.010471460491507,
-    0.038569324035931,
-    -0.145353200345207,
-    0.018054274309386,
-    0.030878064286230,
-    -0.023327164877341,
-    0.087879774703123,
-    0.041399983528574,
-    0.006142028867275,
-    0.117273577227183,
-    0.131521377242440,
-    -0.027662584604004,
-    -0.045800551719357,
-    0.031901446733026,
-    -0.018971209686328,
-    -0.077016905362196,
-    -0.039978648790084,
-    -0.039978648790083,
-    0.587564987363235,
-    0.586625135052903,
-    -0.038387982722330,
-    -0.038387982722329,
-    0.586144174151865,
-    0.585279772905118,
-    -0.039619769353936,
-    0.036240193368041,
-    -0.016411045804494,
-    -0.087491566332149,
-    -0.038256066296852,
-    -0.038256066296852,
-    0.584463586143848,
-    0.583607581281832,
-    -0.035728790792332,
-    -0.035728790792332,
-    0.582825834797552,
-    0.582081355037800,
-    0.041136074560148,
-    -0.023413384043764,
-    0.088264550394640,
-    0.049468566769999,
-    0.008182473975465,
-    0.117707030247519,
-    0.132097234759697,
-    -0.033053839564197,
-    -0.050559218837455,
-    0.029622921946320,
-    -0.020942314145462,
-    -0.071516059919926,
-    -0.039206002897505,
-    -0.039206002897504,
-    0.585649369443771,
-    0.584748468628017,
-    -0.038144715981209,
-    -0.038144715981208,
-    0.584307711118796,
-    0.583456912673444,
-    -0.044686453129913,
-    0.033806968634051,
-    -0.018509734940759,
-    -0.081617242179049,
-    -0.037379993786351,
-    -0.037379993786350,
-    0.582380927733989,
-    0.581566618566537,
-    -0.035443192948095,
-    -0.035443192948094,
-    0.580859995898449,
-    0.580129849096276,
-]
+# Tree of constants_<N>.h in C tree order (read-only array, loaded on first use)
+def tree_values(N):
+    if N not in TREE_VALUES:
+        values = np.load(TREE_VALUES_FILE.format(N=N))
+        values.flags.writeable = False
+        TREE_VALUES[N] = values
+    return TREE_VALUES[N]
 
-tree_values1024 = [
-    -12.195521255216331,
-    3.462676613970205,
-    2.085969764713557,
-    12.792676215975559,
-    -0.018324357825561,
-    -8.307313293623363,
-    -3.045908264085984,
-    -2.186939866845932,
-    -15.821724346160774,
-    6.915836487798979,
-    5.978831166541942,
-    3.252750905351879,
-    -5.920582677805792,
-    -11.316281356796418,
-    -8.749389101944605,
-    17.260948765925093,
-    8.470843428204571,
-    9.238574702495486,
-    -0.964366600368773,
-    -2.959322674848802,
-    5.633406257556397,
-    2.404580134352280,
-    7.821005368185586,
-    4.492599733782097,
-    2.434217478893800,
-    8.828205717664281,
-    -5.704609143043522,
-    6.023598235768468,
-    6.540875254938122,
-    -7.585473546604704,
-    3.471262419722217,
-    -5.022292278542245,
-    -2.936675955675492,
-    -13.849206500522406,
-    -0.976805110155548,
-    -3.167216091913423,
-    -1.669706736649553,
-    -3.743299457452575,
-    -4.426103232699770,
-    15.855438940949213,
-    4.086875169430369,
-    4.838701870496667,
-    6.749773310530987,
-    -4.970717858539278,
-    -1.463672596593548,
-    -14.200872546141985,
-    -1.975519546401043,
-    6.001430187707958,
-    -0.633137431793243,
-    8.156989101776462,
-    3.397269516624891,
-    -3.927071070843672,
-    -2.194535090987999,
-    -5.730270951891987,
-    -1.168252751259024,
-    -0.404143472175780,
-    1.449219704029786,
-    10.119035673318601,
-    -1.879955881638431,
-    3.836614775846944,
-    -4.240698157463133,
-    -9.234816442901375,
-    5.689713299774313,
-    -2.153581944897617,
-    11.560761765605443,
-    -7.616248820327178,
-    -2.642277067692048,
-    -8.786679470722001,
-    -7.612002740408840,
-    -1.065014676564572,
-    -6.539582236272386,
-    -12.423909187539666,
-    -9.481625812602809,
-    0.571619965465302,
-    4.044471346914964,
-    10.726726686319433,
-    -4.091790540839351,
-    4.762033095569775,
-    -1.052956214494213,
-    -5.517792226710383,
-    -3.784504544955337,
-    -5.159378929855412,
-    1.067923738141136,
-    -6.886704819075368,
-    9.350333399606109,
-    -2.105577708362819,
-    -1.166378560899363,
-    3.156882322233662,
-    -11.835740535802929,
-    0.742285674744225,
-    5.940158082410238,
-    5.359148664760043,
-    1.783765105147251,
-    -2.093844133963151,
-    3.606374827611910,
-    -1.102805054661819,
-    -16.696314845783270,
-    1.115281395069810,
-    0.784734934279988,
-    -2.615029227033487,
-    1.331959365070750,
-    9.012184147614569,
-    0.586010283007871,
-    9.135307772776606,
-    9.118445188296661,
-    5.829868910110799,
-    -4.076229868047835,
-    -0.386989736905410,
-    6.275611210233307,
-    -0.882938381072334,
-    -5.701446898937631,
-    -9.965207793822357,
-    -0.718590389711878,
-    -4.943375985951562,
-    10.424413196559208,
-    5.453777046890973,
-    -10.354759594019329,
-    -2.383653583119945,
-    9.806836005971759,
-    -8.842040241165559,
-    0.591525371649668,
-    7.324513724196974,
-    0.878767589776496,
-    4.913021293818819,
-    -2.303072523308596,
-    -1.438493432590332,
-    8.138193099137270,
-    -12.039018766088155,
-    8.615502353721030,
-    0.444062504893412,
-    -2.474435706736923,
-    -1.478744675175770,
-    10.421556124282182,
-    -8.477222101055967,
-    6.104512898954144,
-    2.578631114387568,
-    6.854554377989135,
-    0.386703714385354,
-    1.377500744290063,
-    -11.133319866106230,
-    4.798915522448359,
-    -6.963055657771241,
-    5.747353011332966,
-    -7.071730393277182,
-    3.651789688697830,
-    -3.245277059445531,
-    -5.836147361446987,
-    0.200168895652868,
-    0.715729130016245,
-    -3.914354009993193,
-    6.613800176363426,
-    1.697924358959575,
-    2.434900156824042,
-    2.881992605433175,
-    -1.155726539486467,
-    8.140523748443028,
-    -14.517718850809191,
-    -4.867125039806019,
-    1.462459085155444,
-    0.188610837713886,
-    6.233675547777845,
-    4.445789940774276,
-    3.652892927277718,
-    -0.569542473525356,
-    -3.816865002616478,
-    -18.405554160535758,
-    5.226397581096516,
-    -4.657383814914224,
-    -2.330994200366426,
-    0.295247953667073,
-    4.693393533710898,
-    -7.841997620363489,
-    -2.834563791870430,
-    -1.170768459940143,
-    -5.483207638724222,
-    5.506584506795617,
-    -9.851591319800887,
-    -3.432161924723365,
-    2.564883944351660,
-    7.215198674515208,
-    12.144881514053054,
-    -0.500146319320979,
-    -1.371426205584728,
-    -0.100123682693595,
-    7.956136411679608,
-    1.713849671509170,
-    -0.978387669547773,
-    -6.300930137687510,
-    -2.547211055688381,
-    -5.121963617936528,
-    -9.874113577574731,
-    2.342595276022035,
-    -8.806588229286211,
-    -5.993205558846968,
-    -11.164392843426715,
-    7.703381453829666,
-    2.807373910273105,
-    -0.783276959910856,
-    7.839528242382514,
-    -1.073246751180471,
-    -3.352823933981635,
-    -0.266160131984993,
-    8.613684393070214,
-    10.409550633610845,
-    2.663964411834835,
-    -1.813982121307495,
-    2.630932174078777,
-    -1.377003700710102,
-    0.487423401096423,
-    2.867811132130632,
-    1.710939530744910,
-    3.478213721841100,
-    3.010924303347808,
-    -0.522794124335767,
-    2.158736445678270,
-    3.811372577662949,
-    -4.678038050097634,
-    14.816533746556997,
-    -17.903361683260805,
-    -13.006356360804377,
-    -0.644610618466686,
-    -0.852476580704568,
-    -1.495221041199879,
-    7.103536857670495,
-    -6.527482638538819,
-    1.258481639689167,
-    -9.458971504124344,
-    0.809043759226297,
-    0.994498060651400,
-    -4.338239073279493,
-    4.756438556382497,
-    -1.623934732592577,
-    -1.478369586314996,
-    0.721910103616603,
-    -5.259638432911332,
-    3.612226153367222,
-    3.100058121994409,
-    5.826804568199226,
-    8.371342314683275,
-    -5.317670915240389,
-    1.327240127379736,
-    2.406918526423147,
-    7.065122336435887,
-    1.479669813993076,
-    6.870862603708207,
-    -0.665498726255402,
-    8.121729959484528,
-    0.375262918086909,
-    -2.014347917899477,
-    5.041344035915582,
-    3.430318727111357,
-    1.943979479346501,
-    -4.791783811774171,
-    5.038843648574442,
-    -3.029082346451263,
-    -13.923899144920048,
-    8.172285161033333,
-    -5.117979859596047,
-    -5.102156197137889,
-    -3.220669983675245,
-    2.544843650212263,
-    0.593258585473414,
-    7.471063270388908,
-    -1.658652230776906,
-    1.841111686650040,
-    0.725056351739414,
-    -5.982416413569518,
-    12.347728679604836,
-    -1.006900296058992,
-    -1.894093872219891,
-    -0.922407458482432,
-    0.421734464759100,
-    -6.727033840591386,
-    -3.294889102571904,
-    9.109874495889196,
-    -1.024011992310676,
-    5.977378911797726,
-    -4.638616536043298,
-    -2.446262970725496,
-    6.847674636845930,
-    1.274166584217816,
-    -2.295724604919641,
-    -4.888279002750467,
-    -1.130235929020806,
-    -1.495263391967384,
-    5.472590565946873,
-    -2.247755784613977,
-    -2.709416792464058,
-    2.083612228290025,
-    1.301992637292098,
-    0.823425722279998,
-    -7.489541098995004,
-    -6.047279978567343,
-    -6.895478081364534,
-    -5.038133882072626,
-    -6.801005305372042,
-    1.642340406459531,
-    -1.508980654531010,
-    5.629157758817461,
-    -3.193621649999102,
-    -6.452608523310685,
-    -1.677679185862888,
-    8.095841878892042,
-    -3.528371608450810,
-    -12.191066781565665,
-    3.783843939067221,
-    2.802255038003818,
-    -2.141874713039856,
-    5.901758289114740,
-    -1.589134438853085,
-    9.740812475812639,
-    -0.308962434636748,
-    -12.878258158014729,
-    0.296249309176899,
-    -5.982273111448648,
-    8.242608204548885,
-    -0.599954161576347,
-    -1.918792068104574,
-    -5.189946727990241,
-    4.308237430451644,
-    -10.911308175878709,
-    -10.931477875198542,
-    -3.191417057086860,
-    2.732829485882808,
-    0.438922368405934,
-    -8.827757159802736,
-    15.800070339925417,
-    9.058406423297534,
-    -6.099254094161905,
-    -16.074649798946059,
-    -3.664935641664165,
-    3.301832403111220,
-    2.725037858486852,
-    -17.849368523654693,
-    14.075737461022396,
-    0.599714918229526,
-    3.718601517567885,
-    2.529890343333403,
-    2.829891157008649,
-    2.845021369429118,
-    -9.682540249864470,
-    -2.244510002099434,
-    4.992604703284865,
-    -16.258092621261884,
-    -14.152997657552552,
-    -0.798674279533933,
-    13.656889575617088,
-    9.703244226497906,
-    -7.661691059657948,
-    -3.055457126823936,
-    -4.945167034939542,
-    -8.296465618391002,
-    2.217451114671384,
-    10.951170337592091,
-    8.350931170448142,
-    8.364229318287148,
-    4.413746015478124,
-    12.470944242710347,
-    0.953045649779723,
-    -2.868775132247398,
-    5.076220784099140,
-    -1.331816162254911,
-    -2.047441738238258,
-    4.560569477369815,
-    -2.689950302796247,
-    8.972782405808953,
-    -5.337228154177908,
-    -0.649439793801270,
-    -1.466629400701501,
-    -13.851524847843724,
-    1.444281219098566,
-    -9.143005205324837,
-    1.613962317256643,
-    -10.597171688101474,
-    0.061134582518483,
-    3.260472336170525,
-    0.750584807900726,
-    -3.883243915576868,
-    4.847684695341941,
-    -2.784755899673752,
-    13.943925276066251,
-    -8.544734417009812,
-    -2.798046591190138,
-    9.193849071422536,
-    4.471866072279086,
-    0.708241137138145,
-    -8.536236594776236,
-    -4.359284883309927,
-    -5.305493561104554,
-    -15.348158397461169,
-    2.085248867374607,
-    4.525093619038924,
-    5.800015326400473,
-    -3.049518396576113,
-    1.756921557803383,
-    -5.266989574336079,
-    8.906579338560197,
-    -6.051562696980834,
-    -9.926415298742183,
-    -4.080420782495329,
-    6.022483538553876,
-    -5.927785304731599,
-    -5.294507615706685,
-    -3.038054562271953,
-    3.843890356936977,
-    -0.118747176170577,
-    6.536781528866015,
-    10.347204729721790,
-    7.557096854573237,
-    -6.444104283085591,
-    0.640174012157565,
-    -1.930095811271705,
-    8.635028511720243,
-    8.730395288285736,
-    7.619048060747184,
-    2.538222141823223,
-    7.411923083064003,
-    -7.560933100318194,
-    5.962544260344186,
-    14.073941280438554,
-    -2.164348710774369,
-    3.645053016462017,
-    -9.760817319628526,
-    1.693283979340771,
-    3.220981971397908,
-    8.687747637814974,
-    -0.925487751754563,
-    -1.675888511443953,
-    7.115394511180313,
-    3.889981012508891,
-    -5.432271984107498,
-    -5.885496530323737,
-    1.637748844716891,
-    5.377282175888629,
-    8.730900486559545,
-    0.729705245618273,
-    -3.424368047328473,
-    -0.883374850449523,
-    7.182481524127162,
-    3.174229640793018,
-    -5.424031393266520,
-    4.987571128069732,
-    -1.340710877624010,
-    -0.391275738613710,
-    5.195530894892394,
-    3.520341744643940,
-    8.950010734361474,
-    5.293088024813289,
-    0.010433559887957,
-    -11.131706218891365,
-    -4.508543667141977,
-    5.866582821536967,
-    4.804299076675584,
-    -2.753477593676261,
-    8.537425179762696,
-    -0.633167201915050,
-    8.127879750018183,
-    7.481082868782741,
-    -1.332909869884002,
-    -0.917127275206369,
-    3.660866824738579,
-    -8.649461146630594,
-    8.830184971357680,
-    1.146778316988400,
-    7.674540898837980,
-    -10.837940716123690,
-    -2.454532140713205,
-    7.314909043563557,
-    -1.470541916245492,
-    -2.458278027493472,
-    -5.939847094412241,
-    10.411901232030520,
-    11.250062635508755,
-    3.370459367428295,
-    4.007102760048537,
-    1.967490217186545,
-    2.831598293692489,
-    2.459370168492770,
-    -2.016206370308257,
-    -3.898401150450629,
-    1.810511694254345,
-    -0.154431206806266,
-    -12.017695857495156,
-    -0.127989547645878,
-    -2.339883338426783,
-    11.234865802637289,
-    0.046759182086596,
-    0.818117459823134,
-    -1.440175933087712,
-    1.938333915148322,
-    2.337268166793479,
-    -8.265819344132815,
-    4.525233664493332,
-    0.822618255787880,
-    5.572296489067480,
-    -5.568188097047050,
-    -1.177479916179246,
-    -7.966157356372957,
-    -4.714028367693339,
-    1.874946300165163,
-    9.718325533143105,
-    6.856533454077976,
-    -1.608694173783395,
-    -0.490989335858608,
-    6.472352190386862,
-    0.573283403114102,
-    13.435763944932468,
-    -2.438535169664023,
-    2.054602233448144,
-    -1.071366376983781,
-    -7.003327369003703,
-    7.063890421221893,
-    3.697677661951924,
-    13.682533157298417,
-    3.936242200097359,
-    -1.492658058794682,
-    -1.842753403934336,
-    0.274059668361224,
-    5.383024912547188,
-    14.847369502979324,
-    3.908700406740083,
-    5.116002014192031,
-    3.743071109492419,
-    -6.304560809848124,
-    9.615782653126660,
-    -2.539298165716703,
-    -8.879296012753963,
-    4.320550905708076,
-    -0.720082427409143,
-    18.396053418923056,
-    -17.471763707128275,
-    2.351570021954275,
-    -10.080839328803576,
-    -0.383995118926015,
-    -5.252249409001090,
-    -3.401856707491307,
-    1.191080950891355,
-    -1.156786172083612,
-    -4.563571843601397,
-    -4.728490152914497,
-    2.035049720807794,
-    -1.117430072737241,
-    -4.678968303007792,
-    -6.497783985708698,
-    11.822551803815285,
-    5.841088309857860,
-    5.087379565857590,
-    4.806513028807792,
-    -5.326751114457121,
-    4.019510181878590,
-    -2.801121505622465,
-    8.857481884474964,
-    -3.150143167715786,
-    -6.299295822950167,
-    8.505425544316179,
-    11.809042369630710,
-    -7.610378668496313,
-    3.584880944334798,
-    -1.322514498191837,
-    -1.366706246240594,
-    -1.899601181519395,
-    -5.161401141673292,
-    -7.150874356077438,
-    3.275017310714455,
-    7.655022101893806,
-    7.233476793181630,
-    -11.326303705853197,
-    -11.988822602048311,
-    -2.776570047694288,
-    2.402687324225851,
-    -0.618372126894609,
-    -0.885416187581005,
-    3.992122290844796,
-    -1.099219529406486,
-    1.697721427050092,
-    6.472530901909471,
-    3.911998814818917,
-    2.005013589366183,
-    0.385283139432066,
-    3.206451096194825,
-    4.823824110827575,
-    6.201010017222609,
-    6.242052968704789,
-    3.042020065505541,
-    3.332081562437837,
-    5.124746810498268,
-    -10.099731937477571,
-    -4.399236625619859,
-    -7.393846619700100,
-    -4.119747196990942,
-    3.514664471451075,
-    7.533972644442181,
-    3.562510543196447,
-    7.865731366161331,
-    -1.038069933659691,
-    -1.154138158882881,
-    6.935669544379719,
-    -7.929400461854639,
-    3.840459940488980,
-    -12.262991160305308,
-    7.772291151559712,
-    -6.805480611228019,
-    1.652486265054762,
-    7.005411837546504,
-    -5.114793103884066,
-    -2.545508935582541,
-    5.886264674527280,
-    3.548217893170185,
-    0.821323745778154,
-    0.703187909192414,
-    -8.344323894663226,
-    -7.538942783796351,
-    -3.121128383360475,
-    3.548907138305872,
-    1.584892735042836,
-    -0.188809897155444,
-    4.327287282286678,
-    1.518238999104360,
-    -5.458436814727287,
-    5.322376975195371,
-    -1.944338393247053,
-    -3.870006826468392,
-    -3.511643066703150,
-    -3.081315732751700,
-    5.700861136741391,
-    -0.885263208706644,
-    -13.489796125831951,
-    4.175283924572650,
-    4.802862427387506,
-    -4.672646819923184,
-    10.281638493621774,
-    3.791026588284321,
-    -4.706651880899768,
-    -1.182687503095595,
-    -9.003262573486172,
-    -4.811509787800381,
-    1.256959869975154,
-    -5.558252749517174,
-    -4.130819108269379,
-    -10.786616337912390,
-    -0.021838798912251,
-    4.790387590559317,
-    5.482180698815577,
-    0.340550822851035,
-    3.548395980681929,
-    -0.145373542384827,
-    -4.431321071095984,
-    0.569121324718555,
-    12.938272636601765,
-    -5.935421342777442,
-    0.885462244689155,
-    -4.801667400012989,
-    -2.550877319211579,
-    -4.293899509008938,
-    -16.490878582789840,
-    6.668965049064401,
-    -1.981376130999556,
-    3.502711505891841,
-    13.271313834806001,
-    -1.057464621672506,
-    2.308591200785112,
-    -11.189854194746440,
-    -4.031840455135016,
-    -13.462066095094329,
-    -3.580237433793741,
-    -3.099265657926233,
-    7.369054801537834,
-    8.057612602259733,
-    9.292112325902087,
-    -2.035226116454870,
-    -4.520445634836195,
-    -1.087321429316043,
-    -1.369651501812431,
-    -1.944251222898525,
-    -5.069608309353699,
-    4.838372773914903,
-    -0.264826269551475,
-    -7.107637756644207,
-    6.589796533537424,
-    5.728298882842441,
-    7.586163842172454,
-    1.057355222388264,
-    -8.712280426833484,
-    2.789050586853063,
-    5.517874269739329,
-    10.419009694622289,
-    2.026629682787668,
-    -5.693609842237075,
-    -4.790321850737215,
-    -4.784579001098759,
-    0.764692683677480,
-    -4.203248329547053,
-    -10.866456566064944,
-    -1.275374066283921,
-    -4.091082279205187,
-    3.828283614316272,
-    11.449633102415211,
-    3.639577199909240,
-    5.964942759054715,
-    6.242007676703331,
-    5.073403085083628,
-    -16.040750471083644,
-    15.148065170402054,
-    -5.014288358268257,
-    8.235792503015508,
-    -11.035143020515223,
-    2.339646320987661,
-    -1.853402620479733,
-    7.288105304960184,
-    3.445953958481380,
-    4.934365863921653,
-    -2.323188852584590,
-    1.788397419046551,
-    -2.585386135557328,
-    -3.703248779109571,
-    -4.215287451647763,
-    13.030443506048250,
-    -3.670625757502990,
-    3.048918735377267,
-    -10.612431350252114,
-    -1.283656871091660,
-    -1.063382957067621,
-    -0.495467533868280,
-    2.087449387016874,
-    2.214209454784021,
-    -7.633957301647936,
-    0.263105651499061,
-    -2.964670004367224,
-    5.835038168348356,
-    14.798471694312369,
-    -9.206403499122290,
-    -6.533985204744115,
-    5.549900136227872,
-    -7.051430368504939,
-    -6.470550049700471,
-    -0.029256618073380,
-    -4.294591258578540,
-    -9.074458615311755,
-    -9.450609643198456,
-    -12.705815620935487,
-    -0.911017679069636,
-    -10.122257706952025,
-    -12.478921207710538,
-    -9.754348019843347,
-    -1.791689211900428,
-    -0.408149773795289,
-    -3.264206276096457,
-    5.348275669903474,
-    2.376346785024606,
-    -0.079796902472781,
-    -4.005456556605988,
-    5.552705349083139,
-    -2.443087172512041,
-    -4.423064028768230,
-    7.324928676407012,
-    11.212286435481206,
-    -4.563167010843705,
-    -0.405479463548889,
-    3.903654608287293,
-    -4.021927891213030,
-    -7.316466544929098,
-    -10.399485593974891,
-    11.469173751421952,
-    6.296825416310369,
-    -4.101045427139424,
-    -6.128234232759448,
-    -3.797452465897163,
-    11.407015507867152,
-    8.107162637561503,
-    -6.600314295003694,
-    2.631070983975704,
-    10.394514383766026,
-    11.691749221486869,
-    3.984917993835816,
-    -1.938272334320007,
-    8.788301372767380,
-    -2.930449252562509,
-    -9.004238768302324,
-    -0.621767725927851,
-    -5.400970462179446,
-    -1.727130839051313,
-    -1.663960523126424,
-    7.781718871119364,
-    -2.025368840871224,
-    -2.083430219095616,
-    -0.218152038468741,
-    -6.043510981941786,
-    5.261682757084597,
-    -8.390116416213601,
-    5.905374216471341,
-    -3.190766365815860,
-    -6.778407980160470,
-    1.448120793589568,
-    6.628930261381419,
-    -7.519634657724025,
-    -2.847983591899658,
-    -13.288489613450686,
-    5.675825154001355,
-    1.342472785612989,
-    4.827918635784432,
-    6.535073357318300,
-    1.321358078638808,
-    7.999096400574292,
-    8.353883746786014,
-    6.448904148177040,
-    -6.329892420314118,
-    -3.723509388954084,
-    -10.862103953353088,
-    -1.729454939543533,
-    -3.695007924119572,
-    -4.783424987503045,
-    4.526776603126416,
-    4.886694721860936,
-    -16.107379934828195,
-    9.122110906614930,
-    5.222436601846437,
-    -2.650844519188538,
-    7.100308116060161,
-    -2.394611425847908,
-    6.687900575486918,
-    -4.111484123526633,
-    1.169068423423105,
-    5.750461517920545,
-    9.930372384094463,
-    -7.792509947964245,
-    -9.481620064573908,
-    7.315812619952135,
-    1.622759785700940,
-    9.919666574019198,
-    9.696954124286673,
-    7.334161681605543,
-    -4.877510542982478,
-    -5.503893132602761,
-    -0.928057350868469,
-    -3.859068899974232,
-    -20.777205867529553,
-    8.756283196228384,
-    -8.661330100392044,
-    -5.218676128668221,
-    -12.465938537514690,
-    -2.011769061475347,
-    -7.228740243327167,
-    7.554698749456113,
-    -5.035487006397565,
-    11.838562998364750,
-    -1.892133566497885,
-    13.200116063036392,
-    -8.205650655252278,
-    2.965742091056265,
-    -5.433907520734217,
-    10.227555008888602,
-    6.206423974263816,
-    -0.531619546164064,
-    7.882157052209728,
-    -0.545437420782451,
-    -8.839192819210089,
-    3.414674758520549,
-    2.833460079905443,
-    6.310973675756572,
-    4.130568053908608,
-    1.038285376058677,
-    -2.891579834189648,
-    -9.377028944748636,
-    4.053876290724603,
-    8.820869422254791,
-    2.679526319243058,
-    5.187556300977488,
-    -1.029476690812977,
-    10.149049597453713,
-    -11.572486979766410,
-    -1.033127715904259,
-    -1.976988981397466,
-    11.360349579713015,
-    5.618717329743692,
-    6.309962566502326,
-    10.710505300134205,
-    4.977422311188656,
-    5.909574747869269,
-    -8.183634229553853,
-    -2.872632682636260,
-    6.398916199389567,
-    -6.226090558336892,
-    -2.722504215643867,
-    0.716404947066158,
-    -4.598089934378306,
-    -6.076135294269028,
-    -2.630325973783112,
-    -2.035528441369630,
-    -2.367433538210290,
-    9.511284388578776,
-    1.325163097388714,
-    0.464878442057654,
-    -7.952855002231882,
-    1.907740975764439,
-    -11.728658641609560,
-    0.113272341770081,
-    0.169255006385559,
-    8.520846622090994,
-    -8.875829610455037,
-    2.978638583297687,
-    -1.366062745724398,
-    -8.750220124958819,
-    -3.374809129178065,
-    0.744706250988241,
-    -0.096014283760904,
-    -0.532464609188687,
-    2.490422529771594,
-    -9.592259111097537,
-    -2.392068236587810,
-    -2.763324507607991,
-    18.205424736087984,
-    -3.989321181751643,
-    4.434000184646806,
-    3.549012648642693,
-    -4.821063119720307,
-    6.018337798310015,
-    -1.989571817429510,
-    -2.235931635487866,
-    3.570805185781087,
-    4.773534725649002,
-    -2.359445863778223,
-    -1.838144340247499,
-    0.735681201658259,
-    -9.818544687095434,
-    -2.071861918714320,
-    6.018049036255168,
-    -1.723216837203576,
-    5.613572423833468,
-    -6.525203349973185,
-    2.775676455442175,
-    2.330865349049868,
-    0.841235502303120,
-    1.583073733042047,
-    -7.779412872367484,
-    -0.982163892687384,
-    -0.688409144109937,
-    -1.604947340669933,
-    -3.447155547809320,
-    5.876344675800441,
-    -4.210104476613046,
-    3.188758364859102,
-    3.811616628619126,
-    -4.338722139044859,
-    2.331552990196510,
-    -14.122984355506194,
-    -9.274743055463929,
-    12.606411954789854,
-    -2.827678362021506,
-    -2.113931118075415,
-    6.945736579177539,
-    -2.754226047716465,
-    0.963677677636200,
-    0.596138834226848,
-    -3.143203253278947,
-    5.027778465930664,
-    -4.314961221312035,
-    -1.220046338921923,
-    -2.318969094926265,
-    -3.989347900929310,
-    -3.110156175496244,
-    6.732732852012633,
-    -1.518377311227161,
-    -3.638855025600377,
-    -10.487142905905966,
-    0.343786006391066,
-    -4.436065521176106,
-    -3.233679157642440,
-    2.372547387468078,
-    -0.532706404778347,
-    -7.713581697282366,
-    9.479276656371777,
-    -4.935205377694488,
-    -8.302825471726742,
-    13.142367901707685,
-    -0.765202778374392,
-    0.755970265400841,
-    -8.942205761133321,
-    -14.156599704716053,
-    -6.793308681775073,
-    -2.953057907761159,
-    7.006217378229440,
-    6.847349793590251,
-    0.464269925461354,
-    3.584267300221881,
-    -6.542188297297410,
-    2.890516532329654,
-    3.829334861359797,
-    -6.952151101292615,
-    4.266746680017979,
-    -1.608045932701176,
-    -4.449223752076009,
-    3.958540158685688,
-    0.000485153190989,
-    10.533995764693348,
-    -1.010358731183557,
-    -6.072449689965743,
-    -5.664637597164307,
-    -3.243273918160420,
-    -8.341991011099619,
-    3.947729482491125,
-    -14.819773671734296,
-    -2.448193559911991,
-    0.249247689360953,
-    -12.221086534293342,
-    -6.007720063687295,
-    8.017093035156979,
-    5.040563072784404,
-    -14.377994905123016,
-    2.852904444090096,
-    -4.298945665595444,
-    -15.750718078362862,
-    3.363602966210034,
-    -1.311704493189774,
-    2.790684958400587,
-    6.597796566017256,
-    -4.752437453146390,
-    5.566787537765697,
-    -1.599949374488531,
-    1.356310944317879,
-    4.938603178934974,
-    -8.877697593107911,
-    -4.097995602914400,
-    -4.912857350939361,
-    6.932373227222413,
-    -0.353215959165895,
-    -0.000739895759321,
-    -0.228825169916148,
-    -0.379039335067445,
-    0.530905924916000,
-    -0.239161146482638,
-    0.044607633715406,
-    -0.207773084850901,
-    0.426216015697278,
-    -0.027408610611634,
-    0.138801491525762,
-    0.184685230751528,
-    -0.290521434715676,
-    -0.370665390654004,
-    0.030200478277860,
-    0.039777903268413,
-    0.309982978682542,
-    0.014397704721396,
-    -0.092423378197164,
-    -0.577596857777356,
-    0.788827845783574,
-    -0.067023440865144,
-    -0.064966504647695,
-    0.588831060812822,
-    -0.021117939212680,
-    -0.064242288443897,
-    -0.013971002085180,
-    -0.554083718587903,
-    -0.247593251271452,
-    0.542556040934902,
-    0.011826665222726,
-    0.151775538160633,
-    0.483584812206746,
-    0.025307697497283,
-    0.069662889814042,
-    -0.077477674888351,
-    -0.199875855468157,
-    -0.253429109396571,
-    -0.070066114191256,
-    -0.313302894396338,
-    0.105010643046717,
-    0.054811369696003,
-    -0.128293428374707,
-    -0.356625297448933,
-    -0.483439392462766,
-    0.004508232254095,
-    0.071936575538092,
-    0.223411560847179,
-    0.462173985934433,
-    0.031691991911570,
-    0.432365452408457,
-    -0.060805445734765,
-    0.054354700525427,
-    0.169060945581960,
-    0.110411492907299,
-    0.026131269817160,
-    -0.031032187323835,
-    -0.144446049892337,
-    0.396278248586758,
-    -0.059325732197925,
-    0.067153583514497,
-    -0.229532536086649,
-    0.041600430335018,
-    0.486608977918225,
-    -0.230402615219478,
-    0.000734524226388,
-    -0.074155315969755,
-    0.116915034516706,
-    -0.155881214729515,
-    0.309910707064380,
-    0.103533391333043,
-    0.068125602789219,
-    -0.200445509017084,
-    0.113235482317022,
-    0.085597113683846,
-    0.725829318298404,
-    -0.005508329992460,
-    -0.094041721434106,
-    -0.034596112621626,
-    -0.320223640777799,
-    0.296940154432711,
-    0.042285464892640,
-    -0.248854490422155,
-    -0.631359501260854,
-    -0.270682474251722,
-    -0.005121076196072,
-    0.086058325141606,
-    0.705337811587227,
-    0.336096946097447,
-    0.037046986454048,
-    -0.004034961302378,
-    -0.363513824997189,
-    0.716916954562171,
-    -0.304386660298092,
-    -0.020579345623860,
-    -0.089154474520229,
-    0.062405277041635,
-    0.018060576746206,
-    0.079418007508469,
-    -0.389352146463737,
-    -0.539737407285609,
-    -0.310247529167788,
-    0.182159627420253,
-    0.257165895445088,
-    -0.333860156408946,
-    -0.129251381370566,
-    -0.003014276955705,
-    0.690426344836531,
-    0.477611298464193,
-    -0.331824083080301,
-    0.091660795597973,
-    0.465057608331868,
-    -0.631626372187816,
-    0.006838344639489,
-    0.131088461608444,
-    -0.335630915361730,
-    -0.056526707556067,
-    0.362955049640294,
-    0.075298928267727,
-    -0.207390497021222,
-    -0.379384323453925,
-    -0.000044112344984,
-    0.073372044036301,
-    0.249353992244314,
-    -0.382893738763697,
-    -0.358645836410269,
-    -0.012029545849436,
-    0.399861476599323,
-    -0.150954595775460,
-    0.008081596807743,
-    -0.068023511828085,
-    -0.324585017687753,
-    -0.425249273905490,
-    -0.376102180960719,
-    0.033024865232819,
-    -0.168413288736043,
-    0.528143746091450,
-    -0.072083528036695,
-    -0.132501216891637,
-    -0.538988608545881,
-    -0.166206629314675,
-    -0.229574132554212,
-    -0.039702282826449,
-    0.564445193150183,
-    -0.284219283849725,
-    0.002623772665263,
-    -0.221065297459767,
-    0.307815748309371,
-    0.328894004349047,
-    -0.366664620374948,
-    0.009202803477261,
-    -0.110840336142233,
-    0.253944271569841,
-    -0.086468893614038,
-    -0.109712351424304,
-    0.057720552275944,
-    0.263135449446741,
-    0.187523189104685,
-    -0.049584373749577,
-    0.374312924401045,
-    0.178950940674554,
-    0.051182362759215,
-    -0.191365527270659,
-    0.699115970874085,
-    -0.088633386997762,
-    -0.194448625999260,
-    -0.071609470004319,
-    -0.327324450230409,
-    -0.284636632175219,
-    -0.003016329573590,
-    0.064720735133001,
-    0.390984273497135,
-    -0.196818882862533,
-    -0.269450744046612,
-    0.052441420959607,
-    0.710931105811344,
-    -0.514477674089682,
-    -0.001252341481929,
-    -0.054713207174345,
-    -0.158569600977920,
-    0.494894943416091,
-    0.172231520834746,
-    -0.064481746631830,
-    -0.344668171708650,
-    -0.579590988326752,
-    0.266858105663312,
-    0.246398308017122,
-    0.180947007987551,
-    -0.258042276030744,
-    0.460364876687827,
-    0.020440609509429,
-    0.440326286445130,
-    0.055307388113963,
-    0.002065360187980,
-    0.350452425570945,
-    0.044052050019594,
-    -0.086518210647044,
-    0.039108991133892,
-    0.164102740212995,
-    0.270152939954416,
-    -0.374873756762877,
-    0.138366757369092,
-    -0.328479554540093,
-    0.373144539821963,
-    -0.389457774542235,
-    0.046149982109588,
-    0.042200617099813,
-    -0.339401834132570,
-    0.198609430516819,
-    0.043696955018953,
-    0.178369675337387,
-    -0.007620296478733,
-    0.175234379258552,
-    0.340268780062243,
-    0.129427061554083,
-    0.232473004349986,
-    0.468511624213469,
-    0.248096595069892,
-    0.060814442814694,
-    0.294892807758923,
-    0.118763448964910,
-    -0.149309702385488,
-    0.045366052195140,
-    -0.203376633006466,
-    0.676401636763539,
-    -0.037409530247860,
-    -0.101096291985245,
-    0.488892344314100,
-    -0.434348443537090,
-    -0.005030436855217,
-    0.047758877093950,
-    0.117976057357118,
-    -0.035712684844619,
-    -0.027868776870199,
-    0.167693634341713,
-    0.263928542094342,
-    0.296476747578378,
-    -0.556523872039543,
-    0.079323603451119,
-    0.057141957965185,
-    0.479647311098257,
-    -0.027101807163848,
-    0.148843267982125,
-    0.491317317030226,
-    -0.308279497770724,
-    0.055474469457136,
-    -0.046875139268384,
-    -0.610028896354321,
-    -0.303910772641913,
-    -0.173674743579149,
-    0.151942051086958,
-    -0.434079230468124,
-    0.415014769589939,
-    -0.220737095056927,
-    0.004334872893137,
-    -0.492106189952040,
-    -0.001083656390604,
-    0.241167765518078,
-    -0.230233548845070,
-    0.376720685090415,
-    0.221819125230235,
-    0.572412633696693,
-    0.108633831530400,
-    0.085316567908731,
-    0.086139822624675,
-    0.135616587714475,
-    0.209117121397077,
-    -0.122584823852926,
-    -0.195412113542719,
-    0.551072495660340,
-    0.154300602587350,
-    -0.007785528270484,
-    0.031491193094491,
-    -0.141723541002036,
-    -0.113325412654707,
-    0.471063388001992,
-    0.424753908003616,
-    0.124471971836936,
-    -0.216555365452786,
-    -0.176649032772840,
-    -0.006476873814316,
-    0.209462895392980,
-    -0.026331908221884,
-    0.293981914357512,
-    -0.204468954833460,
-    -0.656985869964728,
-    0.123976245714226,
-    -0.014478567797273,
-    0.025244427531439,
-    -0.484796818084582,
-    0.077336661675917,
-    0.069789910914607,
-    -0.095285716161872,
-    0.531604967476139,
-    -0.197732066520514,
-    0.111018494680767,
-    0.026646443833042,
-    -0.216005453264704,
-    -0.215541525532277,
-    0.212268526641850,
-    -0.360847326123536,
-    -0.006039831541538,
-    0.495424354291642,
-    -0.032439791228966,
-    0.070006830543181,
-    -0.209225501430714,
-    0.586730929187289,
-    0.044807888499121,
-    0.032806038466385,
-    -0.280108708555857,
-    0.446596047987643,
-    -0.006460407621332,
-    -0.011211006770611,
-    0.399828219727566,
-    0.844554083219552,
-    0.027836579940387,
-    0.061240774544965,
-    0.251693948123920,
-    0.903337242144092,
-    -0.022409286301796,
-    -0.006363414579326,
-    -0.026595203030105,
-    -0.078367802154567,
-    -0.110630527944389,
-    -0.069670376755509,
-    -0.693397391037629,
-    0.270872221356328,
-    -0.026039121538776,
-    -0.045657960719331,
-    -0.497121280368980,
-    0.136094581952382,
-    -0.456512623663409,
-    -0.003904740082585,
-    0.132662564924191,
-    -0.203079122926733,
-    0.054552594972811,
-    0.037549287309343,
-    -0.334393896002267,
-    -0.320902584194380,
-    0.489608543832373,
-    -0.154438585485323,
-    0.008975642785306,
-    0.314727997932999,
-    -0.192865557315828,
-    0.112176262176993,
-    -0.110998341072134,
-    -0.008077704196914,
-    0.181581818421050,
-    0.622263086755646,
-    0.350687614539395,
-    -0.291160303973915,
-    0.006301479700439,
-    0.004795832708998,
-    -0.235011386711669,
-    0.092640682453686,
-    0.333779618978455,
-    -0.273759642085214,
-    0.611675978731975,
-    0.557137997265361,
-    -0.084081940074823,
-    -0.093495201118750,
-    0.461541190179823,
-    -0.005359214718042,
-    -0.388328576171065,
-    0.375094891147189,
-    0.422514235523095,
-    0.762411888951659,
-    -0.055911444976552,
-    -0.111594790513339,
-    -0.038705021950773,
-    0.187349619305084,
-    0.234840831415607,
-    -0.036038579818186,
-    -0.569296960383029,
-    0.340200286880699,
-    0.045903201028415,
-    -0.147683398197802,
-    0.000113320334999,
-    0.166904970450139,
-    -0.109616939808529,
-    -0.366791230402254,
-    0.374390753684489,
-    -0.560059930216160,
-    -0.008588637941511,
-    -0.002315796143579,
-    -0.526796878350371,
-    -0.070143127793153,
-    0.314776564498415,
-    -0.183835947750636,
-    0.869999482281686,
-    0.083321652871774,
-    0.066751270194830,
-    0.113502938101309,
-    0.335413912323643,
-    -0.205042448383532,
-    0.348301764274071,
-    -0.114782074734552,
-    0.332427714326633,
-    -0.216937085606024,
-    -0.103300745632659,
-    -0.032402325887111,
-    -0.023014606744706,
-    -0.277956063423876,
-    -0.244813439665971,
-    0.182338237320787,
-    0.661374141925477,
-    0.032102249858376,
-    0.031774777013156,
-    0.081307289766426,
-    0.270065331968971,
-    -0.213055376250464,
-    -0.029723058986593,
-    0.222791399544248,
-    -0.221480715807198,
-    -0.597222602925504,
-    -0.031077309954248,
-    0.011545285531233,
-    -0.793322255818585,
-    -0.217760927728108,
-    -0.614374202872157,
-    -0.043596521606973,
-    0.395321454191864,
-    -0.210248062154014,
-    0.111485119816631,
-    -0.075956257390121,
-    0.011303320106302,
-    0.111835321938804,
-    -0.226268312796770,
-    -0.150704903232588,
-    0.351899595117252,
-    0.395208596315907,
-    -0.094335593255493,
-    -0.084400224790766,
-    0.007633886454520,
-    -0.076187511358701,
-    0.113874981281526,
-    0.307044087747655,
-    -0.277603484839060,
-    -0.275273856153986,
-    0.080737074093012,
-    -0.217466177422730,
-    -0.711230385512987,
-    0.542336595339356,
-    -0.082209161233155,
-    -0.241188062667011,
-    -0.492535158131555,
-    0.605461209512088,
-    -0.014865589300452,
-    0.002207022597034,
-    -0.051757366537724,
-    0.379584293681120,
-    -0.040671197511951,
-    -0.039949828943882,
-    -0.084697232067462,
-    0.445661865136864,
-    -0.099476399465998,
-    -0.090242539694154,
-    -0.574785088294773,
-    -0.536768930136905,
-    -0.228348448164696,
-    -0.283322910022261,
-    -0.063438107868340,
-    0.267506442768516,
-    0.053542511712875,
-    0.027595220170797,
-    -0.314497485358629,
-    0.235933902927241,
-    0.005761061856826,
-    0.102851158015150,
-    -0.579738620409981,
-    0.497239461462959,
-    -0.060510679814397,
-    0.162787782607473,
-    -0.714034781088605,
-    0.125577781154996,
-    -0.142809831715251,
-    0.105666315492673,
-    0.167816348441283,
-    0.777383267117769,
-    0.011868527840136,
-    0.060339348570093,
-    0.419359308475357,
-    -0.120899758349433,
-    -0.408811430766282,
-    -0.227049255795016,
-    0.009623296983398,
-    0.152376918485206,
-    -0.036976755268183,
-    -0.010475372065463,
-    0.095010357546328,
-    0.306904431316100,
-    -0.144211461009257,
-    0.238779706406050,
-    0.690998368393287,
-    0.735886448209706,
-    -0.006159518258664,
-    0.090826751666411,
-    0.143122028406202,
-    0.218381517492305,
-    -0.334869342070423,
-    -0.201906597671406,
-    -0.084700756590310,
-    -0.224822715694635,
-    0.127189947803969,
-    -0.122619241480285,
-    0.430451410988477,
-    0.357478613483037,
-    0.184500236165050,
-    0.407444733374207,
-    0.224838234835808,
-    0.470969662957870,
-    0.004529416544519,
-    -0.408067737237226,
-    0.002728357020356,
-    0.118939633569748,
-    -0.242705747701083,
-    -0.402658627875678,
-    -0.248624391873770,
-    -0.018319096035049,
-    -0.116042732641218,
-    -0.459611346628484,
-    -0.006467554021571,
-    -0.009949874338232,
-    0.173759495774045,
-    -0.178332435924594,
-    0.245106439812841,
-    0.016069611017041,
-    0.335007604246950,
-    -0.674902373132511,
-    -0.030084076075155,
-    0.258024190513824,
-    -0.293902404024657,
-    -0.338223397532776,
-    0.018194383388356,
-    -0.092065942132151,
-    -0.629724820356275,
-    0.415183146033742,
-    0.025697214726560,
-    -0.162836032260985,
-    -0.158889006070310,
-    0.206353132319324,
-    0.116776881726009,
-    -0.009510691763099,
-    0.453849537833399,
-    0.467223114824434,
-    -0.009248332645952,
-    -0.159066414074501,
-    0.184268627639161,
-    -0.296654199569666,
-    -0.008787518182022,
-    -0.077165598076424,
-    0.210862683183187,
-    0.263522628851451,
-    -0.050852879550092,
-    0.244964722306619,
-    -0.560597193131907,
-    -0.216650806330475,
-    -0.029016229589662,
-    -0.053939286401492,
-    -0.387661450045039,
-    0.155357497401284,
-    -0.111882603694352,
-    -0.156273097749664,
-    -0.249297671941581,
-    0.128854780740588,
-    0.074571505556561,
-    0.032215675630482,
-    -0.227649257805071,
-    0.367332367146910,
-    0.063366041428010,
-    -0.238424263542347,
-    0.292676864233919,
-    0.130500564357439,
-    -0.314716809151888,
-    -0.005526470715448,
-    0.527161233269087,
-    -0.281788402478835,
-    -0.013084820962536,
-    0.104287329361580,
-    -0.110141778062019,
-    -0.124189733208272,
-    -0.169259901671925,
-    -0.085580574454137,
-    0.600678177012630,
-    -0.062542721765351,
-    0.124439615502915,
-    0.077623626058236,
-    0.144815978620542,
-    -0.059290214369983,
-    0.226294937303345,
-    -0.010016928141427,
-    0.588974681035799,
-    0.502441173751640,
-    -0.057855448805849,
-    -0.133970172430699,
-    0.296901446042124,
-    0.212010791534121,
-    0.043633691694142,
-    0.026006746300774,
-    0.233804921592555,
-    -0.078985650695190,
-    -0.058925061957582,
-    0.081410474398500,
-    0.190973536298110,
-    0.251417688067376,
-    0.111864188644550,
-    0.037407708352328,
-    0.200785292234486,
-    -0.336097775573131,
-    -0.033094800224069,
-    -0.088346105942726,
-    0.335668148581244,
-    -0.097513391395157,
-    -0.060564883641878,
-    -0.102965730704741,
-    0.065526220787118,
-    -0.555949461589770,
-    -0.077220319816265,
-    0.157549173333695,
-    0.056389460226846,
-    0.000227559677530,
-    -0.027451814528924,
-    -0.058902084098829,
-    0.179074027281096,
-    -0.648452816365684,
-    -0.028038359179759,
-    -0.126890010149301,
-    0.318120516552725,
-    0.269071703732461,
-    0.016790504264533,
-    0.049276952494272,
-    -0.183484278919916,
-    -0.049384407567989,
-    0.163003046839403,
-    -0.132308107495875,
-    -0.142119941301593,
-    -0.588959651089461,
-    -0.171500706578867,
-    0.000351049707854,
-    0.560466947101507,
-    -0.002503903700009,
-    -0.444647482116910,
-    0.120408272358249,
-    0.239745427215748,
-    -0.169688661235930,
-    0.589967271585258,
-    -0.045005307361565,
-    0.047234383854901,
-    -0.094357722411253,
-    0.031503104751626,
-    -0.015090671957124,
-    -0.114566478745181,
-    -0.120747228891962,
-    -0.361999433641153,
-    0.083460564342255,
-    -0.064502821547227,
-    -0.070655983394627,
-    0.287361570261083,
-    0.318366968658564,
-    0.238196601261916,
-    -0.183461220088184,
-    -0.033542599153465,
-    -0.310343176932363,
-    0.186813222198648,
-    0.128731606972586,
-    -0.082878251156685,
-    -0.309193382441051,
-    0.083678554547698,
-    0.171479337930353,
-    -0.140525824379100,
-    -0.103041502239612,
-    -0.041890141033861,
-    0.025827866489986,
-    0.167301266926163,
-    -0.177681685177937,
-    -0.164963258850443,
-    -0.142540926957986,
-    0.018288460922245,
-    -0.219908084725133,
-    -0.073991572798098,
-    0.067730057422132,
-    0.197857273620553,
-    0.414444846982477,
-    0.331350568697586,
-    -0.162749192040884,
-    0.038626241140977,
-    -0.379665162956544,
-    0.055075324314626,
-    0.024020244404725,
-    0.723631326135660,
-    -0.213434610057658,
-    0.182531405968160,
-    0.078311247627683,
-    -0.122701339706269,
-    0.132044460696071,
-    0.055540948922111,
-    0.133981730400012,
-    -0.173728148793024,
-    -0.512213920550229,
-    -0.136234614115710,
-    0.119745514828685,
-    0.342983378257234,
-    -0.128588680561647,
-    -0.022656279738279,
-    -0.008647873321335,
-    0.426365033199340,
-    0.110890989507667,
-    0.103582734144776,
-    -0.055963766842575,
-    0.375606275585850,
-    -0.225979064065361,
-    -0.227482946986346,
-    -0.014448107805913,
-    -0.538672077585207,
-    0.124261468645812,
-    -0.090463612688658,
-    -0.042303497802138,
-    -0.317162316135453,
-    -0.059908983021200,
-    -0.098478003790646,
-    0.065102457017524,
-    0.446510945018775,
-    -0.173855904283717,
-    -0.228786811037931,
-    0.121826998946605,
-    -0.075934017858270,
-    0.096270454740721,
-    -0.063160658128250,
-    -0.026631975033868,
-    0.174761141637269,
-    0.164236434344536,
-    -0.094663807392294,
-    0.219579310516329,
-    -0.128084178880114,
-    0.553386187144501,
-    -0.013572651121094,
-    -0.026866517639624,
-    0.414013043578890,
-    -0.103697414407232,
-    -0.285976019611236,
-    -0.049836383376750,
-    0.118505533572243,
-    -0.318224189376793,
-    -0.021201892970107,
-    -0.157530738956401,
-    0.272522020210443,
-    0.282135877157178,
-    -0.031488773895011,
-    0.000179846832811,
-    0.034734701546833,
-    -0.502948266353795,
-    -0.020972004717891,
-    -0.116620309142031,
-    0.155903831074949,
-    -0.182538929723237,
-    -0.221138119059201,
-    0.172709879178396,
-    -0.026158605462971,
-    0.225915710652913,
-    0.040021767718818,
-    -0.019398605720614,
-    -0.414968426900237,
-    -0.303495312961769,
-    0.061956872702701,
-    -0.567666341369933,
-    0.177933741966325,
-    0.019068581732808,
-    -0.010318111792399,
-    0.101055606225921,
-    0.004533861105341,
-    0.140552472818962,
-    0.338158315389874,
-    -0.335876536285170,
-    0.020154656155129,
-    0.007844570149783,
-    0.243085334962869,
-    -0.214089050668134,
-    0.005009889022609,
-    -0.053876767658353,
-    -0.024651764359220,
-    0.196738497242792,
-    0.071407828579918,
-    0.059692585195328,
-    -0.255640186883410,
-    0.247326443298190,
-    -0.028612358019363,
-    -0.146799129161750,
-    -0.334012336695686,
-    -0.453356440495043,
-    0.020325581056328,
-    -0.035520910053608,
-    0.306012995033731,
-    -0.318504337002572,
-    0.109098095797533,
-    0.055910657431967,
-    0.214375697151300,
-    0.419665731339830,
-    -0.135651611288243,
-    0.001625721688387,
-    -0.406700280041986,
-    0.379157639425370,
-    0.034466279664887,
-    -0.072964867349219,
-    -0.132167349663782,
-    0.420107488428174,
-    -0.170382429567003,
-    -0.026368281277603,
-    -0.082582891184883,
-    0.079901507186329,
-    -0.033155696647310,
-    -0.117701615305202,
-    0.178059037395985,
-    0.130582700911545,
-    0.172400413154697,
-    -0.001593622922001,
-    0.220674491210696,
-    -0.027877958736088,
-    -0.026266260001891,
-    0.060087395694122,
-    0.073393031214255,
-    0.286200653666721,
-    0.116338948140100,
-    0.033634781238130,
-    -0.277315541109274,
-    -0.337293355033965,
-    0.008718713788013,
-    0.033622031994459,
-    -0.328010175258516,
-    -0.044932619569517,
-    0.119586716183067,
-    0.006294443817888,
-    0.045946745048459,
-    0.001240201125652,
-    -0.369433693509656,
-    0.144045186891066,
-    -0.329958872338338,
-    -0.143978552272170,
-    -0.047017253560147,
-    0.019615927302621,
-    -0.097211818390304,
-    -0.045322999712197,
-    -0.023664858716633,
-    -0.082814539339829,
-    0.016037731916857,
-    0.134977771261518,
-    -0.104081351728388,
-    0.320608304124753,
-    0.047596470330194,
-    0.027427986044214,
-    0.258006283505316,
-    -0.183419708644042,
-    0.267325253751027,
-    -0.249524689888005,
-    -0.036929143496086,
-    -0.122488166521456,
-    -0.088742124080406,
-    -0.100901704790430,
-    -0.344376903664880,
-    0.107761874427719,
-    -0.111225665188341,
-    0.353117608980168,
-    0.161216351750683,
-    0.018878528683233,
-    0.035022934097849,
-    0.023294062419742,
-    -0.561007908454729,
-    -0.082517113121502,
-    0.116867553545117,
-    0.205041951663714,
-    0.349094095022464,
-    -0.076646944577329,
-    0.028410381072448,
-    0.021059613074592,
-    0.125794815153988,
-    -0.201952828288760,
-    -0.103775899049210,
-    0.099353607203222,
-    -0.226589775869521,
-    -0.011733666517332,
-    -0.029971188202324,
-    -0.004485601543059,
-    0.163244484704001,
-    0.083131513276616,
-    -0.053048428134442,
-    0.176351670025970,
-    -0.188806167810558,
-    0.141629405233939,
-    0.065858128428466,
-    -0.125375455544145,
-    -0.023455661336396,
-    0.073405151662721,
-    0.150239708756718,
-    -0.041740268084113,
-    -0.128732868054261,
-    0.170895223901309,
-    -0.001692318829749,
-    0.236865067013850,
-    0.002222746118514,
-    0.078169627115417,
-    -0.103441492590885,
-    -0.050133941163449,
-    0.003225256220707,
-    0.008536512673795,
-    0.069625722641060,
-    -0.128021509616035,
-    -0.047562395026797,
-    -0.009650984341633,
-    0.117270723432644,
-    0.154029585554313,
-    -0.084192920405325,
-    -0.008532597982315,
-    0.122286610143499,
-    -0.070606150909746,
-    0.012908017094701,
-    0.096544003185050,
-    0.108940502630753,
-    -0.003404501453532,
-    0.043358127589649,
-    -0.109250470307990,
-    0.065453906638285,
-    -0.407132353275044,
-    0.072387113150780,
-    0.011602943222315,
-    0.052847742793002,
-    0.167713477167250,
-    -0.014481098812197,
-    0.024342966621932,
-    -0.229076912925568,
-    0.005814711020928,
-    -0.090544638662478,
-    0.082104126937644,
-    0.098484487999400,
-    -0.022222847728955,
-    -0.007276061447124,
-    0.022130076948250,
-    -0.026857604930044,
-    -0.028748191338396,
-    0.211804963331808,
-    -0.015240569726121,
-    -0.074260866615813,
-    0.108479873471458,
-    0.119544761822122,
-    -0.049174573844669,
-    -0.021218739714358,
-    -0.008708438113613,
-    -0.104655437754034,
-    0.123709707344313,
-    -0.085018002699590,
-    -0.001928626251211,
-    -0.076537799020772,
-    -0.394780472657538,
-    -0.018113535443104,
-    -0.134498362195264,
-    -0.219118918943250,
-    0.023051089169672,
-    -0.026601318251870,
-    0.144670640323875,
-    0.016787617926892,
-    0.330009546871156,
-    0.016897728256872,
-    -0.014614466041479,
-    -0.004278064069287,
-    -0.021161342494466,
-    0.003040641291085,
-    0.125064583792790,
-    -0.003917220398275,
-    -0.022377022645672,
-    0.137807227650417,
-    -0.061572736657596,
-    0.026503961385501,
-    -0.010159985289177,
-    -0.136991730708175,
-    -0.096926756167349,
-    -0.123912691725991,
-    -0.030100230966283,
-    -0.079198656121225,
-    -0.000717962677681,
-    0.087081994660001,
-    -0.023347943500907,
-    -0.002755876626177,
-    0.059151142845498,
-    0.008282266667519,
-    -0.062539588700432,
-    -0.049308214491812,
-    -0.015423167636021,
-    -0.105809745007322,
-    -0.016950911385203,
-    0.082109683491646,
-    -0.071885781659891,
-    0.167076923692496,
-    -0.202919274451196,
-    0.011748010867452,
-    0.168825106109038,
-    0.010428291505187,
-    -0.136710629185705,
-    0.061278328828283,
-    0.077124818826199,
-    0.009832169622634,
-    0.025319498291978,
-    0.057764330397882,
-    0.016627821622601,
-    -0.105880220503818,
-    -0.166582383648132,
-    -0.050289824806796,
-    0.041224074520791,
-    -0.018394695566341,
-    0.083467199940620,
-    -0.017522618056996,
-    -0.039377180646067,
-    0.005129000739630,
-    0.015990784024693,
-    0.057137177399868,
-    -0.007832608223046,
-    -0.025785227973484,
-    0.023931899520894,
-    -0.038177841369597,
-    -0.019361697255946,
-    -0.002618369769988,
-    -0.008019877593975,
-    0.006321303810012,
-    -0.000422501207146,
-    -0.000422501207146,
-    0.764403083724092,
-    0.764402947272572,
-    -0.000561261791966,
-    -0.000561261791966,
-    0.764310246291010,
-    0.764310005521933,
-    -0.019787317108822,
-    -0.003365437708601,
-    -0.008196175109451,
-    0.008124885359427,
-    0.000151411470625,
-    0.000151411470625,
-    0.763656495356618,
-    0.763656477849462,
-    0.000016538801303,
-    0.000016538801303,
-    0.763554132408460,
-    0.763554132199604,
-    -0.048096924972239,
-    0.009147059343720,
-    0.013980551095385,
-    0.058786459435103,
-    -0.009567073209910,
-    -0.045985372675503,
-    0.020923373334592,
-    -0.039279856393445,
-    -0.016462504335041,
-    -0.002876851883754,
-    -0.006818992566200,
-    0.006945334834698,
-    -0.006881959869088,
-    -0.006881959869088,
-    0.759104129575285,
-    0.759068176511077,
-    -0.006974245264825,
-    -0.006974245264825,
-    0.759033627071975,
-    0.758996706704790,
-    -0.016558093623478,
-    -0.003714454096198,
-    -0.006858586945888,
-    0.008967485455852,
-    -0.006704801899437,
-    -0.006704801899437,
-    0.758134856302582,
-    0.758100774062781,
-    -0.006785067081075,
-    -0.006785067081075,
-    0.758056523421475,
-    0.758021623867389,
-    0.172407023556646,
-    0.010475608159433,
-    -0.142518344074688,
-    0.054655094319634,
-    0.080594677678598,
-    0.003835202624905,
-    0.029571996263830,
-    0.075173400520437,
-    0.016980609698726,
-    -0.106360634556546,
-    -0.173659104715968,
-    -0.044854276718864,
-    0.043078752717575,
-    -0.007175159443746,
-    0.097485807038222,
-    -0.022803601743361,
-    -0.040764415854995,
-    0.004534628719058,
-    0.017559096371689,
-    0.059044883062756,
-    -0.008108546462566,
-    -0.022797118041447,
-    0.026279044817068,
-    -0.039452529540976,
-    -0.015252122850610,
-    -0.005526043069637,
-    -0.006317636139703,
-    0.013341048124976,
-    0.003665238162149,
-    0.003665238162149,
-    0.759787550884178,
-    0.759777343851855,
-    0.003642599165167,
-    0.003642599165167,
-    0.759696106405796,
-    0.759686026289347,
-    -0.015801012049185,
-    -0.006301967924069,
-    -0.006544993489993,
-    0.015214296431927,
-    0.004326867561703,
-    0.004326867561703,
-    0.759007217534948,
-    0.758993007433584,
-    0.004319328205584,
-    0.004319328205584,
-    0.758900222424862,
-    0.758886063797819,
-    -0.050054032491894,
-    0.009091573262009,
-    0.015249899700473,
-    0.060799290011091,
-    -0.009956366099861,
-    -0.045706425305653,
-    0.022823087771798,
-    -0.040624786786071,
-    -0.011999904146819,
-    -0.006254733502971,
-    -0.004970523044789,
-    0.015100262451901,
-    -0.002659462830153,
-    -0.002659462830153,
-    0.754044362777265,
-    0.754039029596760,
-    -0.002624653412912,
-    -0.002624653412912,
-    0.753962127184299,
-    0.753956933267931,
-    -0.012200276537714,
-    -0.007136077123490,
-    -0.005053520006624,
-    0.017228014173671,
-    -0.002437071850251,
-    -0.002437071850251,
-    0.753025651704622,
-    0.753021179231627,
-    -0.002375770460553,
-    -0.002375770460553,
-    0.752927241705195,
-    0.752922991957053,
-    -0.039334882686846,
-    -0.004464876293190,
-    -0.022150342671273,
-    0.001180178502202,
-    0.138735408937616,
-    -0.008005885737507,
-    -0.024811997995913,
-    0.131798795172220,
-    -0.058621758079095,
-    0.027182280785970,
-    -0.008167767254593,
-    -0.061284435216513,
-    -0.155041432358255,
-    -0.124721873046062,
-    -0.033582257079902,
-    -0.048780071317452,
-    -0.001932398872456,
-    0.090884644835612,
-    -0.024439137041983,
-    -0.001069651444408,
-    0.065616961596370,
-    0.016927023206790,
-    -0.069344888909985,
-    -0.047158362974981,
-    -0.014683985982303,
-    -0.108517747850865,
-    -0.013627096398953,
-    0.036732476862502,
-    -0.114986563003298,
-    0.168167978400321,
-    -0.226393187770571,
-    0.007235840051065,
-    0.161127481168333,
-    0.010351203507491,
-    -0.142989537999587,
-    0.068349241020403,
-    0.083018954202404,
-    -0.013860726238898,
-    0.008617964401997,
-    0.025725805209026,
-    0.015869671739674,
-    -0.105097532928370,
-    -0.174233256174692,
-    -0.056092772474681,
-    0.044374555516173,
-    0.025931594884816,
-    0.028409621293743,
-    -0.007803837693287,
-    -0.050795152731638,
-    0.005078816799765,
-    0.026967177635121,
-    0.060410717834147,
-    -0.010103784081261,
-    -0.025532936270733,
-    0.040359233451546,
-    -0.040365151158147,
-    -0.017223311524812,
-    -0.007441852432470,
-    -0.007134129222554,
-    0.017966221071647,
-    0.010199640488765,
-    0.010199640488765,
-    0.752728857460028,
-    0.752650544996397,
-    0.010210470799038,
-    0.010210470799038,
-    0.752592363537364,
-    0.752513898898055,
-    -0.018150492355417,
-    -0.008003002335505,
-    -0.007518180097363,
-    0.019320956778079,
-    0.010953795495793,
-    0.010953795495793,
-    0.751708286892934,
-    0.751618087284569,
-    0.010971965600663,
-    0.010971965600663,
-    0.751553698193560,
-    0.751463217684723,
-    -0.058298540703608,
-    0.009393012988896,
-    0.024739788647497,
-    0.060476381981796,
-    -0.011596300746134,
-    -0.047221865149126,
-    0.037025710256971,
-    -0.040409026538884,
-    -0.012277272261381,
-    -0.006624484524259,
-    -0.005085412679611,
-    0.015992920382196,
-    0.002800247374175,
-    0.002800247374175,
-    0.747652344744842,
-    0.747646482091709,
-    0.002843766901846,
-    0.002843766901846,
-    0.747563413166157,
-    0.747557367588770,
-    -0.012840100144658,
-    -0.007259414353482,
-    -0.005318543622146,
-    0.017525776587061,
-    0.003045137308933,
-    0.003045137308933,
-    0.746432142715178,
-    0.746425221121409,
-    0.003104088736415,
-    0.003104088736415,
-    0.746329074006945,
-    0.746321882817856,
-    0.164402315084987,
-    0.010403828482620,
-    -0.150041229566899,
-    0.062842760131168,
-    0.086922415549229,
-    -0.015006485728120,
-    0.009611818428510,
-    0.050264055824573,
-    0.016192214727887,
-    -0.105631843267499,
-    -0.182825767210822,
-    -0.051573720396782,
-    0.046460999074805,
-    0.028075160120708,
-    0.031685918943328,
-    -0.015247434639039,
-    -0.052698581046399,
-    0.004704259176949,
-    0.025557756706398,
-    0.066276518815531,
-    -0.010482399513488,
-    -0.023649907941471,
-    0.038249885967598,
-    -0.044284554068195,
-    -0.013058360051316,
-    -0.012868411365303,
-    -0.005408949835606,
-    0.031067093244311,
-    0.014502039599274,
-    0.014502039599274,
-    0.747891326549562,
-    0.747734021615411,
-    0.014831269156317,
-    0.014831269156317,
-    0.747646081887280,
-    0.747481606670411,
-    -0.014125015558971,
-    -0.013681680963868,
-    -0.005850773013257,
-    0.033030499739032,
-    0.015368920482101,
-    0.015368920482101,
-    0.746800196646022,
-    0.746623778826145,
-    0.015738291578358,
-    0.015738291578358,
-    0.746522102050556,
-    0.746337170231965,
-    -0.060684454414971,
-    0.009665426466024,
-    0.023132446418683,
-    0.065588347943676,
-    -0.012070888490825,
-    -0.048591380180879,
-    0.034620152614752,
-    -0.043824732992382,
-    -0.007455118771832,
-    -0.012183471192028,
-    -0.003088011304395,
-    0.029413501388577,
-    0.006968071793724,
-    0.006968071793724,
-    0.742427350652881,
-    0.742391301941915,
-    0.007303555661931,
-    0.007303555661931,
-    0.742228843766458,
-    0.742189250794903,
-    -0.008091671053733,
-    -0.013044855347488,
-    -0.003351679892718,
-    0.031493066699101,
-    0.007241495666383,
-    0.007241495666383,
-    0.741120477512620,
-    0.741081612684541,
-    0.007625392864187,
-    0.007625392864187,
-    0.740892997154771,
-    0.740849915481358,
-    0.300141430182368,
-    -0.000363360043665,
-    0.029971309905664,
-    -0.128334621561997,
-    -0.072197559479307,
-    0.005037225369601,
-    0.000881486044966,
-    0.089275966113209,
-    -0.125220011422104,
-    -0.062476239808268,
-    -0.091641712593970,
-    0.079503349190550,
-    0.162478152265016,
-    -0.096897870135851,
-    -0.034755241340337,
-    0.033286606351376,
-    0.040329519960541,
-    0.011731834505335,
-    0.071489692867477,
-    0.108528848804219,
-    0.001040451891886,
-    0.046482828801027,
-    -0.102823474781367,
-    0.041084990214039,
-    -0.396640798110033,
-    0.072734868598769,
-    -0.004015945675054,
-    0.024626613139647,
-    0.117322681684384,
-    -0.057738625880145,
-    0.025242552153282,
-    -0.216016576229961,
-    0.007368058548779,
-    0.014801647198493,
-    0.031479851238753,
-    0.122184716988932,
-    -0.032002977094499,
-    -0.011363798347841,
-    0.002285166642321,
-    -0.034437540274843,
-    -0.028119093881610,
-    0.278219330087228,
-    -0.144718078609291,
-    -0.050344940637642,
-    0.114430025479554,
-    0.137584404373847,
-    -0.200299391266539,
-    -0.005775774104093,
-    0.004974171856175,
-    -0.095119201253442,
-    0.091605575602855,
-    -0.084696744900237,
-    0.000589408716431,
-    -0.082053668054138,
-    -0.371556294998486,
-    -0.011369748035579,
-    -0.131032420529798,
-    -0.220171589708849,
-    -0.007978313784919,
-    -0.012395995343820,
-    0.101203241209219,
-    0.066935113382642,
-    0.342204930374873,
-    0.015934339945029,
-    0.030726537991945,
-    -0.003096784411426,
-    -0.027169133273275,
-    -0.016150386839005,
-    0.144496871867482,
-    0.012113666102601,
-    -0.037931592374480,
-    0.175907463803528,
-    -0.179169459010115,
-    0.050588573783571,
-    -0.000587150442686,
-    -0.120058942658476,
-    -0.101206417802926,
-    -0.115044390884101,
-    -0.031035867647283,
-    -0.082175810531444,
-    0.001509498015866,
-    0.063036494828351,
-    -0.029976519155103,
-    0.014637857390096,
-    0.068341930619800,
-    -0.025612195072608,
-    -0.106011698849100,
-    -0.062940696970830,
-    -0.044879613146564,
-    -0.201960907445778,
-    -0.000979601332135,
-    0.071960560911731,
-    -0.075059795049776,
-    0.155119404229365,
-    -0.209226824604918,
-    0.012189630006946,
-    0.145001707208187,
-    0.008030742336844,
-    -0.131189861750393,
-    0.039380383797600,
-    0.060451899730454,
-    0.005274151844309,
-    0.033821067270999,
-    0.085784683663628,
-    0.014281421632119,
-    -0.081537495284957,
-    -0.159855309064254,
-    -0.032318645757383,
-    0.032312213595308,
-    -0.009867244084499,
-    0.111493116947268,
-    -0.026022499293666,
-    -0.060702065059713,
-    0.004189099209273,
-    -0.004197985376870,
-    0.056111754325756,
-    -0.012074391465862,
-    -0.021060023891211,
-    -0.006282729106609,
-    -0.037492675576646,
-    -0.000758622726559,
-    0.004185820248474,
-    -0.000314231822065,
-    -0.010105464013521,
-    -0.008359761005983,
-    -0.008359761005983,
-    0.737859883681286,
-    0.737808316095611,
-    -0.008317703052758,
-    -0.008317703052758,
-    0.737837429851487,
-    0.737786381404990,
-    -0.002318453467367,
-    0.003323424269902,
-    -0.000960334869914,
-    -0.008023455945918,
-    -0.008293918900793,
-    -0.008293918900793,
-    0.737033594624305,
-    0.736982893009572,
-    -0.008269482398174,
-    -0.008269482398174,
-    0.737018387761949,
-    0.736967985523152,
-    -0.067890835074098,
-    0.008194722354977,
-    -0.005471365639037,
-    0.058428371723572,
-    -0.013504326727971,
-    -0.041197651322184,
-    -0.008188477345032,
-    -0.039040589834099,
-    0.003346014514483,
-    0.002602050631776,
-    0.001385964591796,
-    -0.006281905925215,
-    -0.012416867524161,
-    -0.012416867524161,
-    0.733362509077996,
-    0.733249431555966,
-    -0.012405162404132,
-    -0.012405162404132,
-    0.733351521163424,
-    0.733238658439953,
-    0.001943073549472,
-    0.001673444570348,
-    0.000804847416880,
-    -0.004040052577613,
-    -0.012682536190696,
-    -0.012682536190696,
-    0.732297579215374,
-    0.732179782074193,
-    -0.012677340874341,
-    -0.012677340874341,
-    0.732293220311534,
-    0.732175520368565,
-    0.146484037441439,
-    0.008087348131742,
-    -0.138784549769713,
-    0.030597641456821,
-    0.064665379672921,
-    0.000610927455571,
-    0.036967620208582,
-    0.104187327149073,
-    0.014427418417031,
-    -0.082112223565491,
-    -0.169109463191536,
-    -0.025110835392993,
-    0.034564365545662,
-    -0.001142964878523,
-    0.121865911863515,
-    -0.031604880164585,
-    -0.061306446905235,
-    0.002825419789942,
-    -0.012312012558237,
-    0.056627227323934,
-    -0.012194610489556,
-    -0.014204344491809,
-    -0.018426228944667,
-    -0.037837103622453,
-    0.006726206310141,
-    0.004060795633375,
-    0.002786085876980,
-    -0.009803627892120,
-    -0.003052250562057,
-    -0.003052250562057,
-    0.731529967119680,
-    0.731523151983953,
-    -0.003031178466192,
-    -0.003031178466192,
-    0.731499633132568,
-    0.731492912051685,
-    0.005014755087952,
-    0.003265299169670,
-    0.002077179569409,
-    -0.007883129540622,
-    -0.002869827694432,
-    -0.002869827694432,
-    0.730677081487161,
-    0.730671063670970,
-    -0.002854502932354,
-    -0.002854502932354,
-    0.730658367828347,
-    0.730652414263084,
-    -0.068665536083404,
-    0.007452878521428,
-    -0.013808204893255,
-    0.058458526340769,
-    -0.013658424339743,
-    -0.037468150520790,
-    -0.020665439015311,
-    -0.039060738505145,
-    0.011720040024559,
-    0.001888877426291,
-    0.004854599529728,
-    -0.004560153500213,
-    -0.006894158254173,
-    -0.006894158254173,
-    0.726518592491317,
-    0.726484060664767,
-    -0.006942440635238,
-    -0.006942440635238,
-    0.726485179521043,
-    0.726450163920846,
-    0.010125145395803,
-    0.001058949088636,
-    0.004193972543941,
-    -0.002556529251648,
-    -0.007039955898566,
-    -0.007039955898566,
-    0.725429925955152,
-    0.725393972046809,
-    -0.007079711822669,
-    -0.007079711822669,
-    0.725406957459026,
-    0.725370597468496,
-    -0.016327736102145,
-    -0.003829396275122,
-    -0.029214342003309,
-    -0.019553933255158,
-    0.174360019260614,
-    0.016573507042273,
-    -0.039854026373602,
-    0.194490593489563,
-    -0.175618261972090,
-    0.049944370747915,
-    0.001708777208560,
-    -0.052560241737947,
-    -0.154610017469609,
-    -0.115239543888398,
-    -0.032187040385623,
-    -0.044145816363482,
-    -0.000802130238566,
-    0.077949151901494,
-    -0.032233059253580,
-    0.017722652049002,
-    0.082466147434002,
-    -0.035041736482467,
-    -0.111384541944114,
-    -0.069589847092423,
-    -0.043990084595469,
-    -0.199389104765259,
-    0.002850922537281,
-    0.031503396526471,
-    -0.114666603915464,
-    0.155382537594907,
-    -0.216987400830845,
-    0.006548413265964,
-    0.129458209920582,
-    0.007961899167621,
-    -0.138973479606362,
-    0.045625899145734,
-    0.065191997945350,
-    -0.014734382235502,
-    0.017656797618811,
-    0.050166638212179,
-    0.012750520771184,
-    -0.080838518857812,
-    -0.169339674863580,
-    -0.037444207741391,
-    0.034845848876671,
-    0.027566090291632,
-    0.058206661133854,
-    -0.015217883329394,
-    -0.075397882022754,
-    0.004560497462428,
-    0.005619230611762,
-    0.059050738139981,
-    -0.014997571208558,
-    -0.022927168996602,
-    0.008409772915310,
-    -0.039456441778502,
-    0.003538199630937,
-    -0.001339777407168,
-    0.001465570273518,
-    0.003234508786945,
-    -0.001008323888886,
-    -0.001008323888886,
-    0.725798288037489,
-    0.725797550105609,
-    -0.001009175857026,
-    -0.001009175857026,
-    0.725793403331936,
-    0.725792664157495,
-    0.001052658575459,
-    -0.002287711875842,
-    0.000436025458503,
-    0.005523025037460,
-    -0.001247304701299,
-    -0.001247304701299,
-    0.724744785782533,
-    0.724743658246172,
-    -0.001235128409306,
-    -0.001235128409306,
-    0.724738064397792,
-    0.724736958778456,
-    -0.080488497984808,
-    0.009011690289797,
-    0.004368814600106,
-    0.059445575216011,
-    -0.016010157680991,
-    -0.045304826484704,
-    0.006538393106535,
-    -0.039720263478164,
-    0.010056481529218,
-    -0.001329591351376,
-    0.004165531039157,
-    0.003209917472907,
-    -0.006385752733050,
-    -0.006385752733050,
-    0.721894101364079,
-    0.721864663483165,
-    -0.006423374809962,
-    -0.006423374809962,
-    0.721870712544714,
-    0.721840927729481,
-    0.007921836181055,
-    -0.002298283383129,
-    0.003281331985091,
-    0.005548546913727,
-    -0.007053212226774,
-    -0.007053212226774,
-    0.720626033628933,
-    0.720590183175417,
-    -0.007066453673617,
-    -0.007066453673617,
-    0.720606357114732,
-    0.720570372905361,
-    0.132314901139210,
-    0.008020199260484,
-    -0.149922893839147,
-    0.034249736256718,
-    0.069506996170208,
-    -0.015617585107924,
-    0.017712550326183,
-    0.072714446295280,
-    0.013031880298265,
-    -0.081430449634266,
-    -0.182681574709353,
-    -0.028108032137364,
-    0.037152263479465,
-    0.029218446646847,
-    0.058390453179012,
-    -0.022057686134017,
-    -0.076157104800614,
-    0.003190541171679,
-    -0.004393389475792,
-    0.064756942849978,
-    -0.015148590008671,
-    -0.016039933633634,
-    -0.006575172007105,
-    -0.043269205869316,
-    0.013128057037612,
-    -0.003378232516629,
-    0.005437819272586,
-    0.008155774758495,
-    0.003556172720263,
-    0.003556172720263,
-    0.719045101521879,
-    0.719036008157994,
-    0.003512331782910,
-    0.003512331782910,
-    0.718994682391700,
-    0.718985812477384,
-    0.010458417572464,
-    -0.004530295752962,
-    0.004332018399476,
-    0.010937101448363,
-    0.003502356115868,
-    0.003502356115868,
-    0.717924722962187,
-    0.717915916485736,
-    0.003506598827691,
-    0.003506598827691,
-    0.717876579251220,
-    0.717867752017586,
-    -0.081573736886973,
-    0.008599453788407,
-    -0.005819043554575,
-    0.063905433527814,
-    -0.016226025120193,
-    -0.043232373641171,
-    -0.008708814116978,
-    -0.042700245530257,
-    0.021001006093427,
-    -0.003607658713433,
-    0.008698901547378,
-    0.008709658594384,
-    -0.002087046917843,
-    -0.002087046917843,
-    0.714663655838762,
-    0.714660542925160,
-    -0.002238355528475,
-    -0.002238355528475,
-    0.714555675631994,
-    0.714552095530832,
-    0.018693890311772,
-    -0.004720182351636,
-    0.007743262900651,
-    0.011395528250195,
-    -0.002621374580779,
-    -0.002621374580779,
-    0.713328936142943,
-    0.713324034411637,
-    -0.002712361570483,
-    -0.002712361570483,
-    0.713228955363379,
-    0.713223708186203,
-    0.119892753550839,
-    0.004023740026128,
-    0.242207139640200,
-    0.334405467109050,
-    -0.429746803188307,
-    0.011509578838034,
-    0.038271195920530,
-    0.191989782035880,
-    -0.442336664027015,
-    0.008050363598976,
-    -0.096323820110373,
-    -0.210335899415619,
-    0.116589658622806,
-    0.098350159296376,
-    0.056337545829164,
-    -0.354178533160971,
-    0.142968705041692,
-    -0.028846811430843,
-    -0.180038396586650,
-    -0.332538445908485,
-    -0.464255204459651,
-    -0.048948603137896,
-    -0.045595961455859,
-    0.302831161524840,
-    0.023021792116285,
-    0.105430896506521,
-    0.055419034609895,
-    0.198495627970507,
-    0.383336353318452,
-    -0.049270946503340,
-    0.010679662221253,
-    -0.526689765775223,
-    0.428398854448426,
-    0.034472978571316,
-    -0.017855407273961,
-    -0.293687678916253,
-    0.535749346363637,
-    -0.171849171033950,
-    -0.000511817775863,
-    -0.280817626113049,
-    0.046162481826510,
-    -0.045841738500565,
-    -0.130459581771365,
-    0.157086250119336,
-    0.141257580831236,
-    0.168967478619959,
-    -0.007560554394499,
-    0.367679578436149,
-    0.006012300659942,
-    -0.041231975225250,
-    0.061769388826004,
-    0.118878758741025,
-    0.158549610809607,
-    0.142469340422046,
-    0.033856607685270,
-    -0.155803030177236,
-    -0.535001604822883,
-    -0.010779670414345,
-    0.011440002090463,
-    -0.320454436621892,
-    0.035131434150466,
-    0.149589267495409,
-    -0.012341235218433,
-    -0.141363096557966,
-    0.001471379307535,
-    -0.327867375077707,
-    0.248225961422688,
-    -0.326297020683529,
-    -0.184217460531725,
-    -0.026849814873206,
-    0.095699953296003,
-    -0.076778287867167,
-    -0.093643390139870,
-    -0.038026933596240,
-    -0.148060344682842,
-    0.136838512577173,
-    0.079989491093991,
-    -0.143351474562943,
-    0.302588419780027,
-    0.065942871700669,
-    0.015854930812696,
-    0.260120420806065,
-    -0.224950859281175,
-    0.266145631966432,
-    -0.255523304786829,
-    0.088933742371392,
-    -0.157230366876363,
-    -0.087819409461642,
-    0.007293269830248,
-    -0.332801094502232,
-    0.106814323473190,
-    -0.102986525764696,
-    0.322549129963096,
-    0.058556490167250,
-    0.124016497418594,
-    0.045355810807047,
-    0.026319263067444,
-    -0.561116946607992,
-    -0.020192960192803,
-    0.259690162726262,
-    0.261483297981584,
-    0.352099280394787,
-    -0.001487744623446,
-    0.096607610308420,
-    0.012167029635149,
-    0.173926462241414,
-    -0.223842990155901,
-    -0.091552594424903,
-    0.107475569906391,
-    -0.222077792095428,
-    -0.055667512512816,
-    -0.049936872100634,
-    0.000967387367665,
-    0.256256221802776,
-    0.085458567607378,
-    -0.085925478011325,
-    0.097695404570255,
-    -0.231213111564249,
-    0.142563472488643,
-    0.037000796745514,
-    -0.198865672627210,
-    0.029000183364714,
-    0.024976333631789,
-    0.146778925958399,
-    0.032635432647124,
-    -0.161030054586838,
-    -0.335066642406007,
-    0.005206711158415,
-    0.186166566592179,
-    0.005960167359032,
-    0.061115211684706,
-    -0.087239155262054,
-    -0.092664725913227,
-    -0.044353568911135,
-    -0.001089557654038,
-    0.057313430337839,
-    -0.175176492700073,
-    -0.048806828923502,
-    0.083975602718647,
-    0.063001813354923,
-    0.007036741541021,
-    -0.089795018205865,
-    0.002766728715928,
-    0.137607820574768,
-    -0.117194274555260,
-    0.005586618052170,
-    0.077227510188049,
-    0.073274309876279,
-    -0.077763369152069,
-    0.040401375327255,
-    -0.106613719292178,
-    0.025248933893507,
-    -0.429672540628226,
-    0.066380172117997,
-    -0.042923221111437,
-    -0.033363279604516,
-    0.144839135239007,
-    -0.011715029346143,
-    0.022631771187414,
-    -0.053685106752387,
-    0.004570132692588,
-    -0.242790301328757,
-    0.064191314237348,
-    0.083058580500806,
-    -0.041075448010386,
-    0.100060048167570,
-    -0.002824572005550,
-    -0.022108229700319,
-    -0.039337196891639,
-    0.217346679128751,
-    0.132611968191212,
-    -0.039895458313528,
-    0.004955832538757,
-    0.127499129529595,
-    0.015945050479534,
-    -0.023877221913419,
-    -0.014454535108970,
-    -0.045295102533947,
-    0.098957909027052,
-    -0.057183832683305,
-    -0.044052404493384,
-    -0.071318401343938,
-    -0.385252478779178,
-    -0.006987321039645,
-    -0.141944634293736,
-    -0.200935648911228,
-    -0.085273794616735,
-    0.016793663679490,
-    0.124939097280104,
-    0.013580974704747,
-    0.306811436356370,
-    0.003960051380812,
-    -0.021745152859350,
-    -0.005594516390292,
-    -0.031248882460069,
-    0.012772950559836,
-    0.100666594542624,
-    0.019359565879334,
-    -0.065524606915225,
-    0.178753771955883,
-    -0.009884579762959,
-    0.017012309955820,
-    -0.045920595638802,
-    -0.170598858233057,
-    -0.125949653186954,
-    -0.105856134159867,
-    -0.036461085721980,
-    -0.219137608120978,
-    -0.001068270857735,
-    0.113878997260049,
-    -0.034477828726366,
-    -0.011576727579928,
-    0.047611753327594,
-    -0.040932362971112,
-    -0.183129008319089,
-    -0.063959122312367,
-    -0.002475958337592,
-    -0.067916948422495,
-    -0.076613885283698,
-    0.102253020537367,
-    -0.093410629088878,
-    0.142730474199690,
-    -0.245800674044483,
-    0.032505993507417,
-    0.132413029308584,
-    0.015639030834707,
-    -0.111929548528662,
-    0.059041239118024,
-    0.069311938007130,
-    0.017440087580246,
-    0.034661562304572,
-    -0.004326684467875,
-    0.013041545079376,
-    -0.158785744761849,
-    -0.136386549499645,
-    -0.048453892728405,
-    0.037048002719142,
-    -0.032628108952723,
-    0.114263857749765,
-    0.001312485384345,
-    -0.031209137960307,
-    0.003142142022227,
-    0.007857095704026,
-    0.034302337418042,
-    -0.006207883515563,
-    -0.015796614678208,
-    0.011758974708459,
-    -0.022920089093435,
-    -0.014632345828034,
-    -0.008417270446565,
-    -0.006060916091305,
-    0.020321088470260,
-    -0.006858981296309,
-    -0.006858981296309,
-    0.718843015263523,
-    0.718809196049467,
-    -0.006776596014042,
-    -0.006776596014042,
-    0.718710574743546,
-    0.718677569176450,
-    -0.014980384075602,
-    -0.008704790255872,
-    -0.006205078253672,
-    0.021015222693339,
-    -0.006751263112607,
-    -0.006751263112607,
-    0.718561273832264,
-    0.718528521383719,
-    -0.006661257438395,
-    -0.006661257438395,
-    0.718420645221532,
-    0.718388766501458,
-    -0.027326109434275,
-    0.005654919595659,
-    0.006516683549065,
-    0.040251894324816,
-    -0.005435501118847,
-    -0.028429200608051,
-    0.009752906152998,
-    -0.026895455923627,
-    -0.016246733361299,
-    -0.009001501152862,
-    -0.006729617302510,
-    0.021731546164956,
-    -0.012111451743837,
-    -0.012111451743837,
-    0.714315500372855,
-    0.714210711700796,
-    -0.012025157420799,
-    -0.012025157420799,
-    0.714160707284723,
-    0.714057429028505,
-    -0.016217183721700,
-    -0.009423879364716,
-    -0.006717377441024,
-    0.022751257372466,
-    -0.011967859389471,
-    -0.011967859389471,
-    0.713952825053823,
-    0.713850558510276,
-    -0.011862372938442,
-    -0.011862372938442,
-    0.713788668724740,
-    0.713688220247868,
-    0.138571756739779,
-    0.015728347038407,
-    -0.115130662835533,
-    0.059753791795580,
-    0.071419606352313,
-    0.009821076680817,
-    0.035689898777710,
-    0.002090947935172,
-    0.013648126786968,
-    -0.159692587396385,
-    -0.140287118568378,
-    -0.049038669598224,
-    0.038174574920533,
-    -0.018373942131901,
-    0.117653828791837,
-    -0.000634282121730,
-    -0.033579218106897,
-    0.000095791056252,
-    0.014059656465106,
-    0.022267836860685,
-    -0.006679321768401,
-    -0.000481574160086,
-    0.021041762886775,
-    -0.014878892902981,
-    -0.006015334734651,
-    -0.014109244434149,
-    -0.002491633229307,
-    0.034062729267760,
-    -0.001605402248909,
-    -0.001605402248909,
-    0.711573375607698,
-    0.711571541655618,
-    -0.001139466027934,
-    -0.001139466027934,
-    0.711323440883780,
-    0.711322517313039,
-    -0.006556991148126,
-    -0.014123931034880,
-    -0.002715994661914,
-    0.034098185858429,
-    -0.001571785189576,
-    -0.001571785189576,
-    0.711349189764032,
-    0.711347432367512,
-    -0.001107667338903,
-    -0.001107667338903,
-    0.711097423915891,
-    0.711096551450774,
-    -0.030391340282971,
-    0.002777792956462,
-    0.012353491979828,
-    0.028592208890386,
-    -0.006045213443526,
-    -0.013964908230971,
-    0.018488307286052,
-    -0.019104703191482,
-    -0.007538872011016,
-    -0.014836332596593,
-    -0.003122703031958,
-    0.035818075370572,
-    -0.007214914665283,
-    -0.007214914665283,
-    0.706859019713801,
-    0.706822223214289,
-    -0.006706697736129,
-    -0.006706697736129,
-    0.706578996116918,
-    0.706547213624057,
-    -0.007888944398291,
-    -0.014967901260239,
-    -0.003267707762579,
-    0.036135710222730,
-    -0.007127619205246,
-    -0.007127619205246,
-    0.706610513144573,
-    0.706574614330187,
-    -0.006612157703828,
-    -0.006612157703828,
-    0.706324732687322,
-    0.706293851050280,
-    -0.009014080586621,
-    -0.005757397248011,
-    -0.030671062600546,
-    0.011376045388892,
-    0.108751240401445,
-    0.023490013332770,
-    -0.061537102518598,
-    0.169917230564193,
-    -0.015682657094147,
-    0.017883199860424,
-    -0.046246613538358,
-    -0.098102025867625,
-    -0.196543267961741,
-    -0.103616359907434,
-    -0.038992807593372,
-    -0.173285017505955,
-    -0.000442833382789,
-    0.117194513286082,
-    -0.033840302754780,
-    -0.010310646532855,
-    0.051435506044372,
-    -0.049665460368590,
-    -0.171984680101035,
-    -0.060797357245787,
-    -0.003928301103235,
-    -0.071393735812699,
-    -0.077157813288325,
-    0.058800091452522,
-    -0.145766422049916,
-    0.139710488218839,
-    -0.262868156544222,
-    0.025704404197346,
-    0.114099654745419,
-    0.016083037199572,
-    -0.119902443656536,
-    0.060148355392426,
-    0.071080475035668,
-    -0.004628997595321,
-    0.018389615695457,
-    -0.026662036386390,
-    0.011237835118444,
-    -0.163293817037509,
-    -0.146101550322102,
-    -0.049362479573789,
-    0.037993305455237,
-    0.008660245379336,
-    0.060622438580080,
-    0.008087840316030,
-    -0.043960703434827,
-    0.004340799101552,
-    0.020335378148988,
-    0.047015328800551,
-    -0.008744327591896,
-    -0.021822670750618,
-    0.030434044123757,
-    -0.031414638359280,
-    -0.014266714169007,
-    -0.012211946221385,
-    -0.005909466499303,
-    0.029482246190639,
-    0.001150480030018,
-    0.001150480030018,
-    0.708097812543555,
-    0.708096875301625,
-    0.001426379435150,
-    0.001426379435150,
-    0.707875518754603,
-    0.707874078539131,
-    -0.014966762586868,
-    -0.012567810120572,
-    -0.006199436048299,
-    0.030341377642416,
-    0.001504135167603,
-    0.001504135167603,
-    0.707481919821378,
-    0.707480319196482,
-    0.001792866389156,
-    0.001792866389156,
-    0.707245006358290,
-    0.707242733007583,
-    -0.037077367733421,
-    0.007294028167148,
-    0.018553994207474,
-    0.048359848385100,
-    -0.007375146992061,
-    -0.036669555861382,
-    0.027768014651368,
-    -0.032313017623940,
-    -0.014165232293931,
-    -0.011999152523066,
-    -0.005867431330312,
-    0.028968516758168,
-    -0.005137117149041,
-    -0.005137117149041,
-    0.703950921291754,
-    0.703932343801094,
-    -0.004872485074158,
-    -0.004872485074158,
-    0.703735537449196,
-    0.703718829787497,
-    -0.014179691796066,
-    -0.012433553462517,
-    -0.005873420652201,
-    0.030017253397701,
-    -0.004853683059152,
-    -0.004853683059152,
-    0.703311341850377,
-    0.703294772878357,
-    -0.004563570778227,
-    -0.004563570778227,
-    0.703083288078024,
-    0.703068645387666,
-    0.120861828998705,
-    0.016171358581658,
-    -0.123432884271129,
-    0.060465106258056,
-    0.073345037525438,
-    -0.005817425614421,
-    0.013901005918022,
-    -0.006540299034810,
-    0.011903851150396,
-    -0.164190559078699,
-    -0.150403404657863,
-    -0.049622430291188,
-    0.039203739324075,
-    0.010883637819955,
-    0.045825475171557,
-    0.001983978022010,
-    -0.046480564554448,
-    0.001825001234822,
-    0.022549800460280,
-    0.044747344890705,
-    -0.009245559132668,
-    -0.009174900780999,
-    0.033748161315813,
-    -0.029899219959576,
-    -0.006262423024476,
-    -0.020521810049336,
-    -0.002593980550055,
-    0.049544032145552,
-    0.006478610047851,
-    0.006478610047851,
-    0.701149782117723,
-    0.701120352569288,
-    0.007480465249121,
-    0.007480465249121,
-    0.700642005180289,
-    0.700602798006138,
-    -0.007260591662169,
-    -0.020760615714658,
-    -0.003007435537324,
-    0.050120560021544,
-    0.006860699962643,
-    0.006860699962643,
-    0.700555675871362,
-    0.700522700497276,
-    0.007880820376000,
-    0.007880820376000,
-    0.700034114414340,
-    0.699990635814514,
-    -0.040246054827430,
-    0.004989778333212,
-    0.020667007906029,
-    0.045679622713303,
-    -0.008005438043416,
-    -0.025085309671509,
-    0.030930363129217,
-    -0.030522148085242,
-    -0.005998512509104,
-    -0.020031773658329,
-    -0.002484665235336,
-    0.048360979644326,
-    -0.000357205673751,
-    -0.000357205673751,
-    0.696895645425250,
-    0.696895556504222,
-    0.000597975394496,
-    0.000597975394496,
-    0.696410511257720,
-    0.696410262238985,
-    -0.006474689026073,
-    -0.020344323443305,
-    -0.002681904006748,
-    0.049115541574131,
-    -0.000005689627721,
-    -0.000005689627721,
-    0.696316213898881,
-    0.696316213876339,
-    0.000977581973766,
-    0.000977581973766,
-    0.695815493138925,
-    0.695814828171039,
-    0.233585172772870,
-    0.004577939226705,
-    -0.023472518074563,
-    -0.098997069296452,
-    -0.193845590031843,
-    -0.051014935358723,
-    0.000798898876864,
-    0.038938474757243,
-    -0.151447326994070,
-    -0.060465206567924,
-    -0.000734587267645,
-    0.030347121741197,
-    0.059819317145109,
-    -0.100077468849280,
-    -0.021322969720992,
-    -0.015256851748731,
-    -0.030272776078725,
-    -0.004576289614116,
-    -0.006180231874468,
-    0.037067855064580,
-    -0.064538092826740,
-    0.049167733505116,
-    -0.101063812651445,
-    -0.044572824018270,
-    -0.402944147381673,
-    0.064794953272160,
-    -0.033701902574565,
-    -0.035269153562935,
-    -0.002234190138861,
-    -0.054665718944759,
-    0.024192338570363,
-    -0.004348573591487,
-    0.005734194136649,
-    -0.186484569536818,
-    -0.024653956717672,
-    0.094253045261658,
-    -0.085925840463303,
-    0.115087850077782,
-    0.002071067459801,
-    -0.015020227179542,
-    -0.034008634542525,
-    0.269263792387955,
-    -0.001160040061837,
-    -0.019217102903703,
-    0.042129516428273,
-    0.142099087663806,
-    -0.122887302472928,
-    0.002647314908288,
-    -0.003733790804512,
-    0.037103575966843,
-    -0.007919235284298,
-    -0.028928038019340,
-    -0.036560377995909,
-    -0.086793187679532,
-    -0.365197693104967,
-    0.012334961641265,
-    -0.133114765856964,
-    -0.196137122976580,
-    -0.066954181068459,
-    0.017753000011307,
-    -0.001927225667571,
-    0.063372760261158,
-    0.327967532197416,
-    0.000320770058910,
-    0.051226253355100,
-    -0.003110582182252,
-    -0.048266732714533,
-    -0.022358323400171,
-    0.135821718570863,
-    0.043674740367597,
-    -0.070808702039111,
-    0.159763558761775,
-    -0.113230416265006,
-    0.048150257946524,
-    -0.037983408207955,
-    -0.174232285060509,
-    -0.138687686398527,
-    -0.096031924447783,
-    -0.046767039544241,
-    -0.243812335287879,
-    0.002516584452829,
-    0.063317354905684,
-    -0.053254133034659,
-    0.020264403117760,
-    0.064238888685042,
-    -0.092342480019343,
-    -0.197897064862381,
-    -0.057164315382532,
-    -0.028362742771417,
-    -0.192226604968779,
-    -0.063371488079507,
-    0.104430812767963,
-    -0.102857798378672,
-    0.129484060829585,
-    -0.315277771229661,
-    0.036166143528958,
-    0.110312897741096,
-    0.015532474761107,
-    -0.100662455271200,
-    0.012250945899153,
-    0.059709670786470,
-    0.009440066379041,
-    0.036438612067256,
-    0.033685934360008,
-    0.010864872106916,
-    -0.157703862790754,
-    -0.122657556642299,
-    -0.010054091467024,
-    0.031915483959324,
-    -0.017661121993742,
-    0.120122005732633,
-    -0.010218516472323,
-    -0.048001477778004,
-    0.003084606226112,
-    -0.025776271549764,
-    0.017233888281820,
-    -0.009548087582545,
-    -0.015507362698192,
-    -0.038576916541407,
-    -0.011515315998200,
-    -0.006286679591765,
-    0.002083245324445,
-    -0.002604027949203,
-    -0.005029399116025,
-    -0.011002427955676,
-    -0.011002427955676,
-    0.686771612123258,
-    0.686688471037659,
-    -0.011008319969009,
-    -0.011008319969009,
-    0.686758618502989,
-    0.686675389915527,
-    -0.007278945077763,
-    0.002413339147258,
-    -0.003015037770978,
-    -0.005826316099915,
-    -0.011012670335061,
-    -0.011012670335061,
-    0.686324839755842,
-    0.686241597980764,
-    -0.011020554240099,
-    -0.011020554240099,
-    0.686307424676708,
-    0.686224065782381,
-    -0.041605758864207,
-    0.005546284952521,
-    -0.026938477498476,
-    0.023317680607430,
-    -0.008275899992307,
-    -0.027883057376392,
-    -0.040316280661654,
-    -0.015580376067710,
-    -0.009335192885028,
-    0.000938195258952,
-    -0.003866763500348,
-    -0.002265003718316,
-    -0.014701543440307,
-    -0.014701543440307,
-    0.683161755561377,
-    0.683014084175830,
-    -0.014735502524291,
-    -0.014735502524291,
-    0.683143632683147,
-    0.682995282159001,
-    -0.009793664145677,
-    0.001238040676909,
-    -0.004056668514466,
-    -0.002988894592964,
-    -0.014606701027175,
-    -0.014606701027175,
-    0.682671189406768,
-    0.682525522065975,
-    -0.014642717103142,
-    -0.014642717103142,
-    0.682650583762137,
-    0.682504201526528,
-    0.110997440904039,
-    0.015736326896064,
-    -0.104475389658669,
-    0.018420151590779,
-    0.071261289990913,
-    0.000799560747982,
-    0.035876258196747,
-    0.054907225894112,
-    0.010932293723693,
-    -0.159773608250849,
-    -0.127303630636266,
-    -0.015117027734401,
-    0.038089953062362,
-    -0.001495872946707,
-    0.118268173464476,
-    -0.016655924881058,
-    -0.048269731186573,
-    0.000999629604540,
-    -0.026304919404640,
-    -0.005765021637083,
-    -0.009601446503101,
-    -0.005025477388402,
-    -0.039368093967435,
-    0.003852064305041,
-    0.004568017891050,
-    -0.003941045006922,
-    0.001892134963636,
-    0.009514524305633,
-    -0.001848774413300,
-    -0.001848774413300,
-    0.677295060306058,
-    0.677292745330051,
-    -0.001819918862426,
-    -0.001819918862426,
-    0.677272926221570,
-    0.677270683019036,
-    0.003459920341252,
-    -0.003520853204820,
-    0.001433145930077,
-    0.008500091558200,
-    -0.001874932022835,
-    -0.001874932022835,
-    0.676890905225219,
-    0.676888525698994,
-    -0.001849961960265,
-    -0.001849961960265,
-    0.676874175629204,
-    0.676871859118641,
-    -0.041616736506420,
-    0.003625907572561,
-    -0.028119365181181,
-    -0.000736939159485,
-    -0.008278083581108,
-    -0.018228668334334,
-    -0.042083603972651,
-    0.000492407003814,
-    0.001909691279457,
-    -0.005137208234304,
-    0.000791020027897,
-    0.012402317791992,
-    -0.005580211338884,
-    -0.005580211338884,
-    0.673426984390306,
-    0.673406014383518,
-    -0.005518006746710,
-    -0.005518006746710,
-    0.673395691288270,
-    0.673375187155779,
-    0.001236826712612,
-    -0.004646644363105,
-    0.000512310398669,
-    0.011217991840932,
-    -0.005500930794481,
-    -0.005500930794481,
-    0.673027073398708,
-    0.673006707130057,
-    -0.005449437660207,
-    -0.005449437660207,
-    0.673001773857193,
-    0.672981787850199,
-    0.040898603068291,
-    -0.003542865350589,
-    -0.058285447565197,
-    -0.023001755840117,
-    0.159938641063098,
-    0.043401997797655,
-    -0.066723753621794,
-    0.166812897947424,
-    -0.113006620872227,
-    0.047903649862241,
-    -0.036837061573658,
-    -0.110517181180904,
-    -0.198145685631052,
-    -0.094849567942134,
-    -0.046303793485664,
-    -0.189951285143552,
-    0.002009219528717,
-    0.072116680943597,
-    -0.064308081447723,
-    0.020847576288160,
-    0.075645343526770,
-    -0.091765814305859,
-    -0.186480398850696,
-    -0.059686609274644,
-    -0.028306684943776,
-    -0.191242090309433,
-    -0.061458924265522,
-    0.066241449175380,
-    -0.146954855989717,
-    0.127889837631622,
-    -0.312154819973771,
-    0.028176611465947,
-    0.092168201588382,
-    0.016912354831472,
-    -0.115017348155600,
-    0.017653384090551,
-    0.059785999735189,
-    -0.010201658249182,
-    0.021945747570403,
-    0.002524305090180,
-    0.009077775519346,
-    -0.171714020259640,
-    -0.140149044231378,
-    -0.014487757909467,
-    0.031956282632410,
-    0.019085960166265,
-    0.072345434304500,
-    -0.000765739577519,
-    -0.056207776794157,
-    0.003725899772201,
-    -0.012378988316160,
-    0.026215681582781,
-    -0.011180421947273,
-    -0.018731363068491,
-    -0.018526465249934,
-    -0.017516758412109,
-    -0.008210183165891,
-    -0.002146901234914,
-    -0.003400769216879,
-    0.005183078078404,
-    -0.004453208767444,
-    -0.004453208767444,
-    0.677177247911015,
-    0.677163818629583,
-    -0.004470002407713,
-    -0.004470002407713,
-    0.677158600447110,
-    0.677145070059079,
-    -0.009561189437588,
-    -0.002242186405931,
-    -0.003960374337467,
-    0.005413116830568,
-    -0.004831153933215,
-    -0.004831153933215,
-    0.676745626091927,
-    0.676729830631974,
-    -0.004856883217563,
-    -0.004856883217563,
-    0.676721781733279,
-    0.676705818141993,
-    -0.045639295354353,
-    0.006932809886421,
-    -0.013527755794666,
-    0.028593140967512,
-    -0.009078220284474,
-    -0.034853588933407,
-    -0.020245717278228,
-    -0.019105325985507,
-    -0.009807031742309,
-    -0.002201622963167,
-    -0.004062205554288,
-    0.005315188016910,
-    -0.009969261352650,
-    -0.009969261352650,
-    0.673680754618542,
-    0.673613796739737,
-    -0.009997393933557,
-    -0.009997393933557,
-    0.673656391226461,
-    0.673589057329521,
-    -0.010224609728455,
-    -0.002314551957128,
-    -0.004235172019498,
-    0.005587822725716,
-    -0.010260649421315,
-    -0.010260649421315,
-    0.673245460056429,
-    0.673174576419057,
-    -0.010291015097688,
-    -0.010291015097688,
-    0.673218897678126,
-    0.673147596660560,
-    0.093918653310707,
-    0.017225862648884,
-    -0.121582964864557,
-    0.020791746751621,
-    0.071178454161864,
-    -0.012932678103846,
-    0.016583561838816,
-    0.034722851901420,
-    0.009250179965986,
-    -0.174897118547665,
-    -0.148149271338902,
-    -0.017063345583336,
-    0.038045676389279,
-    0.024195338944327,
-    0.054668676913184,
-    -0.010533061969685,
-    -0.056011476575988,
-    0.002090186677520,
-    -0.016511742228340,
-    0.015781067825149,
-    -0.011141375406160,
-    -0.010508078029813,
-    -0.024711568570581,
-    -0.010544572404320,
-    0.002919285560346,
-    -0.009853431399687,
-    0.001209207671535,
-    0.023788287721036,
-    0.003430998516680,
-    0.003430998516680,
-    0.668184215993978,
-    0.668176350249587,
-    0.003661936659846,
-    0.003661936659846,
-    0.668072321057659,
-    0.668063362294675,
-    0.001463282733969,
-    -0.009753349904540,
-    0.000606111553996,
-    0.023546669618110,
-    0.003054184973410,
-    0.003054184973410,
-    0.667795430521573,
-    0.667789201266124,
-    0.003283026992816,
-    0.003283026992816,
-    0.667687023965490,
-    0.667679827418200,
-    -0.045042954144521,
-    0.005668428310499,
-    -0.018116390637045,
-    0.016592077914476,
-    -0.008959600642660,
-    -0.028497113503655,
-    -0.027113094626100,
-    -0.011086472021145,
-    0.001981973592256,
-    -0.009608730552756,
-    0.000820960342178,
-    0.023197527617651,
-    -0.002506865481670,
-    -0.002506865481670,
-    0.664408549822538,
-    0.664404374417241,
-    -0.002285526065203,
-    -0.002285526065203,
-    0.664302688819024,
-    0.664299218738909,
-    0.001396791923809,
-    -0.009481452162237,
-    0.000578570158655,
-    0.022890250401064,
-    -0.002768399742694,
-    -0.002768399742694,
-    0.664040609465460,
-    0.664035520214068,
-    -0.002552111493322,
-    -0.002552111493322,
-    0.663937917330544,
-    0.663933592907501,
-    -0.438165867830789,
-    0.002148089816173,
-    0.147333101619080,
-    -0.254533732871004,
-    -0.470556820246877,
-    -0.246933936266645,
-    0.065987288827429,
-    -0.105366862572781,
-    -0.490184963124572,
-    -0.080971244832762,
-    -0.371420929380621,
-    0.000084504011293,
-    -0.159005592157220,
-    0.120968307988108,
-    0.111603620726885,
-    0.331580753898928,
-    -0.674489373141445,
-    -0.030085983612749,
-    0.348407577086233,
-    -0.317559147646342,
-    -0.323461893534797,
-    -0.011367536898988,
-    -0.144889563318546,
-    -0.560288408314151,
-    0.334169322538584,
-    0.128071542149756,
-    -0.140093997393133,
-    -0.055675928567226,
-    0.275050170039709,
-    0.533573369983279,
-    -0.004255050297056,
-    0.832454534689009,
-    0.445950680325162,
-    -0.009637880792776,
-    0.113639862556667,
-    0.212816593046096,
-    -0.189062297146094,
-    -0.253820562254500,
-    -0.072964185085755,
-    0.180094367952109,
-    0.275469957881300,
-    -0.138160348375114,
-    0.224533183590716,
-    -0.690243505718003,
-    -0.260468916173087,
-    -0.082679819966077,
-    -0.125703836186884,
-    -0.353171983076703,
-    0.180899147470032,
-    -0.121119329066418,
-    -0.105896870434713,
-    -0.117715761857336,
-    0.183736584774967,
-    -0.174302386955478,
-    0.018207507605486,
-    0.080246901267113,
-    0.138722056385397,
-    0.041627403557958,
-    -0.137489616165817,
-    0.326019718110513,
-    0.064961720672723,
-    -0.326062227667573,
-    -0.005885665141549,
-    0.596162631424831,
-    -0.137773614803073,
-    -0.015701248270562,
-    0.565949155369981,
-    -0.119129871613880,
-    -0.220708637195400,
-    -0.241045978527097,
-    -0.062469996496860,
-    0.493753596105505,
-    -0.103565937692746,
-    0.121819729388022,
-    0.242948370692016,
-    0.139759838346295,
-    -0.055208965338612,
-    0.239676556152459,
-    -0.013182229332829,
-    0.673869932329677,
-    0.772091206447485,
-    -0.115015574810973,
-    -0.072972504233302,
-    0.270405275184622,
-    0.174673516027568,
-    -0.008916501272236,
-    0.045859983802755,
-    -0.026506878517232,
-    -0.225045030886094,
-    -0.063544544713349,
-    0.015397731504597,
-    0.169230739042581,
-    0.368883931483400,
-    0.233262653771342,
-    0.047010237162288,
-    0.313097796262561,
-    -0.336266417669764,
-    -0.022378686469539,
-    -0.088467558607757,
-    0.385528995280568,
-    0.021894769591027,
-    0.005467329382696,
-    -0.136564420876110,
-    0.042072475289870,
-    -0.534652901055376,
-    -0.065611996477631,
-    0.266899405441905,
-    0.162419338099362,
-    0.216082626801889,
-    -0.056427303969082,
-    -0.057762500096248,
-    0.552404130717711,
-    -0.750558586905322,
-    -0.068420257391557,
-    -0.198739878332684,
-    0.321751310014406,
-    0.272265465899200,
-    0.026404078280053,
-    0.155786924456459,
-    0.197653531000417,
-    -0.164393010618460,
-    0.105696523871767,
-    -0.155876101735458,
-    -0.328477151716606,
-    -0.572756913005916,
-    -0.199868027339171,
-    -0.002471361295187,
-    0.551311295937175,
-    -0.002688585834075,
-    -0.350079817632406,
-    0.149152336312964,
-    0.251429144575242,
-    -0.198302361691309,
-    0.585955945605716,
-    0.162113796988286,
-    0.042888845506052,
-    -0.100634453478944,
-    0.394406540606918,
-    -0.563322833310165,
-    -0.000055716822672,
-    -0.107661203256530,
-    -0.178658949204522,
-    0.579634513780530,
-    -0.063843011102134,
-    -0.070612746147771,
-    0.287379790963524,
-    0.429887848708033,
-    0.257369482634934,
-    -0.175454194100151,
-    0.020956837361633,
-    -0.488405227202011,
-    0.166214320182743,
-    0.103612476330713,
-    -0.413054315390098,
-    -0.266010761329813,
-    0.029321608466383,
-    0.228566537982344,
-    -0.642086315162624,
-    -0.046100408428219,
-    -0.076835239336965,
-    0.024651936659608,
-    0.174348147805916,
-    0.126938941824643,
-    -0.190520324463911,
-    -0.090843531381330,
-    0.528247832653180,
-    -0.207934812866314,
-    -0.063194991810284,
-    0.070800735962186,
-    0.537551267377861,
-    0.379877641317125,
-    0.407980241359611,
-    -0.195665579911446,
-    0.110062909918528,
-    -0.884797902124934,
-    0.050175382423321,
-    0.027969308256897,
-    0.783372372638285,
-    -0.144631786104132,
-    0.086189427077633,
-    0.111665559522737,
-    0.286800383522041,
-    0.074628281894891,
-    -0.019578315727481,
-    0.050597831341473,
-    -0.114128192265257,
-    -0.295373022380045,
-    -0.151754975943025,
-    0.059607977363271,
-    0.355347795590830,
-    -0.136946335871101,
-    -0.025621814531599,
-    -0.004228168218984,
-    0.511620545616686,
-    0.601786067724603,
-    0.112035578480797,
-    -0.099458195078265,
-    0.534907449107466,
-    -0.164954622361086,
-    -0.186989518556830,
-    -0.023924955463550,
-    -0.527331159415039,
-    0.388916659531572,
-    -0.087305144128586,
-    -0.039391531447097,
-    -0.335917244011447,
-    -0.078839933972965,
-    -0.112672696954745,
-    0.100041631154619,
-    0.887655597886109,
-    -0.094697950156709,
-    -0.208369347546210,
-    0.100372014552219,
-    0.015517040629642,
-    0.169762162634007,
-    0.007160635801292,
-    -0.075879524841586,
-    0.188461697111483,
-    0.031063183675000,
-    -0.083886104829599,
-    0.322170170119339,
-    -0.267085077304177,
-    0.695439978706365,
-    -0.021164733273851,
-    -0.026879998317550,
-    0.279955401870457,
-    -0.103839971084771,
-    -0.328455493859200,
-    0.011189808042490,
-    -0.010697763237566,
-    -0.422063747166805,
-    -0.013613117121179,
-    -0.151496264332360,
-    0.231554516643665,
-    0.477958063972758,
-    -0.090697548673346,
-    0.170776195842374,
-    0.071397304553159,
-    -0.493217680293358,
-    -0.064694038613479,
-    -0.134983413172105,
-    0.380442385450942,
-    -0.285899296890980,
-    -0.223662026808091,
-    0.174759869089229,
-    -0.041135981115246,
-    0.714222612551036,
-    -0.043112378635749,
-    -0.064574940821591,
-    -0.269079143551861,
-    -0.357556820778638,
-    0.143198884605952,
-    -0.552049398798320,
-    0.207365128186991,
-    -0.134241259269787,
-    -0.010149557638163,
-    0.192714863145066,
-    0.006526564247868,
-    0.138231288709452,
-    0.421883347004839,
-    -0.216229593189953,
-    0.065308726516039,
-    0.063440754227648,
-    0.431386237391369,
-    -0.330149262307368,
-    0.013316305533475,
-    -0.029834052765844,
-    -0.071614189891493,
-    0.233725750195152,
-    0.055407620494493,
-    0.088231748803261,
-    -0.440703956078252,
-    0.236933134194798,
-    -0.005922781045157,
-    -0.067960772404510,
-    -0.355393312842885,
-    -0.337907845493097,
-    -0.009836220395482,
-    -0.031971273353286,
-    0.499651281140934,
-    -0.308603949901645,
-    0.143632247309653,
-    0.114106462169639,
-    0.134502937948142,
-    0.360568418502888,
-    -0.018903872480004,
-    -0.000838570805223,
-    -0.363528266877418,
-    0.318623645604515,
-    0.046112878688268,
-    -0.084780869298826,
-    -0.204308412118793,
-    0.461438711613946,
-    -0.093930363484763,
-    -0.035792474213492,
-    -0.128635504436350,
-    0.154517082681159,
-    -0.029696063551274,
-    -0.100751761087790,
-    0.030671382680883,
-    0.086814453166358,
-    0.217518116479008,
-    -0.028544891129833,
-    0.180531731195647,
-    0.074562318272871,
-    -0.035590909737161,
-    0.079128899620863,
-    0.066349054804233,
-    0.273160612589357,
-    0.124113758530097,
-    -0.019443145679000,
-    -0.394312982983214,
-    -0.357849386053753,
-    0.022547803267632,
-    0.055776048688936,
-    -0.287081857236162,
-    0.024269359846468,
-    0.065288550279622,
-    0.005678328864666,
-    0.035152738840252,
-    0.002365085907931,
-    -0.531805602332479,
-    0.141666321602132,
-    -0.411653793802312,
-    -0.092690082285049,
-    -0.152353725643361,
-    0.158638293646640,
-    -0.172514893059147,
-    -0.069893135000790,
-    -0.062901291356963,
-    -0.045858232478067,
-    0.046590141061975,
-    0.160353877303613,
-    -0.080760053229545,
-    0.473891878885966,
-    0.082052642135816,
-    0.026275389770077,
-    0.053407507498773,
-    -0.084914298503258,
-    0.284437420716292,
-    -0.185982469478805,
-    0.017871232976672,
-    -0.110247813146965,
-    -0.144896186461150,
-    -0.097765276740596,
-    -0.453386727177370,
-    0.219928128419492,
-    -0.069784863405061,
-    0.303391600283891,
-    0.022466473683903,
-    -0.009737818663808,
-    0.031305182608280,
-    0.019575074632192,
-    -0.750579693464467,
-    -0.095880015089830,
-    0.180657509995859,
-    0.225214490597421,
-    0.192452562856250,
-    -0.104041054418559,
-    0.044253520893347,
-    0.040726014931001,
-    0.112668747846585,
-    -0.172870211288029,
-    -0.017875814445253,
-    0.066052616611871,
-    -0.285888997355898,
-    -0.210172826122795,
-    -0.024519147919956,
-    0.011997178597796,
-    0.221197068778389,
-    0.109475624520024,
-    -0.047957047247381,
-    0.168316632398563,
-    -0.201423886800258,
-    -0.081871237362825,
-    0.093643201424789,
-    -0.133016346521751,
-    -0.060659593855733,
-    0.121772809978689,
-    0.131493160498773,
-    0.022545081856492,
-    -0.070281905857622,
-    0.154167597771663,
-    -0.001294752039429,
-    0.226090142785132,
-    0.001922815997421,
-    0.132382628451463,
-    -0.104622300095460,
-    -0.049459858129127,
-    -0.016592686792461,
-    -0.011782326532184,
-    0.056132774035351,
-    -0.007120401782424,
-    -0.012807916521528,
-    -0.064711289785381,
-    0.060702227413004,
-    0.278064237815173,
-    -0.147562074452666,
-    -0.009057948417801,
-    0.016930606669918,
-    -0.084169555903769,
-    0.012373910295969,
-    0.152218235399003,
-    0.069017296821635,
-    -0.068194422026723,
-    -0.012330424489376,
-    -0.099612769698077,
-    0.111154266572358,
-    -0.424860331800059,
-    0.106347158448516,
-    0.033776319989799,
-    0.126567917344567,
-    0.107585454925270,
-    -0.146285811623795,
-    0.021613879462388,
-    -0.250341786904860,
-    0.005550201477785,
-    -0.078326840051914,
-    0.139045822934139,
-    0.099608710200774,
-    -0.021924047270009,
-    0.037432501610174,
-    -0.030544532966846,
-    -0.021652800308313,
-    -0.001598939689598,
-    0.057036242343784,
-    -0.102190293666397,
-    -0.038439261575707,
-    0.195834931494320,
-    0.209522047216059,
-    -0.052202243006830,
-    -0.002937738937351,
-    -0.010381324561583,
-    -0.100325014233629,
-    0.195049642985951,
-    -0.053861627088213,
-    -0.038631662903379,
-    0.021766243236804,
-    -0.359954297617860,
-    -0.030760528295694,
-    -0.140354895230447,
-    -0.321917443280086,
-    0.067102023080738,
-    -0.063708935742948,
-    0.092803851643078,
-    0.169585909571806,
-    0.293012214915663,
-    0.018466319597351,
-    -0.050716972650696,
-    -0.001140995389522,
-    -0.011076997975631,
-    -0.008577150276005,
-    0.149373392723470,
-    0.015075206564221,
-    0.014503111809714,
-    0.180820442724398,
-    -0.036043190709983,
-    0.031449349213272,
-    -0.003580345182041,
-    -0.207340455978921,
-    -0.054117032004833,
-    -0.147116828072495,
-    -0.024522121563478,
-    -0.095383239615591,
-    -0.002491565096173,
-    0.023225494711670,
-    -0.012221583907653,
-    0.007773875870909,
-    0.070648353213582,
-    -0.031873846283397,
-    0.040533482126646,
-    -0.064698588937415,
-    -0.009028349276539,
-    -0.125552839913314,
-    -0.005973445057433,
-    0.124275086732858,
-    -0.040135926349005,
-    0.198364079703022,
-    -0.165314715399988,
-    0.014148767042986,
-    0.226558194078430,
-    0.007506802566086,
-    -0.136408523015629,
-    0.078222445873142,
-    0.054557779261586,
-    0.007545041344897,
-    0.029552395939469,
-    0.050792909558563,
-    0.022314034476849,
-    -0.076217845519611,
-    -0.166214266214793,
-    -0.064195502294830,
-    0.029161740568063,
-    -0.014115779517813,
-    0.097421193428053,
-    -0.015407860665358,
-    -0.044545517590355,
-    -0.000680932770414,
-    0.031963369012840,
-    0.030214576789681,
-    -0.008860654360050,
-    0.003423280208186,
-    0.047836562258820,
-    -0.020188734764637,
-    0.008883459409184,
-    -0.002573190380315,
-    0.003679649368075,
-    0.006212231114724,
-    -0.004336525968068,
-    -0.004336525968068,
-    0.697559682191551,
-    0.697546564139267,
-    -0.004353229249659,
-    -0.004353229249659,
-    0.697535724255576,
-    0.697522505406409,
-    0.007935285530867,
-    -0.002191649632125,
-    0.003286902888188,
-    0.005291110265846,
-    -0.003885148253314,
-    -0.003885148253314,
-    0.696970499017338,
-    0.696959978602503,
-    -0.003899634839354,
-    -0.003899634839354,
-    0.696951968671083,
-    0.696941369936053,
-    -0.067681194316937,
-    0.002932385518412,
-    0.030972619478867,
-    0.033368300394388,
-    -0.013462626588665,
-    -0.014742097522851,
-    0.046353800796917,
-    -0.022295985507204,
-    0.009119965126315,
-    -0.003401262483044,
-    0.003777613243689,
-    0.008211374015756,
-    -0.012875564991075,
-    -0.012875564991075,
-    0.691923743581259,
-    0.691809026833095,
-    -0.012882086065280,
-    -0.012882086065280,
-    0.691893280372178,
-    0.691778452439726,
-    0.007019498210488,
-    -0.003114086085410,
-    0.002907571359838,
-    0.007518068861793,
-    -0.012928860728482,
-    -0.012928860728482,
-    0.691079162874322,
-    0.690963635576644,
-    -0.012925859324243,
-    -0.012925859324243,
-    0.691057721555129,
-    0.690942251477149,
-    0.225595076832071,
-    0.007513530642070,
-    -0.144384099426489,
-    0.064532933745147,
-    0.061368779439902,
-    -0.006634129904543,
-    0.037910922399613,
-    0.059846769866935,
-    0.022219175707658,
-    -0.076286156821457,
-    -0.175932534190022,
-    -0.052960810034593,
-    0.032802296010336,
-    0.012411584078117,
-    0.124975562444869,
-    -0.018154319163747,
-    -0.045326226945728,
-    -0.001639634067611,
-    0.037920556242392,
-    0.035221399303158,
-    -0.009015947106162,
-    0.008242997100736,
-    0.056752122995844,
-    -0.023534186611996,
-    0.016025621068923,
-    -0.003599308402562,
-    0.006638029592200,
-    0.008689499160628,
-    0.000185260186190,
-    0.000185260186190,
-    0.692347434242787,
-    0.692347410480498,
-    0.000110143206447,
-    0.000110143206447,
-    0.692280030586253,
-    0.692280022187839,
-    0.015070877258949,
-    -0.003049502558442,
-    0.006242561757517,
-    0.007362150435081,
-    0.000936060212183,
-    0.000936060212183,
-    0.691592258241395,
-    0.691591652261961,
-    0.000864418536052,
-    0.000864418536052,
-    0.691535222031993,
-    0.691534705303262,
-    -0.068228358390273,
-    0.002866225028442,
-    0.036633067288796,
-    0.040732635143972,
-    -0.013571464289837,
-    -0.014409486278807,
-    0.054825259608525,
-    -0.027216676669363,
-    0.016972935032472,
-    -0.005048634242221,
-    0.007030419883727,
-    0.012188481259031,
-    -0.007786174640692,
-    -0.007786174640692,
-    0.686267678997661,
-    0.686226073090887,
-    -0.007843974041373,
-    -0.007843974041373,
-    0.686180216293691,
-    0.686137995747314,
-    0.014832401508456,
-    -0.004674719079105,
-    0.006143781867366,
-    0.011285770201059,
-    -0.007496616082090,
-    -0.007496616082090,
-    0.685243393563961,
-    0.685204882315155,
-    -0.007534988789754,
-    -0.007534988789754,
-    0.685173869141335,
-    0.685134966566930,
-    -0.073770268306698,
-    -0.000737151147603,
-    -0.011497717182238,
-    -0.009523178634073,
-    0.150854510099050,
-    0.017116612768263,
-    0.005247819778469,
-    0.181960829814304,
-    -0.034564636345104,
-    0.038050658949927,
-    -0.005003236541746,
-    -0.151244022528333,
-    -0.094442862989646,
-    -0.151199211737708,
-    -0.022300965918806,
-    -0.083024237767170,
-    -0.003624100888556,
-    0.015005056319763,
-    -0.012685776019669,
-    0.008631305995055,
-    0.071348869561192,
-    -0.036190037061441,
-    0.014666673744593,
-    -0.065106625962696,
-    -0.008657990688203,
-    -0.151906745648021,
-    -0.008347395871595,
-    0.090652178460752,
-    -0.070043600927766,
-    0.203868536870528,
-    -0.150340900336414,
-    0.012315482298812,
-    0.227310046537393,
-    0.007504868651611,
-    -0.133889606331879,
-    0.114334586584660,
-    0.064505982971915,
-    -0.014311402801447,
-    0.006877484270349,
-    0.031493383802737,
-    0.022388085480650,
-    -0.076198210156433,
-    -0.163144957354981,
-    -0.093831970268194,
-    0.034479166233941,
-    0.026774751429621,
-    0.022672027228263,
-    -0.009553413532134,
-    -0.057351836091425,
-    -0.004226545027188,
-    0.040274487466801,
-    0.044756239979327,
-    -0.011407989490515,
-    0.021248276730430,
-    0.060275030031214,
-    -0.029905163467776,
-    0.013375061089770,
-    -0.010760169681617,
-    0.005540131700951,
-    0.025977347578794,
-    0.008005610907381,
-    0.008005610907381,
-    0.684793496095048,
-    0.684749606406247,
-    0.008211107736431,
-    0.008211107736431,
-    0.684623370362521,
-    0.684577209930752,
-    0.012009930588126,
-    -0.010307544968793,
-    0.004974676132761,
-    0.024884614858431,
-    0.008765727575623,
-    0.008765727575623,
-    0.683756812194508,
-    0.683704271683665,
-    0.008962538453296,
-    0.008962538453296,
-    0.683605073718411,
-    0.683550159502713,
-    -0.080627446758116,
-    -0.001940144862788,
-    0.039046836010695,
-    0.044539765228368,
-    -0.016037796310434,
-    0.009753766889137,
-    0.058437719787460,
-    -0.029760519663536,
-    0.016134479004602,
-    -0.010288847652467,
-    0.006683120025530,
-    0.024839475543777,
-    -0.002207991601472,
-    -0.002207991601472,
-    0.679130860665697,
-    0.679127549740578,
-    -0.002060176059910,
-    -0.002060176059910,
-    0.678956106252854,
-    0.678953224536092,
-    0.013048556582986,
-    -0.009891466559551,
-    0.005404889106065,
-    0.023880112719829,
-    -0.002049797385857,
-    -0.002049797385857,
-    0.677869839931114,
-    0.677866991740219,
-    -0.001884043428194,
-    -0.001884043428194,
-    0.677722567383657,
-    0.677720161722053,
-    0.224835140836595,
-    0.007511103254545,
-    -0.141939882891305,
-    0.099997877492565,
-    0.074829511331478,
-    -0.021722898623763,
-    0.014511374153532,
-    0.039282251414548,
-    0.022144328545002,
-    -0.076261511142314,
-    -0.172954247724599,
-    -0.082066137186031,
-    0.039997207104431,
-    0.040640684847702,
-    0.047837589588802,
-    -0.011916140691233,
-    -0.058925014985632,
-    -0.005176802721353,
-    0.041136332859674,
-    0.054850456713834,
-    -0.011720914228674,
-    0.026025544764005,
-    0.061564872812713,
-    -0.036649903456301,
-    0.020322811409142,
-    -0.013208522377715,
-    0.008417984111217,
-    0.031888193863188,
-    0.011768171628749,
-    0.011768171628749,
-    0.679890289818751,
-    0.679796125384469,
-    0.012018429312331,
-    0.012018429312331,
-    0.679607493983438,
-    0.679509322590133,
-    0.018978394256995,
-    -0.012991368850041,
-    0.007861108293311,
-    0.031363938871560,
-    0.012742858756590,
-    0.012742858756590,
-    0.678685871765503,
-    0.678575657499671,
-    0.013001245874702,
-    0.013001245874702,
-    0.678420914623045,
-    0.678306229817964,
-    -0.081610365568311,
-    -0.001814556811935,
-    0.039727280765849,
-    0.055188058450941,
-    -0.016233311017912,
-    0.009122393121346,
-    0.059456077329200,
-    -0.036875481725160,
-    0.023532124150237,
-    -0.012674571703609,
-    0.009747324974476,
-    0.030599122904122,
-    0.002097594753665,
-    0.002097594753665,
-    0.674026729483754,
-    0.674023763824495,
-    0.002256187198930,
-    0.002256187198930,
-    0.673732723518601,
-    0.673729293953836,
-    0.020364391074678,
-    -0.012538647922235,
-    0.008435206972601,
-    0.030270973867680,
-    0.002516146715331,
-    0.002516146715331,
-    0.672616564905121,
-    0.672612306560007,
-    0.002724085227785,
-    0.002724085227785,
-    0.672354644188803,
-    0.672349654868303,
-    0.360384785961203,
-    -0.002808302114684,
-    0.122701292921703,
-    -0.178907501062689,
-    -0.102449687356766,
-    -0.017468174284972,
-    -0.025082428855650,
-    0.074745337545578,
-    -0.034238148869800,
-    -0.036609584127662,
-    -0.106561775279511,
-    -0.066766679044463,
-    0.329382921125598,
-    -0.136714247951187,
-    -0.030138872169419,
-    -0.053351491631102,
-    0.269037163666671,
-    0.008682017935157,
-    0.075359918148549,
-    0.066474358482196,
-    -0.073465333389401,
-    -0.002574228631638,
-    -0.084801847266046,
-    0.116986319268173,
-    -0.407300792813012,
-    0.107966684906972,
-    0.022348218094616,
-    0.050410744815901,
-    0.050191645938541,
-    -0.172975925983485,
-    0.021887343023556,
-    -0.239635688274517,
-    0.008846949924368,
-    0.114397545500656,
-    0.128877198231763,
-    0.170334100950160,
-    -0.045412823112905,
-    0.039407569746095,
-    -0.065023751716372,
-    -0.028832458321632,
-    -0.007688433433831,
-    0.163029881472192,
-    -0.168279432314543,
-    0.042279533218275,
-    0.231977626108489,
-    0.194119317043926,
-    -0.173694600186488,
-    0.009257361970903,
-    0.033182569221878,
-    -0.070391941761932,
-    0.096564810988613,
-    -0.051877098530088,
-    -0.041617597308347,
-    0.004544149034907,
-    -0.306434500936642,
-    -0.032374474638049,
-    -0.134554007102389,
-    -0.326819819840369,
-    0.044398283970876,
-    -0.025374636555701,
-    0.043295611536315,
-    0.200527169493197,
-    0.296719469964260,
-    0.017676590318061,
-    -0.006770147092316,
-    -0.002864338641885,
-    -0.028722675411165,
-    -0.081665355745224,
-    0.184075967976993,
-    -0.005443499241962,
-    -0.003719018025716,
-    0.199532358683234,
-    -0.219619611009111,
-    0.053204067364561,
-    -0.003043608828233,
-    -0.183872177974615,
-    -0.065326294515169,
-    -0.151888736076480,
-    -0.027217315939475,
-    -0.101016201368403,
-    -0.000332595999121,
-    0.058304952491899,
-    -0.031690588764401,
-    0.074017163986625,
-    0.087061448941216,
-    0.011509312150580,
-    -0.010393959079394,
-    -0.071393819524243,
-    -0.055011848760069,
-    -0.212402543126106,
-    -0.005077954551130,
-    0.110208742223841,
-    -0.048449282013103,
-    0.204798252815913,
-    -0.183484240009112,
-    0.014984337987355,
-    0.174880678786532,
-    0.002264886974541,
-    -0.120011779629006,
-    0.084540724345342,
-    -0.000547863530879,
-    -0.005250884656614,
-    0.039219021892891,
-    0.078135700774370,
-    0.017224243473739,
-    -0.022995783361193,
-    -0.146234776590031,
-    -0.069380779431514,
-    -0.000292839158236,
-    0.009823714238008,
-    0.129287788567540,
-    -0.023702205701241,
-    -0.072403605357455,
-    -0.000600234703877,
-    0.001736530434957,
-    0.037444699052234,
-    -0.014401972548474,
-    0.003017583631344,
-    0.002598901456001,
-    -0.025019748010020,
-    0.000017915311275,
-    0.008787743485550,
-    0.000007420764904,
-    -0.021215489505470,
-    -0.015090838431272,
-    -0.015090838431272,
-    0.667289565052775,
-    0.667137583620704,
-    -0.014904437004359,
-    -0.014904437004359,
-    0.667199712514228,
-    0.667051482808081,
-    -0.002502023063455,
-    0.008401355001101,
-    -0.001036371886253,
-    -0.020282665185970,
-    -0.015688314577198,
-    -0.015688314577198,
-    0.666666071030239,
-    0.666501968836824,
-    -0.015520546408149,
-    -0.015520546408149,
-    0.666582760230689,
-    0.666422169524351,
-    -0.087423042348625,
-    0.001780847396990,
-    0.001770891817028,
-    0.042311201692356,
-    -0.017389524317097,
-    -0.008952924448339,
-    0.002650326898421,
-    -0.028271441115527,
-    0.004409555028021,
-    0.006451952714965,
-    0.001826497496637,
-    -0.015576391748259,
-    -0.019736029950961,
-    -0.019736029950961,
-    0.663065301689380,
-    0.662806980222085,
-    -0.019643643345183,
-    -0.019643643345183,
-    0.663013194335970,
-    0.662757306249062,
-    0.000763227388896,
-    0.005957902461461,
-    0.000316139135655,
-    -0.014383648925755,
-    -0.020696455908567,
-    -0.020696455908567,
-    0.662189656671817,
-    0.661905951402902,
-    -0.020611063345333,
-    -0.020611063345333,
-    0.662148244868592,
-    0.661866893970805,
-    0.176504117027605,
-    0.001755844625079,
-    -0.132860885522873,
-    0.066998901594173,
-    -0.002085271600125,
-    -0.016324593994266,
-    0.047814195821105,
-    0.089781864543725,
-    0.017384138184366,
-    -0.017827389652590,
-    -0.161891457422361,
-    -0.054984577547154,
-    -0.001114600891749,
-    0.030541167239158,
-    0.157622279737847,
-    -0.027235030857423,
-    -0.069622700015091,
-    -0.001403138656274,
-    -0.006005626739804,
-    0.041889308567079,
-    -0.013848816083366,
-    0.007054054379613,
-    -0.008988055587208,
-    -0.027989541141732,
-    0.007711877337005,
-    0.010720916099073,
-    0.003194364184345,
-    -0.025882581047446,
-    -0.008404212017505,
-    -0.008404212017505,
-    0.659858094738550,
-    0.659811486800834,
-    -0.008151288160909,
-    -0.008151288160909,
-    0.659715711183399,
-    0.659671875907080,
-    0.005402240911727,
-    0.010257357535371,
-    0.002237681452844,
-    -0.024763451676002,
-    -0.008830957868886,
-    -0.008830957868886,
-    0.659212219380152,
-    0.659160808171974,
-    -0.008588984425507,
-    -0.008588984425507,
-    0.659086762841306,
-    0.659038139786580,
-    -0.085042091875796,
-    0.002236277569489,
-    -0.005673881242286,
-    0.049625159890292,
-    -0.016915923821933,
-    -0.011242526540448,
-    -0.008491563363884,
-    -0.033158471742023,
-    0.012913883232447,
-    0.007460203886135,
-    0.005349105577782,
-    -0.018010525399976,
-    -0.012336655011263,
-    -0.012336655011263,
-    0.654987258281448,
-    0.654887566181601,
-    -0.012271371528493,
-    -0.012271371528493,
-    0.654892501536101,
-    0.654793876101263,
-    0.009488965595007,
-    0.006797589012647,
-    0.003930458242343,
-    -0.016410831585770,
-    -0.013048955978821,
-    -0.013048955978821,
-    0.654051867572358,
-    0.653940489242402,
-    -0.012974707388364,
-    -0.012974707388364,
-    0.653982389259388,
-    0.653872286612941,
-    -0.069596229838593,
-    -0.003616320830783,
-    -0.032334206378852,
-    -0.082239817335606,
-    0.195777230336447,
-    0.001870997538710,
-    -0.023737994169349,
-    0.212367656593367,
-    -0.252142649924875,
-    0.054126508135450,
-    -0.004875615752272,
-    -0.145993332024092,
-    -0.096031403217537,
-    -0.152088250363501,
-    -0.022349290519869,
-    -0.084733335796541,
-    -0.003419043527802,
-    0.073611901592578,
-    -0.035675299139340,
-    0.074537825622778,
-    0.092595733870701,
-    -0.003955891927013,
-    -0.066343249297802,
-    -0.075986362551265,
-    -0.063158445914263,
-    -0.216085133110767,
-    -0.008134473447821,
-    0.087505035686607,
-    -0.071221742655557,
-    0.205067266690472,
-    -0.150666678334489,
-    0.012569003042798,
-    0.161717990635393,
-    0.002335257928131,
-    -0.116485879700673,
-    0.122871913948542,
-    -0.010146837703779,
-    -0.020786385942303,
-    0.016496130348059,
-    0.062283542353865,
-    0.015927831845781,
-    -0.023710271643333,
-    -0.141938455096486,
-    -0.100838373766093,
-    -0.005423597747355,
-    0.038888592854718,
-    0.054380453914610,
-    -0.018893506016363,
-    -0.099751258156897,
-    -0.004412535290676,
-    0.005784544654962,
-    0.048712522983336,
-    -0.019841758909088,
-    0.022183312927212,
-    0.008657182865012,
-    -0.032548667256618,
-    0.002858996289633,
-    -0.000163348255892,
-    0.001184235037940,
-    0.000394357574764,
-    -0.009087570431087,
-    -0.009087570431087,
-    0.652896228830548,
-    0.652842307863355,
-    -0.009090891204473,
-    -0.009090891204473,
-    0.652894655717211,
-    0.652840695463682,
-    -0.001707811966768,
-    -0.000800479792949,
-    -0.000707398878618,
-    0.001932529172543,
-    -0.010390748640353,
-    -0.010390748640353,
-    0.651725605366625,
-    0.651655236280809,
-    -0.010390409865918,
-    -0.010390409865918,
-    0.651724333432397,
-    0.651653969072632,
-    -0.112445864290046,
-    -0.003563623191470,
-    0.006288361446195,
-    0.048293802537944,
-    -0.022366873067985,
-    0.017915543605535,
-    0.009411197978099,
-    -0.032268887199747,
-    0.011074073741616,
-    -0.000687602281741,
-    0.004587031534497,
-    0.001660018754098,
-    -0.015688206566530,
-    -0.015688206566530,
-    0.649129493448872,
-    0.648969710146025,
-    -0.015737841385270,
-    -0.015737841385270,
-    0.649106158708001,
-    0.648945368406137,
-    0.005116554765315,
-    -0.001309679184653,
-    0.002119346376418,
-    0.003161845249948,
-    -0.017486682588574,
-    -0.017486682588574,
-    0.647756548553587,
-    0.647558444627983,
-    -0.017493381378667,
-    -0.017493381378667,
-    0.647749760927945,
-    0.647551507248370,
-    0.161998691221943,
-    0.001841728306173,
-    -0.131136444225281,
-    0.105012361547569,
-    -0.018549156289920,
-    -0.027676136585166,
-    0.024151554569009,
-    0.069954152286190,
-    0.015955478440473,
-    -0.018699381300253,
-    -0.159790219621575,
-    -0.086181417896921,
-    -0.009914730599454,
-    0.051778409697555,
-    0.079617005473089,
-    -0.021220360100579,
-    -0.098607738895183,
-    -0.005653909063148,
-    -0.007070644263576,
-    0.058724140789020,
-    -0.019614298785596,
-    0.028424120318055,
-    -0.010581966950626,
-    -0.039238216405388,
-    0.011699296831903,
-    0.001928272330744,
-    0.004846007418003,
-    -0.004655261212830,
-    -0.003528367934446,
-    -0.003528367934446,
-    0.645162006304490,
-    0.645153974387334,
-    -0.003576089430157,
-    -0.003576089430157,
-    0.645132155007379,
-    0.645123904736501,
-    0.007394766797485,
-    0.001002448926956,
-    0.003063012698105,
-    -0.002420125795044,
-    -0.004573974197965,
-    -0.004573974197965,
-    0.643853376999419,
-    0.643839906647507,
-    -0.004594198277298,
-    -0.004594198277298,
-    0.643842019886576,
-    0.643828430389962,
-    -0.111455097990428,
-    -0.003212455485433,
-    -0.006234504516927,
-    0.059381004902021,
-    -0.022169797397808,
-    0.016150104328612,
-    -0.009330595387396,
-    -0.039677118973711,
-    0.020587769339744,
-    0.001138022839834,
-    0.008527733279531,
-    -0.002747430174217,
-    -0.009750971309122,
-    -0.009750971309122,
-    0.641059830003296,
-    0.640998874212570,
-    -0.009923421885041,
-    -0.009923421885041,
-    0.640979901510325,
-    0.640916778353829,
-    0.014710982735782,
-    0.000183710930647,
-    0.006093488564998,
-    -0.000443517420325,
-    -0.011211563471251,
-    -0.011211563471251,
-    0.639568088404440,
-    0.639487690182550,
-    -0.011301111864867,
-    -0.011301111864867,
-    0.639528152901111,
-    0.639446470263932,
-    0.152733145903905,
-    0.006111792210326,
-    0.208895399137746,
-    0.426084911852540,
-    -0.263897673361212,
-    0.172981962437625,
-    0.065259588274008,
-    0.535045238548871,
-    -0.536214183024958,
-    0.031999918396582,
-    -0.069009795643649,
-    -0.120156920583930,
-    0.262397849091439,
-    0.080707185323143,
-    0.143398265686761,
-    -0.780380856130122,
-    0.145350219697532,
-    -0.008975671395962,
-    0.049077130742947,
-    -0.351460374101496,
-    -0.226714452267266,
-    -0.194215031219389,
-    -0.044683267479052,
-    0.830079971179821,
-    0.134516985351396,
-    0.144931019049840,
-    0.129559682952421,
-    0.134100551594500,
-    0.358428699155035,
-    -0.027347382472857,
-    0.010135751314644,
-    -0.530154074075686,
-    0.439870726906903,
-    0.055906367723376,
-    0.034469382276371,
-    -0.302006679070850,
-    0.562699845929934,
-    -0.049459953024828,
-    -0.006323686434723,
-    -0.397475711143587,
-    0.449084751749885,
-    -0.043360920775310,
-    -0.110645923489423,
-    0.043889588299688,
-    0.079849838556239,
-    0.208198274138770,
-    -0.037388429498738,
-    0.430223064006775,
-    0.055566414788912,
-    -0.055778072382639,
-    0.078996496354045,
-    0.152660025503964,
-    0.149767714519889,
-    0.200061879382417,
-    -0.027511169509357,
-    -0.429027253406468,
-    -0.599149429799785,
-    0.016041491171247,
-    0.033517930977254,
-    0.031234931568656,
-    0.044584832380353,
-    0.074587053532424,
-    -0.010794025725182,
-    -0.136007923433160,
-    0.001874411787218,
-    -0.498008632766477,
-    0.214086427694789,
-    -0.415753481836319,
-    -0.113123725100827,
-    -0.403536370288891,
-    0.163186422575018,
-    -0.213968977471860,
-    -0.113517413371077,
-    -0.151155753027933,
-    -0.106075673886098,
-    0.078170651487644,
-    0.180025146834734,
-    -0.117635742602439,
-    0.770190713399717,
-    0.145295521482265,
-    0.016119035814463,
-    0.080936342865208,
-    0.061319934752736,
-    0.281289711091461,
-    -0.124782286832290,
-    0.352865422991909,
-    -0.154083087945572,
-    -0.240718730885855,
-    0.042614782809427,
-    -0.457486404510721,
-    0.249712575857340,
-    -0.069576091186749,
-    0.301591185040096,
-    0.032501237473961,
-    0.117700387025960,
-    0.045654139200844,
-    0.027024053068574,
-    -0.909988392444466,
-    0.038981965154742,
-    0.267046148894423,
-    0.274637034064845,
-    0.101337782216951,
-    -0.018381601689692,
-    0.136740628217417,
-    0.118365115284956,
-    0.164514082507733,
-    -0.189846648487951,
-    -0.025579614218461,
-    0.060753602428022,
-    -0.273639717041710,
-    -0.275286805484780,
-    -0.058431295568351,
-    0.008940711846192,
-    0.346660037753022,
-    0.109292443275335,
-    -0.110342552391762,
-    0.092284158799691,
-    -0.324679889022931,
-    -0.115844088514040,
-    0.101887300802308,
-    -0.222710087759062,
-    -0.043155882093625,
-    0.073177873580378,
-    -0.014306650756223,
-    0.041417190314532,
-    -0.080291571065861,
-    -0.293059640608644,
-    0.005009468452623,
-    0.195317758359344,
-    0.006281022920485,
-    0.129926360002425,
-    -0.158098119714640,
-    -0.035436518525463,
-    -0.073719750644252,
-    -0.032108918788102,
-    0.105136996522783,
-    -0.050868822937540,
-    0.007926766009705,
-    0.005229924737533,
-    -0.057743435278727,
-    0.071608356561616,
-    -0.129276663601260,
-    -0.000113758832360,
-    0.014336405840612,
-    -0.080680128469685,
-    0.019526149273524,
-    0.171033458437508,
-    0.018650432580641,
-    -0.485774526738077,
-    -0.012049637067059,
-    -0.102490295494022,
-    0.058709114849895,
-    -0.419221941917992,
-    0.092891204991665,
-    0.009746469700754,
-    0.007636546129074,
-    0.038746342841174,
-    -0.261567147590883,
-    0.024650628427152,
-    -0.091144720162407,
-    0.004794781841126,
-    -0.255860507877616,
-    0.136465923502932,
-    0.150521922912935,
-    -0.015707928340766,
-    0.166309092626664,
-    -0.083239241908124,
-    -0.040555814848736,
-    -0.011422976180748,
-    -0.035299492026831,
-    0.008258953678008,
-    0.036565627120355,
-    0.050432294752647,
-    0.183558758681495,
-    -0.000655608305228,
-    -0.002487602392563,
-    -0.009950944736736,
-    -0.158313835880355,
-    0.219159123211770,
-    -0.014554940441791,
-    -0.275187870301765,
-    0.021270584118397,
-    -0.370352339755392,
-    -0.016247000175920,
-    -0.138492222813343,
-    -0.281185690810909,
-    0.019362909725311,
-    -0.003843914293942,
-    0.033422825188050,
-    0.303229015486335,
-    0.334180416203027,
-    0.006723238469053,
-    -0.042995034657730,
-    0.001575152567689,
-    -0.029879434552704,
-    -0.070353215949356,
-    0.168266445509144,
-    0.059771879491338,
-    -0.035913768971583,
-    0.154360254659825,
-    -0.002224500021892,
-    0.024036593486482,
-    -0.108212821886335,
-    -0.291304650643849,
-    -0.074132729585672,
-    -0.142103861109379,
-    -0.028266319975091,
-    -0.232328494299214,
-    -0.002112210608463,
-    -0.032062967096018,
-    -0.032966875799964,
-    0.063764438107091,
-    0.079584101690261,
-    -0.126377021161238,
-    -0.100372260230053,
-    -0.055230982260852,
-    -0.000557208248429,
-    -0.095959460197548,
-    -0.180542186069112,
-    0.174601288270194,
-    -0.054980579393850,
-    0.191604876209794,
-    -0.190556050788310,
-    0.034462676635171,
-    0.225432156774569,
-    0.009661391567077,
-    -0.081217472533501,
-    0.110753822150016,
-    0.052433875615097,
-    0.029061965816747,
-    0.045104018984819,
-    0.055618728057375,
-    0.022203129482560,
-    -0.098093754761938,
-    -0.098963776621416,
-    -0.090893312841728,
-    0.028026490417328,
-    -0.054371113831055,
-    0.148688024040516,
-    -0.016871756702663,
-    -0.027066000414423,
-    0.006751867789457,
-    0.034230685964680,
-    -0.002793466665816,
-    -0.005383762217932,
-    -0.033943931583550,
-    0.051229841874733,
-    0.001866534751838,
-    0.010628181293163,
-    -0.007539661220809,
-    0.004402336834988,
-    0.018202352374976,
-    -0.011463753336174,
-    -0.011463753336174,
-    0.640387677987705,
-    0.640303514219359,
-    -0.011373302645621,
-    -0.011373302645621,
-    0.640303676260634,
-    0.640220846333679,
-    0.010829861343555,
-    -0.006814315745725,
-    0.004485875447120,
-    0.016451213491621,
-    -0.011122555442216,
-    -0.011122555442216,
-    0.639917808292306,
-    0.639838638369615,
-    -0.011059034280531,
-    -0.011059034280531,
-    0.639844643518767,
-    0.639766384300182,
-    -0.048078399586259,
-    0.006341107816176,
-    0.034304572338997,
-    0.005959671635789,
-    -0.009563388281528,
-    -0.031878901748092,
-    0.051340420648318,
-    -0.003982125276048,
-    0.005227095771181,
-    -0.009495136818525,
-    0.002165133960246,
-    0.022923288083872,
-    -0.017095733421590,
-    -0.017095733421590,
-    0.635135046988192,
-    0.634949392680519,
-    -0.016889443383647,
-    -0.016889443383647,
-    0.635029962284222,
-    0.634848792049882,
-    0.004604025872817,
-    -0.008774466541361,
-    0.001907049958037,
-    0.021183436126743,
-    -0.017008956425410,
-    -0.017008956425410,
-    0.634544392229600,
-    0.634360789056396,
-    -0.016831915846452,
-    -0.016831915846452,
-    0.634455135410084,
-    0.634275360304238,
-    0.225043281673137,
-    0.009317915788252,
-    -0.086056126331502,
-    0.104759714272286,
-    0.056751423209135,
-    0.010891719198681,
-    0.052161872967280,
-    0.046588421059791,
-    0.022164828628089,
-    -0.094606386655514,
-    -0.104859693333380,
-    -0.085974075636536,
-    0.030334267686339,
-    -0.020376973398892,
-    0.171954650523884,
-    -0.014132443022990,
-    -0.024946384563421,
-    0.007339918284632,
-    0.056566398607693,
-    -0.010444678299115,
-    -0.004962144411074,
-    -0.036900261061308,
-    0.084657598129507,
-    0.006978910919408,
-    0.019676385161013,
-    -0.006913034249773,
-    0.008150225592168,
-    0.016689541042952,
-    -0.001994124732408,
-    -0.001994124732408,
-    0.631828079430747,
-    0.631825566940260,
-    -0.002039133527133,
-    -0.002039133527133,
-    0.631704930730227,
-    0.631702304054261,
-    0.020031615360165,
-    -0.004949776871403,
-    0.008297366758421,
-    0.011949818453662,
-    -0.000457847210103,
-    -0.000457847210103,
-    0.630817974611898,
-    0.630817842377254,
-    -0.000564942010794,
-    -0.000564942010794,
-    0.630717475049117,
-    0.630717273749626,
-    -0.046206103313486,
-    0.007343398597558,
-    0.055572297324151,
-    0.002213493319700,
-    -0.009190965397474,
-    -0.036917757775926,
-    0.083169820419884,
-    -0.001479008951400,
-    0.014392482436596,
-    -0.009810218400633,
-    0.005961561421454,
-    0.023683962312651,
-    -0.007101940716039,
-    -0.007101940716039,
-    0.626445704401387,
-    0.626414107210510,
-    -0.006955346061730,
-    -0.006955346061730,
-    0.626304108978441,
-    0.626273809632586,
-    0.014021127509612,
-    -0.007888495295236,
-    0.005807741174244,
-    0.019044512328476,
-    -0.005927679189913,
-    -0.005927679189913,
-    0.625349701596978,
-    0.625327728060466,
-    -0.005858859955745,
-    -0.005858859955745,
-    0.625246999014924,
-    0.625225536268014,
-    -0.028616983836784,
-    0.001264441979681,
-    -0.019098822448236,
-    -0.072110759399190,
-    0.167650226916562,
-    0.058810197043174,
-    -0.028566988685263,
-    0.154263452313249,
-    0.007060324131884,
-    0.033602537913901,
-    -0.195400020017485,
-    -0.230611324069538,
-    -0.123572788799422,
-    -0.141992357761625,
-    -0.015929912745126,
-    -0.179963016422090,
-    -0.001405862265805,
-    -0.025738307781067,
-    -0.021072303308350,
-    0.065357382637277,
-    0.079292652001721,
-    -0.124343714460223,
-    -0.079839384849165,
-    -0.055196345827411,
-    0.001768519129761,
-    -0.134148851054912,
-    -0.326005238168173,
-    0.138223108293128,
-    -0.091647826317450,
-    0.191454531349516,
-    -0.107390748593682,
-    0.026694991761351,
-    0.220147807423971,
-    0.010049936445892,
-    -0.081042747917841,
-    0.122724082974420,
-    0.061032136647259,
-    0.035210007049661,
-    0.024184331285874,
-    0.068195932880667,
-    0.021682666499190,
-    -0.102038717119786,
-    -0.098750874061227,
-    -0.100717052021003,
-    0.032622356688831,
-    -0.065873289968093,
-    0.079725055828132,
-    -0.020687010074859,
-    -0.044575873349413,
-    0.005668817218056,
-    0.059704414689123,
-    -0.005053187276267,
-    -0.008866692495947,
-    -0.028499068673976,
-    0.089353971080312,
-    0.003376431791407,
-    0.000103406854596,
-    -0.010844095262961,
-    0.000042832521616,
-    0.026179961855506,
-    0.008474926496705,
-    0.008474926496705,
-    0.625228030908676,
-    0.625183122680734,
-    0.008758891932226,
-    0.008758891932226,
-    0.625104008782083,
-    0.625056050095571,
-    -0.000461579631950,
-    -0.008629986573129,
-    -0.000191192543669,
-    0.020834630627946,
-    0.010071880547644,
-    0.010071880547644,
-    0.624077012914115,
-    0.624013701596984,
-    0.010251603489819,
-    0.010251603489819,
-    0.623998753763241,
-    0.623933170934362,
-    -0.063937565634622,
-    0.004784337003789,
-    0.059922422662880,
-    -0.004274295594299,
-    -0.012717972544875,
-    -0.024052486362789,
-    0.089680243070143,
-    0.002855993008263,
-    -0.003667150126441,
-    -0.011012093717644,
-    -0.001518983317630,
-    0.026585546003261,
-    0.001544109139312,
-    0.001544109139312,
-    0.620415699468616,
-    0.620414220226430,
-    0.001831420917933,
-    0.001831420917933,
-    0.620285082174515,
-    0.620283001671233,
-    -0.005356525693489,
-    -0.008779677117580,
-    -0.002218745589443,
-    0.021196015570519,
-    0.002814630699291,
-    0.002814630699291,
-    0.619110311034297,
-    0.619105406332611,
-    0.002988885962084,
-    0.002988885962084,
-    0.619023937934465,
-    0.619018407896993,
-    0.220073523396322,
-    0.009627492029656,
-    -0.085998120799729,
-    0.115179221755854,
-    0.069477298963121,
-    0.054125173412641,
-    0.029155165059107,
-    0.057809198871403,
-    0.021675350161060,
-    -0.097749566982442,
-    -0.104789013388410,
-    -0.094525144439181,
-    0.037136389991571,
-    -0.101261077220332,
-    0.096111698708552,
-    -0.017536228759637,
-    -0.042207111158873,
-    0.006375521446277,
-    0.087729847897091,
-    0.001665798174449,
-    -0.008395516400868,
-    -0.032051910749765,
-    0.131296995920553,
-    -0.001113050755252,
-    0.008870215932134,
-    -0.006648562839217,
-    0.003674163740268,
-    0.016051050576728,
-    0.019099466679020,
-    0.019099466679020,
-    0.616699631441771,
-    0.616474624765446,
-    0.019173552776947,
-    0.019173552776947,
-    0.616639753665672,
-    0.616413019714266,
-    0.008507579605169,
-    -0.001818305210759,
-    0.003523954855430,
-    0.004389777100347,
-    0.023091995789496,
-    0.023091995789496,
-    0.614561082681857,
-    0.614233286544113,
-    0.023070019676296,
-    0.023070019676296,
-    0.614544273362781,
-    0.614217109954837,
-    -0.061983842249645,
-    0.005995082640894,
-    0.089637103069530,
-    0.004360805996350,
-    -0.012329352801164,
-    -0.030139315719126,
-    0.134151405002499,
-    -0.002913797410871,
-    0.005045126520034,
-    -0.006208543339298,
-    0.002089759828486,
-    0.014988749532315,
-    0.013206079203552,
-    0.013206079203552,
-    0.611606939642953,
-    0.611500265766992,
-    0.013288577527910,
-    0.013288577527910,
-    0.611562799873980,
-    0.611454796729608,
-    0.003632896530883,
-    -0.001167475825679,
-    0.001504795013790,
-    0.002818535972098,
-    0.017039757449475,
-    0.017039757449475,
-    0.609229762129685,
-    0.609052844549082,
-    0.017037582494133,
-    0.017037582494133,
-    0.609225966948903,
-    0.609049095637332,
-    0.317220736207657,
-    0.002198717881020,
-    0.171959798667373,
-    -0.280089028838002,
-    -0.185122384476336,
-    -0.074624179102445,
-    -0.047428817662249,
-    0.085172508912563,
-    -0.058146780644610,
-    -0.016171203760358,
-    0.033993280374012,
-    -0.532838289802601,
-    0.168140891674814,
-    -0.112943738604258,
-    -0.021028462446588,
-    -0.141740971888268,
-    0.599880595565338,
-    0.008988707149493,
-    0.026483767067504,
-    -0.057727310763746,
-    -0.545913244921364,
-    -0.000492357145972,
-    -0.089055596489594,
-    -0.003167957055439,
-    -0.368784577014470,
-    0.090341533920818,
-    0.037923604833774,
-    -0.082320602318261,
-    -0.156962245575298,
-    -0.260107184284849,
-    0.024923627871749,
-    -0.055823717923550,
-    0.007787331978277,
-    -0.089565836781555,
-    0.180615024773135,
-    0.266666923576376,
-    -0.082059109377143,
-    0.168349450535004,
-    -0.122954586320955,
-    -0.032854662163682,
-    -0.013057296236363,
-    0.072013640557085,
-    0.053681255861620,
-    0.337416125769496,
-    0.118418176538106,
-    0.160367787050801,
-    -0.121190015228996,
-    0.024594391698552,
-    0.073988214549685,
-    -0.072878512220070,
-    0.033935811290279,
-    0.045050835491251,
-    -0.309256033345769,
-    0.000869131910895,
-    -0.321805575535264,
-    0.000876691787444,
-    -0.121829968098386,
-    -0.273467726322657,
-    0.075341262980372,
-    0.041436709029012,
-    -0.135396564173591,
-    0.301536512280132,
-    0.337881379376777,
-    0.004117804818100,
-    0.044220751021006,
-    0.000966718260419,
-    -0.080713373750915,
-    -0.372716266902228,
-    0.211688044486560,
-    -0.009902591523200,
-    -0.046558788687474,
-    0.133222586126245,
-    -0.316736359410732,
-    0.047728579400682,
-    -0.119563022689625,
-    -0.312978214775585,
-    -0.099609005482818,
-    -0.147723567016077,
-    -0.044635304967191,
-    -0.255760226516641,
-    0.002172426192102,
-    -0.019678002252439,
-    -0.089053484701964,
-    0.337810333354219,
-    0.100120988519457,
-    0.020937270655173,
-    -0.130123097295437,
-    -0.047667803524287,
-    -0.079338327850855,
-    -0.190543169848962,
-    -0.199478852072533,
-    0.187591922681433,
-    -0.073875073329946,
-    0.199182172464675,
-    -0.300906784037504,
-    0.037938445773377,
-    0.197268497762610,
-    -0.004402618342556,
-    -0.005137586963980,
-    0.089292228896762,
-    -0.035892434614791,
-    0.014238646220101,
-    0.050764935308174,
-    0.088364248701006,
-    0.019429251182799,
-    0.044700534183578,
-    -0.006260167828625,
-    -0.073280238441390,
-    -0.019184905997992,
-    -0.026638633439832,
-    0.167349564216384,
-    -0.026805001792905,
-    -0.002071493396854,
-    0.012902282018672,
-    -0.022330468074126,
-    0.004640816863136,
-    -0.000412045655579,
-    -0.064864151931014,
-    -0.033419907202754,
-    -0.003100894690443,
-    -0.017785949959198,
-    0.014289851952468,
-    -0.007367181692789,
-    -0.034498754387953,
-    -0.031564239067323,
-    -0.031564239067323,
-    0.593998474213891,
-    0.593406377728128,
-    -0.031202683190837,
-    -0.031202683190837,
-    0.593729528338780,
-    0.593151187177830,
-    -0.015763802172330,
-    0.014592829110483,
-    -0.006529580654346,
-    -0.035230205951921,
-    -0.032072189174163,
-    -0.032072189174163,
-    0.593558633416121,
-    0.592947769641098,
-    -0.031661488491770,
-    -0.031661488491770,
-    0.593291768761605,
-    0.592696725114570,
-    -0.020735485632530,
-    0.011603512240632,
-    -0.022537060695934,
-    0.013992356392776,
-    -0.004124544535933,
-    -0.058334795334695,
-    -0.033729094911076,
-    -0.009349393635806,
-    -0.024093710217449,
-    0.010769981469508,
-    -0.009979941539955,
-    -0.026001035330192,
-    -0.032645901218647,
-    -0.032645901218647,
-    0.590373492902389,
-    0.589743963838565,
-    -0.032606379534746,
-    -0.032606379534746,
-    0.590155409901995,
-    0.589527636947811,
-    -0.022664096207819,
-    0.011030700365982,
-    -0.009387776028207,
-    -0.026630466426028,
-    -0.033030086678455,
-    -0.033030086678455,
-    0.589941241450135,
-    0.589297271972721,
-    -0.032949217792725,
-    -0.032949217792725,
-    0.589728330144163,
-    0.589087743104516,
-    0.196515999655002,
-    -0.017790655941486,
-    -0.022846511056560,
-    0.088934083731090,
-    -0.068138525161425,
-    -0.006328395302144,
-    0.057484860048113,
-    0.101586862950972,
-    0.019355136588157,
-    0.180631561081235,
-    -0.027838554269803,
-    -0.072986316299886,
-    -0.036420800486045,
-    0.011839594868097,
-    0.189502187281278,
-    -0.030816037974251,
-    0.064563653320139,
-    0.013683139739920,
-    -0.015190816078718,
-    -0.014793715007573,
-    0.012842509128588,
-    -0.068789788790775,
-    -0.022734662883001,
-    0.009884844343527,
-    -0.037926902065675,
-    0.019815373262279,
-    -0.015709837214399,
-    -0.047838542873280,
-    -0.021909038712219,
-    -0.021909038712219,
-    0.576757451724203,
-    0.576480538223901,
-    -0.021556488487804,
-    -0.021556488487804,
-    0.576123061553476,
-    0.575855285194195,
-    -0.037655463405696,
-    0.019897675066241,
-    -0.015597403640083,
-    -0.048037237004612,
-    -0.023367037133482,
-    -0.023367037133482,
-    0.576031475012943,
-    0.575716865299741,
-    -0.022998126232956,
-    -0.022998126232956,
-    0.575397614088801,
-    0.575093197818052,
-    0.061499346656945,
-    0.012515269967643,
-    -0.016802570267838,
-    -0.002875428219701,
-    0.012232980635835,
-    -0.062918510962950,
-    -0.025146823490438,
-    0.001921299711274,
-    -0.051348368663435,
-    0.015457978453708,
-    -0.021269190706128,
-    -0.037318861229813,
-    -0.024252770484104,
-    -0.024252770484104,
-    0.571548033300322,
-    0.571211751603538,
-    -0.024768633141598,
-    -0.024768633141598,
-    0.570880261765894,
-    0.570529927685980,
-    -0.051263497058087,
-    0.015630503243679,
-    -0.021234035736133,
-    -0.037735372917606,
-    -0.025521033710644,
-    -0.025521033710644,
-    0.570926011504706,
-    0.570554032991232,
-    -0.026020264371448,
-    -0.026020264371448,
-    0.570255323131967,
-    0.569869098602588,
-    -0.004725128251867,
-    -0.001431980691213,
-    -0.083151154920752,
-    -0.370178004339069,
-    0.212501482941273,
-    -0.114580577220993,
-    -0.047216358185278,
-    0.130606764545908,
-    -0.495306182363920,
-    0.047317094475713,
-    -0.232311895538794,
-    -0.268121392242133,
-    -0.129867588114683,
-    -0.148112058015611,
-    -0.035905084799577,
-    -0.200148770908283,
-    -0.000232130665771,
-    0.029148636599598,
-    -0.091743161740924,
-    0.335509786265873,
-    0.100505716255892,
-    0.242260276159174,
-    -0.131960880926699,
-    -0.046731847596905,
-    -0.124067739984299,
-    -0.188900429944837,
-    -0.387588981964522,
-    0.160705777936618,
-    -0.096316367668287,
-    0.199705991939342,
-    -0.242052420288736,
-    0.029689265587267,
-    0.223322529484725,
-    -0.003301845685075,
-    0.062631270574786,
-    0.097850219226000,
-    -0.093501293873066,
-    0.034128180632928,
-    0.034882361641484,
-    0.111903497320353,
-    0.021995349330222,
-    0.033524201834158,
-    0.076316424007431,
-    -0.080303599596713,
-    -0.049977482800961,
-    -0.063849335097987,
-    0.114991735616390,
-    -0.033945554796192,
-    -0.027931557358740,
-    0.020475276560455,
-    -0.007218759415632,
-    -0.006429554740902,
-    -0.005555932198828,
-    -0.102936166464572,
-    -0.010803636940730,
-    0.004296091129204,
-    -0.012606666274212,
-    0.015744669324150,
-    -0.005221852147090,
-    -0.038010994217442,
-    -0.020892670015875,
-    -0.020892670015875,
-    0.572344205545594,
-    0.572094320655126,
-    -0.020359982331365,
-    -0.020359982331365,
-    0.572068922024889,
-    0.571831733764169,
-    -0.007865522215766,
-    0.015765498997906,
-    -0.003258005976917,
-    -0.038061281498324,
-    -0.022972591924988,
-    -0.022972591924988,
-    0.571496322530405,
-    0.571194641447124,
-    -0.022398245679942,
-    -0.022398245679942,
-    0.571235878365184,
-    0.570949228022927,
-    -0.052669635788994,
-    0.019861673597310,
-    -0.008898625292721,
-    -0.006106923445712,
-    -0.010476641943813,
-    -0.099851376055472,
-    -0.013317733892887,
-    0.004080515789833,
-    -0.018176684504051,
-    0.014612883532670,
-    -0.007529029240555,
-    -0.035278621609951,
-    -0.023689096588443,
-    -0.023689096588443,
-    0.568025291735692,
-    0.567706441619647,
-    -0.023310495898799,
-    -0.023310495898799,
-    0.567758104066269,
-    0.567449512247091,
-    -0.014698988500423,
-    0.014651599167091,
-    -0.006088520390042,
-    -0.035372089419645,
-    -0.026008736276812,
-    -0.026008736276812,
-    0.567083012804798,
-    0.566699277193021,
-    -0.025580175866194,
-    -0.025580175866194,
-    0.566832932080260,
-    0.566461906130787,
-    0.223714543877124,
-    -0.016461160813240,
-    0.068181086959580,
-    0.098005769856236,
-    -0.206130185043541,
-    0.063399254561240,
-    0.040208705476094,
-    0.121304125045471,
-    0.022033959377866,
-    0.167132970514654,
-    0.083078894838669,
-    -0.080431256699848,
-    -0.110178879361370,
-    -0.118611662689618,
-    0.132550338108001,
-    -0.036797204040434,
-    0.039330035777010,
-    0.024821450461430,
-    -0.004113354929342,
-    -0.009680918712311,
-    0.007823230525532,
-    -0.124785858156593,
-    -0.006156070691142,
-    0.006468583078999,
-    -0.025989592106979,
-    0.036113503426012,
-    -0.010765241531255,
-    -0.087185709755885,
-    -0.005797973124321,
-    -0.005797973124321,
-    0.551136161685998,
-    0.551117634110013,
-    -0.002915296425625,
-    -0.002915296425625,
-    0.549789273091053,
-    0.549784600437868,
-    -0.019198221957439,
-    0.036098189449632,
-    -0.007952163908220,
-    -0.087148738546415,
-    -0.008995714228995,
-    -0.008995714228995,
-    0.549877020343233,
-    0.549832520913548,
-    -0.005988765372315,
-    -0.005988765372315,
-    0.548578120687291,
-    0.548558445409722,
-    0.027944175276912,
-    0.024381133798810,
-    -0.014644785482568,
-    -0.008361718427236,
-    0.005558442058803,
-    -0.122572236809562,
-    -0.021917470346212,
-    0.005587121629375,
-    -0.038183972418433,
-    0.039730788557074,
-    -0.015816319240995,
-    -0.095918608578266,
-    -0.005993636003741,
-    -0.005993636003741,
-    0.543833404285945,
-    0.543813867441886,
-    -0.002766602176365,
-    -0.002766602176365,
-    0.542122536100790,
-    0.542118386631527,
-    -0.031297206908573,
-    0.039843207009683,
-    -0.012963727565928,
-    -0.096190010731215,
-    -0.008889032589569,
-    -0.008889032589569,
-    0.542633046932057,
-    0.542590169141852,
-    -0.005441912774542,
-    -0.005441912774542,
-    0.540987810456249,
-    0.540971789181678,
-    0.353215959165832,
-    0.000739895759321,
-    0.228825169916149,
-    0.379039335067452,
-    -0.530905924916028,
-    0.239161146482639,
-    -0.044607633715362,
-    0.207773084850871,
-    -0.426216015697298,
-    0.027408610611655,
-    -0.138801491525722,
-    -0.184685230751526,
-    0.290521434715678,
-    0.370665390654002,
-    -0.030200478277865,
-    -0.039777903268314,
-    -0.309982978682540,
-    -0.014397704721395,
-    0.092423378197156,
-    0.577596857777372,
-    -0.788827845783575,
-    0.067023440865139,
-    0.064966504647707,
-    -0.588831060812815,
-    0.021117939212687,
-    0.064242288443900,
-    0.013971002085177,
-    0.554083718587947,
-    0.247593251271462,
-    -0.542556040934901,
-    -0.011826665222726,
-    -0.151775538160633,
-    -0.483584812206746,
-    -0.025307697497284,
-    -0.069662889814038,
-    0.077477674888355,
-    0.199875855468186,
-    0.253429109396566,
-    0.070066114191264,
-    0.313302894396337,
-    -0.105010643046718,
-    -0.054811369696000,
-    0.128293428374694,
-    0.356625297448929,
-    0.483439392462770,
-    -0.004508232254102,
-    -0.071936575538095,
-    -0.223411560847178,
-    -0.462173985933960,
-    -0.031691991911572,
-    -0.432365452408454,
-    0.060805445734773,
-    -0.054354700525428,
-    -0.169060945581967,
-    -0.110411492907295,
-    -0.026131269817157,
-    0.031032187323832,
-    0.144446049892272,
-    -0.396278248586757,
-    0.059325732197948,
-    -0.067153583514486,
-    0.229532536086653,
-    -0.041600430335018,
-    -0.486608977918235,
-    0.230402615219460,
-    -0.000734524226388,
-    0.074155315969760,
-    -0.116915034516709,
-    0.155881214729519,
-    -0.309910707064363,
-    -0.103533391333041,
-    -0.068125602789165,
-    0.200445509017084,
-    -0.113235482317024,
-    -0.085597113683836,
-    -0.725829318298421,
-    0.005508329992458,
-    0.094041721434099,
-    0.034596112621626,
-    0.320223640777800,
-    -0.296940154432709,
-    -0.042285464892640,
-    0.248854490421816,
-    0.631359501260868,
-    0.270682474251707,
-    0.005121076196065,
-    -0.086058325141605,
-    -0.705337811587226,
-    -0.336096946097436,
-    -0.037046986454056,
-    0.004034961302382,
-    0.363513824997190,
-    -0.716916954562176,
-    0.304386660298112,
-    0.020579345623727,
-    0.089154474520244,
-    -0.062405277041600,
-    -0.018060576746206,
-    -0.079418007508434,
-    0.389352146463734,
-    0.539737407285609,
-    0.310247529167789,
-    -0.182159627420249,
-    -0.257165895445076,
-    0.333860156408952,
-    0.129251381370565,
-    0.003014276955703,
-    -0.690426344836534,
-    -0.477611298464206,
-    0.331824083080254,
-    -0.091660795597975,
-    -0.465057608331886,
-    0.631626372187828,
-    -0.006838344639508,
-    -0.131088461608442,
-    0.335630915361734,
-    0.056526707556068,
-    -0.362955049640307,
-    -0.075298928267727,
-    0.207390497021224,
-    0.379384323453916,
-    0.000044112344988,
-    -0.073372044036307,
-    -0.249353992244312,
-    0.382893738763508,
-    0.358645836410542,
-    0.012029545849436,
-    -0.399861476598994,
-    0.150954595775431,
-    -0.008081596807742,
-    0.068023511828091,
-    0.324585017687755,
-    0.425249273905503,
-    0.376102180960718,
-    -0.033024865232814,
-    0.168413288736052,
-    -0.528143746091471,
-    0.072083528036686,
-    0.132501216891625,
-    0.538988608545884,
-    0.166206629314706,
-    0.229574132554166,
-    0.039702282826452,
-    -0.564445193150116,
-    0.284219283849722,
-    -0.002623772665272,
-    0.221065297459767,
-    -0.307815748309403,
-    -0.328894004349048,
-    0.366664620374948,
-    -0.009202803477264,
-    0.110840336142227,
-    -0.253944271569852,
-    0.086468893614037,
-    0.109712351424303,
-    -0.057720552275975,
-    -0.263135449446896,
-    -0.187523189104655,
-    0.049584373749577,
-    -0.374312924401001,
-    -0.178950940674613,
-    -0.051182362759215,
-    0.191365527270655,
-    -0.699115970874081,
-    0.088633386997771,
-    0.194448625999260,
-    0.071609470004322,
-    0.327324450230307,
-    0.284636632175220,
-    0.003016329573588,
-    -0.064720735133005,
-    -0.390984273497045,
-    0.196818882862560,
-    0.269450744046614,
-    -0.052441420959608,
-    -0.710931105811345,
-    0.514477674089673,
-    0.001252341481932,
-    0.054713207174365,
-    0.158569600977921,
-    -0.494894943416027,
-    -0.172231520834731,
-    0.064481746631866,
-    0.344668171708951,
-    0.579590988326754,
-    -0.266858105663312,
-    -0.246398308017124,
-    -0.180947007987554,
-    0.258042276030767,
-    -0.460364876687826,
-    -0.020440609509430,
-    -0.440326286445098,
-    -0.055307388113963,
-    -0.002065360187976,
-    -0.350452425570954,
-    -0.044052050019595,
-    0.086518210647045,
-    -0.039108991133956,
-    -0.164102740212987,
-    -0.270152939954420,
-    0.374873756762891,
-    -0.138366757369094,
-    0.328479554540094,
-    -0.373144539821968,
-    0.389457774542210,
-    -0.046149982109547,
-    -0.042200617099808,
-    0.339401834132611,
-    -0.198609430516819,
-    -0.043696955018973,
-    -0.178369675337390,
-    0.007620296478728,
-    -0.175234379258552,
-    -0.340268780062243,
-    -0.129427061554080,
-    -0.232473004350007,
-    -0.468511624213503,
-    -0.248096595069893,
-    -0.060814442814696,
-    -0.294892807758924,
-    -0.118763448964912,
-    0.149309702385506,
-    -0.045366052195140,
-    0.203376633006454,
-    -0.676401636763538,
-    0.037409530247858,
-    0.101096291985235,
-    -0.488892344314103,
-    0.434348443537094,
-    0.005030436855222,
-    -0.047758877093950,
-    -0.117976057357115,
-    0.035712684844607,
-    0.027868776870202,
-    -0.167693634341703,
-    -0.263928542094347,
-    -0.296476747578256,
-    0.556523872039543,
-    -0.079323603451122,
-    -0.057141957965186,
-    -0.479647311098256,
-    0.027101807163846,
-    -0.148843267982147,
-    -0.491317317030263,
-    0.308279497770724,
-    -0.055474469457146,
-    0.046875139268383,
-    0.610028896354320,
-    0.303910772641911,
-    0.173674743579328,
-    -0.151942051086960,
-    0.434079230468128,
-    -0.415014769589943,
-    0.220737095056937,
-    -0.004334872893138,
-    0.492106189951994,
-    0.001083656390604,
-    -0.241167765518130,
-    0.230233548845070,
-    -0.376720685090404,
-    -0.221819125230247,
-    -0.572412633696695,
-    -0.108633831530237,
-    -0.085316567908718,
-    -0.086139822624679,
-    -0.135616587714645,
-    -0.209117121397053,
-    0.122584823852924,
-    0.195412113542720,
-    -0.551072495660341,
-    -0.154300602587339,
-    0.007785528270465,
-    -0.031491193094491,
-    0.141723541002036,
-    0.113325412654698,
-    -0.471063388002002,
-    -0.424753908003615,
-    -0.124471971836927,
-    0.216555365452824,
-    0.176649032772838,
-    0.006476873814318,
-    -0.209462895392993,
-    0.026331908221879,
-    -0.293981914357532,
-    0.204468954833468,
-    0.656985869964727,
-    -0.123976245714226,
-    0.014478567797273,
-    -0.025244427531439,
-    0.484796818084600,
-    -0.077336661675912,
-    -0.069789910914610,
-    0.095285716161886,
-    -0.531604967476128,
-    0.197732066520537,
-    -0.111018494680766,
-    -0.026646443833042,
-    0.216005453264694,
-    0.215541525532264,
-    -0.212268526641851,
-    0.360847326123539,
-    0.006039831541548,
-    -0.495424354291660,
-    0.032439791228966,
-    -0.070006830543109,
-    0.209225501430733,
-    -0.586730929187286,
-    -0.044807888499127,
-    -0.032806038466383,
-    0.280108708555865,
-    -0.446596047987628,
-    0.006460407621331,
-    0.011211006770608,
-    -0.399828219727475,
-    -0.844554083219549,
-    -0.027836579940397,
-    -0.061240774544955,
-    -0.251693948123925,
-    -0.903337242144092,
-    0.022409286301758,
-    0.006363414579325,
-    0.026595203030106,
-    0.078367802154572,
-    0.110630527944392,
-    0.069670376755510,
-    0.693397391037665,
-    -0.270872221356323,
-    0.026039121538755,
-    0.045657960719332,
-    0.497121280368983,
-    -0.136094581952377,
-    0.456512623663416,
-    0.003904740082584,
-    -0.132662564924180,
-    0.203079122926732,
-    -0.054552594972811,
-    -0.037549287309342,
-    0.334393896002266,
-    0.320902584193942,
-    -0.489608543832384,
-    0.154438585485315,
-    -0.008975642785295,
-    -0.314727997932995,
-    0.192865557315827,
-    -0.112176262176990,
-    0.110998341072157,
-    0.008077704196854,
-    -0.181581818421050,
-    -0.622263086755650,
-    -0.350687614539414,
-    0.291160303974250,
-    -0.006301479700442,
-    -0.004795832709000,
-    0.235011386711666,
-    -0.092640682453645,
-    -0.333779618978453,
-    0.273759642085214,
-    -0.611675978731976,
-    -0.557137997265403,
-    0.084081940074819,
-    0.093495201118753,
-    -0.461541190179820,
-    0.005359214718039,
-    0.388328576171067,
-    -0.375094891147198,
-    -0.422514235523062,
-    -0.762411888951674,
-    0.055911444976554,
-    0.111594790513352,
-    0.038705021950819,
-    -0.187349619305081,
-    -0.234840831415609,
-    0.036038579818187,
-    0.569296960383050,
-    -0.340200286880698,
-    -0.045903201028407,
-    0.147683398197803,
-    -0.000113320334995,
-    -0.166904970450124,
-    0.109616939808528,
-    0.366791230402143,
-    -0.374390753684774,
-    0.560059930216164,
-    0.008588637941504,
-    0.002315796143583,
-    0.526796878350248,
-    0.070143127793155,
-    -0.314776564498417,
-    0.183835947750642,
-    -0.869999482281685,
-    -0.083321652871766,
-    -0.066751270194833,
-    -0.113502938101311,
-    -0.335413912323599,
-    0.205042448383537,
-    -0.348301764274074,
-    0.114782074734574,
-    -0.332427714326618,
-    0.216937085606034,
-    0.103300745632646,
-    0.032402325887110,
-    0.023014606744782,
-    0.277956063423876,
-    0.244813439665997,
-    -0.182338237320788,
-    -0.661374141925477,
-    -0.032102249858385,
-    -0.031774777013154,
-    -0.081307289766432,
-    -0.270065331968967,
-    0.213055376250463,
-    0.029723058986627,
-    -0.222791399544379,
-    0.221480715807155,
-    0.597222602925508,
-    0.031077309954231,
-    -0.011545285531258,
-    0.793322255818589,
-    0.217760927728104,
-    0.614374202872154,
-    0.043596521606963,
-    -0.395321454191844,
-    0.210248062154022,
-    -0.111485119816596,
-    0.075956257390122,
-    -0.011303320106295,
-    -0.111835321938811,
-    0.226268312796717,
-    0.150704903232609,
-    -0.351899595117257,
-    -0.395208596315922,
-    0.094335593255476,
-    0.084400224790764,
-    -0.007633886454509,
-    0.076187511358726,
-    -0.113874981281527,
-    -0.307044087747637,
-    0.277603484839050,
-    0.275273856154027,
-    -0.080737074093082,
-    0.217466177422731,
-    0.711230385512987,
-    -0.542336595339361,
-    0.082209161233155,
-    0.241188062667033,
-    0.492535158131554,
-    -0.605461209512122,
-    0.014865589300451,
-    -0.002207022597034,
-    0.051757366537726,
-    -0.379584293681129,
-    0.040671197511953,
-    0.039949828943883,
-    0.084697232067544,
-    -0.445661865136843,
-    0.099476399465999,
-    0.090242539694157,
-    0.574785088294779,
-    0.536768930136907,
-    0.228348448164693,
-    0.283322910022246,
-    0.063438107868283,
-    -0.267506442768483,
-    -0.053542511712883,
-    -0.027595220170792,
-    0.314497485358773,
-    -0.235933902927245,
-    -0.005761061856822,
-    -0.102851158015150,
-    0.579738620409981,
-    -0.497239461462948,
-    0.060510679814397,
-    -0.162787782607482,
-    0.714034781088607,
-    -0.125577781155000,
-    0.142809831715251,
-    -0.105666315492674,
-    -0.167816348441307,
-    -0.777383267117768,
-    -0.011868527840133,
-    -0.060339348570093,
-    -0.419359308475336,
-    0.120899758349420,
-    0.408811430766285,
-    0.227049255795018,
-    -0.009623296983408,
-    -0.152376918485200,
-    0.036976755268183,
-    0.010475372065340,
-    -0.095010357546336,
-    -0.306904431316086,
-    0.144211461009260,
-    -0.238779706405876,
-    -0.690998368393288,
-    -0.735886448209707,
-    0.006159518258664,
-    -0.090826751666411,
-    -0.143122028406224,
-    -0.218381517492337,
-    0.334869342070448,
-    0.201906597671406,
-    0.084700756590324,
-    0.224822715694642,
-    -0.127189947803964,
-    0.122619241480284,
-    -0.430451410988496,
-    -0.357478613483043,
-    -0.184500236165053,
-    -0.407444733374203,
-    -0.224838234835819,
-    -0.470969662957870,
-    -0.004529416544519,
-    0.438165867830800,
-    -0.002148089816177,
-    -0.147333101619086,
-    0.254533732871011,
-    0.470556820246934,
-    0.246933936266646,
-    -0.065987288827429,
-    0.105366862572833,
-    0.490184963124575,
-    0.080971244832759,
-    0.371420929380621,
-    -0.000084504011278,
-    0.159005592157219,
-    -0.120968307988115,
-    -0.111603620726885,
-    -0.331580753898923,
-    0.674489373141448,
-    0.030085983612751,
-    -0.348407577086235,
-    0.317559147646338,
-    0.323461893534794,
-    0.011367536898996,
-    0.144889563318549,
-    0.560288408314155,
-    -0.334169322538447,
-    -0.128071542149755,
-    0.140093997393133,
-    0.055675928567206,
-    -0.275050170039729,
-    -0.533573369983279,
-    0.004255050297056,
-    -0.832454534689008,
-    -0.445950680325143,
-    0.009637880792776,
-    -0.113639862556661,
-    -0.212816593046110,
-    0.189062297146093,
-    0.253820562254498,
-    0.072964185085758,
-    -0.180094367952108,
-    -0.275469957881301,
-    0.138160348375078,
-    -0.224533183590722,
-    0.690243505718006,
-    0.260468916173098,
-    0.082679819966103,
-    0.125703836186885,
-    0.353171983076817,
-    -0.180899147470043,
-    0.121119329066417,
-    0.105896870434714,
-    0.117715761857352,
-    -0.183736584774966,
-    0.174302386955476,
-    -0.018207507605484,
-    -0.080246901267115,
-    -0.138722056385409,
-    -0.041627403557957,
-    0.137489616165819,
-    -0.326019718110519,
-    -0.064961720672708,
-    0.326062227667569,
-    0.005885665141574,
-    -0.596162631424753,
-    0.137773614803022,
-    0.015701248270564,
-    -0.565949155369983,
-    0.119129871613875,
-    0.220708637195379,
-    0.241045978527099,
-    0.062469996496860,
-    -0.493753596105494,
-    0.103565937692773,
-    -0.121819729388025,
-    -0.242948370692016,
-    -0.139759838346299,
-    0.055208965338612,
-    -0.239676556152479,
-    0.013182229332812,
-    -0.673869932329678,
-    -0.772091206447480,
-    0.115015574810973,
-    0.072972504233287,
-    -0.270405275184593,
-    -0.174673516027571,
-    0.008916501272257,
-    -0.045859983802751,
-    0.026506878517242,
-    0.225045030886086,
-    0.063544544713354,
-    -0.015397731504585,
-    -0.169230739042665,
-    -0.368883931483401,
-    -0.233262653771342,
-    -0.047010237162288,
-    -0.313097796262546,
-    0.336266417669766,
-    0.022378686469540,
-    0.088467558607776,
-    -0.385528995280579,
-    -0.021894769591026,
-    -0.005467329382697,
-    0.136564420876104,
-    -0.042072475289864,
-    0.534652901055407,
-    0.065611996477630,
-    -0.266899405441903,
-    -0.162419338099363,
-    -0.216082626801897,
-    0.056427303969082,
-    0.057762500096249,
-    -0.552404130717709,
-    0.750558586905319,
-    0.068420257391556,
-    0.198739878332687,
-    -0.321751310014403,
-    -0.272265465899121,
-    -0.026404078280054,
-    -0.155786924456461,
-    -0.197653531000416,
-    0.164393010618471,
-    -0.105696523871772,
-    0.155876101735461,
-    0.328477151716616,
-    0.572756913005912,
-    0.199868027339175,
-    0.002471361295185,
-    -0.551311295937160,
-    0.002688585834075,
-    0.350079817632392,
-    -0.149152336312970,
-    -0.251429144575261,
-    0.198302361691329,
-    -0.585955945605706,
-    -0.162113796988288,
-    -0.042888845506077,
-    0.100634453478944,
-    -0.394406540606917,
-    0.563322833310165,
-    0.000055716822663,
-    0.107661203256530,
-    0.178658949204531,
-    -0.579634513780533,
-    0.063843011102133,
-    0.070612746147772,
-    -0.287379790963542,
-    -0.429887848708035,
-    -0.257369482634931,
-    0.175454194100150,
-    -0.020956837361656,
-    0.488405227202021,
-    -0.166214320182745,
-    -0.103612476330671,
-    0.413054315390094,
-    0.266010761329812,
-    -0.029321608466372,
-    -0.228566537982375,
-    0.642086315162625,
-    0.046100408428219,
-    0.076835239336961,
-    -0.024651936659606,
-    -0.174348147805917,
-    -0.126938941824648,
-    0.190520324463923,
-    0.090843531381329,
-    -0.528247832653183,
-    0.207934812866325,
-    0.063194991810284,
-    -0.070800735962186,
-    -0.537551267377723,
-    -0.379877641317134,
-    -0.407980241359612,
-    0.195665579911454,
-    -0.110062909918537,
-    0.884797902124935,
-    -0.050175382423290,
-    -0.027969308256896,
-    -0.783372372638280,
-    0.144631786104132,
-    -0.086189427077639,
-    -0.111665559522737,
-    -0.286800383522038,
-    -0.074628281894902,
-    0.019578315727482,
-    -0.050597831341489,
-    0.114128192265255,
-    0.295373022380049,
-    0.151754975943024,
-    -0.059607977363256,
-    -0.355347795590831,
-    0.136946335871304,
-    0.025621814531596,
-    0.004228168218985,
-    -0.511620545616688,
-    -0.601786067724604,
-    -0.112035578480793,
-    0.099458195078256,
-    -0.534907449107463,
-    0.164954622361055,
-    0.186989518556826,
-    0.023924955463557,
-    0.527331159415053,
-    -0.388916659531571,
-    0.087305144128588,
-    0.039391531447096,
-    0.335917244011462,
-    0.078839933972875,
-    0.112672696954743,
-    -0.100041631154623,
-    -0.887655597886109,
-    0.094697950156702,
-    0.208369347546188,
-    -0.100372014552220,
-    -0.015517040629675,
-    -0.169762162633991,
-    -0.007160635801299,
-    0.075879524841586,
-    -0.188461697111495,
-    -0.031063183674996,
-    0.083886104829630,
-    -0.322170170119340,
-    0.267085077304177,
-    -0.695439978706370,
-    0.021164733273850,
-    0.026879998317552,
-    -0.279955401870461,
-    0.103839971084808,
-    0.328455493859209,
-    -0.011189808042491,
-    0.010697763237565,
-    0.422063747166786,
-    0.013613117121176,
-    0.151496264332370,
-    -0.231554516643660,
-    -0.477958063972754,
-    0.090697548673345,
-    -0.170776195842379,
-    -0.071397304553159,
-    0.493217680293368,
-    0.064694038613479,
-    0.134983413172105,
-    -0.380442385450937,
-    0.285899296890985,
-    0.223662026808090,
-    -0.174759869089142,
-    0.041135981115250,
-    -0.714222612551001,
-    0.043112378635748,
-    0.064574940821592,
-    0.269079143551874,
-    0.357556820778644,
-    -0.143198884605959,
-    0.552049398798345,
-    -0.207365128186995,
-    0.134241259269789,
-    0.010149557638163,
-    -0.152733145903890,
-    -0.006111792210323,
-    -0.208895399137766,
-    -0.426084911852527,
-    0.263897673361209,
-    -0.172981962437627,
-    -0.065259588274007,
-    -0.535045238548870,
-    0.536214183024953,
-    -0.031999918396582,
-    0.069009795643656,
-    0.120156920583936,
-    -0.262397849091404,
-    -0.080707185323146,
-    -0.143398265686762,
-    0.780380856130121,
-    -0.145350219697525,
-    0.008975671395957,
-    -0.049077130742944,
-    0.351460374101500,
-    0.226714452267234,
-    0.194215031219390,
-    0.044683267479048,
-    -0.830079971179834,
-    -0.134516985351401,
-    -0.144931019049842,
-    -0.129559682952422,
-    -0.134100551594518,
-    -0.358428699155035,
-    0.027347382472856,
-    -0.010135751314641,
-    0.530154074075710,
-    -0.439870726906890,
-    -0.055906367723376,
-    -0.034469382276370,
-    0.302006679070854,
-    -0.562699845929940,
-    0.049459953024830,
-    0.006323686434725,
-    0.397475711143609,
-    -0.449084751749887,
-    0.043360920775313,
-    0.110645923489414,
-    -0.043889588299692,
-    -0.079849838556233,
-    -0.208198274138803,
-    0.037388429498738,
-    -0.430223064006780,
-    -0.055566414788910,
-    0.055778072382646,
-    -0.078996496354045,
-    -0.152660025503991,
-    -0.149767714519900,
-    -0.200061879382416,
-    0.027511169509355,
-    0.429027253406472,
-    0.599149429799784,
-    -0.016041491171248,
-    -0.033517930977249,
-    -0.031234931568666,
-    -0.044584832380360,
-    -0.074587053532425,
-    0.010794025725188,
-    0.136007923433168,
-    -0.001874411787217,
-    0.498008632766466,
-    -0.214086427694805,
-    0.415753481836307,
-    0.113123725100828,
-    0.403536370288896,
-    -0.163186422575017,
-    0.213968977471859,
-    0.113517413371076,
-    0.151155753027934,
-    0.106075673886107,
-    -0.078170651487648,
-    -0.180025146834710,
-    0.117635742602440,
-    -0.770190713399707,
-    -0.145295521482265,
-    -0.016119035814463,
-    -0.080936342865206,
-    -0.061319934752732,
-    -0.281289711091464,
-    0.124782286832273,
-    -0.352865422991912,
-    0.154083087945583,
-    0.240718730885854,
-    -0.042614782809428,
-    0.457486404510722,
-    -0.249712575857341,
-    0.069576091186755,
-    -0.301591185040095,
-    -0.032501237473961,
-    -0.117700387025974,
-    -0.045654139200839,
-    -0.027024053068572,
-    0.909988392444466,
-    -0.038981965154738,
-    -0.267046148894431,
-    -0.274637034064848,
-    -0.101337782216953,
-    0.018381601689700,
-    -0.136740628217424,
-    -0.118365115284958,
-    -0.164514082507746,
-    0.189846648487937,
-    0.025579614218461,
-    -0.060753602428018,
-    0.273639717041764,
-    0.275286805484780,
-    0.058431295568352,
-    -0.008940711846192,
-    -0.346660037753040,
-    -0.109292443275335,
-    0.110342552391781,
-    -0.092284158799697,
-    0.324679889022928,
-    0.115844088514035,
-    -0.101887300802309,
-    0.222710087759062,
-    0.043155882093626,
-    -0.073177873580339,
-    0.014306650756224,
-    -0.041417190314537,
-    0.080291571065861,
-    0.293059640608644,
-    -0.005009468452624,
-    -0.317220736207647,
-    -0.002198717881019,
-    -0.171959798667370,
-    0.280089028838004,
-    0.185122384476336,
-    0.074624179102445,
-    0.047428817662258,
-    -0.085172508912568,
-    0.058146780644623,
-    0.016171203760358,
-    -0.033993280374004,
-    0.532838289802600,
-    -0.168140891674814,
-    0.112943738604262,
-    0.021028462446588,
-    0.141740971888285,
-    -0.599880595565335,
-    -0.008988707149491,
-    -0.026483767067509,
-    0.057727310763744,
-    0.545913244921363,
-    0.000492357145968,
-    0.089055596489597,
-    0.003167957055436,
-    0.368784577014471,
-    -0.090341533920818,
-    -0.037923604833776,
-    0.082320602318263,
-    0.156962245575300,
-    0.260107184284839,
-    -0.024923627871750,
-    0.055823717923554,
-    -0.007787331978278,
-    0.089565836781542,
-    -0.180615024773133,
-    -0.266666923576377,
-    0.082059109377143,
-    -0.168349450535004,
-    0.122954586320975,
-    0.032854662163682,
-    0.013057296236364,
-    -0.072013640557086,
-    -0.053681255861607,
-    -0.337416125769495,
-    -0.118418176538105,
-    -0.160367787050803,
-    0.121190015229000,
-    -0.024594391698556,
-    -0.073988214549684,
-    0.072878512220066,
-    -0.033935811290285,
-    -0.045050835491248,
-    0.309256033345768,
-    -0.000869131910893,
-    0.321805575535270,
-    -0.000876691787443,
-    0.121829968098387,
-    0.273467726322657,
-    -0.075341262980376,
-    -0.041436709029013,
-    0.135396564173594,
-    -0.301536512280125,
-    -0.337881379376779,
-    -0.004117804818097,
-    0.004725128251872,
-    0.001431980691213,
-    0.083151154920756,
-    0.370178004339066,
-    -0.212501482941273,
-    0.114580577220987,
-    0.047216358185278,
-    -0.130606764545900,
-    0.495306182363918,
-    -0.047317094475715,
-    0.232311895538792,
-    0.268121392242135,
-    0.129867588114683,
-    0.148112058015611,
-    0.035905084799578,
-    0.200148770908285,
-    0.000232130665771,
-    -0.029148636599596,
-    0.091743161740927,
-    -0.335509786265870,
-    -0.100505716255891,
-    -0.242260276159165,
-    0.131960880926696,
-    0.046731847596901,
-    0.124067739984298,
-    0.188900429944842,
-    0.387588981964520,
-    -0.160705777936619,
-    0.096316367668286,
-    -0.199705991939340,
-    0.242052420288725,
-    -0.029689265587268,
-    -0.223714543877123,
-    0.016461160813240,
-    -0.068181086959582,
-    -0.098005769856235,
-    0.206130185043545,
-    -0.063399254561243,
-    -0.040208705476094,
-    -0.121304125045476,
-    -0.022033959377866,
-    -0.167132970514659,
-    -0.083078894838669,
-    0.080431256699846,
-    0.110178879361373,
-    0.118611662689624,
-    -0.132550338108002,
-    0.036797204040434,
-    -0.027944175276914,
-    -0.024381133798809,
-    0.014644785482567,
-    0.008361718427238,
-    -0.005558442058803,
-    0.122572236809559,
-    0.021917470346210,
-    -0.005587121629376,
-    0.031297206908574,
-    -0.039843207009683,
-    0.012963727565929,
-    0.096190010731214,
-    0.005441912774542,
-    0.005441912774542,
-    0.801155283622782,
-    0.801131557526695,
-    0.008889032589569,
-    0.008889032589569,
-    0.798765683276625,
-    0.798702566392050,
-    0.038183972418433,
-    -0.039730788557074,
-    0.015816319240996,
-    0.095918608578266,
-    0.002766602176365,
-    0.002766602176365,
-    0.799460814983113,
-    0.799454695816583,
-    0.005993636003742,
-    0.005993636003742,
-    0.796968288492728,
-    0.796939657950637,
-    -0.039330035777011,
-    -0.024821450461429,
-    0.004113354929340,
-    0.009680918712312,
-    -0.007823230525532,
-    0.124785858156590,
-    0.006156070691139,
-    -0.006468583079000,
-    0.019198221957440,
-    -0.036098189449631,
-    0.007952163908221,
-    0.087148738546414,
-    0.005988765372316,
-    0.005988765372316,
-    0.790075170331322,
-    0.790046833531711,
-    0.008995714228996,
-    0.008995714228996,
-    0.788244402993247,
-    0.788180613409233,
-    0.025989592106979,
-    -0.036113503426011,
-    0.010765241531256,
-    0.087185709755884,
-    0.002915296425626,
-    0.002915296425626,
-    0.788313108167443,
-    0.788306408302720,
-    0.005797973124322,
-    0.005797973124322,
-    0.786406350240748,
-    0.786379913573329,
-    -0.223322529484723,
-    0.003301845685076,
-    -0.062631270574790,
-    -0.097850219225998,
-    0.093501293873072,
-    -0.034128180632932,
-    -0.034882361641484,
-    -0.111903497320362,
-    -0.021995349330222,
-    -0.033524201834167,
-    -0.076316424007433,
-    0.080303599596710,
-    0.049977482800965,
-    0.063849335097995,
-    -0.114991735616391,
-    0.033945554796193,
-    0.052669635788991,
-    -0.019861673597310,
-    0.008898625292719,
-    0.006106923445715,
-    0.010476641943812,
-    0.099851376055470,
-    0.013317733892884,
-    -0.004080515789835,
-    0.014698988500423,
-    -0.014651599167090,
-    0.006088520390042,
-    0.035372089419644,
-    0.025580175866195,
-    0.025580175866195,
-    0.765104241791161,
-    0.764603435448250,
-    0.026008736276812,
-    0.026008736276812,
-    0.764783765634048,
-    0.764266249221889,
-    0.018176684504050,
-    -0.014612883532670,
-    0.007529029240555,
-    0.035278621609950,
-    0.023310495898800,
-    0.023310495898800,
-    0.763772631467256,
-    0.763357500473802,
-    0.023689096588443,
-    0.023689096588443,
-    0.763426967566705,
-    0.762998432463177,
-    0.027931557358737,
-    -0.020475276560454,
-    0.007218759415629,
-    0.006429554740905,
-    0.005555932198827,
-    0.102936166464570,
-    0.010803636940727,
-    -0.004296091129205,
-    0.007865522215766,
-    -0.015765498997905,
-    0.003258005976918,
-    0.038061281498323,
-    0.022398245679943,
-    0.022398245679943,
-    0.759090976783609,
-    0.758710059378838,
-    0.022972591924989,
-    0.022972591924989,
-    0.758764833815221,
-    0.758364297559786,
-    0.012606666274211,
-    -0.015744669324149,
-    0.005221852147090,
-    0.038010994217441,
-    0.020359982331366,
-    0.020359982331366,
-    0.757919474564370,
-    0.757605229907796,
-    0.020892670015876,
-    0.020892670015876,
-    0.757571595357679,
-    0.757240840379655,
-    -0.044220751020998,
-    -0.000966718260419,
-    0.080713373750918,
-    0.372716266902226,
-    -0.211688044486560,
-    0.009902591523191,
-    0.046558788687474,
-    -0.133222586126239,
-    0.316736359410733,
-    -0.047728579400685,
-    0.119563022689623,
-    0.312978214775590,
-    0.099609005482818,
-    0.147723567016076,
-    0.044635304967192,
-    0.255760226516643,
-    -0.002172426192101,
-    0.019678002252443,
-    0.089053484701968,
-    -0.337810333354218,
-    -0.100120988519457,
-    -0.020937270655163,
-    0.130123097295436,
-    0.047667803524284,
-    0.079338327850855,
-    0.190543169848967,
-    0.199478852072531,
-    -0.187591922681435,
-    0.073875073329945,
-    -0.199182172464674,
-    0.300906784037487,
-    -0.037938445773379,
-    -0.196515999654998,
-    0.017790655941487,
-    0.022846511056556,
-    -0.088934083731091,
-    0.068138525161431,
-    0.006328395302140,
-    -0.057484860048112,
-    -0.101586862950979,
-    -0.019355136588157,
-    -0.180631561081239,
-    0.027838554269802,
-    0.072986316299885,
-    0.036420800486049,
-    -0.011839594868089,
-    -0.189502187281278,
-    0.030816037974251,
-    -0.061499346656946,
-    -0.012515269967642,
-    0.016802570267836,
-    0.002875428219703,
-    -0.012232980635835,
-    0.062918510962948,
-    0.025146823490436,
-    -0.001921299711275,
-    0.051263497058088,
-    -0.015630503243678,
-    0.021234035736134,
-    0.037735372917605,
-    0.026020264371449,
-    0.026020264371448,
-    0.760529757196073,
-    0.760014662929283,
-    0.025521033710644,
-    0.025521033710644,
-    0.759616762187416,
-    0.759121844968171,
-    0.051348368663435,
-    -0.015457978453708,
-    0.021269190706129,
-    0.037318861229812,
-    0.024768633141598,
-    0.024768633141598,
-    0.759648856549233,
-    0.759182680187848,
-    0.024252770484105,
-    0.024252770484104,
-    0.758742105667644,
-    0.758295684600909,
-    -0.064563653320139,
-    -0.013683139739919,
-    0.015190816078716,
-    0.014793715007575,
-    -0.012842509128588,
-    0.068789788790774,
-    0.022734662882999,
-    -0.009884844343527,
-    0.037655463405696,
-    -0.019897675066241,
-    0.015597403640084,
-    0.048037237004612,
-    0.022998126232956,
-    0.022998126232956,
-    0.753621167557073,
-    0.753222461445390,
-    0.023367037133482,
-    0.023367037133482,
-    0.752804778383771,
-    0.752393620824336,
-    0.037926902065675,
-    -0.019815373262279,
-    0.015709837214399,
-    0.047838542873280,
-    0.021556488487805,
-    0.021556488487805,
-    0.752623824660419,
-    0.752274012474230,
-    0.021909038712219,
-    0.021909038712219,
-    0.751807525938440,
-    0.751446567180233,
-    -0.197268497762605,
-    0.004402618342556,
-    0.005137586963976,
-    -0.089292228896761,
-    0.035892434614798,
-    -0.014238646220106,
-    -0.050764935308173,
-    -0.088364248701019,
-    -0.019429251182798,
-    -0.044700534183585,
-    0.006260167828624,
-    0.073280238441389,
-    0.019184905997996,
-    0.026638633439842,
-    -0.167349564216385,
-    0.026805001792906,
-    0.020735485632529,
-    -0.011603512240631,
-    0.022537060695932,
-    -0.013992356392771,
-    0.004124544535933,
-    0.058334795334693,
-    0.033729094911075,
-    0.009349393635804,
-    0.022664096207820,
-    -0.011030700365981,
-    0.009387776028208,
-    0.026630466426026,
-    0.032949217792725,
-    0.032949217792725,
-    0.735717916841596,
-    0.734918749940033,
-    0.033030086678455,
-    0.033030086678455,
-    0.735456327063795,
-    0.734653515879691,
-    0.024093710217450,
-    -0.010769981469506,
-    0.009979941539955,
-    0.026001035330190,
-    0.032606379534746,
-    0.032606379534746,
-    0.735168938707684,
-    0.734386908807199,
-    0.032645901218647,
-    0.032645901218647,
-    0.734899267764969,
-    0.734115627487072,
-    0.002071493396854,
-    -0.012902282018671,
-    0.022330468074124,
-    -0.004640816863132,
-    0.000412045655579,
-    0.064864151931012,
-    0.033419907202753,
-    0.003100894690441,
-    0.015763802172331,
-    -0.014592829110482,
-    0.006529580654346,
-    0.035230205951919,
-    0.031661488491771,
-    0.031661488491770,
-    0.731238066331468,
-    0.730504669057561,
-    0.032072189174164,
-    0.032072189174163,
-    0.730928471922752,
-    0.730176233305547,
-    0.017785949959198,
-    -0.014289851952468,
-    0.007367181692790,
-    0.034498754387951,
-    0.031202683190838,
-    0.031202683190838,
-    0.730677804517038,
-    0.729966064525047,
-    0.031564239067323,
-    0.031564239067323,
-    0.730363581283141,
-    0.729635556332606,
-    -0.195317758359338,
-    -0.006281022920483,
-    -0.129926360002420,
-    0.158098119714643,
-    0.035436518525466,
-    0.073719750644252,
-    0.032108918788116,
-    -0.105136996522804,
-    0.050868822937554,
-    -0.007926766009706,
-    -0.005229924737518,
-    0.057743435278688,
-    -0.071608356561616,
-    0.129276663601262,
-    0.000113758832360,
-    -0.014336405840610,
-    0.080680128469697,
-    -0.019526149273522,
-    -0.171033458437516,
-    -0.018650432580652,
-    0.485774526738076,
-    0.012049637067054,
-    0.102490295494031,
-    -0.058709114849900,
-    0.419221941917998,
-    -0.092891204991667,
-    -0.009746469700758,
-    -0.007636546129074,
-    -0.038746342841171,
-    0.261567147590871,
-    -0.024650628427153,
-    0.091144720162411,
-    -0.004794781841128,
-    0.255860507877581,
-    -0.136465923502927,
-    -0.150521922912938,
-    0.015707928340768,
-    -0.166309092626664,
-    0.083239241908158,
-    0.040555814848737,
-    0.011422976180749,
-    0.035299492026833,
-    -0.008258953677985,
-    -0.036565627120337,
-    -0.050432294752645,
-    -0.183558758681495,
-    0.000655608305232,
-    0.002487602392559,
-    0.009950944736738,
-    0.158313835880355,
-    -0.219159123211780,
-    0.014554940441801,
-    0.275187870301764,
-    -0.021270584118391,
-    0.370352339755418,
-    0.016247000175921,
-    0.138492222813346,
-    0.281185690810914,
-    -0.019362909725318,
-    0.003843914293942,
-    -0.033422825188047,
-    -0.303229015486325,
-    -0.334180416203029,
-    -0.006723238469048,
-    0.028616983836796,
-    -0.001264441979681,
-    0.019098822448242,
-    0.072110759399189,
-    -0.167650226916561,
-    -0.058810197043196,
-    0.028566988685264,
-    -0.154263452313252,
-    -0.007060324131879,
-    -0.033602537913905,
-    0.195400020017481,
-    0.230611324069545,
-    0.123572788799422,
-    0.141992357761624,
-    0.015929912745127,
-    0.179963016422092,
-    0.001405862265806,
-    0.025738307781067,
-    0.021072303308356,
-    -0.065357382637276,
-    -0.079292652001719,
-    0.124343714460256,
-    0.079839384849163,
-    0.055196345827410,
-    -0.001768519129760,
-    0.134148851054921,
-    0.326005238168168,
-    -0.138223108293133,
-    0.091647826317450,
-    -0.191454531349515,
-    0.107390748593669,
-    -0.026694991761352,
-    -0.220073523396317,
-    -0.009627492029654,
-    0.085998120799729,
-    -0.115179221755856,
-    -0.069477298963112,
-    -0.054125173412645,
-    -0.029155165059107,
-    -0.057809198871410,
-    -0.021675350161059,
-    0.097749566982426,
-    0.104789013388415,
-    0.094525144439181,
-    -0.037136389991565,
-    0.101261077220340,
-    -0.096111698708554,
-    0.017536228759637,
-    0.061983842249640,
-    -0.005995082640893,
-    -0.089637103069532,
-    -0.004360805996347,
-    0.012329352801163,
-    0.030139315719123,
-    -0.134151405002501,
-    0.002913797410870,
-    -0.003632896530878,
-    0.001167475825680,
-    -0.001504795013787,
-    -0.002818535972099,
-    -0.017037582494131,
-    -0.017037582494132,
-    0.711605041856671,
-    0.711398447712787,
-    -0.017039757449474,
-    -0.017039757449474,
-    0.711600661703902,
-    0.711394016074865,
-    -0.005045126520028,
-    0.006208543339299,
-    -0.002089759828483,
-    -0.014988749532316,
-    -0.013288577527908,
-    -0.013288577527909,
-    0.708805310730805,
-    0.708680134375536,
-    -0.013206079203550,
-    -0.013206079203550,
-    0.708752606428001,
-    0.708628988818840,
-    0.042207111158867,
-    -0.006375521446276,
-    -0.087729847897091,
-    -0.001665798174446,
-    0.008395516400867,
-    0.032051910749762,
-    -0.131296995920553,
-    0.001113050755250,
-    -0.008507579605162,
-    0.001818305210759,
-    -0.003523954855426,
-    -0.004389777100348,
-    -0.023070019676294,
-    -0.023070019676294,
-    0.705617606819255,
-    0.705241958927055,
-    -0.023091995789494,
-    -0.023091995789495,
-    0.705599023511477,
-    0.705222669327620,
-    -0.008870215932127,
-    0.006648562839218,
-    -0.003674163740264,
-    -0.016051050576729,
-    -0.019173552776945,
-    -0.019173552776945,
-    0.703103914636118,
-    0.702845388441745,
-    -0.019099466679018,
-    -0.019099466679018,
-    0.703033652615743,
-    0.702777146437606,
-    -0.220147807423966,
-    -0.010049936445891,
-    0.081042747917845,
-    -0.122724082974422,
-    -0.061032136647249,
-    -0.035210007049668,
-    -0.024184331285874,
-    -0.068195932880676,
-    -0.021682666499189,
-    0.102038717119769,
-    0.098750874061237,
-    0.100717052021003,
-    -0.032622356688824,
-    0.065873289968106,
-    -0.079725055828135,
-    0.020687010074860,
-    0.063937565634616,
-    -0.004784337003788,
-    -0.059922422662882,
-    0.004274295594302,
-    0.012717972544874,
-    0.024052486362784,
-    -0.089680243070145,
-    -0.002855993008265,
-    0.005356525693496,
-    0.008779677117581,
-    0.002218745589447,
-    -0.021196015570521,
-    -0.002988885962084,
-    -0.002988885962084,
-    0.700144618745960,
-    0.700138364018573,
-    -0.002814630699291,
-    -0.002814630699291,
-    0.700046232451939,
-    0.700040686561529,
-    0.003667150126447,
-    0.011012093717646,
-    0.001518983317633,
-    -0.026585546003263,
-    -0.001831420917932,
-    -0.001831420917932,
-    0.698717208155071,
-    0.698714864581951,
-    -0.001544109139311,
-    -0.001544109139311,
-    0.698569428398327,
-    0.698567762816091,
-    0.044575873349406,
-    -0.005668817218054,
-    -0.059704414689124,
-    0.005053187276270,
-    0.008866692495946,
-    0.028499068673971,
-    -0.089353971080313,
-    -0.003376431791409,
-    0.000461579631958,
-    0.008629986573130,
-    0.000191192543673,
-    -0.020834630627948,
-    -0.010251603489819,
-    -0.010251603489819,
-    0.694629533071203,
-    0.694556526884048,
-    -0.010071880547643,
-    -0.010071880547643,
-    0.694539889243781,
-    0.694469429614155,
-    -0.000103406854587,
-    0.010844095262962,
-    -0.000042832521612,
-    -0.026179961855508,
-    -0.008758891932225,
-    -0.008758891932225,
-    0.693381668935936,
-    0.693328471910118,
-    -0.008474926496704,
-    -0.008474926496704,
-    0.693240734547307,
-    0.693190941173711,
-    0.042995034657733,
-    -0.001575152567690,
-    0.029879434552709,
-    0.070353215949355,
-    -0.168266445509143,
-    -0.059771879491358,
-    0.035913768971584,
-    -0.154360254659828,
-    0.002224500021896,
-    -0.024036593486485,
-    0.108212821886332,
-    0.291304650643865,
-    0.074132729585670,
-    0.142103861109378,
-    0.028266319975092,
-    0.232328494299216,
-    0.002112210608464,
-    0.032062967096020,
-    0.032966875799970,
-    -0.063764438107091,
-    -0.079584101690260,
-    0.126377021161268,
-    0.100372260230052,
-    0.055230982260851,
-    0.000557208248430,
-    0.095959460197553,
-    0.180542186069107,
-    -0.174601288270204,
-    0.054980579393848,
-    -0.191604876209793,
-    0.190556050788291,
-    -0.034462676635173,
-    -0.225043281673127,
-    -0.009317915788251,
-    0.086056126331501,
-    -0.104759714272288,
-    -0.056751423209124,
-    -0.010891719198687,
-    -0.052161872967280,
-    -0.046588421059801,
-    -0.022164828628088,
-    0.094606386655501,
-    0.104859693333383,
-    0.085974075636536,
-    -0.030334267686332,
-    0.020376973398905,
-    -0.171954650523889,
-    0.014132443022990,
-    0.046206103313483,
-    -0.007343398597557,
-    -0.055572297324153,
-    -0.002213493319695,
-    0.009190965397474,
-    0.036917757775923,
-    -0.083169820419886,
-    0.001479008951398,
-    -0.014021127509606,
-    0.007888495295237,
-    -0.005807741174241,
-    -0.019044512328478,
-    0.005858859955747,
-    0.005858859955747,
-    0.693193706995335,
-    0.693169911853389,
-    0.005927679189915,
-    0.005927679189914,
-    0.693080424464823,
-    0.693056071006311,
-    -0.014392482436590,
-    0.009810218400635,
-    -0.005961561421451,
-    -0.023683962312654,
-    0.006955346061732,
-    0.006955346061732,
-    0.692033421368896,
-    0.691999942169771,
-    0.007101940716042,
-    0.007101940716041,
-    0.691878427073999,
-    0.691843529532887,
-    0.024946384563420,
-    -0.007339918284631,
-    -0.056566398607695,
-    0.010444678299121,
-    0.004962144411073,
-    0.036900261061305,
-    -0.084657598129508,
-    -0.006978910919411,
-    -0.020031615360157,
-    0.004949776871404,
-    -0.008297366758418,
-    -0.011949818453664,
-    0.000564942010797,
-    0.000564942010796,
-    0.687157979069109,
-    0.687157759756094,
-    0.000457847210105,
-    0.000457847210105,
-    0.687048428371149,
-    0.687048284349247,
-    -0.019676385161006,
-    0.006913034249774,
-    -0.008150225592165,
-    -0.016689541042954,
-    0.002039133527136,
-    0.002039133527136,
-    0.686086475246643,
-    0.686083622448180,
-    0.001994124732411,
-    0.001994124732411,
-    0.685952626596938,
-    0.685949898877951,
-    -0.225432156774560,
-    -0.009661391567075,
-    0.081217472533503,
-    -0.110753822150018,
-    -0.052433875615085,
-    -0.029061965816757,
-    -0.045104018984820,
-    -0.055618728057388,
-    -0.022203129482558,
-    0.098093754761925,
-    0.098963776621424,
-    0.090893312841728,
-    -0.028026490417320,
-    0.054371113831075,
-    -0.148688024040521,
-    0.016871756702665,
-    0.048078399586257,
-    -0.006341107816175,
-    -0.034304572338998,
-    -0.005959671635782,
-    0.009563388281527,
-    0.031878901748087,
-    -0.051340420648318,
-    0.003982125276044,
-    -0.004604025872810,
-    0.008774466541363,
-    -0.001907049958034,
-    -0.021183436126748,
-    0.016831915846453,
-    0.016831915846453,
-    0.683303237549515,
-    0.683109621161217,
-    0.017008956425411,
-    0.017008956425411,
-    0.683211217765290,
-    0.683013533018429,
-    -0.005227095771175,
-    0.009495136818528,
-    -0.002165133960243,
-    -0.022923288083877,
-    0.016889443383649,
-    0.016889443383649,
-    0.682686038976848,
-    0.682491272750044,
-    0.017095733421592,
-    0.017095733421592,
-    0.682577875008445,
-    0.682378352838446,
-    0.027066000414422,
-    -0.006751867789455,
-    -0.034230685964679,
-    0.002793466665823,
-    0.005383762217931,
-    0.033943931583545,
-    -0.051229841874731,
-    -0.001866534751842,
-    -0.010829861343546,
-    0.006814315745727,
-    -0.004485875447116,
-    -0.016451213491625,
-    0.011059034280533,
-    0.011059034280533,
-    0.677438542926657,
-    0.677355685608797,
-    0.011122555442219,
-    0.011122555442218,
-    0.677362042870890,
-    0.677278240388957,
-    -0.010628181293154,
-    0.007539661220811,
-    -0.004402336834984,
-    -0.018202352374980,
-    0.011373302645623,
-    0.011373302645623,
-    0.676957661837653,
-    0.676870090337191,
-    0.011463753336176,
-    0.011463753336176,
-    0.676870261632350,
-    0.676781303093862,
-    -0.192714863145063,
-    -0.006526564247865,
-    -0.138231288709510,
-    -0.421883347004829,
-    0.216229593189948,
-    -0.065308726516042,
-    -0.063440754227646,
-    -0.431386237391365,
-    0.330149262307363,
-    -0.013316305533474,
-    0.029834052765852,
-    0.071614189891501,
-    -0.233725750195074,
-    -0.055407620494495,
-    -0.088231748803267,
-    0.440703956078250,
-    -0.236933134194781,
-    0.005922781045151,
-    0.067960772404513,
-    0.355393312842891,
-    0.337907845492982,
-    0.009836220395482,
-    0.031971273353282,
-    -0.499651281141000,
-    0.308603949901630,
-    -0.143632247309656,
-    -0.114106462169640,
-    -0.134502937948159,
-    -0.360568418502890,
-    0.018903872480002,
-    0.000838570805227,
-    0.363528266877534,
-    -0.318623645604493,
-    -0.046112878688267,
-    0.084780869298829,
-    0.204308412118800,
-    -0.461438711613949,
-    0.093930363484764,
-    0.035792474213496,
-    0.128635504436367,
-    -0.154517082681150,
-    0.029696063551280,
-    0.100751761087781,
-    -0.030671382680891,
-    -0.086814453166349,
-    -0.217518116479050,
-    0.028544891129833,
-    -0.180531731195640,
-    -0.074562318272869,
-    0.035590909737168,
-    -0.079128899620863,
-    -0.066349054804269,
-    -0.273160612589388,
-    -0.124113758530098,
-    0.019443145678998,
-    0.394312982983223,
-    0.357849386053754,
-    -0.022547803267632,
-    -0.055776048688916,
-    0.287081857236107,
-    -0.024269359846474,
-    -0.065288550279624,
-    -0.005678328864642,
-    -0.035152738840232,
-    -0.002365085907930,
-    0.531805602332472,
-    -0.141666321602183,
-    0.411653793802303,
-    0.092690082285051,
-    0.152353725643366,
-    -0.158638293646635,
-    0.172514893059145,
-    0.069893135000789,
-    0.062901291356959,
-    0.045858232478078,
-    -0.046590141061980,
-    -0.160353877303560,
-    0.080760053229545,
-    -0.473891878885956,
-    -0.082052642135821,
-    -0.026275389770075,
-    -0.053407507498766,
-    0.084914298503263,
-    -0.284437420716296,
-    0.185982469478742,
-    -0.017871232976675,
-    0.110247813146974,
-    0.144896186461152,
-    0.097765276740593,
-    0.453386727177372,
-    -0.219928128419494,
-    0.069784863405067,
-    -0.303391600283891,
-    -0.022466473683903,
-    0.009737818663795,
-    -0.031305182608282,
-    -0.019575074632188,
-    0.750579693464465,
-    0.095880015089837,
-    -0.180657509995870,
-    -0.225214490597423,
-    -0.192452562856251,
-    0.104041054418579,
-    -0.044253520893354,
-    -0.040726014931003,
-    -0.112668747846610,
-    0.172870211288015,
-    0.017875814445255,
-    -0.066052616611865,
-    0.285888997355964,
-    0.210172826122794,
-    0.024519147919955,
-    -0.011997178597796,
-    -0.221197068778406,
-    -0.109475624520023,
-    0.047957047247407,
-    -0.168316632398581,
-    0.201423886800258,
-    0.081871237362817,
-    -0.093643201424792,
-    0.133016346521752,
-    0.060659593855730,
-    -0.121772809978612,
-    -0.131493160498757,
-    -0.022545081856496,
-    0.070281905857624,
-    -0.154167597771692,
-    0.001294752039427,
-    -0.360384785961190,
-    0.002808302114687,
-    -0.122701292921700,
-    0.178907501062691,
-    0.102449687356762,
-    0.017468174284969,
-    0.025082428855666,
-    -0.074745337545581,
-    0.034238148869820,
-    0.036609584127662,
-    0.106561775279539,
-    0.066766679044444,
-    -0.329382921125597,
-    0.136714247951189,
-    0.030138872169419,
-    0.053351491631155,
-    -0.269037163666661,
-    -0.008682017935154,
-    -0.075359918148559,
-    -0.066474358482196,
-    0.073465333389394,
-    0.002574228631636,
-    0.084801847266051,
-    -0.116986319268178,
-    0.407300792813019,
-    -0.107966684906971,
-    -0.022348218094623,
-    -0.050410744815899,
-    -0.050191645938535,
-    0.172975925983475,
-    -0.021887343023557,
-    0.239635688274541,
-    -0.008846949924369,
-    -0.114397545500679,
-    -0.128877198231761,
-    -0.170334100950162,
-    0.045412823112903,
-    -0.039407569746089,
-    0.065023751716413,
-    0.028832458321626,
-    0.007688433433833,
-    -0.163029881472192,
-    0.168279432314589,
-    -0.042279533218267,
-    -0.231977626108487,
-    -0.194119317043927,
-    0.173694600186492,
-    -0.009257361970915,
-    -0.033182569221877,
-    0.070391941761925,
-    -0.096564810988627,
-    0.051877098530088,
-    0.041617597308341,
-    -0.004544149034905,
-    0.306434500936651,
-    0.032374474638051,
-    0.134554007102392,
-    0.326819819840365,
-    -0.044398283970888,
-    0.025374636555700,
-    -0.043295611536309,
-    -0.200527169493189,
-    -0.296719469964261,
-    -0.017676590318052,
-    0.069596229838601,
-    0.003616320830783,
-    0.032334206378856,
-    0.082239817335593,
-    -0.195777230336447,
-    -0.001870997538733,
-    0.023737994169349,
-    -0.212367656593341,
-    0.252142649924868,
-    -0.054126508135453,
-    0.004875615752273,
-    0.145993332024095,
-    0.096031403217533,
-    0.152088250363501,
-    0.022349290519869,
-    0.084733335796544,
-    0.003419043527803,
-    -0.073611901592575,
-    0.035675299139344,
-    -0.074537825622768,
-    -0.092595733870700,
-    0.003955891927052,
-    0.066343249297799,
-    0.075986362551254,
-    0.063158445914260,
-    0.216085133110772,
-    0.008134473447823,
-    -0.087505035686609,
-    0.071221742655553,
-    -0.205067266690471,
-    0.150666678334461,
-    -0.012569003042802,
-    -0.161998691221942,
-    -0.001841728306171,
-    0.131136444225276,
-    -0.105012361547563,
-    0.018549156289929,
-    0.027676136585161,
-    -0.024151554569009,
-    -0.069954152286207,
-    -0.015955478440473,
-    0.018699381300239,
-    0.159790219621574,
-    0.086181417896915,
-    0.009914730599460,
-    -0.051778409697544,
-    -0.079617005473090,
-    0.021220360100580,
-    0.111455097990423,
-    0.003212455485434,
-    0.006234504516924,
-    -0.059381004902015,
-    0.022169797397807,
-    -0.016150104328616,
-    0.009330595387393,
-    0.039677118973708,
-    -0.014710982735785,
-    -0.000183710930647,
-    -0.006093488564998,
-    0.000443517420323,
-    0.011301111864868,
-    0.011301111864868,
-    0.677777464335497,
-    0.677690896370574,
-    0.011211563471251,
-    0.011211563471251,
-    0.677733776345329,
-    0.677648580427145,
-    -0.020587769339745,
-    -0.001138022839833,
-    -0.008527733279531,
-    0.002747430174215,
-    0.009923421885042,
-    0.009923421885042,
-    0.676222595243878,
-    0.676156001416825,
-    0.009750971309123,
-    0.009750971309123,
-    0.676135988111027,
-    0.676071697070059,
-    0.098607738895177,
-    0.005653909063150,
-    0.007070644263573,
-    -0.058724140789015,
-    0.019614298785595,
-    -0.028424120318059,
-    0.010581966950622,
-    0.039238216405385,
-    -0.007394766797488,
-    -0.001002448926956,
-    -0.003063012698105,
-    0.002420125795043,
-    0.004594198277299,
-    0.004594198277299,
-    0.673164443718745,
-    0.673150235317233,
-    0.004573974197966,
-    0.004573974197966,
-    0.673152444759925,
-    0.673138361428774,
-    -0.011699296831905,
-    -0.001928272330743,
-    -0.004846007418003,
-    0.004655261212829,
-    0.003576089430159,
-    0.003576089430158,
-    0.671812661120957,
-    0.671804069646497,
-    0.003528367934447,
-    0.003528367934447,
-    0.671781348949061,
-    0.671772985635523,
-    -0.161717990635393,
-    -0.002335257928130,
-    0.116485879700668,
-    -0.122871913948532,
-    0.010146837703790,
-    0.020786385942298,
-    -0.016496130348058,
-    -0.062283542353887,
-    -0.015927831845780,
-    0.023710271643317,
-    0.141938455096485,
-    0.100838373766083,
-    0.005423597747363,
-    -0.038888592854706,
-    -0.054380453914610,
-    0.018893506016365,
-    0.112445864290040,
-    0.003563623191472,
-    -0.006288361446198,
-    -0.048293802537937,
-    0.022366873067984,
-    -0.017915543605542,
-    -0.009411197978102,
-    0.032268887199743,
-    -0.005116554765319,
-    0.001309679184655,
-    -0.002119346376419,
-    -0.003161845249950,
-    0.017493381378668,
-    0.017493381378668,
-    0.669294106094234,
-    0.669089258439700,
-    0.017486682588575,
-    0.017486682588575,
-    0.669286935857594,
-    0.669082247275679,
-    -0.011074073741618,
-    0.000687602281743,
-    -0.004587031534498,
-    -0.001660018754101,
-    0.015737841385271,
-    0.015737841385271,
-    0.667856538152424,
-    0.667691103187849,
-    0.015688206566531,
-    0.015688206566531,
-    0.667831488000036,
-    0.667667101198982,
-    0.099751258156890,
-    0.004412535290678,
-    -0.005784544654965,
-    -0.048712522983330,
-    0.019841758909086,
-    -0.022183312927221,
-    -0.008657182865016,
-    0.032548667256614,
-    0.001707811966764,
-    0.000800479792950,
-    0.000707398878617,
-    -0.001932529172545,
-    0.010390409865919,
-    0.010390409865919,
-    0.665080591484076,
-    0.665008785096604,
-    0.010390748640355,
-    0.010390748640355,
-    0.665079298168966,
-    0.665007487238381,
-    -0.002858996289637,
-    0.000163348255893,
-    -0.001184235037941,
-    -0.000394357574766,
-    0.009090891204475,
-    0.009090891204475,
-    0.663871615549252,
-    0.663816748075040,
-    0.009087570431088,
-    0.009087570431088,
-    0.663869975909231,
-    0.663815148649383,
-    0.006770147092331,
-    0.002864338641885,
-    0.028722675411169,
-    0.081665355745213,
-    -0.184075967976993,
-    0.005443499241945,
-    0.003719018025717,
-    -0.199532358683210,
-    0.219619611009106,
-    -0.053204067364563,
-    0.003043608828234,
-    0.183872177974620,
-    0.065326294515160,
-    0.151888736076480,
-    0.027217315939475,
-    0.101016201368401,
-    0.000332595999123,
-    -0.058304952491895,
-    0.031690588764405,
-    -0.074017163986616,
-    -0.087061448941215,
-    -0.011509312150553,
-    0.010393959079392,
-    0.071393819524233,
-    0.055011848760067,
-    0.212402543126109,
-    0.005077954551133,
-    -0.110208742223845,
-    0.048449282013096,
-    -0.204798252815913,
-    0.183484240009081,
-    -0.014984337987358,
-    -0.176504117027604,
-    -0.001755844625078,
-    0.132860885522871,
-    -0.066998901594169,
-    0.002085271600137,
-    0.016324593994260,
-    -0.047814195821104,
-    -0.089781864543746,
-    -0.017384138184366,
-    0.017827389652577,
-    0.161891457422363,
-    0.054984577547149,
-    0.001114600891756,
-    -0.030541167239146,
-    -0.157622279737849,
-    0.027235030857425,
-    0.085042091875791,
-    -0.002236277569487,
-    0.005673881242284,
-    -0.049625159890286,
-    0.016915923821932,
-    0.011242526540441,
-    0.008491563363882,
-    0.033158471742019,
-    -0.009488965595007,
-    -0.006797589012646,
-    -0.003930458242343,
-    0.016410831585769,
-    0.012974707388364,
-    0.012974707388364,
-    0.662824248812863,
-    0.662712657575664,
-    0.013048955978821,
-    0.013048955978821,
-    0.662755119652972,
-    0.662642259248383,
-    -0.012913883232448,
-    -0.007460203886135,
-    -0.005349105577782,
-    0.018010525399975,
-    0.012271371528494,
-    0.012271371528494,
-    0.661891356978339,
-    0.661791677530576,
-    0.012336655011264,
-    0.012336655011264,
-    0.661796664915743,
-    0.661695936392611,
-    0.069622700015086,
-    0.001403138656276,
-    0.006005626739801,
-    -0.041889308567074,
-    0.013848816083365,
-    -0.007054054379620,
-    0.008988055587205,
-    0.027989541141729,
-    -0.005402240911727,
-    -0.010257357535371,
-    -0.002237681452844,
-    0.024763451676002,
-    0.008588984425508,
-    0.008588984425508,
-    0.657628718322922,
-    0.657580202833061,
-    0.008830957868887,
-    0.008830957868887,
-    0.657506335056100,
-    0.657455056887892,
-    -0.007711877337006,
-    -0.010720916099073,
-    -0.003194364184345,
-    0.025882581047446,
-    0.008151288160910,
-    0.008151288160910,
-    0.656996945030926,
-    0.656953290404943,
-    0.008404212017506,
-    0.008404212017506,
-    0.656857929671956,
-    0.656811533645722,
-    -0.174880678786531,
-    -0.002264886974540,
-    0.120011779629004,
-    -0.084540724345334,
-    0.000547863530892,
-    0.005250884656607,
-    -0.039219021892890,
-    -0.078135700774397,
-    -0.017224243473739,
-    0.022995783361178,
-    0.146234776590033,
-    0.069380779431506,
-    0.000292839158244,
-    -0.009823714237994,
-    -0.129287788567541,
-    0.023702205701244,
-    0.087423042348620,
-    -0.001780847396988,
-    -0.001770891817029,
-    -0.042311201692347,
-    0.017389524317096,
-    0.008952924448330,
-    -0.002650326898422,
-    0.028271441115522,
-    -0.000763227388897,
-    -0.005957902461459,
-    -0.000316139135655,
-    0.014383648925752,
-    0.020611063345333,
-    0.020611063345333,
-    0.654818077685706,
-    0.654539841421438,
-    0.020696455908567,
-    0.020696455908567,
-    0.654779438491496,
-    0.654498908019892,
-    -0.004409555028023,
-    -0.006451952714964,
-    -0.001826497496637,
-    0.015576391748256,
-    0.019643643345184,
-    0.019643643345184,
-    0.653938331735117,
-    0.653685946066034,
-    0.019736029950961,
-    0.019736029950961,
-    0.653889322421669,
-    0.653634575794473,
-    0.072403605357449,
-    0.000600234703879,
-    -0.001736530434959,
-    -0.037444699052228,
-    0.014401972548473,
-    -0.003017583631354,
-    -0.002598901456003,
-    0.025019748010016,
-    0.002502023063453,
-    -0.008401355001101,
-    0.001036371886253,
-    0.020282665185968,
-    0.015520546408151,
-    0.015520546408151,
-    0.650342120975816,
-    0.650185442905515,
-    0.015688314577199,
-    0.015688314577199,
-    0.650264256458452,
-    0.650104191629265,
-    -0.000017915311277,
-    -0.008787743485549,
-    -0.000007420764905,
-    0.021215489505468,
-    0.014904437004360,
-    0.014904437004360,
-    0.649728571727749,
-    0.649584223531166,
-    0.015090838431273,
-    0.015090838431273,
-    0.649644717723143,
-    0.649496755069884,
-    -0.226090142785122,
-    -0.001922815997417,
-    -0.132382628451459,
-    0.104622300095464,
-    0.049459858129124,
-    0.016592686792458,
-    0.011782326532211,
-    -0.056132774035360,
-    0.007120401782447,
-    0.012807916521528,
-    0.064711289785441,
-    -0.060702227413063,
-    -0.278064237815166,
-    0.147562074452668,
-    0.009057948417801,
-    -0.016930606669913,
-    0.084169555903784,
-    -0.012373910295966,
-    -0.152218235399013,
-    -0.069017296821635,
-    0.068194422026721,
-    0.012330424489372,
-    0.099612769698089,
-    -0.111154266572362,
-    0.424860331800069,
-    -0.106347158448515,
-    -0.033776319989812,
-    -0.126567917344570,
-    -0.107585454925264,
-    0.146285811623791,
-    -0.021613879462388,
-    0.250341786904889,
-    -0.005550201477787,
-    0.078326840051863,
-    -0.139045822934136,
-    -0.099608710200777,
-    0.021924047270008,
-    -0.037432501610168,
-    0.030544532966914,
-    0.021652800308305,
-    0.001598939689601,
-    -0.057036242343781,
-    0.102190293666493,
-    0.038439261575736,
-    -0.195834931494313,
-    -0.209522047216058,
-    0.052202243006833,
-    0.002937738937346,
-    0.010381324561586,
-    0.100325014233625,
-    -0.195049642985964,
-    0.053861627088214,
-    0.038631662903374,
-    -0.021766243236799,
-    0.359954297617897,
-    0.030760528295696,
-    0.140354895230452,
-    0.321917443280085,
-    -0.067102023080761,
-    0.063708935742949,
-    -0.092803851643072,
-    -0.169585909571804,
-    -0.293012214915664,
-    -0.018466319597342,
-    0.073770268306715,
-    0.000737151147603,
-    0.011497717182243,
-    0.009523178634051,
-    -0.150854510099045,
-    -0.017116612768309,
-    -0.005247819778468,
-    -0.181960829814301,
-    0.034564636345106,
-    -0.038050658949930,
-    0.005003236541745,
-    0.151244022528344,
-    0.094442862989642,
-    0.151199211737709,
-    0.022300965918805,
-    0.083024237767173,
-    0.003624100888558,
-    -0.015005056319762,
-    0.012685776019675,
-    -0.008631305995037,
-    -0.071348869561189,
-    0.036190037061525,
-    -0.014666673744594,
-    0.065106625962693,
-    0.008657990688203,
-    0.151906745648028,
-    0.008347395871594,
-    -0.090652178460759,
-    0.070043600927762,
-    -0.203868536870530,
-    0.150340900336370,
-    -0.012315482298816,
-    -0.224835140836596,
-    -0.007511103254543,
-    0.141939882891295,
-    -0.099997877492567,
-    -0.074829511331465,
-    0.021722898623756,
-    -0.014511374153531,
-    -0.039282251414572,
-    -0.022144328545002,
-    0.076261511142291,
-    0.172954247724593,
-    0.082066137186031,
-    -0.039997207104422,
-    -0.040640684847687,
-    -0.047837589588800,
-    0.011916140691236,
-    0.081610365568302,
-    0.001814556811935,
-    -0.039727280765851,
-    -0.055188058450931,
-    0.016233311017910,
-    -0.009122393121343,
-    -0.059456077329201,
-    0.036875481725154,
-    -0.020364391074677,
-    0.012538647922235,
-    -0.008435206972600,
-    -0.030270973867682,
-    -0.002724085227784,
-    -0.002724085227784,
-    0.644608655713022,
-    0.644603872286288,
-    -0.002516146715330,
-    -0.002516146715330,
-    0.644356939304835,
-    0.644352859871816,
-    -0.023532124150235,
-    0.012674571703610,
-    -0.009747324974474,
-    -0.030599122904125,
-    -0.002256187198929,
-    -0.002256187198929,
-    0.643288648843387,
-    0.643285374250945,
-    -0.002097594753664,
-    -0.002097594753664,
-    0.643007606637773,
-    0.643004777459969,
-    0.058925014985621,
-    0.005176802721353,
-    -0.041136332859675,
-    -0.054850456713825,
-    0.011720914228672,
-    -0.026025544763999,
-    -0.061564872812715,
-    0.036649903456295,
-    -0.018978394256994,
-    0.012991368850041,
-    -0.007861108293310,
-    -0.031363938871561,
-    -0.013001245874700,
-    -0.013001245874700,
-    0.638947997440748,
-    0.638839985401372,
-    -0.012742858756588,
-    -0.012742858756589,
-    0.638694303875736,
-    0.638590583985988,
-    -0.020322811409140,
-    0.013208522377716,
-    -0.008417984111216,
-    -0.031888193863190,
-    -0.012018429312329,
-    -0.012018429312330,
-    0.637816719779122,
-    0.637724585191719,
-    -0.011768171628747,
-    -0.011768171628747,
-    0.637547627898960,
-    0.637459327900257,
-    -0.227310046537395,
-    -0.007504868651609,
-    0.133889606331872,
-    -0.114334586584662,
-    -0.064505982971901,
-    0.014311402801439,
-    -0.006877484270347,
-    -0.031493383802768,
-    -0.022388085480650,
-    0.076198210156409,
-    0.163144957354978,
-    0.093831970268193,
-    -0.034479166233932,
-    -0.026774751429604,
-    -0.022672027228260,
-    0.009553413532139,
-    0.080627446758107,
-    0.001940144862788,
-    -0.039046836010696,
-    -0.044539765228355,
-    0.016037796310432,
-    -0.009753766889136,
-    -0.058437719787461,
-    0.029760519663528,
-    -0.013048556582984,
-    0.009891466559553,
-    -0.005404889106064,
-    -0.023880112719833,
-    0.001884043428194,
-    0.001884043428194,
-    0.639500536759181,
-    0.639498266771488,
-    0.002049797385857,
-    0.002049797385857,
-    0.639362017143130,
-    0.639359330749712,
-    -0.016134479004600,
-    0.010288847652469,
-    -0.006683120025529,
-    -0.024839475543782,
-    0.002060176059910,
-    0.002060176059910,
-    0.638339124893180,
-    0.638336415568470,
-    0.002207991601473,
-    0.002207991601472,
-    0.638175269666690,
-    0.638172158409857,
-    0.057351836091413,
-    0.004226545027188,
-    -0.040274487466802,
-    -0.044756239979315,
-    0.011407989490513,
-    -0.021248276730427,
-    -0.060275030031215,
-    0.029905163467769,
-    -0.012009930588125,
-    0.010307544968795,
-    -0.004974676132760,
-    -0.024884614858434,
-    -0.008962538453295,
-    -0.008962538453295,
-    0.634046238112321,
-    0.633995304973846,
-    -0.008765727575622,
-    -0.008765727575622,
-    0.633903319232584,
-    0.633854609510613,
-    -0.013375061089768,
-    0.010760169681618,
-    -0.005540131700950,
-    -0.025977347578798,
-    -0.008211107736430,
-    -0.008211107736430,
-    0.633094997768933,
-    0.633052311615184,
-    -0.008005610907380,
-    -0.008005610907380,
-    0.632935606153008,
-    0.632895040132823,
-    0.050716972650711,
-    0.001140995389521,
-    0.011076997975636,
-    0.008577150275985,
-    -0.149373392723466,
-    -0.015075206564264,
-    -0.014503111809712,
-    -0.180820442724395,
-    0.036043190709983,
-    -0.031449349213274,
-    0.003580345182041,
-    0.207340455978946,
-    0.054117032004824,
-    0.147116828072498,
-    0.024522121563477,
-    0.095383239615587,
-    0.002491565096174,
-    -0.023225494711668,
-    0.012221583907658,
-    -0.007773875870893,
-    -0.070648353213579,
-    0.031873846283472,
-    -0.040533482126643,
-    0.064698588937412,
-    0.009028349276539,
-    0.125552839913317,
-    0.005973445057433,
-    -0.124275086732872,
-    0.040135926348998,
-    -0.198364079703025,
-    0.165314715399944,
-    -0.014148767042989,
-    -0.225595076832069,
-    -0.007513530642068,
-    0.144384099426485,
-    -0.064532933745151,
-    -0.061368779439887,
-    0.006634129904533,
-    -0.037910922399612,
-    -0.059846769866964,
-    -0.022219175707657,
-    0.076286156821434,
-    0.175932534190022,
-    0.052960810034594,
-    -0.032802296010326,
-    -0.012411584078097,
-    -0.124975562444868,
-    0.018154319163751,
-    0.068228358390266,
-    -0.002866225028441,
-    -0.036633067288797,
-    -0.040732635143961,
-    0.013571464289836,
-    0.014409486278805,
-    -0.054825259608526,
-    0.027216676669356,
-    -0.014832401508453,
-    0.004674719079106,
-    -0.006143781867364,
-    -0.011285770201061,
-    0.007534988789756,
-    0.007534988789756,
-    0.632579605979624,
-    0.632543689584827,
-    0.007496616082092,
-    0.007496616082092,
-    0.632515059918138,
-    0.632479512045551,
-    -0.016972935032469,
-    0.005048634242222,
-    -0.007030419883725,
-    -0.012188481259034,
-    0.007843974041375,
-    0.007843974041375,
-    0.631654871002628,
-    0.631616005391026,
-    0.007786174640695,
-    0.007786174640695,
-    0.631573797890902,
-    0.631535507874688,
-    0.045326226945720,
-    0.001639634067612,
-    -0.037920556242392,
-    -0.035221399303149,
-    0.009015947106161,
-    -0.008242997100737,
-    -0.056752122995844,
-    0.023534186611990,
-    -0.015070877258945,
-    0.003049502558442,
-    -0.006242561757515,
-    -0.007362150435082,
-    -0.000864418536050,
-    -0.000864418536050,
-    0.626725461311026,
-    0.626724993009424,
-    -0.000936060212180,
-    -0.000936060212180,
-    0.626673855556612,
-    0.626673306459274,
-    -0.016025621068919,
-    0.003599308402562,
-    -0.006638029592198,
-    -0.008689499160629,
-    -0.000110143206445,
-    -0.000110143206445,
-    0.626050721244379,
-    0.626050713649428,
-    -0.000185260186188,
-    -0.000185260186188,
-    0.625989785811411,
-    0.625989764326604,
-    -0.226558194078429,
-    -0.007506802566084,
-    0.136408523015627,
-    -0.078222445873145,
-    -0.054557779261570,
-    -0.007545041344910,
-    -0.029552395939467,
-    -0.050792909558599,
-    -0.022314034476849,
-    0.076217845519588,
-    0.166214266214797,
-    0.064195502294831,
-    -0.029161740568053,
-    0.014115779517839,
-    -0.097421193428051,
-    0.015407860665364,
-    0.067681194316929,
-    -0.002932385518411,
-    -0.030972619478866,
-    -0.033368300394373,
-    0.013462626588663,
-    0.014742097522848,
-    -0.046353800796915,
-    0.022295985507195,
-    -0.007019498210485,
-    0.003114086085412,
-    -0.002907571359836,
-    -0.007518068861799,
-    0.012925859324245,
-    0.012925859324245,
-    0.627262851949219,
-    0.627158041470775,
-    0.012928860728484,
-    0.012928860728484,
-    0.627243439276041,
-    0.627138583358776,
-    -0.009119965126311,
-    0.003401262483047,
-    -0.003777613243687,
-    -0.008211374015763,
-    0.012882086065282,
-    0.012882086065282,
-    0.626504635501831,
-    0.626400659593975,
-    0.012875564991077,
-    0.012875564991077,
-    0.626476947225977,
-    0.626373081158578,
-    0.044545517590346,
-    0.000680932770416,
-    -0.031963369012838,
-    -0.030214576789668,
-    0.008860654360048,
-    -0.003423280208189,
-    -0.047836562258817,
-    0.020188734764629,
-    -0.007935285530863,
-    0.002191649632127,
-    -0.003286902888186,
-    -0.005291110265851,
-    0.003899634839356,
-    0.003899634839356,
-    0.621863510891221,
-    0.621854054046456,
-    0.003885148253317,
-    0.003885148253316,
-    0.621846907282683,
-    0.621837520820217,
-    -0.008883459409179,
-    0.002573190380317,
-    -0.003679649368072,
-    -0.006212231114729,
-    0.004353229249661,
-    0.004353229249661,
-    0.621345410125873,
-    0.621333635142926,
-    0.004336525968070,
-    0.004336525968070,
-    0.621323979609254,
-    0.621312295217713,
-    0.408067737237270,
-    -0.002728357020362,
-    -0.118939633569770,
-    0.242705747701082,
-    0.402658627875750,
-    0.248624391873768,
-    0.018319096035050,
-    0.116042732641272,
-    0.459611346628488,
-    0.006467554021555,
-    0.009949874338230,
-    -0.173759495774018,
-    0.178332435924595,
-    -0.245106439812871,
-    -0.016069611017043,
-    -0.335007604246945,
-    0.674902373132521,
-    0.030084076075157,
-    -0.258024190513835,
-    0.293902404024657,
-    0.338223397532770,
-    -0.018194383388350,
-    0.092065942132154,
-    0.629724820356286,
-    -0.415183146033391,
-    -0.025697214726560,
-    0.162836032260987,
-    0.158889006070282,
-    -0.206353132319382,
-    -0.116776881726027,
-    0.009510691763099,
-    -0.453849537833404,
-    -0.467223114824412,
-    0.009248332645952,
-    0.159066414074553,
-    -0.184268627639173,
-    0.296654199569667,
-    0.008787518181989,
-    0.077165598076427,
-    -0.210862683183187,
-    -0.263522628851451,
-    0.050852879549969,
-    -0.244964722306622,
-    0.560597193131911,
-    0.216650806330491,
-    0.029016229589687,
-    0.053939286401486,
-    0.387661450045235,
-    -0.155357497401293,
-    0.111882603694351,
-    0.156273097749666,
-    0.249297671941627,
-    -0.128854780740591,
-    -0.074571505556566,
-    -0.032215675630489,
-    0.227649257805083,
-    -0.367332367146929,
-    -0.063366041428010,
-    0.238424263542357,
-    -0.292676864233925,
-    -0.130500564357422,
-    0.314716809151883,
-    0.005526470715504,
-    -0.527161233268884,
-    0.281788402478709,
-    0.013084820962538,
-    -0.104287329361592,
-    0.110141778062011,
-    0.124189733208220,
-    0.169259901671927,
-    0.085580574454131,
-    -0.600678177012587,
-    0.062542721765382,
-    -0.124439615502921,
-    -0.077623626058236,
-    -0.144815978620545,
-    0.059290214369979,
-    -0.226294937303367,
-    0.010016928141394,
-    -0.588974681035787,
-    -0.502441173751633,
-    0.057855448805853,
-    0.133970172430678,
-    -0.296901446042065,
-    -0.212010791534125,
-    -0.043633691694092,
-    -0.026006746300772,
-    -0.233804921592540,
-    0.078985650695188,
-    0.058925061957589,
-    -0.081410474398462,
-    -0.190973536298288,
-    -0.251417688067379,
-    -0.111864188644547,
-    -0.037407708352329,
-    -0.200785292234423,
-    0.336097775573133,
-    0.033094800224070,
-    0.088346105942750,
-    -0.335668148581264,
-    0.097513391395157,
-    0.060564883641876,
-    0.102965730704738,
-    -0.065526220787136,
-    0.555949461589833,
-    0.077220319816264,
-    -0.157549173333692,
-    -0.056389460226860,
-    -0.000227559677554,
-    0.027451814528925,
-    0.058902084098831,
-    -0.179074027281092,
-    0.648452816365675,
-    0.028038359179757,
-    0.126890010149303,
-    -0.318120516552723,
-    -0.269071703732380,
-    -0.016790504264539,
-    -0.049276952494265,
-    0.183484278919918,
-    0.049384407568003,
-    -0.163003046839417,
-    0.132308107495878,
-    0.142119941301608,
-    0.588959651089463,
-    0.171500706578871,
-    -0.000351049707857,
-    -0.560466947101471,
-    0.002503903700009,
-    0.444647482116895,
-    -0.120408272358271,
-    -0.239745427215759,
-    0.169688661235956,
-    -0.589967271585241,
-    0.045005307361562,
-    -0.047234383854927,
-    0.094357722411254,
-    -0.031503104751595,
-    0.015090671957123,
-    0.114566478745163,
-    0.120747228891964,
-    0.361999433641193,
-    -0.083460564342267,
-    0.064502821547226,
-    0.070655983394628,
-    -0.287361570261100,
-    -0.318366968658579,
-    -0.238196601261916,
-    0.183461220088182,
-    0.033542599153445,
-    0.310343176932371,
-    -0.186813222198652,
-    -0.128731606972477,
-    0.082878251156686,
-    0.309193382441053,
-    -0.083678554547684,
-    -0.171479337930422,
-    0.140525824379122,
-    0.103041502239616,
-    0.041890141033845,
-    -0.025827866489984,
-    -0.167301266926164,
-    0.177681685177950,
-    0.164963258850454,
-    0.142540926957984,
-    -0.018288460922196,
-    0.219908084725142,
-    0.073991572798099,
-    -0.067730057422132,
-    -0.197857273620075,
-    -0.414444846982482,
-    -0.331350568697589,
-    0.162749192040896,
-    -0.038626241140986,
-    0.379665162956512,
-    -0.055075324314599,
-    -0.024020244404724,
-    -0.723631326135652,
-    0.213434610057660,
-    -0.182531405968181,
-    -0.078311247627686,
-    0.122701339706279,
-    -0.132044460696135,
-    -0.055540948922113,
-    -0.133981730400036,
-    0.173728148793025,
-    0.512213920550251,
-    0.136234614115710,
-    -0.119745514828668,
-    -0.342983378257235,
-    0.128588680562281,
-    0.022656279738271,
-    0.008647873321332,
-    -0.426365033199341,
-    -0.110890989507680,
-    -0.103582734144769,
-    0.055963766842554,
-    -0.375606275585843,
-    0.225979064065307,
-    0.227482946986329,
-    0.014448107805920,
-    0.538672077585234,
-    -0.124261468645813,
-    0.090463612688660,
-    0.042303497802134,
-    0.317162316135471,
-    0.059908983021015,
-    0.098478003790640,
-    -0.065102457017531,
-    -0.446510945018804,
-    0.173855904283704,
-    0.228786811037886,
-    -0.121826998946607,
-    0.075934017858186,
-    -0.096270454740710,
-    0.063160658128232,
-    0.026631975033870,
-    -0.174761141637284,
-    -0.164236434344492,
-    0.094663807392370,
-    -0.219579310516331,
-    0.128084178880110,
-    -0.553386187144518,
-    0.013572651121090,
-    0.026866517639626,
-    -0.414013043578901,
-    0.103697414407276,
-    0.285976019611253,
-    0.049836383376749,
-    -0.118505533572244,
-    0.318224189376782,
-    0.021201892970111,
-    0.157530738956420,
-    -0.272522020210439,
-    -0.282135877157173,
-    0.031488773895016,
-    -0.000179846832828,
-    -0.034734701546833,
-    0.502948266353810,
-    0.020972004717890,
-    0.116620309142029,
-    -0.155903831074935,
-    0.182538929723240,
-    0.221138119059200,
-    -0.172709879178308,
-    0.026158605462982,
-    -0.225915710652751,
-    -0.040021767718820,
-    0.019398605720617,
-    0.414968426900271,
-    0.303495312961776,
-    -0.061956872702713,
-    0.567666341369974,
-    -0.177933741966328,
-    -0.019068581732801,
-    0.010318111792398,
-    -0.119892753550810,
-    -0.004023740026125,
-    -0.242207139640231,
-    -0.334405467109032,
-    0.429746803188314,
-    -0.011509578838040,
-    -0.038271195920525,
-    -0.191989782035876,
-    0.442336664027008,
-    -0.008050363598978,
-    0.096323820110379,
-    0.210335899415627,
-    -0.116589658622713,
-    -0.098350159296377,
-    -0.056337545829166,
-    0.354178533160968,
-    -0.142968705041684,
-    0.028846811430833,
-    0.180038396586669,
-    0.332538445908488,
-    0.464255204459552,
-    0.048948603137897,
-    0.045595961455855,
-    -0.302831161524872,
-    -0.023021792116292,
-    -0.105430896506527,
-    -0.055419034609894,
-    -0.198495627970554,
-    -0.383336353318454,
-    0.049270946503342,
-    -0.010679662221250,
-    0.526689765775300,
-    -0.428398854448386,
-    -0.034472978571316,
-    0.017855407273963,
-    0.293687678916260,
-    -0.535749346363642,
-    0.171849171033951,
-    0.000511817775864,
-    0.280817626113103,
-    -0.046162481826544,
-    0.045841738500570,
-    0.130459581771345,
-    -0.157086250119343,
-    -0.141257580831227,
-    -0.168967478620038,
-    0.007560554394499,
-    -0.367679578436162,
-    -0.006012300659939,
-    0.041231975225259,
-    -0.061769388826007,
-    -0.118878758741066,
-    -0.158549610809626,
-    -0.142469340422045,
-    -0.033856607685275,
-    0.155803030177244,
-    0.535001604822885,
-    0.010779670414345,
-    -0.011440002090459,
-    0.320454436621840,
-    -0.035131434150462,
-    -0.149589267495409,
-    0.012341235218441,
-    0.141363096557983,
-    -0.001471379307533,
-    0.327867375077672,
-    -0.248225961422716,
-    0.326297020683513,
-    0.184217460531732,
-    0.026849814873217,
-    -0.095699953295990,
-    0.076778287867166,
-    0.093643390139869,
-    0.038026933596247,
-    0.148060344682849,
-    -0.136838512577178,
-    -0.079989491093928,
-    0.143351474562942,
-    -0.302588419779986,
-    -0.065942871700673,
-    -0.015854930812695,
-    -0.260120420806083,
-    0.224950859281201,
-    -0.266145631966434,
-    0.255523304786775,
-    -0.088933742371394,
-    0.157230366876376,
-    0.087819409461633,
-    -0.007293269830249,
-    0.332801094502239,
-    -0.106814323473189,
-    0.102986525764716,
-    -0.322549129963097,
-    -0.058556490167254,
-    -0.124016497418608,
-    -0.045355810807041,
-    -0.026319263067439,
-    0.561116946607991,
-    0.020192960192809,
-    -0.259690162726274,
-    -0.261483297981587,
-    -0.352099280394789,
-    0.001487744623454,
-    -0.096607610308439,
-    -0.012167029635161,
-    -0.173926462241434,
-    0.223842990155868,
-    0.091552594424900,
-    -0.107475569906384,
-    0.222077792095546,
-    0.055667512512820,
-    0.049936872100636,
-    -0.000967387367665,
-    -0.256256221802807,
-    -0.085458567607380,
-    0.085925478011354,
-    -0.097695404570265,
-    0.231213111564245,
-    -0.142563472488662,
-    -0.037000796745517,
-    0.198865672627210,
-    -0.029000183364716,
-    -0.024976333631751,
-    -0.146778925958385,
-    -0.032635432647119,
-    0.161030054586837,
-    0.335066642406006,
-    -0.005206711158417,
-    -0.233585172772851,
-    -0.004577939226703,
-    0.023472518074566,
-    0.098997069296459,
-    0.193845590031840,
-    0.051014935358721,
-    -0.000798898876843,
-    -0.038938474757274,
-    0.151447326994088,
-    0.060465206567926,
-    0.000734587267665,
-    -0.030347121741248,
-    -0.059819317145105,
-    0.100077468849288,
-    0.021322969720993,
-    0.015256851748768,
-    0.030272776078741,
-    0.004576289614119,
-    0.006180231874461,
-    -0.037067855064591,
-    0.064538092826740,
-    -0.049167733505128,
-    0.101063812651450,
-    0.044572824018264,
-    0.402944147381671,
-    -0.064794953272156,
-    0.033701902574560,
-    0.035269153562943,
-    0.002234190138865,
-    0.054665718944757,
-    -0.024192338570365,
-    0.004348573591497,
-    -0.005734194136651,
-    0.186484569536801,
-    0.024653956717674,
-    -0.094253045261664,
-    0.085925840463301,
-    -0.115087850077778,
-    -0.002071067459747,
-    0.015020227179546,
-    0.034008634542525,
-    -0.269263792387966,
-    0.001160040061869,
-    0.019217102903731,
-    -0.042129516428268,
-    -0.142099087663812,
-    0.122887302472932,
-    -0.002647314908298,
-    0.003733790804515,
-    -0.037103575966853,
-    0.007919235284289,
-    0.028928038019350,
-    0.036560377995907,
-    0.086793187679546,
-    0.365197693104978,
-    -0.012334961641263,
-    0.133114765856964,
-    0.196137122976570,
-    0.066954181068451,
-    -0.017753000011312,
-    0.001927225667575,
-    -0.063372760261157,
-    -0.327967532197426,
-    -0.000320770058904,
-    -0.040898603068284,
-    0.003542865350589,
-    0.058285447565201,
-    0.023001755840110,
-    -0.159938641063097,
-    -0.043401997797681,
-    0.066723753621794,
-    -0.166812897947405,
-    0.113006620872227,
-    -0.047903649862245,
-    0.036837061573659,
-    0.110517181180904,
-    0.198145685631051,
-    0.094849567942133,
-    0.046303793485666,
-    0.189951285143558,
-    -0.002009219528717,
-    -0.072116680943594,
-    0.064308081447727,
-    -0.020847576288154,
-    -0.075645343526768,
-    0.091765814305903,
-    0.186480398850691,
-    0.059686609274635,
-    0.028306684943775,
-    0.191242090309443,
-    0.061458924265525,
-    -0.066241449175380,
-    0.146954855989716,
-    -0.127889837631620,
-    0.312154819973750,
-    -0.028176611465950,
-    -0.093918653310702,
-    -0.017225862648882,
-    0.121582964864555,
-    -0.020791746751619,
-    -0.071178454161853,
-    0.012932678103839,
-    -0.016583561838814,
-    -0.034722851901431,
-    -0.009250179965986,
-    0.174897118547643,
-    0.148149271338904,
-    0.017063345583332,
-    -0.038045676389272,
-    -0.024195338944312,
-    -0.054668676913182,
-    0.010533061969685,
-    0.045042954144511,
-    -0.005668428310497,
-    0.018116390637041,
-    -0.016592077914472,
-    0.008959600642658,
-    0.028497113503647,
-    0.027113094626096,
-    0.011086472021143,
-    -0.001396791923806,
-    0.009481452162237,
-    -0.000578570158653,
-    -0.022890250401064,
-    0.002552111493322,
-    0.002552111493322,
-    0.652779753613330,
-    0.652775501866691,
-    0.002768399742695,
-    0.002768399742695,
-    0.652679554030564,
-    0.652674551851056,
-    -0.001981973592253,
-    0.009608730552756,
-    -0.000820960342176,
-    -0.023197527617651,
-    0.002285526065204,
-    0.002285526065204,
-    0.652420468018212,
-    0.652417060006577,
-    0.002506865481671,
-    0.002506865481671,
-    0.652317209039924,
-    0.652313109621380,
-    0.056011476575975,
-    -0.002090186677518,
-    0.016511742228337,
-    -0.015781067825146,
-    0.011141375406157,
-    0.010508078029805,
-    0.024711568570577,
-    0.010544572404319,
-    -0.001463282733965,
-    0.009753349904539,
-    -0.000606111553994,
-    -0.023546669618109,
-    -0.003283026992815,
-    -0.003283026992815,
-    0.649117120805734,
-    0.649110124410884,
-    -0.003054184973409,
-    -0.003054184973409,
-    0.649010805164330,
-    0.649004751133545,
-    -0.002919285560340,
-    0.009853431399686,
-    -0.001209207671532,
-    -0.023788287721035,
-    -0.003661936659844,
-    -0.003661936659844,
-    0.648744462957996,
-    0.648735763379076,
-    -0.003430998516679,
-    -0.003430998516679,
-    0.648634760915858,
-    0.648627125304136,
-    -0.092168201588377,
-    -0.016912354831470,
-    0.115017348155600,
-    -0.017653384090547,
-    -0.059785999735177,
-    0.010201658249175,
-    -0.021945747570401,
-    -0.002524305090199,
-    -0.009077775519345,
-    0.171714020259617,
-    0.140149044231384,
-    0.014487757909462,
-    -0.031956282632402,
-    -0.019085960166251,
-    -0.072345434304498,
-    0.000765739577522,
-    0.045639295354343,
-    -0.006932809886419,
-    0.013527755794662,
-    -0.028593140967507,
-    0.009078220284472,
-    0.034853588933396,
-    0.020245717278224,
-    0.019105325985504,
-    0.010224609728458,
-    0.002314551957129,
-    0.004235172019500,
-    -0.005587822725718,
-    0.010291015097688,
-    0.010291015097688,
-    0.643844543668954,
-    0.643776353706854,
-    0.010260649421316,
-    0.010260649421315,
-    0.643818739411179,
-    0.643750954009322,
-    0.009807031742312,
-    0.002201622963168,
-    0.004062205554290,
-    -0.005315188016912,
-    0.009997393933558,
-    0.009997393933558,
-    0.643422577130362,
-    0.643358265190237,
-    0.009969261352651,
-    0.009969261352651,
-    0.643398946534975,
-    0.643334998398725,
-    0.056207776794143,
-    -0.003725899772199,
-    0.012378988316157,
-    -0.026215681582775,
-    0.011180421947270,
-    0.018731363068478,
-    0.018526465249930,
-    0.017516758412106,
-    0.009561189437593,
-    0.002242186405932,
-    0.003960374337470,
-    -0.005413116830569,
-    0.004856883217564,
-    0.004856883217564,
-    0.640459111735953,
-    0.640444003566287,
-    0.004831153933216,
-    0.004831153933216,
-    0.640436386244467,
-    0.640421438253817,
-    0.008210183165896,
-    0.002146901234914,
-    0.003400769216882,
-    -0.005183078078405,
-    0.004470002407714,
-    0.004470002407714,
-    0.640043657345034,
-    0.640030868555177,
-    0.004453208767445,
-    0.004453208767445,
-    0.640025936516919,
-    0.640013243992987,
-    -0.051226253355091,
-    0.003110582182251,
-    0.048266732714537,
-    0.022358323400163,
-    -0.135821718570861,
-    -0.043674740367624,
-    0.070808702039112,
-    -0.159763558761756,
-    0.113230416265006,
-    -0.048150257946528,
-    0.037983408207957,
-    0.174232285060515,
-    0.138687686398525,
-    0.096031924447781,
-    0.046767039544242,
-    0.243812335287887,
-    -0.002516584452828,
-    -0.063317354905680,
-    0.053254133034664,
-    -0.020264403117753,
-    -0.064238888685039,
-    0.092342480019388,
-    0.197897064862377,
-    0.057164315382524,
-    0.028362742771417,
-    0.192226604968789,
-    0.063371488079511,
-    -0.104430812767966,
-    0.102857798378671,
-    -0.129484060829582,
-    0.315277771229640,
-    -0.036166143528961,
-    -0.110997440904030,
-    -0.015736326896062,
-    0.104475389658665,
-    -0.018420151590776,
-    -0.071261289990902,
-    -0.000799560747990,
-    -0.035876258196745,
-    -0.054907225894124,
-    -0.010932293723691,
-    0.159773608250829,
-    0.127303630636266,
-    0.015117027734397,
-    -0.038089953062355,
-    0.001495872946723,
-    -0.118268173464472,
-    0.016655924881059,
-    0.041616736506411,
-    -0.003625907572559,
-    0.028119365181179,
-    0.000736939159488,
-    0.008278083581106,
-    0.018228668334324,
-    0.042083603972648,
-    -0.000492407003815,
-    -0.001236826712607,
-    0.004646644363105,
-    -0.000512310398667,
-    -0.011217991840933,
-    0.005449437660208,
-    0.005449437660208,
-    0.644003173664253,
-    0.643984048823230,
-    0.005500930794481,
-    0.005500930794481,
-    0.643979328292217,
-    0.643959841028593,
-    -0.001909691279452,
-    0.005137208234305,
-    -0.000791020027894,
-    -0.012402317791993,
-    0.005518006746711,
-    0.005518006746711,
-    0.643626934078740,
-    0.643607336371030,
-    0.005580211338885,
-    0.005580211338885,
-    0.643597470079826,
-    0.643577428941545,
-    0.048269731186561,
-    -0.000999629604538,
-    0.026304919404638,
-    0.005765021637084,
-    0.009601446503098,
-    0.005025477388393,
-    0.039368093967433,
-    -0.003852064305042,
-    -0.003459920341245,
-    0.003520853204820,
-    -0.001433145930074,
-    -0.008500091558200,
-    0.001849961960267,
-    0.001849961960267,
-    0.640302003038075,
-    0.640299811690839,
-    0.001874932022837,
-    0.001874932022837,
-    0.640286237303573,
-    0.640283986456529,
-    -0.004568017891043,
-    0.003941045006922,
-    -0.001892134963632,
-    -0.009514524305633,
-    0.001819918862428,
-    0.001819918862428,
-    0.639924948857693,
-    0.639922829355774,
-    0.001848774413301,
-    0.001848774413301,
-    0.639904103775053,
-    0.639901916600314,
-    -0.110312897741086,
-    -0.015532474761105,
-    0.100662455271200,
-    -0.012250945899148,
-    -0.059709670786458,
-    -0.009440066379049,
-    -0.036438612067254,
-    -0.033685934360030,
-    -0.010864872106915,
-    0.157703862790733,
-    0.122657556642304,
-    0.010054091467018,
-    -0.031915483959316,
-    0.017661121993759,
-    -0.120122005732630,
-    0.010218516472326,
-    0.041605758864198,
-    -0.005546284952518,
-    0.026938477498473,
-    -0.023317680607426,
-    0.008275899992305,
-    0.027883057376378,
-    0.040316280661651,
-    0.015580376067708,
-    0.009793664145682,
-    -0.001238040676908,
-    0.004056668514469,
-    0.002988894592961,
-    0.014642717103143,
-    0.014642717103143,
-    0.635017932819166,
-    0.634881764555535,
-    0.014606701027176,
-    0.014606701027176,
-    0.634998096308372,
-    0.634862601379725,
-    0.009335192885033,
-    -0.000938195258950,
-    0.003866763500350,
-    0.002265003718313,
-    0.014735502524291,
-    0.014735502524291,
-    0.634561348394315,
-    0.634423547931669,
-    0.014701543440307,
-    0.014701543440307,
-    0.634543880184760,
-    0.634406717977985,
-    0.048001477777993,
-    -0.003084606226109,
-    0.025776271549761,
-    -0.017233888281816,
-    0.009548087582542,
-    0.015507362698178,
-    0.038576916541404,
-    0.011515315998198,
-    0.007278945077771,
-    -0.002413339147256,
-    0.003015037770982,
-    0.005826316099913,
-    0.011020554240100,
-    0.011020554240100,
-    0.631575645339164,
-    0.631498934166318,
-    0.011012670335062,
-    0.011012670335062,
-    0.631559509754348,
-    0.631482910261493,
-    0.006286679591773,
-    -0.002083245324444,
-    0.002604027949207,
-    0.005029399116023,
-    0.011008319969011,
-    0.011008319969011,
-    0.631160536053415,
-    0.631084045422701,
-    0.011002427955678,
-    0.011002427955678,
-    0.631148512714732,
-    0.631072105403196,
-    -0.186166566592169,
-    -0.005960167359028,
-    -0.061115211684706,
-    0.087239155262061,
-    0.092664725913228,
-    0.044353568911132,
-    0.001089557654066,
-    -0.057313430337881,
-    0.175176492700096,
-    0.048806828923506,
-    -0.083975602718584,
-    -0.063001813354982,
-    -0.007036741541014,
-    0.089795018205867,
-    -0.002766728715928,
-    -0.137607820574784,
-    0.117194274555295,
-    -0.005586618052167,
-    -0.077227510188059,
-    -0.073274309876305,
-    0.077763369152071,
-    -0.040401375327273,
-    0.106613719292192,
-    -0.025248933893518,
-    0.429672540628231,
-    -0.066380172117996,
-    0.042923221111429,
-    0.033363279604524,
-    -0.144839135239004,
-    0.011715029346155,
-    -0.022631771187416,
-    0.053685106752395,
-    -0.004570132692589,
-    0.242790301328711,
-    -0.064191314237351,
-    -0.083058580500811,
-    0.041075448010387,
-    -0.100060048167565,
-    0.002824572005618,
-    0.022108229700326,
-    0.039337196891639,
-    -0.217346679128769,
-    -0.132611968191112,
-    0.039895458313558,
-    -0.004955832538750,
-    -0.127499129529591,
-    -0.015945050479531,
-    0.023877221913415,
-    0.014454535108975,
-    0.045295102533943,
-    -0.098957909027064,
-    0.057183832683325,
-    0.044052404493383,
-    0.071318401343962,
-    0.385252478779226,
-    0.006987321039648,
-    0.141944634293739,
-    0.200935648911225,
-    0.085273794616722,
-    -0.016793663679495,
-    -0.124939097280100,
-    -0.013580974704761,
-    -0.306811436356380,
-    -0.003960051380805,
-    0.009014080586643,
-    0.005757397248011,
-    0.030671062600552,
-    -0.011376045388899,
-    -0.108751240401440,
-    -0.023490013332812,
-    0.061537102518600,
-    -0.169917230564198,
-    0.015682657094163,
-    -0.017883199860430,
-    0.046246613538355,
-    0.098102025867633,
-    0.196543267961740,
-    0.103616359907433,
-    0.038992807593372,
-    0.173285017505959,
-    0.000442833382790,
-    -0.117194513286083,
-    0.033840302754787,
-    0.010310646532861,
-    -0.051435506044368,
-    0.049665460368667,
-    0.171984680101034,
-    0.060797357245786,
-    0.003928301103239,
-    0.071393735812715,
-    0.077157813288321,
-    -0.058800091452526,
-    0.145766422049916,
-    -0.139710488218836,
-    0.262868156544189,
-    -0.025704404197349,
-    -0.120861828998697,
-    -0.016171358581655,
-    0.123432884271115,
-    -0.060465106258061,
-    -0.073345037525418,
-    0.005817425614411,
-    -0.013901005918021,
-    0.006540299034795,
-    -0.011903851150395,
-    0.164190559078669,
-    0.150403404657853,
-    0.049622430291189,
-    -0.039203739324063,
-    -0.010883637819934,
-    -0.045825475171555,
-    -0.001983978022009,
-    0.040246054827417,
-    -0.004989778333212,
-    -0.020667007906032,
-    -0.045679622713296,
-    0.008005438043413,
-    0.025085309671512,
-    -0.030930363129219,
-    0.030522148085238,
-    0.006474689026080,
-    0.020344323443305,
-    0.002681904006751,
-    -0.049115541574132,
-    -0.000977581973765,
-    -0.000977581973765,
-    0.622870323607470,
-    0.622869728350874,
-    0.000005689627723,
-    0.000005689627722,
-    0.622421822954621,
-    0.622421822934472,
-    0.005998512509112,
-    0.020031773658330,
-    0.002484665235339,
-    -0.048360979644327,
-    -0.000597975394494,
-    -0.000597975394494,
-    0.622337766534868,
-    0.622337544002667,
-    0.000357205673752,
-    0.000357205673752,
-    0.621904391768274,
-    0.621904312415823,
-    0.046480564554431,
-    -0.001825001234823,
-    -0.022549800460282,
-    -0.044747344890698,
-    0.009245559132665,
-    0.009174900781006,
-    -0.033748161315813,
-    0.029899219959572,
-    0.007260591662177,
-    0.020760615714658,
-    0.003007435537327,
-    -0.050120560021544,
-    -0.007880820375997,
-    -0.007880820375997,
-    0.619154578674416,
-    0.619116123442589,
-    -0.006860699962640,
-    -0.006860699962640,
-    0.618684315135134,
-    0.618655193471524,
-    0.006262423024484,
-    0.020521810049336,
-    0.002593980550060,
-    -0.049544032145552,
-    -0.007480465249118,
-    -0.007480465249118,
-    0.618613583084741,
-    0.618578966132995,
-    -0.006478610047848,
-    -0.006478610047848,
-    0.618156933550065,
-    0.618130987482791,
-    -0.114099654745411,
-    -0.016083037199569,
-    0.119902443656525,
-    -0.060148355392431,
-    -0.071080475035647,
-    0.004628997595310,
-    -0.018389615695456,
-    0.026662036386365,
-    -0.011237835118443,
-    0.163293817037479,
-    0.146101550322096,
-    0.049362479573790,
-    -0.037993305455224,
-    -0.008660245379313,
-    -0.060622438580079,
-    -0.008087840316026,
-    0.037077367733408,
-    -0.007294028167148,
-    -0.018553994207477,
-    -0.048359848385090,
-    0.007375146992058,
-    0.036669555861384,
-    -0.027768014651371,
-    0.032313017623934,
-    0.014179691796074,
-    0.012433553462519,
-    0.005873420652205,
-    -0.030017253397704,
-    0.004563570778227,
-    0.004563570778227,
-    0.616443941906692,
-    0.616431103601590,
-    0.004853683059153,
-    0.004853683059153,
-    0.616245739208321,
-    0.616231221372758,
-    0.014165232293939,
-    0.011999152523067,
-    0.005867431330315,
-    -0.028968516758172,
-    0.004872485074158,
-    0.004872485074158,
-    0.615874393079188,
-    0.615859771363415,
-    0.005137117149042,
-    0.005137117149042,
-    0.615687588459829,
-    0.615671340266840,
-    0.043960703434809,
-    -0.004340799101553,
-    -0.020335378148989,
-    -0.047015328800540,
-    0.008744327591893,
-    0.021822670750623,
-    -0.030434044123758,
-    0.031414638359273,
-    0.014966762586877,
-    0.012567810120574,
-    0.006199436048303,
-    -0.030341377642418,
-    -0.001792866389154,
-    -0.001792866389155,
-    0.612805741178432,
-    0.612803771390944,
-    -0.001504135167602,
-    -0.001504135167602,
-    0.612599948626143,
-    0.612598562664605,
-    0.014266714169017,
-    0.012211946221386,
-    0.005909466499308,
-    -0.029482246190642,
-    -0.001426379435149,
-    -0.001426379435149,
-    0.612259186108640,
-    0.612257940430368,
-    -0.001150480030016,
-    -0.001150480030016,
-    0.612066543873897,
-    0.612065733739452,
-    0.021745152859363,
-    0.005594516390292,
-    0.031248882460075,
-    -0.012772950559844,
-    -0.100666594542619,
-    -0.019359565879386,
-    0.065524606915227,
-    -0.178753771955891,
-    0.009884579762971,
-    -0.017012309955826,
-    0.045920595638799,
-    0.170598858233084,
-    0.125949653186951,
-    0.105856134159864,
-    0.036461085721980,
-    0.219137608120985,
-    0.001068270857736,
-    -0.113878997260049,
-    0.034477828726373,
-    0.011576727579936,
-    -0.047611753327590,
-    0.040932362971210,
-    0.183129008319088,
-    0.063959122312366,
-    0.002475958337595,
-    0.067916948422512,
-    0.076613885283696,
-    -0.102253020537383,
-    0.093410629088875,
-    -0.142730474199686,
-    0.245800674044451,
-    -0.032505993507420,
-    -0.138571756739763,
-    -0.015728347038404,
-    0.115130662835513,
-    -0.059753791795585,
-    -0.071419606352293,
-    -0.009821076680831,
-    -0.035689898777709,
-    -0.002090947935190,
-    -0.013648126786966,
-    0.159692587396357,
-    0.140287118568359,
-    0.049038669598225,
-    -0.038174574920521,
-    0.018373942131930,
-    -0.117653828791837,
-    0.000634282121732,
-    0.030391340282960,
-    -0.002777792956463,
-    -0.012353491979829,
-    -0.028592208890379,
-    0.006045213443524,
-    0.013964908230975,
-    -0.018488307286053,
-    0.019104703191478,
-    0.007888944398298,
-    0.014967901260241,
-    0.003267707762583,
-    -0.036135710222734,
-    0.006612157703831,
-    0.006612157703831,
-    0.613629025014572,
-    0.613602196180819,
-    0.007127619205249,
-    0.007127619205249,
-    0.613385194435020,
-    0.613354031862665,
-    0.007538872011024,
-    0.014836332596595,
-    0.003122703031962,
-    -0.035818075370576,
-    0.006706697736132,
-    0.006706697736132,
-    0.613408982211878,
-    0.613381390581352,
-    0.007214914665287,
-    0.007214914665287,
-    0.613170317739678,
-    0.613138398331891,
-    0.033579218106884,
-    -0.000095791056253,
-    -0.014059656465106,
-    -0.022267836860678,
-    0.006679321768398,
-    0.000481574160095,
-    -0.021041762886773,
-    0.014878892902977,
-    0.006556991148134,
-    0.014123931034881,
-    0.002715994661918,
-    -0.034098185858432,
-    0.001107667338908,
-    0.001107667338908,
-    0.609484614022593,
-    0.609483866229045,
-    0.001571785189581,
-    0.001571785189581,
-    0.609269658500514,
-    0.609268153292674,
-    0.006015334734660,
-    0.014109244434151,
-    0.002491633229311,
-    -0.034062729267764,
-    0.001139466027939,
-    0.001139466027939,
-    0.609290999012534,
-    0.609290207919049,
-    0.001605402248915,
-    0.001605402248915,
-    0.609077769166220,
-    0.609076199378086,
-    -0.132413029308569,
-    -0.015639030834704,
-    0.111929548528645,
-    -0.059041239118030,
-    -0.069311938007109,
-    -0.017440087580263,
-    -0.034661562304571,
-    0.004326684467847,
-    -0.013041545079374,
-    0.158785744761820,
-    0.136386549499630,
-    0.048453892728408,
-    -0.037048002719129,
-    0.032628108952757,
-    -0.114263857749765,
-    -0.001312485384341,
-    0.027326109434265,
-    -0.005654919595659,
-    -0.006516683549065,
-    -0.040251894324807,
-    0.005435501118845,
-    0.028429200608054,
-    -0.009752906152996,
-    0.026895455923622,
-    0.016217183721709,
-    0.009423879364720,
-    0.006717377441029,
-    -0.022751257372473,
-    0.011862372938445,
-    0.011862372938444,
-    0.607271347484547,
-    0.607185888742239,
-    0.011967859389474,
-    0.011967859389474,
-    0.607133246625501,
-    0.607046280909523,
-    0.016246733361308,
-    0.009001501152865,
-    0.006729617302514,
-    -0.021731546164964,
-    0.012025157420802,
-    0.012025157420802,
-    0.606957353252983,
-    0.606869578195627,
-    0.012111451743840,
-    0.012111451743840,
-    0.606827089111673,
-    0.606738068777095,
-    0.031209137960294,
-    -0.003142142022228,
-    -0.007857095704024,
-    -0.034302337418032,
-    0.006207883515560,
-    0.015796614678215,
-    -0.011758974708455,
-    0.022920089093430,
-    0.014980384075612,
-    0.008704790255875,
-    0.006205078253677,
-    -0.021015222693346,
-    0.006661257438400,
-    0.006661257438400,
-    0.603297862387846,
-    0.603271092049599,
-    0.006751263112612,
-    0.006751263112612,
-    0.603180520042738,
-    0.603153026717304,
-    0.014632345828045,
-    0.008417270446568,
-    0.006060916091310,
-    -0.020321088470268,
-    0.006776596014046,
-    0.006776596014046,
-    0.603055425384179,
-    0.603027731084130,
-    0.006858981296314,
-    0.006858981296314,
-    0.602944995105413,
-    0.602916628514348,
-    -0.101055606225922,
-    -0.004533861105337,
-    -0.140552472819038,
-    -0.338158315389861,
-    0.335876536285175,
-    -0.020154656155132,
-    -0.007844570149769,
-    -0.243085334962863,
-    0.214089050668120,
-    -0.005009889022609,
-    0.053876767658360,
-    0.024651764359220,
-    -0.196738497242549,
-    -0.071407828579915,
-    -0.059692585195335,
-    0.255640186883405,
-    -0.247326443298170,
-    0.028612358019353,
-    0.146799129161768,
-    0.334012336695690,
-    0.453356440494874,
-    -0.020325581056330,
-    0.035520910053603,
-    -0.306012995033853,
-    0.318504337002553,
-    -0.109098095797543,
-    -0.055910657431966,
-    -0.214375697151342,
-    -0.419665731339838,
-    0.135651611288256,
-    -0.001625721688382,
-    0.406700280042267,
-    -0.379157639425294,
-    -0.034466279664887,
-    0.072964867349223,
-    0.132167349663817,
-    -0.420107488428166,
-    0.170382429567004,
-    0.026368281277608,
-    0.082582891184943,
-    -0.079901507186342,
-    0.033155696647321,
-    0.117701615305177,
-    -0.178059037395989,
-    -0.130582700911533,
-    -0.172400413154805,
-    0.001593622922001,
-    -0.220674491210685,
-    0.027877958736096,
-    0.026266260001900,
-    -0.060087395694125,
-    -0.073393031214301,
-    -0.286200653666783,
-    -0.116338948140100,
-    -0.033634781238135,
-    0.277315541109291,
-    0.337293355033974,
-    -0.008718713788013,
-    -0.033622031994440,
-    0.328010175258433,
-    0.044932619569535,
-    -0.119586716183068,
-    -0.006294443817851,
-    -0.045946745048413,
-    -0.001240201125649,
-    0.369433693509621,
-    -0.144045186891134,
-    0.329958872338325,
-    0.143978552272178,
-    0.047017253560151,
-    -0.019615927302584,
-    0.097211818390301,
-    0.045322999712194,
-    0.023664858716631,
-    0.082814539339838,
-    -0.016037731916856,
-    -0.134977771261352,
-    0.104081351728381,
-    -0.320608304124730,
-    -0.047596470330201,
-    -0.027427986044212,
-    -0.258006283505341,
-    0.183419708644068,
-    -0.267325253751031,
-    0.249524689887913,
-    0.036929143496084,
-    0.122488166521465,
-    0.088742124080416,
-    0.100901704790426,
-    0.344376903664900,
-    -0.107761874427718,
-    0.111225665188357,
-    -0.353117608980175,
-    -0.161216351750701,
-    -0.018878528683245,
-    -0.035022934097859,
-    -0.023294062419734,
-    0.561007908454725,
-    0.082517113121512,
-    -0.116867553545155,
-    -0.205041951663710,
-    -0.349094095022465,
-    0.076646944577350,
-    -0.028410381072470,
-    -0.021059613074600,
-    -0.125794815154035,
-    0.201952828288718,
-    0.103775899049205,
-    -0.099353607203214,
-    0.226589775869679,
-    0.011733666517333,
-    0.029971188202323,
-    0.004485601543059,
-    -0.163244484704026,
-    -0.083131513276618,
-    0.053048428134475,
-    -0.176351670026006,
-    0.188806167810556,
-    -0.141629405233959,
-    -0.065858128428471,
-    0.125375455544149,
-    0.023455661336392,
-    -0.073405151662644,
-    -0.150239708756691,
-    0.041740268084131,
-    0.128732868054260,
-    -0.170895223901381,
-    0.001692318829746,
-    -0.300141430182349,
-    0.000363360043669,
-    -0.029971309905664,
-    0.128334621562014,
-    0.072197559479301,
-    -0.005037225369608,
-    -0.000881486044920,
-    -0.089275966113229,
-    0.125220011422133,
-    0.062476239808271,
-    0.091641712594005,
-    -0.079503349190616,
-    -0.162478152265006,
-    0.096897870135856,
-    0.034755241340338,
-    -0.033286606351268,
-    -0.040329519960511,
-    -0.011731834505328,
-    -0.071489692867493,
-    -0.108528848804222,
-    -0.001040451891908,
-    -0.046482828801039,
-    0.102823474781373,
-    -0.041084990214049,
-    0.396640798110039,
-    -0.072734868598765,
-    0.004015945675040,
-    -0.024626613139643,
-    -0.117322681684374,
-    0.057738625880138,
-    -0.025242552153284,
-    0.216016576230013,
-    -0.007368058548781,
-    -0.014801647198519,
-    -0.031479851238755,
-    -0.122184716988947,
-    0.032002977094496,
-    0.011363798347855,
-    -0.002285166642205,
-    0.034437540274841,
-    0.028119093881612,
-    -0.278219330087238,
-    0.144718078609349,
-    0.050344940637676,
-    -0.114430025479545,
-    -0.137584404373849,
-    0.200299391266549,
-    0.005775774104070,
-    -0.004974171856171,
-    0.095119201253405,
-    -0.091605575602877,
-    0.084696744900240,
-    -0.000589408716446,
-    0.082053668054152,
-    0.371556294998502,
-    0.011369748035582,
-    0.131032420529801,
-    0.220171589708839,
-    0.007978313784895,
-    0.012395995343817,
-    -0.101203241209209,
-    -0.066935113382637,
-    -0.342204930374889,
-    -0.015934339945016,
-    0.016327736102151,
-    0.003829396275122,
-    0.029214342003311,
-    0.019553933255120,
-    -0.174360019260613,
-    -0.016573507042311,
-    0.039854026373602,
-    -0.194490593489508,
-    0.175618261972078,
-    -0.049944370747918,
-    -0.001708777208557,
-    0.052560241737949,
-    0.154610017469603,
-    0.115239543888400,
-    0.032187040385623,
-    0.044145816363489,
-    0.000802130238566,
-    -0.077949151901485,
-    0.032233059253582,
-    -0.017722652048968,
-    -0.082466147433999,
-    0.035041736482534,
-    0.111384541944110,
-    0.069589847092401,
-    0.043990084595466,
-    0.199389104765262,
-    -0.002850922537274,
-    -0.031503396526473,
-    0.114666603915460,
-    -0.155382537594910,
-    0.216987400830811,
-    -0.006548413265970,
-    -0.132314901139207,
-    -0.008020199260480,
-    0.149922893839142,
-    -0.034249736256705,
-    -0.069506996170185,
-    0.015617585107913,
-    -0.017712550326181,
-    -0.072714446295304,
-    -0.013031880298265,
-    0.081430449634225,
-    0.182681574709353,
-    0.028108032137351,
-    -0.037152263479451,
-    -0.029218446646825,
-    -0.058390453179010,
-    0.022057686134020,
-    0.081573736886955,
-    -0.008599453788405,
-    0.005819043554572,
-    -0.063905433527806,
-    0.016226025120189,
-    0.043232373641161,
-    0.008708814116975,
-    0.042700245530251,
-    -0.018693890311771,
-    0.004720182351635,
-    -0.007743262900650,
-    -0.011395528250192,
-    0.002712361570484,
-    0.002712361570484,
-    0.607666854339371,
-    0.607662383775432,
-    0.002621374580780,
-    0.002621374580781,
-    0.607581388381579,
-    0.607577213308115,
-    -0.021001006093425,
-    0.003607658713432,
-    -0.008698901547376,
-    -0.008709658594382,
-    0.002238355528476,
-    0.002238355528476,
-    0.606537171893398,
-    0.606534132991731,
-    0.002087046917844,
-    0.002087046917844,
-    0.606445131866135,
-    0.606442490328001,
-    0.076157104800593,
-    -0.003190541171676,
-    0.004393389475791,
-    -0.064756942849971,
-    0.015148590008667,
-    0.016039933633624,
-    0.006575172007103,
-    0.043269205869311,
-    -0.010458417572462,
-    0.004530295752960,
-    -0.004332018399474,
-    -0.010937101448358,
-    -0.003506598827689,
-    -0.003506598827689,
-    0.603735724269106,
-    0.603728300546916,
-    -0.003502356115866,
-    -0.003502356115866,
-    0.603695220068830,
-    0.603687814796983,
-    -0.013128057037609,
-    0.003378232516627,
-    -0.005437819272584,
-    -0.008155774758491,
-    -0.003512331782908,
-    -0.003512331782908,
-    0.602796883710977,
-    0.602789447276691,
-    -0.003556172720261,
-    -0.003556172720261,
-    0.602754802647576,
-    0.602747179942487,
-    -0.129458209920580,
-    -0.007961899167616,
-    0.138973479606359,
-    -0.045625899145711,
-    -0.065191997945324,
-    0.014734382235492,
-    -0.017656797618809,
-    -0.050166638212211,
-    -0.012750520771184,
-    0.080838518857770,
-    0.169339674863583,
-    0.037444207741370,
-    -0.034845848876655,
-    -0.027566090291610,
-    -0.058206661133850,
-    0.015217883329398,
-    0.080488497984790,
-    -0.009011690289793,
-    -0.004368814600108,
-    -0.059445575216000,
-    0.016010157680987,
-    0.045304826484687,
-    -0.006538393106537,
-    0.039720263478156,
-    -0.007921836181056,
-    0.002298283383129,
-    -0.003281331985091,
-    -0.005548546913726,
-    0.007066453673619,
-    0.007066453673619,
-    0.601471311464391,
-    0.601441276384366,
-    0.007053212226775,
-    0.007053212226775,
-    0.601454775978078,
-    0.601424854180249,
-    -0.010056481529218,
-    0.001329591351376,
-    -0.004165531039156,
-    -0.003209917472906,
-    0.006423374809964,
-    0.006423374809964,
-    0.600412626306770,
-    0.600387852924462,
-    0.006385752733051,
-    0.006385752733051,
-    0.600392884037993,
-    0.600368400815054,
-    0.075397882022732,
-    -0.004560497462423,
-    -0.005619230611763,
-    -0.059050738139971,
-    0.014997571208554,
-    0.022927168996583,
-    -0.008409772915310,
-    0.039456441778495,
-    -0.001052658575459,
-    0.002287711875841,
-    -0.000436025458503,
-    -0.005523025037457,
-    0.001235128409308,
-    0.001235128409308,
-    0.598013392230295,
-    0.598012479934941,
-    0.001247304701300,
-    0.001247304701301,
-    0.598007864246202,
-    0.598006933883371,
-    -0.003538199630936,
-    0.001339777407167,
-    -0.001465570273517,
-    -0.003234508786943,
-    0.001009175857028,
-    0.001009175857028,
-    0.597143548835492,
-    0.597142940682749,
-    0.001008323888888,
-    0.001008323888888,
-    0.597139528964667,
-    0.597138921842410,
-    -0.030726537991932,
-    0.003096784411425,
-    0.027169133273278,
-    0.016150386838965,
-    -0.144496871867481,
-    -0.012113666102637,
-    0.037931592374482,
-    -0.175907463803467,
-    0.179169459010101,
-    -0.050588573783573,
-    0.000587150442689,
-    0.120058942658485,
-    0.101206417802916,
-    0.115044390884103,
-    0.031035867647284,
-    0.082175810531445,
-    -0.001509498015865,
-    -0.063036494828338,
-    0.029976519155105,
-    -0.014637857390061,
-    -0.068341930619798,
-    0.025612195072670,
-    0.106011698849098,
-    0.062940696970806,
-    0.044879613146560,
-    0.201960907445778,
-    0.000979601332143,
-    -0.071960560911736,
-    0.075059795049768,
-    -0.155119404229368,
-    0.209226824604886,
-    -0.012189630006952,
-    -0.146484037441432,
-    -0.008087348131738,
-    0.138784549769712,
-    -0.030597641456808,
-    -0.064665379672895,
-    -0.000610927455583,
-    -0.036967620208580,
-    -0.104187327149108,
-    -0.014427418417030,
-    0.082112223565451,
-    0.169109463191540,
-    0.025110835392980,
-    -0.034564365545647,
-    0.001142964878547,
-    -0.121865911863513,
-    0.031604880164589,
-    0.068665536083386,
-    -0.007452878521424,
-    0.013808204893253,
-    -0.058458526340763,
-    0.013658424339739,
-    0.037468150520773,
-    0.020665439015310,
-    0.039060738505140,
-    -0.010125145395800,
-    -0.001058949088637,
-    -0.004193972543939,
-    0.002556529251651,
-    0.007079711822670,
-    0.007079711822670,
-    0.597491004882638,
-    0.597461056497038,
-    0.007039955898567,
-    0.007039955898567,
-    0.597471751758373,
-    0.597442139739580,
-    -0.011720040024554,
-    -0.001888877426292,
-    -0.004854599529725,
-    0.004560153500215,
-    0.006942440635240,
-    0.006942440635240,
-    0.596603082659632,
-    0.596574327200322,
-    0.006894158254174,
-    0.006894158254174,
-    0.596575245982945,
-    0.596546890434812,
-    0.061306446905214,
-    -0.002825419789938,
-    0.012312012558237,
-    -0.056627227323931,
-    0.012194610489551,
-    0.014204344491790,
-    0.018426228944668,
-    0.037837103622450,
-    -0.005014755087947,
-    -0.003265299169672,
-    -0.002077179569406,
-    0.007883129540627,
-    0.002854502932356,
-    0.002854502932356,
-    0.593171799248606,
-    0.593166965954177,
-    0.002869827694434,
-    0.002869827694434,
-    0.593156659326717,
-    0.593151774121147,
-    -0.006726206310135,
-    -0.004060795633377,
-    -0.002786085876977,
-    0.009803627892125,
-    0.003031178466194,
-    0.003031178466194,
-    0.592490234769560,
-    0.592484790918859,
-    0.003052250562060,
-    0.003052250562060,
-    0.592465742223397,
-    0.592460222648495,
-    -0.145001707208180,
-    -0.008030742336839,
-    0.131189861750393,
-    -0.039380383797577,
-    -0.060451899730425,
-    -0.005274151844322,
-    -0.033821067270997,
-    -0.085784683663669,
-    -0.014281421632118,
-    0.081537495284916,
-    0.159855309064260,
-    0.032318645757362,
-    -0.032312213595291,
-    0.009867244084524,
-    -0.111493116947264,
-    0.026022499293673,
-    0.067890835074080,
-    -0.008194722354972,
-    0.005471365639036,
-    -0.058428371723563,
-    0.013504326727967,
-    0.041197651322160,
-    0.008188477345033,
-    0.039040589834093,
-    -0.001943073549470,
-    -0.001673444570348,
-    -0.000804847416879,
-    0.004040052577615,
-    0.012677340874342,
-    0.012677340874342,
-    0.591937855250343,
-    0.591842714328821,
-    0.012682536190697,
-    0.012682536190697,
-    0.591934409833041,
-    0.591839191463864,
-    -0.003346014514481,
-    -0.002602050631776,
-    -0.001385964591795,
-    0.006281905925216,
-    0.012405162404133,
-    0.012405162404134,
-    0.591079592169736,
-    0.590988625081464,
-    0.012416867524162,
-    0.012416867524162,
-    0.591070907854761,
-    0.590979770343943,
-    0.060702065059693,
-    -0.004189099209267,
-    0.004197985376871,
-    -0.056111754325751,
-    0.012074391465857,
-    0.021060023891184,
-    0.006282729106611,
-    0.037492675576642,
-    0.002318453467371,
-    -0.003323424269904,
-    0.000960334869916,
-    0.008023455945922,
-    0.008269482398176,
-    0.008269482398176,
-    0.588088513622627,
-    0.588048296203103,
-    0.008293918900796,
-    0.008293918900796,
-    0.588076617930591,
-    0.588036163283296,
-    0.000758622726563,
-    -0.004185820248475,
-    0.000314231822067,
-    0.010105464013525,
-    0.008317703052760,
-    0.008317703052761,
-    0.587436171386670,
-    0.587395528688492,
-    0.008359761005986,
-    0.008359761005986,
-    0.587418707188451,
-    0.587377653642677,
-    -0.236865067013845,
-    -0.002222746118510,
-    -0.078169627115419,
-    0.103441492590902,
-    0.050133941163446,
-    -0.003225256220713,
-    -0.008536512673723,
-    -0.069625722641088,
-    0.128021509616077,
-    0.047562395026800,
-    0.009650984341743,
-    -0.117270723432745,
-    -0.154029585554290,
-    0.084192920405323,
-    0.008532597982315,
-    -0.122286610143526,
-    0.070606150909806,
-    -0.012908017094694,
-    -0.096544003185063,
-    -0.108940502630759,
-    0.003404501453514,
-    -0.043358127589667,
-    0.109250470308009,
-    -0.065453906638293,
-    0.407132353275053,
-    -0.072387113150777,
-    -0.011602943222341,
-    -0.052847742793000,
-    -0.167713477167243,
-    0.014481098812211,
-    -0.024342966621934,
-    0.229076912925634,
-    -0.005814711020931,
-    0.090544638662420,
-    -0.082104126937649,
-    -0.098484487999415,
-    0.022222847728954,
-    0.007276061447137,
-    -0.022130076948065,
-    0.026857604930043,
-    0.028748191338399,
-    -0.211804963331823,
-    0.015240569726295,
-    0.074260866615867,
-    -0.108479873471439,
-    -0.119544761822114,
-    0.049174573844676,
-    0.021218739714356,
-    0.008708438113620,
-    0.104655437754005,
-    -0.123709707344331,
-    0.085018002699594,
-    0.001928626251198,
-    0.076537799020797,
-    0.394780472657604,
-    0.018113535443107,
-    0.134498362195268,
-    0.219118918943244,
-    -0.023051089169721,
-    0.026601318251868,
-    -0.144670640323868,
-    -0.016787617926909,
-    -0.330009546871173,
-    -0.016897728256860,
-    0.039334882686870,
-    0.004464876293190,
-    0.022150342671276,
-    -0.001180178502264,
-    -0.138735408937610,
-    0.008005885737433,
-    0.024811997995915,
-    -0.131798795172217,
-    0.058621758079108,
-    -0.027182280785974,
-    0.008167767254590,
-    0.061284435216529,
-    0.155041432358250,
-    0.124721873046068,
-    0.033582257079900,
-    0.048780071317456,
-    0.001932398872458,
-    -0.090884644835605,
-    0.024439137041987,
-    0.001069651444463,
-    -0.065616961596365,
-    -0.016927023206650,
-    0.069344888909984,
-    0.047158362974977,
-    0.014683985982305,
-    0.108517747850873,
-    0.013627096398951,
-    -0.036732476862512,
-    0.114986563003295,
-    -0.168167978400330,
-    0.226393187770516,
-    -0.007235840051072,
-    -0.164402315084983,
-    -0.010403828482614,
-    0.150041229566880,
-    -0.062842760131175,
-    -0.086922415549198,
-    0.015006485728106,
-    -0.009611818428506,
-    -0.050264055824606,
-    -0.016192214727886,
-    0.105631843267438,
-    0.182825767210805,
-    0.051573720396785,
-    -0.046460999074786,
-    -0.028075160120679,
-    -0.031685918943320,
-    0.015247434639043,
-    0.060684454414945,
-    -0.009665426466026,
-    -0.023132446418682,
-    -0.065588347943661,
-    0.012070888490819,
-    0.048591380180891,
-    -0.034620152614749,
-    0.043824732992373,
-    0.008091671053743,
-    0.013044855347486,
-    0.003351679892723,
-    -0.031493066699097,
-    -0.007625392864185,
-    -0.007625392864185,
-    0.585007027924372,
-    0.584973010756147,
-    -0.007241495666381,
-    -0.007241495666381,
-    0.584824127026694,
-    0.584793458478404,
-    0.007455118771843,
-    0.012183471192027,
-    0.003088011304400,
-    -0.029413501388574,
-    -0.007303555661929,
-    -0.007303555661929,
-    0.583951339539864,
-    0.583920189620307,
-    -0.006968071793723,
-    -0.006968071793723,
-    0.583792409824976,
-    0.583764063665817,
-    0.052698581046367,
-    -0.004704259176952,
-    -0.025557756706396,
-    -0.066276518815518,
-    0.010482399513481,
-    0.023649907941490,
-    -0.038249885967593,
-    0.044284554068186,
-    0.014125015558981,
-    0.013681680963865,
-    0.005850773013262,
-    -0.033030499739025,
-    -0.015738291578355,
-    -0.015738291578355,
-    0.580705912126913,
-    0.580562057041978,
-    -0.015368920482098,
-    -0.015368920482098,
-    0.580482994896272,
-    0.580345866458311,
-    0.013058360051329,
-    0.012868411365301,
-    0.005408949835612,
-    -0.031067093244305,
-    -0.014831269156314,
-    -0.014831269156314,
-    0.579816818669725,
-    0.579689264337127,
-    -0.014502039599271,
-    -0.014502039599271,
-    0.579621088067447,
-    0.579499175626623,
-    -0.161127481168330,
-    -0.010351203507485,
-    0.142989537999566,
-    -0.068349241020410,
-    -0.083018954202372,
-    0.013860726238884,
-    -0.008617964401993,
-    -0.025725805209072,
-    -0.015869671739673,
-    0.105097532928310,
-    0.174233256174675,
-    0.056092772474684,
-    -0.044374555516155,
-    -0.025931594884786,
-    -0.028409621293731,
-    0.007803837693295,
-    0.058298540703582,
-    -0.009393012988898,
-    -0.024739788647496,
-    -0.060476381981776,
-    0.011596300746129,
-    0.047221865149139,
-    -0.037025710256968,
-    0.040409026538870,
-    0.012840100144667,
-    0.007259414353481,
-    0.005318543622151,
-    -0.017525776587060,
-    -0.003104088736413,
-    -0.003104088736413,
-    0.580717807117477,
-    0.580712211661392,
-    -0.003045137308932,
-    -0.003045137308932,
-    0.580637410057822,
-    0.580632025862730,
-    0.012277272261391,
-    0.006624484524259,
-    0.005085412679616,
-    -0.015992920382197,
-    -0.002843766901845,
-    -0.002843766901845,
-    0.579758057353782,
-    0.579753368825505,
-    -0.002800247374174,
-    -0.002800247374174,
-    0.579688954037785,
-    0.579684408455488,
-    0.050795152731606,
-    -0.005078816799769,
-    -0.026967177635119,
-    -0.060410717834128,
-    0.010103784081255,
-    0.025532936270753,
-    -0.040359233451541,
-    0.040365151158135,
-    0.018150492355426,
-    0.008003002335503,
-    0.007518180097367,
-    -0.019320956778076,
-    -0.010971965600660,
-    -0.010971965600660,
-    0.576744672253017,
-    0.576675237225899,
-    -0.010953795495790,
-    -0.010953795495790,
-    0.576625835016239,
-    0.576556644047616,
-    0.017223311524823,
-    0.007441852432469,
-    0.007134129222559,
-    -0.017966221071645,
-    -0.010210470799035,
-    -0.010210470799035,
-    0.575939405010893,
-    0.575879358058695,
-    -0.010199640488763,
-    -0.010199640488763,
-    0.575834841381597,
-    0.575774932631420,
-    0.014614466041500,
-    0.004278064069287,
-    0.021161342494470,
-    -0.003040641291151,
-    -0.125064583792786,
-    0.003917220398196,
-    0.022377022645676,
-    -0.137807227650417,
-    0.061572736657602,
-    -0.026503961385505,
-    0.010159985289176,
-    0.136991730708219,
-    0.096926756167339,
-    0.123912691725998,
-    0.030100230966281,
-    0.079198656121220,
-    0.000717962677682,
-    -0.087081994659991,
-    0.023347943500911,
-    0.002755876626236,
-    -0.059151142845493,
-    -0.008282266667368,
-    0.062539588700435,
-    0.049308214491809,
-    0.015423167636022,
-    0.105809745007328,
-    0.016950911385203,
-    -0.082109683491672,
-    0.071885781659883,
-    -0.167076923692506,
-    0.202919274451142,
-    -0.011748010867458,
-    -0.172407023556637,
-    -0.010475608159427,
-    0.142518344074671,
-    -0.054655094319646,
-    -0.080594677678565,
-    -0.003835202624925,
-    -0.029571996263827,
-    -0.075173400520483,
-    -0.016980609698724,
-    0.106360634556484,
-    0.173659104715955,
-    0.044854276718870,
-    -0.043078752717556,
-    0.007175159443785,
-    -0.097485807038215,
-    0.022803601743369,
-    0.050054032491867,
-    -0.009091573262009,
-    -0.015249899700469,
-    -0.060799290011079,
-    0.009956366099855,
-    0.045706425305657,
-    -0.022823087771791,
-    0.040624786786063,
-    0.012200276537727,
-    0.007136077123489,
-    0.005053520006630,
-    -0.017228014173668,
-    0.002375770460556,
-    0.002375770460556,
-    0.575626474185945,
-    0.575623225176740,
-    0.002437071850253,
-    0.002437071850253,
-    0.575551417605557,
-    0.575547999211818,
-    0.011999904146833,
-    0.006254733502970,
-    0.004970523044796,
-    -0.015100262451899,
-    0.002624653412915,
-    0.002624653412915,
-    0.574837086934452,
-    0.574833126979905,
-    0.002659462830155,
-    0.002659462830155,
-    0.574774501295435,
-    0.574770436048989,
-    0.040764415854962,
-    -0.004534628719059,
-    -0.017559096371683,
-    -0.059044883062747,
-    0.008108546462559,
-    0.022797118041458,
-    -0.026279044817057,
-    0.039452529540970,
-    0.015801012049200,
-    0.006301967924067,
-    0.006544993490000,
-    -0.015214296431922,
-    -0.004319328205579,
-    -0.004319328205579,
-    0.571103394658250,
-    0.571092739713464,
-    -0.004326867561698,
-    -0.004326867561698,
-    0.571022925045454,
-    0.571012234378147,
-    0.015252122850626,
-    0.005526043069635,
-    0.006317636139711,
-    -0.013341048124971,
-    -0.003642599165162,
-    -0.003642599165162,
-    0.570502012931193,
-    0.570494443158653,
-    -0.003665238162144,
-    -0.003665238162144,
-    0.570433444351663,
-    0.570425781113962,
-    -0.168825106109030,
-    -0.010428291505181,
-    0.136710629185687,
-    -0.061278328828294,
-    -0.077124818826166,
-    -0.009832169622658,
-    -0.025319498291973,
-    -0.057764330397938,
-    -0.016627821622600,
-    0.105880220503756,
-    0.166582383648118,
-    0.050289824806802,
-    -0.041224074520771,
-    0.018394695566388,
-    -0.083467199940609,
-    0.017522618057007,
-    0.048096924972212,
-    -0.009147059343721,
-    -0.013980551095379,
-    -0.058786459435085,
-    0.009567073209904,
-    0.045985372675509,
-    -0.020923373334582,
-    0.039279856393433,
-    0.016558093623490,
-    0.003714454096198,
-    0.006858586945894,
-    -0.008967485455854,
-    0.006785067081078,
-    0.006785067081078,
-    0.571754674995382,
-    0.571728352442132,
-    0.006704801899440,
-    0.006704801899440,
-    0.571694980432613,
-    0.571669279668094,
-    0.016462504335055,
-    0.002876851883755,
-    0.006818992566206,
-    -0.006945334834700,
-    0.006974245264828,
-    0.006974245264828,
-    0.571020141938958,
-    0.570992366788348,
-    0.006881959869091,
-    0.006881959869091,
-    0.570966377731482,
-    0.570939335340275,
-    0.039377180646035,
-    -0.005129000739632,
-    -0.015990784024684,
-    -0.057137177399854,
-    0.007832608223039,
-    0.025785227973496,
-    -0.023931899520880,
-    0.038177841369588,
-    0.019787317108836,
-    0.003365437708601,
-    0.008196175109458,
-    -0.008124885359426,
-    -0.000016538801298,
-    -0.000016538801297,
-    0.567611894058186,
-    0.567611893902926,
-    -0.000151411470620,
-    -0.000151411470620,
-    0.567535822408367,
-    0.567535809397362,
-    0.019361697255962,
-    0.002618369769988,
-    0.008019877593982,
-    -0.006321303810012,
-    0.000561261791971,
-    0.000561261791971,
-    0.567050547634542,
-    0.567050369005199,
-    0.000422501207151,
-    0.000422501207151,
-    0.566981601444857,
-    0.566981500234510,
-]
 
-tree_values = tree_values512 if N == 512 else tree_values1024
 
 
-def order_for_FPGA(n, tree_addr):
+# Fills permutation[tree_addr:tree_addr + treesize(n)] with the tree index stored at every FPGA tree position
+def fill_fpga_permutation(permutation, n, tree_addr):
 
     if n == 1:
-        print(f"{tree_addr}\t\tsamplerz:\t{tree_values[tree_addr]}")
-        reordered_values[tree_addr] = tree_values[tree_addr]
+        permutation[tree_addr] = tree_addr
         return
 
     tree_addr0 = tree_addr + n
     tree_addr1 = tree_addr0 + treesize(n // 2)
 
-    order_for_FPGA(n=n // 2, tree_addr=tree_addr1)
+    fill_fpga_permutation(permutation, n // 2, tree_addr1)
+
+    # The values of the "multiply with tmp" step, real and imag part interleaved
+    permutation[tree_addr : tree_addr + n : 2] = np.arange(tree_addr, tree_addr + n // 2)
+    permutation[tree_addr + 1 : tree_addr + n : 2] = np.arange(tree_addr + n // 2, tree_addr + n)
+
+    fill_fpga_permutation(permutation, n // 2, tree_addr0)
+
+
+# FPGA tree layout as a permutation: reordered[i] = tree[permutation[i]], cached per n
+def fpga_permutation(n):
+    if n not in FPGA_PERMUTATIONS:
+        permutation = np.empty(treesize(n), dtype=np.int64)
+        fill_fpga_permutation(permutation, n, tree_addr=0)
+        permutation.flags.writeable = False
+        FPGA_PERMUTATIONS[n] = permutation
+    return FPGA_PERMUTATIONS[n]
+
+
+# Reorders a tree (shape (treesize(n),)) or a stack of trees (shape (..., treesize(n))) for the FPGA
+def order_for_FPGA(values, n):
+    return np.asarray(values, dtype=np.float64)[..., fpga_permutation(n)]
+
+
+def file_sha256(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def key_sha256(key):
+    return hashlib.sha256(np.array([key[name] for name in ["f", "g", "F", "G"]], dtype="<i8").tobytes()).hexdigest()
+
+
+# Yields (name, key) from a directory of <name>.json files or from JSON lines on stdin ("-")
+def iter_keys(source):
+    if source == "-":
+        for line in sys.stdin:
+            if line.strip():
+                key = json.loads(line)
+                yield key["name"], key
+        return
+    for filename in sorted(os.listdir(source)):
+        if filename.endswith(".json"):
+            with open(os.path.join(source, filename)) as f:
+                yield filename[: -len(".json")], json.load(f)
+
+
+# a^e mod q for arrays
+def power_mod(a, e, q):
+    result = np.ones_like(a)
+    while e:
+        if e & 1:
+            result = result * a % q
+        a = a * a % q
+        e >>= 1
+    return result
+
+
+# Public keys h = g / f mod q of a batch of keys (shape (batch, N))
+def public_keys(f, g):
+    f_ntt = ntt(f % Q, ntt_twiddle_factor, Q)
+    if np.any(f_ntt == 0):
+        raise ValueError("f is not invertible modulo q")
+    return intt(ntt(g % Q, ntt_twiddle_factor, Q) * power_mod(f_ntt, Q - 2, Q) % Q, intt_twiddle_factor, Q)
+
+
+# BRAM rows (real part, imag part) of a polynomial in FFT form, like b00..b11 of constants_<N>.h
+def fft_rows(values):
+    half = len(values) // 2
+    return np.ascontiguousarray(np.stack([values[:half], values[half:]], axis=1)).view(np.uint64)
+
+
+# Computes and writes the images of a chunk of keys of the same N, returns their manifest entries
+def write_chunk(chunk, directory):
+    f, g, F, G = (np.array([key[name] for _, key in chunk], dtype=np.int64) for name in ["f", "g", "F", "G"])
+    n = f.shape[1]
+    basis = [ffldl_tree.fft(g), -ffldl_tree.fft(f), ffldl_tree.fft(G), -ffldl_tree.fft(F)]
+    rows = generate_rows(order_for_FPGA(ffldl_tree.tree_from_basis(*basis), n))
+    keys = public_keys(f, g)
+
+    entries = {}
+    for i, (name, key) in enumerate(chunk):
+        sign_key = f"{name}_sign_key.bin"
+        public_key = f"{name}_public_key.bin"
+        sections = [(bank, 0, fft_rows(b[i])) for bank, b in enumerate(basis)] + [(TREE_BANK, 0, rows[i])]
+        write_row_image(os.path.join(directory, sign_key), sections)
+        write_row_image(os.path.join(directory, public_key), [(PUBLIC_KEY_BANK, 0, public_key_rows(keys[i]))])
+        entries[name] = {
+            "N": n,
+            "key_sha256": key_sha256(key),
+            "sign_key": sign_key,
+            "sign_key_sha256": file_sha256(os.path.join(directory, sign_key)),
+            "public_key": public_key,
+            "public_key_sha256": file_sha256(os.path.join(directory, public_key)),
+        }
+    return entries
+
+
+# Provisions a chunk of keys of the same N, returns (manifest entries, {name: failure} of the keys that couldn't be
+# provisioned). The chunk is computed as one batch; if that fails, its keys are computed one by one, so a bad key (e.g. f not
+# invertible modulo q, missing polynomials) only fails itself. Images are only written after all values of a key are computed.
+def provision_chunk(chunk, directory):
+    try:
+        return write_chunk(chunk, directory), {}
+    except (ValueError, KeyError, TypeError, IndexError) as error:
+        if len(chunk) == 1:
+            name, key = chunk[0]
+            try:
+                sha256 = key_sha256(key)
+            except (ValueError, KeyError, TypeError):
+                sha256 = None
+            return {}, {name: {"key_sha256": sha256, "error": f"{type(error).__name__}: {error}"}}
+
+    entries, failed = {}, {}
+    for name, key in chunk:
+        key_entries, key_failed = provision_chunk([(name, key)], directory)
+        entries.update(key_entries)
+        failed.update(key_failed)
+    return entries, failed
+
+
+def read_manifest(directory):
+    filename = os.path.join(directory, MANIFEST_FILE)
+    if os.path.exists(filename):
+        with open(filename) as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            manifest.setdefault("failed", {})
+            return manifest
+    return {"version": MANIFEST_VERSION, "keys": {}, "failed": {}}
+
+
+# Writes the manifest to a temporary file first, so an interrupted run never leaves a partial manifest
+def write_manifest(directory, manifest):
+    filename = os.path.join(directory, MANIFEST_FILE)
+    with open(filename + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(filename + ".tmp", filename)
+
+
+# Whether the images of a key are present and match the manifest entry
+def up_to_date(entry, key, directory):
+    if entry is None or entry["key_sha256"] != key_sha256(key):
+        return False
+    for image in ["sign_key", "public_key"]:
+        filename = os.path.join(directory, entry[image])
+        if not os.path.exists(filename) or file_sha256(filename) != entry[image + "_sha256"]:
+            return False
+    return True
+
+
+# Provisions all keys of source into directory, returns (number of provisioned keys, number of skipped keys, number of failed
+# keys). A chunk is submitted as soon as it is full, so workers start while keys are still being read. At most
+# MAX_CHUNKS_PER_PROCESS chunks per process are in flight, reading waits for a finished chunk before submitting more.
+# Keys that fail and repeated names of the stream (only the first key of a name is provisioned, two keys with the same name
+# would write the same images) are listed in "failed" of the manifest with the reason. "failed" only lists the failures of the
+# last run, failed keys are tried again by the next run.
+def provision(source, directory, processes=None):
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory)
+    manifest["failed"] = {}
+    pending = {}
+    running = set()
+    names = set()
+    provisioned, skipped = 0, 0
+
+    def finish(futures):
+        nonlocal provisioned
+        for future in futures:
+            entries, failed = future.result()
+            manifest["keys"].update(entries)
+            provisioned += len(entries)
+            for name, failure in failed.items():
+                manifest["keys"].pop(name, None)  # Entry of an earlier version of the key
+                manifest["failed"][name] = failure
+        write_manifest(directory, manifest)
+
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        max_running = MAX_CHUNKS_PER_PROCESS * (processes or os.cpu_count() or 1)
+
+        def submit(chunk):
+            nonlocal running
+            done = {future for future in running if future.done()}
+            if len(running) - len(done) >= max_running:
+                done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            else:
+                running -= done
+            if done:
+                finish(done)
+            running.add(pool.submit(provision_chunk, chunk, directory))
+
+        for name, key in iter_keys(source):
+            if name in names:
+                manifest["failed"].setdefault(name, {"key_sha256": None, "error": "name repeated in the key stream, only its first key is used"})
+                continue
+            names.add(name)
+            try:
+                if up_to_date(manifest["keys"].get(name), key, directory):
+                    skipped += 1
+                    continue
+                n = len(key["f"])
+            except (KeyError, TypeError, ValueError):
+                n = None  # Malformed key, fails in its own chunk
+            chunk = pending.setdefault(n, [])
+            chunk.append((name, key))
+            if len(chunk) == CHUNK_SIZE:
+                submit(pending.pop(n))
+
+        for chunk in pending.values():
+            submit(chunk)
+        for future in concurrent.futures.as_completed(running):
+            finish([future])
+    write_manifest(directory, manifest)
+    return provisioned, skipped, len(manifest["failed"])
+
+
+# Writes the tree of a key file (or of constants_<N>.h without key) in the selected formats
+def write_tree(N, key_file, formats, filenames):
+    if key_file:
+        with open(key_file) as f:
+            key = json.load(f)
+        values = ffldl_tree.tree_from_key(key["f"], key["g"], key["F"], key["G"])[0]
+        N = len(key["f"])
+    else:
+        values = tree_values(N)
+
+    rows = generate_rows(order_for_FPGA(values, N))
+
+    if "coe" in formats:
+        write_coe_file(rows=rows, filename=filenames["coe"])
+
+    if "array" in formats:
+        write_array(rows=rows, filename=filenames["array"])
+
+    if "image" in formats:
+        write_image(rows=rows, filename=filenames["image"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reorder Falcon LDL trees for the FPGA and provision key images")
+    parser.add_argument("--N", type=int, choices=[512, 1024], default=1024, help="tree of constants_<N>.h to write (default: 1024)")
+    parser.add_argument("--key", help="compute the tree from a JSON key file (f, g, F, G) instead")
+    parser.add_argument("--formats", nargs="+", choices=list(OUTPUT_FILES), default=list(OUTPUT_FILES), help="output formats (default: all)")
+    for output, filename in OUTPUT_FILES.items():
+        parser.add_argument(f"--{output}-file", default=filename, help=f"output file of the {output} format (default: {filename})")
+    commands = parser.add_subparsers(dest="command")
 
-    for i in range(n // 2):
-        print(f"{tree_addr+2*i} {tree_addr + 2*i+1}\tmul:\t\t{tree_values[tree_addr + i]}\t{tree_values[tree_addr + n // 2 + i]}")
-        reordered_values[tree_addr + 2 * i] = tree_values[tree_addr + i]
-        reordered_values[tree_addr + 2 * i + 1] = tree_values[tree_addr + n // 2 + i]
+    batch = commands.add_parser("batch", help="provision sign and public key images of many keys")
+    batch.add_argument("keys", help="directory of <name>.json key files or - for JSON lines on stdin")
+    batch.add_argument("directory", help="output directory for the images and manifest.json")
+    batch.add_argument("--processes", type=int, help="worker processes (default: number of CPUs)")
 
-    order_for_FPGA(n=n // 2, tree_addr=tree_addr0)
+    args = parser.parse_args()
 
+    if args.command == "batch":
+        import time
 
-reordered_values = [None] * treesize(N)
-order_for_FPGA(N, tree_addr=0)
+        start = time.perf_counter()
+        provisioned, skipped, failed = provision(args.keys, args.directory, args.processes)
+        print(f"{provisioned} keys provisioned, {skipped} up to date, {failed} failed, {time.perf_counter() - start:.2f} s")
+        if failed:
+            print(f"Failed keys are listed in {os.path.join(args.directory, MANIFEST_FILE)}", file=sys.stderr)
+            sys.exit(1)
 
-rows = generate_rows(reordered_values)
+    else:
+        filenames = {output: getattr(args, f"{output}_file") for output in OUTPUT_FILES}
+        write_tree(args.N, args.key, args.formats, filenames)
 
-if toggle_write_coe_file:
-    write_coe_file(rows=rows, filename=f"tree_FPGA.coe")
 
-if toggle_write_array:
-    write_array(rows=rows, filename=f"tree_arr.h")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Generates NTT/INTT twiddle factor tables for all supported N, without (R=1) and with Montgomery factor (R=4091 = 2^16 mod q)
+#
+# Same tables as NTT_negative_compute_twiddle_factors.py (GMb/iGMb of the reference C implementation, entry i is
+# R * g^bitreverse10(i) mod q), computed with NumPy for all tables at once. The table for N is the first N entries of the
+# table for N = 1024, the NTT of size N only uses indices below N.
+#
+# Writes for every table a .coe file (Vivado ROM initialization), a .mem file ($readmemh) and one C header with all tables.
+# Tables are cached in an .npz file in the output directory and files are only rewritten when their content changes, so
+# running this in a build loop is fast and doesn't touch timestamps.
+#
+# Usage: python generate_twiddle_factors.py [output directory]
+
+import os
+import sys
+
+import numpy as np
+
+Q = 12289  # Modulus
+g = 7  # Primitive root
+MAX_N = 1024
+SUPPORTED_N = [8, 512, 1024]
+MONTGOMERY_R = (1 << 16) % Q
+R_VALUES = [1, MONTGOMERY_R]
+
+CACHE_FILE = "twiddle_factors_cache.npz"
+CACHE_VERSION = 1
+HEADER_FILE = "ntt_twiddle_factors.h"
+
+toggle_write_coe_file = True
+toggle_write_mem_file = True
+toggle_write_header = True
+
+
+def bit_reverse(indices, bits):
+    reversed_indices = np.zeros_like(indices)
+    for bit in range(bits):
+        reversed_indices |= ((indices >> bit) & 1) << (bits - 1 - bit)
+    return reversed_indices
+
+
+# g^k mod q for k < count, every step doubles the number of known powers
+def powers(g, count):
+    result = np.ones(count, dtype=np.int64)
+    known = 1
+    while known < count:
+        result[known : 2 * known] = result[:known] * pow(g, known, Q) % Q
+        known *= 2
+    return result
+
+
+# Returns {(kind, N, R): table} for kind "ntt" and "intt"
+def compute_tables():
+    bits = MAX_N.bit_length() - 1
+    reversed_indices = bit_reverse(np.arange(MAX_N), bits)
+    tables = {}
+    for kind, root in [("ntt", g), ("intt", pow(g, -1, Q))]:
+        full_table = powers(root, MAX_N)[reversed_indices]
+        for R in R_VALUES:
+            for N in SUPPORTED_N:
+                tables[(kind, N, R)] = R * full_table[:N] % Q
+    return tables
+
+
+def cache_key():
+    return np.array([CACHE_VERSION, Q, g, MAX_N] + SUPPORTED_N + R_VALUES, dtype=np.int64)
+
+
+def table_name(kind, N, R):
+    return f"{kind}_twiddle_factors_{N}_r{R}"
+
+
+# Returns the tables from the cache in the output directory, computes and stores them if the cache is missing or stale
+def cached_tables(directory):
+    filename = os.path.join(directory, CACHE_FILE)
+    if os.path.exists(filename):
+        with np.load(filename) as cache:
+            if np.array_equal(cache["key"], cache_key()):
+                return {(kind, N, R): cache[table_name(kind, N, R)] for kind in ["ntt", "intt"] for N in SUPPORTED_N for R in R_VALUES}
+
+    tables = compute_tables()
+    np.savez(filename, key=cache_key(), **{table_name(*parameters): table for parameters, table in tables.items()})
+    return tables
+
+
+def coe_content(table):
+    lines = ["memory_initialization_radix=16;", "memory_initialization_vector="]
+    lines += [f"{value:04x}{',' if i < len(table) - 1 else ';'}" for i, value in enumerate(table)]
+    return "\n".join(lines) + "\n"
+
+
+def mem_content(table):
+    return "".join(f"{value:04x}\n" for value in table)
+
+
+def header_content(tables):
+    lines = ["// Generated by utilities/generate_twiddle_factors.py", "", "#pragma once", "", "#include <stdint.h>", ""]
+    for (kind, N, R), table in sorted(tables.items()):
+        lines.append(f"static const uint16_t {table_name(kind, N, R)}[{N}] = {{{', '.join(str(value) for value in table)}}};")
+    return "\n".join(lines) + "\n"
+
+
+# Writes the file only if its content changed, returns whether it was written
+def write_if_changed(filename, content):
+    if os.path.exists(filename):
+        with open(filename) as f:
+            if f.read() == content:
+                return False
+    with open(filename, "w") as f:
+        f.write(content)
+    return True
+
+
+def write_files(tables, directory):
+    files = {}
+    for (kind, N, R), table in tables.items():
+        if toggle_write_coe_file:
+            files[os.path.join(directory, table_name(kind, N, R) + ".coe")] = coe_content(table)
+        if toggle_write_mem_file:
+            files[os.path.join(directory, table_name(kind, N, R) + ".mem")] = mem_content(table)
+    if toggle_write_header:
+        files[os.path.join(directory, HEADER_FILE)] = header_content(tables)
+    return [filename for filename, content in files.items() if write_if_changed(filename, content)]
+
+
+# Tables of ntt_twiddle_factor_rom.sv, {"ntt": [...], "intt": [...]}
+def read_rom_tables():
+    import re
+
+    rom_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ip", "falcon_ip.srcs", "sources_1", "ntt", "ntt_twiddle_factor_rom.sv")
+    with open(rom_file) as f:
+        source = f.read()
+    return {kind: [int(value) for value in body.split(",")] for kind, body in re.findall(r"twiddle_rom_(\w+)\s*\[\d+\]\s*=\s*\{([^}]*)\}", source)}
+
+
+if __name__ == "__main__":
+    import time
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    os.makedirs(directory, exist_ok=True)
+
+    start = time.perf_counter()
+    tables = cached_tables(directory)
+    written = write_files(tables, directory)
+    print(f"{len(tables)} tables, {len(written)} files written in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rom = read_rom_tables()
+    print(f"R=1 tables match ntt_twiddle_factor_rom.sv: {all(tables[(kind, MAX_N, 1)].tolist() == rom[kind] for kind in rom)}")
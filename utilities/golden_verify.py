@@ -0,0 +1,225 @@
+# Batched golden model of the verify program
+#
+# Computes the status the accelerator returns for verify (0 = accepted, 1 = rejected, -1 = the hardware doesn't finish) for
+# many (public key, message, signature) vectors at once. It runs the same steps as the 5 instructions of the verify program
+# (HASH_TO_POINT, DECOMPRESS, NTT of the public key and of s2, MULT_MOD_Q, INTT, CHECK_BOUND) on NumPy arrays of shape
+# (batch, N), with the arithmetic of the RTL as modeled by isa_simulator.py:
+# - NTT/INTT use the signed 15-bit mod_add/mod_sub of ntt.sv, so negative s2 coefficients give the same non-canonical
+#   intermediate values as on the FPGA and CHECK_BOUND normalizes the difference by +-q only once.
+# - DECOMPRESS doesn't check coefficient ranges or trailing bits like the Falcon reference does. Decoding stops when no
+#   1 is found within 97 bits (the remaining coefficients stay 0, BRAM after reset) and an encoding of -0 makes the
+#   hardware hang (status -1).
+# - The message is what the host writes to BRAM (nonce followed by the message), the signature are the rows written to
+#   BRAM1 (compressed s2 without header and nonce), rows after the signature read as 0.
+#
+# Usage: python golden_verify.py [N] [batch]   ... cross-check against isa_simulator.py and measure throughput
+
+import hashlib
+import sys
+
+import numpy as np
+
+from isa_simulator import BOUND2, INTT_SCALE, INTT_TWIDDLES, NTT_TWIDDLES, Q
+
+HIGH_BIT_WINDOW = 97  # decompress.sv searches at most this many bits for the end of the unary high part
+PADDING_BITS = 256  # Zero bits after the signature, more than a coefficient can read past the last 1
+CHUNK_SIZE = 4096  # Vectors per slice of verify_batch, DECOMPRESS needs a few bytes per signature bit of every vector
+
+NTT_TWIDDLES32 = NTT_TWIDDLES.astype(np.int32)
+INTT_TWIDDLES32 = INTT_TWIDDLES.astype(np.int32)
+
+ACCEPTED = 0
+REJECTED = 1
+NOT_FINISHED = -1
+
+
+# Host message rows (message_blocks in constants_<N>.h: length in bytes, then little-endian 64-bit words) as bytes
+def message_bytes(message_blocks):
+    length = message_blocks[0] & 0xFFFF
+    return np.array(message_blocks[1:], dtype="<u8").tobytes()[:length]
+
+
+# Signature rows (high, low) from the bytes printed by main.c (uint128_t blocks in little-endian order)
+def signature_rows(signature):
+    blocks = np.frombuffer(bytes(signature), dtype="<u8").reshape(-1, 2)
+    return blocks[:, ::-1].copy()
+
+
+# signed15() for int arrays: sign extends [14:0] of each value without converting to uint64
+def wrap15(values):
+    return ((values + 0x4000) & 0x7FFF) - 0x4000
+
+
+# mod_add() and mod_sub() of ntt.sv, see isa_simulator.ntt_mod_add()
+def mod_add(a, b):
+    total = a + b
+    return wrap15(np.where(total >= Q, total - Q, total))
+
+
+def mod_sub(a, b):
+    return wrap15(np.where(a >= b, a - b, a + Q - b))
+
+
+# HASH_TO_POINT: SHAKE256 of every message, 16-bit big-endian words below 5*q, reduced mod q
+def hash_to_point(messages, N):
+    output_length = 4 * N
+    points = np.empty((len(messages), N), dtype=np.int64)
+    pending = list(range(len(messages)))
+    while pending:
+        words = np.array([np.frombuffer(hashlib.shake_256(messages[i]).digest(output_length), dtype=">u2") for i in pending], dtype=np.int64)
+        accepted = words < 5 * Q
+        complete = np.sum(accepted, axis=1) >= N
+        selected = accepted & (np.cumsum(accepted, axis=1) <= N)
+        rows = np.array(pending)[complete]
+        points[rows] = words[complete][selected[complete]].reshape(-1, N) % Q
+        pending = [i for i, done in zip(pending, complete) if not done]
+        output_length *= 2
+    return points
+
+
+# DECOMPRESS of signature rows of shape (batch, rows, 2). Returns s2 and a mask of vectors on which the hardware hangs.
+def decompress(signatures, N):
+    signatures = np.asarray(signatures, dtype=np.uint64)
+    batch = len(signatures)
+    data = signatures.astype(">u8").reshape(batch, -1).view(np.uint8)
+    bits = np.unpackbits(data, axis=1)
+    bits = np.concatenate([bits, np.zeros((batch, PADDING_BITS), dtype=np.uint8)], axis=1)
+    length = bits.shape[1]
+
+    # Sign and low bits (8 bits) starting at every bit and position of the next 1 at or after every bit
+    windows = np.zeros((batch, length), dtype=np.uint8)
+    for offset in range(8):
+        windows[:, : length - offset] |= bits[:, offset:] << (7 - offset)
+    ones = np.where(bits == 1, np.arange(length, dtype=np.int32), np.int32(length))
+    next_one = np.minimum.accumulate(ones[:, ::-1], axis=1)[:, ::-1]
+    next_one = np.concatenate([next_one, np.full((batch, 1), length, dtype=np.int32)], axis=1)
+
+    s2 = np.zeros((batch, N), dtype=np.int64)
+    position = np.zeros(batch, dtype=np.int64)
+    active = np.ones(batch, dtype=bool)
+    hangs = np.zeros(batch, dtype=bool)
+    rows = np.arange(batch)
+    for index in range(N):
+        window = windows[rows, np.minimum(position, length - 1)].astype(np.int64)
+        sign = window >> 7
+        low = window & 0x7F
+        unary_start = np.minimum(position + 8, length)
+        one = next_one[rows, unary_start].astype(np.int64)
+        high = one - unary_start
+        active &= high < HIGH_BIT_WINDOW
+        negative_zero = active & (sign == 1) & (high == 0) & (low == 0)
+        hangs |= negative_zero
+        active &= ~negative_zero
+        if not active.any():
+            break
+        coefficient = (high << 7) | low
+        s2[:, index] = np.where(active, np.where(sign == 1, -coefficient, coefficient), 0)
+        position = np.where(active, one + 1, position)
+
+    return wrap15(s2), hangs
+
+
+# NTT of ntt.sv on rows of signed coefficients. Products of 15-bit values and twiddle factors fit into int32.
+def ntt(coefficients):
+    batch, N = coefficients.shape
+    coefficients = coefficients.astype(np.int32)
+    m = 1
+    while m < N:
+        groups = coefficients.reshape(batch, m, 2, N // (2 * m))
+        product = groups[:, :, 1] * NTT_TWIDDLES32[m : 2 * m, None] % Q
+        coefficients = np.stack([mod_add(groups[:, :, 0], product), mod_sub(groups[:, :, 0], product)], axis=2).reshape(batch, N)
+        m <<= 1
+    return coefficients
+
+
+# INTT of ntt.sv, including the scaling of the last stage
+def intt(coefficients):
+    batch, N = coefficients.shape
+    coefficients = coefficients.astype(np.int32)
+    t = 1
+    while t < N:
+        m = N // (2 * t)
+        groups = coefficients.reshape(batch, m, 2, t)
+        difference = mod_sub(groups[:, :, 0], groups[:, :, 1])
+        product = difference * INTT_TWIDDLES32[m : 2 * m, None] % Q
+        coefficients = np.stack([mod_add(groups[:, :, 0], groups[:, :, 1]), product], axis=2).reshape(batch, N)
+        t <<= 1
+    return (coefficients * INTT_SCALE[N] % Q).astype(np.int64)
+
+
+# Squared norm of CHECK_BOUND: (c - s2 * h) normalized by +-q once, plus s2
+def squared_norm(c, s1, s2):
+    difference = c - s1
+    difference = np.where(difference > Q // 2, difference - Q, difference)
+    difference = np.where(difference < -(Q // 2), difference + Q, difference)
+    return np.sum(difference * difference, axis=1) + np.sum(s2 * s2, axis=1)
+
+
+# Status of verify for one slice of vectors
+def verify_chunk(public_keys, messages, signatures, N):
+    public_keys = wrap15(np.asarray(public_keys, dtype=np.int64).reshape(-1, N))
+    c = hash_to_point(messages, N)
+    s2, hangs = decompress(signatures, N)
+    s1 = intt(ntt(public_keys) * ntt(s2) % Q)
+    norms = squared_norm(c, s1, s2)
+    status = np.where(norms <= BOUND2[N], ACCEPTED, REJECTED)
+    return np.where(hangs, NOT_FINISHED, status)
+
+
+# Returns the status of verify for every vector: public_keys (batch, N), messages (list of bytes), signatures (batch, rows, 2).
+# Vectors are processed in slices of chunk_size, so the memory used doesn't grow with the batch.
+def verify_batch(public_keys, messages, signatures, N, chunk_size=CHUNK_SIZE):
+    statuses = [
+        verify_chunk(public_keys[start : start + chunk_size], messages[start : start + chunk_size], signatures[start : start + chunk_size], N)
+        for start in range(0, len(messages), chunk_size)
+    ]
+    return np.concatenate(statuses) if statuses else np.empty(0, dtype=np.int64)
+
+
+def verify(public_key, message, signature, N):
+    return int(verify_batch([public_key], [message], [signature], N)[0])
+
+
+if __name__ == "__main__":
+    import time
+
+    from cost_model import generate_program
+    from isa_simulator import read_host_constants, simulate_sign, simulate_verify
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    constants = read_host_constants(N)
+    program = generate_program("verify", N)
+    _, signature = simulate_sign(generate_program("sign", N), N, constants)
+    message = message_bytes(constants["message_blocks"])
+
+    # Valid signature, signatures with flipped bits and modified messages
+    rng = np.random.default_rng(0)
+    signatures = np.repeat(signature[None], batch, axis=0)
+    messages = [message] * batch
+    for i in range(1, batch):
+        if i % 2:
+            for _ in range(rng.integers(1, 4)):
+                row, column, bit = rng.integers(len(signature)), rng.integers(2), rng.integers(64)
+                signatures[i, row, column] ^= np.uint64(1 << int(bit))
+        else:
+            messages[i] = message[:-1] + bytes([rng.integers(256)])
+    public_keys = np.repeat(np.array(constants["public_key"])[None], batch, axis=0)
+
+    start = time.perf_counter()
+    status = verify_batch(public_keys, messages, signatures, N)
+    elapsed = time.perf_counter() - start
+    print(f"N={N}: {batch} vectors in {elapsed:.2f} s ({batch / elapsed:.0f} verifications/s)")
+    print(f"  accepted {np.sum(status == ACCEPTED)}, rejected {np.sum(status == REJECTED)}, not finished {np.sum(status == NOT_FINISHED)}")
+
+    # Cross-check with the simulator (it signals a hanging decompression with ValueError)
+    def simulated_status(i):
+        constants_i = dict(constants, message_blocks=[len(messages[i])] + list(np.frombuffer(messages[i].ljust(-(-len(messages[i]) // 8) * 8, b"\0"), dtype="<u8")))
+        try:
+            return simulate_verify(program, N, signatures[i], constants_i)
+        except ValueError:
+            return NOT_FINISHED
+
+    checked = min(batch, 200)
+    mismatches = [i for i in range(checked) if simulated_status(i) != status[i]]
+    print(f"  matches isa_simulator.py on {checked - len(mismatches)} of {checked} vectors")
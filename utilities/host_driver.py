@@ -0,0 +1,346 @@
+# Host driver for the accelerator on top of a mock_axi.py device
+#
+# Mirrors sw/falcon/src/utilities.h (and the loaders of main.c) function by function, with the same register accesses: every
+# CONTROL_REG update is a read-modify-write and bram_write()/bram_read() enable and disable BRAM access once per burst, so the
+# MMIO counters of the device show what the C driver costs. Rows are (high, low) pairs of 64-bit words like in
+# isa_simulator.py, createUint128_t(high, low) on the host.
+#
+# Key residency is tracked like in utilities.h: sign() only loads b00..b11 and the tree if the constants passed (compared by
+# identity) are not resident anymore. The main block checks that the sign program leaves the key material untouched.
+#
+# sign_batch() mirrors sign_batch() of main.c: the key is loaded once, the rows of the next message are prepared while the
+# accelerator runs and the report has signatures/s, host time per stage and the cycle count distribution. On
+# FunctionalDevice the run (the simulation) ends up under "wait" like on the board, cycle counts vary with the SAMPLERZ
+# rejection loops of every signature. They are estimates of the uncalibrated cost_model.py and are printed as such.
+#
+# Usage: python host_driver.py [N] [batch size]   ... run sign(); reset_algorithm(); verify(); sign_throughput(); of main.c
+#                                                     (built with RUN_SIGN_THROUGHPUT) on FunctionalDevice
+
+import time
+
+import numpy as np
+
+from mock_axi import (
+    ALGORITHM_DONE_MASK,
+    ALGORITHM_MASK,
+    ALGORITHM_SHIFT,
+    BRAM_ACCESS,
+    CONTROL_REG,
+    CYCLE_COUNT_REG,
+    INTERRUPT_EDGE,
+    INTERRUPT_ENABLE,
+    INTERRUPT_PENDING,
+    INTERRUPT_REG,
+    OUTPUT_REG,
+    RESET,
+    SIGN,
+    SIGNATURE_ACCEPTED_MASK,
+    SIGNATURE_REJECTED_MASK,
+    START,
+    VERIFY,
+    bram_address,
+)
+
+MASK64 = (1 << 64) - 1
+
+BRAM0, BRAM1, BRAM2, BRAM3, BRAM4, BRAM5, BRAM6 = range(7)
+
+# main.h
+BRAM_ROWS = 1 << 13
+TREE_SIZE = {512: 5120, 1024: 11264}
+SIGNATURE_BLOCK_COUNT = {512: 40, 1024: 78}
+SEED_BASE_ADDR = {512: 324, 1024: 648}
+GENERATED_SIGNATURE_ADDR = {512: 256, 1024: 512}
+SEED = [(0x1111111111111111, 0x1111111111111111)] * 4
+STAGES = ["key", "transfer", "start", "staging", "wait", "signature", "reset"]
+
+
+def create_uint128(high, low):
+    return (int(high) << 64) | int(low)
+
+
+# Rows of a message as written by load_message()
+def message_rows(message_blocks):
+    return np.array([(0, block) for block in message_blocks], dtype=np.uint64)
+
+
+class FalconDriver:
+
+    def __init__(self, device, N):
+        self.device = device
+        self.N = N
+        self.residency = {}  # bram_id: (key, first_row, row_count)
+        self.done_interrupt_enabled = False
+
+    def set_control_bits(self, mask):
+        self.device.write32(CONTROL_REG, self.device.read32(CONTROL_REG) | mask)
+
+    def clear_control_bits(self, mask):
+        self.device.write32(CONTROL_REG, self.device.read32(CONTROL_REG) & ~mask)
+
+    def set_resident(self, bram_id, key, first_row, row_count):
+        self.residency[bram_id] = (key, first_row, row_count)
+
+    def is_resident(self, bram_id, key):
+        return key is not None and bram_id in self.residency and self.residency[bram_id][0] is key
+
+    # Forgets the resident key material of BRAM bram_id if it overlaps rows [bram_addr, bram_addr + count)
+    def invalidate_rows(self, bram_id, bram_addr, count):
+        if bram_id in self.residency:
+            _, first_row, row_count = self.residency[bram_id]
+            if bram_addr < first_row + row_count and first_row < bram_addr + count:
+                del self.residency[bram_id]
+
+    def invalidate_residency(self):
+        self.residency.clear()
+
+    def enable_bram_access(self):
+        self.set_control_bits(BRAM_ACCESS)
+
+    def disable_bram_access(self):
+        self.clear_control_bits(BRAM_ACCESS)
+
+    # Writes rows (high, low) to BRAM bram_id starting at bram_addr
+    def bram_write(self, rows, bram_id, bram_addr, count=None):
+        rows = np.asarray(rows, dtype=np.uint64).reshape(-1, 2)
+        count = len(rows) if count is None else count
+        self.invalidate_rows(bram_id, bram_addr, count)
+        self.enable_bram_access()
+        for i in range(count):
+            self.device.write128(bram_address(bram_id, bram_addr + i), create_uint128(*rows[i]))
+        self.disable_bram_access()
+
+    # Reads count rows (high, low) from BRAM bram_id starting at bram_addr
+    def bram_read(self, bram_id, bram_addr, count):
+        rows = np.zeros((count, 2), dtype=np.uint64)
+        self.enable_bram_access()
+        for i in range(count):
+            value = self.device.read128(bram_address(bram_id, bram_addr + i))
+            rows[i] = (value >> 64, value & MASK64)
+        self.disable_bram_access()
+        return rows
+
+    def start_algorithm(self, algorithm):
+        # The sign program only writes BRAM4, BRAM5 and the rows behind the key material, see start_algorithm() in utilities.h
+        if algorithm == SIGN:
+            for bram_id in [BRAM0, BRAM1, BRAM2, BRAM3]:
+                self.invalidate_rows(bram_id, self.N // 2, BRAM_ROWS - self.N // 2)
+            self.invalidate_rows(BRAM4, 0, BRAM_ROWS)
+            self.invalidate_rows(BRAM5, 0, BRAM_ROWS)
+            self.invalidate_rows(BRAM6, TREE_SIZE[self.N] // 2, BRAM_ROWS - TREE_SIZE[self.N] // 2)
+        else:
+            self.invalidate_residency()
+        self.clear_control_bits(ALGORITHM_MASK)
+        self.set_control_bits(algorithm << ALGORITHM_SHIFT)
+        self.set_control_bits(START)
+        self.clear_control_bits(START)
+
+    def reset_algorithm(self):
+        self.set_control_bits(RESET)
+        self.clear_control_bits(RESET)
+
+    def enable_done_interrupt(self, edge=False):
+        self.device.write32(INTERRUPT_REG, INTERRUPT_ENABLE | (INTERRUPT_EDGE if edge else 0))
+        self.done_interrupt_enabled = True
+
+    def disable_done_interrupt(self):
+        self.device.write32(INTERRUPT_REG, 0)
+        self.done_interrupt_enabled = False
+
+    # done_interrupt_handler() of utilities.h, the acknowledge re-arms the interrupt for the next run
+    def acknowledge_done_interrupt(self):
+        self.device.write32(INTERRUPT_REG, (self.device.read32(INTERRUPT_REG) & (INTERRUPT_ENABLE | INTERRUPT_EDGE)) | INTERRUPT_PENDING)
+
+    # Sleeps on the done interrupt if enabled, otherwise polls OUTPUT_REG until done. Returns the number of polls. timeout
+    # in seconds (None = wait forever like the C driver).
+    def wait_until_done(self, timeout=None):
+        if self.done_interrupt_enabled:
+            if not self.device.wait_for_interrupt(timeout):
+                raise TimeoutError(f"No done interrupt after {timeout} s")
+            self.acknowledge_done_interrupt()
+            return 0
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        polls = 1
+        while (self.device.read32(OUTPUT_REG) & ALGORITHM_DONE_MASK) == 0:
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Algorithm not done after {timeout} s")
+            polls += 1
+        return polls
+
+    # 0 = signature accepted, 1 = signature rejected, -1 = neither
+    def get_status(self):
+        accepted = self.device.read32(OUTPUT_REG) & SIGNATURE_ACCEPTED_MASK
+        rejected = self.device.read32(OUTPUT_REG) & SIGNATURE_REJECTED_MASK
+        if accepted and not rejected:
+            return 0
+        if rejected and not accepted:
+            return 1
+        return -1
+
+    def get_cycle_count(self):
+        return self.device.read32(CYCLE_COUNT_REG)
+
+    # Loaders of main.c
+
+    def load_into_bram(self, words, bram_id, start_addr=0):
+        self.bram_write(np.asarray(words, dtype=np.uint64).reshape(-1, 2), bram_id, start_addr)
+
+    def load_public_key(self, public_key, bram_id):
+        public_key = np.asarray(public_key, dtype=np.uint64)
+        self.bram_write(np.stack([public_key[: self.N // 2], public_key[self.N // 2 :]], axis=1), bram_id, 0)
+
+    def load_message(self, message_blocks, bram_id):
+        self.bram_write(message_rows(message_blocks), bram_id, 0)
+
+    def load_seed(self, seed):
+        self.bram_write(seed, BRAM3, SEED_BASE_ADDR[self.N])
+
+    def sign_key_resident(self, key):
+        return all(self.is_resident(bram_id, key) for bram_id in [BRAM0, BRAM1, BRAM2, BRAM3, BRAM6])
+
+    # Loads b00, b01, b10, b11 and the tree of constants unless they are still resident, returns whether they were loaded
+    def load_sign_key(self, constants):
+        if self.sign_key_resident(constants):
+            return False
+        for bank, name in enumerate(["b00", "b01", "b10", "b11"]):
+            self.load_into_bram(constants[name], bank)
+            self.set_resident(bank, constants, 0, self.N // 2)
+        self.load_into_bram(constants["tree"], BRAM6)
+        self.set_resident(BRAM6, constants, 0, TREE_SIZE[self.N] // 2)
+        return True
+
+    # sign() of main.c, returns (status, signature rows, cycle count)
+    def sign(self, constants, seed=SEED):
+        self.load_sign_key(constants)
+        self.load_message(constants["message_blocks"], BRAM4)
+        self.load_seed(seed)
+
+        self.start_algorithm(SIGN)
+        self.wait_until_done()
+
+        signature = self.bram_read(BRAM0, GENERATED_SIGNATURE_ADDR[self.N], SIGNATURE_BLOCK_COUNT[self.N])
+        return self.get_status(), signature, self.get_cycle_count()
+
+    # sign_batch() of main.c. Signs messages[i] (message blocks) with seeds[i], returns (statuses, signatures, cycle counts,
+    # report) with report = {"count", "accepted", "stages": {stage: seconds}, "total": seconds}.
+    def sign_batch(self, constants, messages, seeds):
+        report = {"count": len(messages), "accepted": 0, "stages": dict.fromkeys(STAGES, 0.0), "total": 0.0}
+        statuses, signatures, cycle_counts = [], [], []
+        start = stage_start = time.perf_counter()
+
+        def end_stage(stage):
+            nonlocal stage_start
+            now = time.perf_counter()
+            report["stages"][stage] += now - stage_start
+            stage_start = now
+
+        self.reset_algorithm()  # done stays set after a previous run until reset
+        self.load_sign_key(constants)
+        end_stage("key")
+
+        staged = message_rows(messages[0]) if messages else None
+        end_stage("staging")
+
+        for i in range(len(messages)):
+            self.bram_write(staged, BRAM4, 0)
+            self.load_seed(seeds[i])
+            end_stage("transfer")
+
+            self.start_algorithm(SIGN)
+            end_stage("start")
+
+            # Host work that overlaps with the run, BRAM4 can't be written before the accelerator is done
+
+            if i + 1 < len(messages):
+                staged = message_rows(messages[i + 1])
+            end_stage("staging")
+
+            self.wait_until_done()
+            end_stage("wait")
+
+            signatures.append(self.bram_read(BRAM0, GENERATED_SIGNATURE_ADDR[self.N], SIGNATURE_BLOCK_COUNT[self.N]))
+            statuses.append(self.get_status())
+            cycle_counts.append(self.get_cycle_count())
+            report["accepted"] += statuses[-1] == 0
+            end_stage("signature")
+
+            self.reset_algorithm()
+            end_stage("reset")
+
+        report["total"] = stage_start - start
+        return statuses, signatures, cycle_counts, report
+
+    # verify() of main.c, returns (status, cycle count)
+    def verify(self, constants, signature):
+        self.load_public_key(constants["public_key"], BRAM0)
+        self.bram_write(signature, BRAM1, 0)
+        self.load_message(constants["message_blocks"], BRAM6)
+
+        self.start_algorithm(VERIFY)
+        self.wait_until_done()
+        return self.get_status(), self.get_cycle_count()
+
+
+# print_batch_report() of main.c. estimated marks cycle counts that come from cost_model.py instead of the hardware.
+def print_batch_report(report, cycle_counts, estimated=False):
+    if not report["count"] or not report["total"]:
+        return
+    print(f"{report['count']} signatures ({report['accepted']} accepted) in {report['total']:.3f} s, {report['count'] / report['total']:.2f} signatures/s")
+    print("Host time per stage:")
+    for stage, seconds in report["stages"].items():
+        print(f"  {stage}: {seconds * 1e6:.0f} us ({seconds * 1e6 / report['count']:.0f} us per signature)")
+    cycle_counts = np.sort(cycle_counts)
+    count = len(cycle_counts)
+    print(f"{'Estimated cycle count (cost_model.py, not measured)' if estimated else 'Cycle count'}: min {cycle_counts[0]}, median {cycle_counts[count // 2]}, p90 {cycle_counts[count * 9 // 10]}, max {cycle_counts[-1]}, mean {cycle_counts.mean():.0f}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    from isa_simulator import read_host_constants
+    from mock_axi import FunctionalDevice
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    constants = read_host_constants(N)
+    device = FunctionalDevice(N, busy_reads=100)
+    driver = FalconDriver(device, N)
+    device.program(SIGN), device.program(VERIFY)  # Generate the programs before timing
+
+    cycle_count_name = "estimated cycle count" if device.cycle_counts_estimated else "cycle count"
+
+    def report(name, start, result=""):
+        print(f"{name:<7} {result}{device.mmio_operations()} MMIO operations ({device.bram_writes} BRAM writes, {device.bram_reads} BRAM reads), {time.perf_counter() - start:.2f} s")
+        device.reset_counters()
+
+    start = time.perf_counter()
+    status, signature, cycle_count = driver.sign(constants)
+    report("sign", start, f"status {status}, {cycle_count_name} {cycle_count}, ")
+
+    start = time.perf_counter()
+    driver.reset_algorithm()
+    report("reset", start)
+
+    # Key material after signing has to equal the loaded key, so the second signature only transfers message and seed
+    key_rows = [bank[: N // 2] for bank in device.simulator.banks[:4]] + [device.simulator.banks[BRAM6][: TREE_SIZE[N] // 2]]
+    preserved = all(np.array_equal(rows, np.asarray(constants[name], dtype=np.uint64).reshape(-1, 2)) for rows, name in zip(key_rows, ["b00", "b01", "b10", "b11", "tree"]))
+    start = time.perf_counter()
+    status, second_signature, cycle_count = driver.sign(constants)
+    report("sign", start, f"status {status}, key preserved {preserved}, same signature {np.array_equal(signature, second_signature)}, ")
+    driver.reset_algorithm()
+    device.reset_counters()
+
+    start = time.perf_counter()
+    status, cycle_count = driver.verify(constants, signature)
+    report("verify", start, f"status {status}, {cycle_count_name} {cycle_count}, ")
+
+    # sign_throughput() of main.c, row 0 low of the seed is the initial ChaCha20 counter
+    seeds = [[(high, low + i if j == 0 else low) for j, (high, low) in enumerate(SEED)] for i in range(batch_size)]
+    for interrupt in [False, True]:
+        if interrupt:
+            driver.enable_done_interrupt()
+        start = time.perf_counter()
+        statuses, signatures, cycle_counts, batch_report = driver.sign_batch(constants, [constants["message_blocks"]] * batch_size, seeds)
+        report("batch", start, f"{'done interrupt' if interrupt else 'polling'}, statuses {statuses}, ")
+        print_batch_report(batch_report, cycle_counts, device.cycle_counts_estimated)
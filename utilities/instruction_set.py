@@ -0,0 +1,296 @@
+# Description of the 70-bit instruction format executed by control_unit.sv
+#
+# Used by the instruction generator and by the scripts that analyze or transform generated programs.
+# Field layout, module bits and BRAM port usage mirror control_unit.sv, keep them in sync when changing the hardware.
+
+# Module names in the order of their bits in the instruction, from the most significant bit to the least significant one.
+# This is also the order in which calculate_cycles.py prints modules_running.
+MODULE_NAMES = [
+    "COPY",
+    "HASH_TO_POINT",
+    "INT_TO_DOUBLE",
+    "FFT_IFFT",
+    "NTT_INTT",
+    "COMPLEX_MUL",
+    "MUL_CONST",
+    "SPLIT",
+    "MERGE",
+    "MULT_MOD_Q",
+    "CHECK_BOUND",
+    "DECOMPRESS",
+    "COMPRESS",
+    "ADD_SUB",
+    "SAMPLERZ",
+]
+
+MODULE_COUNT = len(MODULE_NAMES)
+
+# Bit of each module in the "modules" field (COPY is bit 14, SAMPLERZ is bit 0)
+MODULE_BITS = {name: MODULE_COUNT - 1 - i for i, name in enumerate(MODULE_NAMES)}
+
+# (name, width) from the most significant to the least significant bit. The modules field is 16 bits wide but the top bit
+# is never set, so instructions fit into `INSTRUCTION_WIDTH bits
+INSTRUCTION_FIELDS = [
+    ("modules", 16),
+    ("input_output_addr_same", 1),
+    ("mul_const_constant", 1),
+    ("element_count", 4),
+    ("mode2", 1),
+    ("mode1", 1),
+    ("addr2", 13),
+    ("addr1", 13),
+    ("bank7", 3),
+    ("bank6", 3),
+    ("bank5", 3),
+    ("bank4", 3),
+    ("bank3", 3),
+    ("bank2", 3),
+    ("bank1", 3),
+]
+
+INSTRUCTION_WIDTH = 70
+
+# Number of 128 bit rows in each BRAM bank (see BRAM*_COUNT in control_unit.sv)
+BANK_ROWS = [3072, 2048, 1024, 1024, 1024, 1024, 6144]
+BANK_COUNT = len(BANK_ROWS)
+
+# Instruction fields each module reads. Fields that are only used in some modes are added in module_fields()
+MODULE_FIELDS = {
+    "COPY": ["bank3", "bank4", "addr1", "element_count", "input_output_addr_same"],
+    "HASH_TO_POINT": ["bank3", "bank4"],
+    "INT_TO_DOUBLE": ["bank1", "bank2", "element_count"],
+    "FFT_IFFT": ["bank1", "bank2", "addr1", "addr2", "mode1"],
+    "NTT_INTT": ["bank1", "bank2", "mode1"],
+    "COMPLEX_MUL": ["bank1", "bank2", "addr1", "addr2", "element_count"],
+    "MUL_CONST": ["bank3", "bank4", "element_count", "mul_const_constant"],
+    "SPLIT": ["bank1", "bank2", "addr1", "addr2", "element_count"],
+    "MERGE": ["bank1", "bank2", "addr1", "addr2", "element_count"],
+    "MULT_MOD_Q": ["bank1", "bank2", "bank3", "element_count"],
+    "CHECK_BOUND": ["bank1", "bank2", "bank3", "element_count"],
+    "DECOMPRESS": ["bank5", "bank6", "bank7"],
+    "COMPRESS": ["bank1", "bank2", "bank3", "bank4", "addr1", "addr2", "element_count"],
+    "ADD_SUB": ["bank3", "bank4", "addr1", "mode2", "element_count", "input_output_addr_same"],
+    "SAMPLERZ": ["bank1", "bank2", "bank3", "bank4", "addr1", "addr2", "mode1", "mode2"],
+}
+
+
+def seed_base_addr(N):
+    # `SEED_BASE_ADDR in common_definitions.vh
+    return 324 if N == 512 else 648
+
+
+def samplerz_output_addr(N):
+    # SAMPLERZ always writes its result to this row of bank3, see control_unit.sv
+    return 528 if N == 512 else 784
+
+
+def encode_instruction(**fields):
+    instruction = 0
+    for name, width in INSTRUCTION_FIELDS:
+        instruction = (instruction << width) | (fields.get(name, 0) & ((1 << width) - 1))
+    return instruction
+
+
+def decode_instruction(instruction):
+    fields = {}
+    for name, width in reversed(INSTRUCTION_FIELDS):
+        fields[name] = instruction & ((1 << width) - 1)
+        instruction >>= width
+    return fields
+
+
+def instruction_modules(instruction):
+    modules = decode_instruction(instruction)["modules"]
+    return [name for name in MODULE_NAMES if modules & (1 << MODULE_BITS[name])]
+
+
+def module_fields(module, fields):
+    used = list(MODULE_FIELDS[module])
+    if module in ["COPY", "ADD_SUB"] and not fields["input_output_addr_same"]:
+        used.append("addr2")
+    return used
+
+
+# Returns list of BRAM accesses the module makes when executing the instruction with given (decoded) fields.
+# Each access is a tuple (bank, port, first_row, row_count, is_write).
+# Accesses whose rows are not known exactly (hash_to_point input, decompress input) conservatively cover the whole bank.
+def module_accesses(module, fields, N):
+    element_count = 1 << fields["element_count"]
+    bank = [None] + [fields[f"bank{i}"] for i in range(1, 8)]
+    addr1 = fields["addr1"]
+    addr2 = fields["addr2"]
+    dst = addr1 if fields["input_output_addr_same"] else addr2
+
+    if module == "COPY":
+        return [(bank[3], "a", addr1, element_count, False), (bank[4], "b", dst, element_count, True)]
+
+    if module == "HASH_TO_POINT":
+        return [
+            (bank[3], "a", 0, BANK_ROWS[bank[3]], False),
+            (bank[4], "a", 0, N // 2, True),
+            (bank[4], "b", 0, N // 2, False),
+        ]
+
+    if module == "INT_TO_DOUBLE":
+        return [(bank[1], "a", 0, element_count, False), (bank[2], "b", 0, element_count, True)]
+
+    if module in ["FFT_IFFT", "NTT_INTT"]:
+        if module == "FFT_IFFT":
+            regions = [(bank[1], addr1, N // 2), (bank[2], addr2, N // 2)]
+        else:  # NTT keeps one coefficient per row during the computation
+            regions = [(bank[1], 0, N), (bank[2], 0, N)]
+        accesses = []
+        for b, start, count in regions:
+            for port in ["a", "b"]:
+                accesses.append((b, port, start, count, False))
+                accesses.append((b, port, start, count, True))
+        return accesses
+
+    if module == "COMPLEX_MUL":
+        return [
+            (bank[1], "a", addr1, element_count, False),
+            (bank[2], "a", addr2, element_count, False),
+            (bank[1], "b", addr1, element_count, True),
+        ]
+
+    if module == "MUL_CONST":
+        return [(bank[3], "a", 0, element_count, False), (bank[4], "b", 0, element_count, True)]
+
+    if module in ["SPLIT", "MERGE"]:
+        return [
+            (bank[1], "a", addr1, element_count // 2, False),
+            (bank[1], "b", addr1, element_count // 2, False),
+            (bank[2], "a", addr2, element_count // 2, True),
+            (bank[2], "b", addr2, element_count // 2, True),
+        ]
+
+    if module == "MULT_MOD_Q":
+        return [
+            (bank[1], "a", 0, N, False),
+            (bank[1], "b", 0, N, False),
+            (bank[2], "a", 0, N, False),
+            (bank[2], "b", 0, N, False),
+            (bank[3], "a", 0, element_count, True),
+        ]
+
+    if module == "CHECK_BOUND":
+        return [
+            (bank[1], "a", 0, element_count, False),
+            (bank[2], "a", 0, N, False),
+            (bank[2], "b", 0, N, False),
+            (bank[3], "b", 0, element_count, False),
+        ]
+
+    if module == "DECOMPRESS":
+        return [
+            (bank[5], "a", 0, BANK_ROWS[bank[5]], False),
+            (bank[6], "a", 0, N // 2, True),
+            (bank[6], "b", 0, N // 2, False),
+            (bank[7], "a", 0, N // 2, True),
+        ]
+
+    if module == "COMPRESS":
+        return [
+            (bank[1], "a", addr1, N // 2, False),
+            (bank[2], "a", addr1, N // 2, False),
+            (bank[3], "a", addr2, N // 2, False),
+            (bank[4], "b", addr1, N // 2, True),
+        ]
+
+    if module == "ADD_SUB":
+        return [
+            (bank[3], "a", addr1, element_count, False),
+            (bank[4], "a", dst, element_count, False),
+            (bank[4], "b", dst, element_count, True),
+        ]
+
+    if module == "SAMPLERZ":
+        return [
+            (bank[1], "a", addr1, 1, False),
+            (bank[2], "a", addr2, 1, False),
+            (bank[3], "a", samplerz_output_addr(N), 1, True),
+            (bank[4], "a", seed_base_addr(N), 4, False),
+            (bank[4], "b", seed_base_addr(N), 4, False),
+        ]
+
+    raise ValueError(f"Unknown module '{module}'")
+
+
+# Returns (bank field, address field) of each access returned by module_accesses() (same order). Address field is None if
+# the row doesn't come from the instruction (fixed rows, rows starting at 0).
+def module_access_fields(module, fields):
+    dst = "addr1" if fields["input_output_addr_same"] else "addr2"
+
+    if module == "COPY":
+        return [("bank3", "addr1"), ("bank4", dst)]
+    if module == "HASH_TO_POINT":
+        return [("bank3", None), ("bank4", None), ("bank4", None)]
+    if module == "INT_TO_DOUBLE":
+        return [("bank1", None), ("bank2", None)]
+    if module == "FFT_IFFT":
+        return [("bank1", "addr1")] * 4 + [("bank2", "addr2")] * 4
+    if module == "NTT_INTT":
+        return [("bank1", None)] * 4 + [("bank2", None)] * 4
+    if module == "COMPLEX_MUL":
+        return [("bank1", "addr1"), ("bank2", "addr2"), ("bank1", "addr1")]
+    if module == "MUL_CONST":
+        return [("bank3", None), ("bank4", None)]
+    if module in ["SPLIT", "MERGE"]:
+        return [("bank1", "addr1"), ("bank1", "addr1"), ("bank2", "addr2"), ("bank2", "addr2")]
+    if module == "MULT_MOD_Q":
+        return [("bank1", None), ("bank1", None), ("bank2", None), ("bank2", None), ("bank3", None)]
+    if module == "CHECK_BOUND":
+        return [("bank1", None), ("bank2", None), ("bank2", None), ("bank3", None)]
+    if module == "DECOMPRESS":
+        return [("bank5", None), ("bank6", None), ("bank6", None), ("bank7", None)]
+    if module == "COMPRESS":
+        return [("bank1", "addr1"), ("bank2", "addr1"), ("bank3", "addr2"), ("bank4", "addr1")]
+    if module == "ADD_SUB":
+        return [("bank3", "addr1"), ("bank4", dst), ("bank4", dst)]
+    if module == "SAMPLERZ":
+        return [("bank1", "addr1"), ("bank2", "addr2"), ("bank3", None), ("bank4", None), ("bank4", None)]
+
+    raise ValueError(f"Unknown module '{module}'")
+
+
+# control_unit.sv sets BRAM port addresses in one if block per module (in MODULE_NAMES order), so when modules of the same
+# instruction use the same port, the last of them drives the address and the others access its rows. The sign program relies
+# on this: "COMPLEX_MUL, COPY (2)" copies the rows COMPLEX_MUL reads, not the rows at addr1.
+# Returns for every access (module, bank, port, ...) the index of the access whose address is used.
+def address_drivers(accesses):
+    drivers = []
+    for i, (module, bank, port) in enumerate(access[:3] for access in accesses):
+        driver = i
+        for j in range(i + 1, len(accesses)):
+            if accesses[j][0] != module and accesses[j][1:3] == (bank, port):
+                driver = j
+        drivers.append(driver)
+    return drivers
+
+
+def unresolved_accesses(instruction, N):
+    fields = decode_instruction(instruction)
+    return [(module,) + access for module in instruction_modules(instruction) for access in module_accesses(module, fields, N)]
+
+
+# Returns all BRAM accesses of an instruction as tuples (module, bank, port, first_row, row_count, is_write). Rows of accesses
+# through a port shared with a later module are the rows of that module, see address_drivers().
+def instruction_accesses(instruction, N):
+    accesses = unresolved_accesses(instruction, N)
+    drivers = address_drivers(accesses)
+    return [access[:3] + (accesses[driver][3],) + access[4:] for access, driver in zip(accesses, drivers)]
+
+
+# Returns (bank field, address field) of every access of instruction_accesses(), address fields resolved like the rows
+def instruction_access_fields(instruction, N):
+    fields = decode_instruction(instruction)
+    access_fields = [access_fields for module in instruction_modules(instruction) for access_fields in module_access_fields(module, fields)]
+    drivers = address_drivers(unresolved_accesses(instruction, N))
+    return [(bank_field, access_fields[driver][1]) for (bank_field, _), driver in zip(access_fields, drivers)]
+
+
+def format_instruction(instruction):
+    fields = decode_instruction(instruction)
+    modules = "+".join(instruction_modules(instruction)) or "NOP"
+    details = " ".join(f"{name}={fields[name]}" for name, _ in reversed(INSTRUCTION_FIELDS) if name != "modules" and fields[name])
+    return f"{modules} {details}".strip()
@@ -0,0 +1,698 @@
+# Functional simulator of the instruction set executed by control_unit.sv
+#
+# Runs generated programs on a model of the seven BRAM banks without simulating the RTL cycle by cycle, so whole sign/verify
+# programs finish in seconds. Meant for checking that copy elimination and other program transformations don't change
+# what a program computes: run the original and the transformed program on the same inputs and compare the outputs.
+#
+# - Banks hold 128 bit rows as pairs of uint64 (column 0 = bits [127:64], column 1 = bits [63:0]). Doubles are stored by
+#   their bit pattern, complex numbers as (real, imaginary) halves of one row.
+# - All modules of an instruction read the banks as they were before the instruction and their writes are applied when the
+#   instruction finishes (in module order). Accesses through a BRAM port shared with a later module use the rows of that
+#   module (see instruction_set.address_drivers). This is what the hardware does for programs whose co-issued modules don't
+#   overwrite rows another module of the same instruction still has to read.
+# - Integer modules (COPY, HASH_TO_POINT, INT_TO_DOUBLE, NTT_INTT, MULT_MOD_Q, CHECK_BOUND, DECOMPRESS, COMPRESS) follow the
+#   RTL bit for bit, including the signed 15-bit arithmetic of ntt.sv and what intermediate NTT/FFT stages leave in the banks.
+# - Floating point modules use IEEE double arithmetic in the order of the RTL datapath. The custom fp_adder/fp_multiplier may
+#   round differently in corner cases.
+# - SAMPLERZ implements the sampler of the Falcon reference (ChaCha20 PRNG with 8 interleaved blocks, seeded from the 4 seed
+#   rows). The RTL refill logic hands out the random bytes in a different order, so samples are deterministic but not the
+#   ones the FPGA draws.
+#
+# Usage:
+#   python isa_simulator.py [N]          ... sign the message of sw/falcon/src/constants_<N>.h, verify the signature and check
+#                                            that the copy elimination pass gives the same result
+
+import hashlib
+import math
+import os
+import re
+import struct
+import sys
+
+import numpy as np
+
+from instruction_set import (
+    BANK_ROWS,
+    decode_instruction,
+    instruction_accesses,
+    instruction_modules,
+    samplerz_output_addr,
+    seed_base_addr,
+    unresolved_accesses,
+)
+
+REPOSITORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+FFT_TWIDDLE_FILE = os.path.join(REPOSITORY_DIR, "ip", "falcon_ip.srcs", "sources_1", "coefficients", "fft_twiddle_factors.mem")
+HOST_CONSTANTS_FILE = os.path.join(REPOSITORY_DIR, "sw", "falcon", "src", "constants_{N}.h")
+
+Q = 12289
+MASK64 = (1 << 64) - 1
+
+# Squared acceptance bound (check_bound.sv, compress.sv) and expected compressed signature length in bytes (SLEN)
+BOUND2 = {8: 428865, 512: 34034726, 1024: 70265242}
+SIGNATURE_LENGTH = {8: 52 - 41, 512: 666 - 41, 1024: 1280 - 41}
+
+# Host side constants from main.h
+SIGNATURE_BLOCK_COUNT = {512: 40, 1024: 78}
+SEED = [(0x1111111111111111, 0x1111111111111111)] * 4
+
+# INTT scale factor N^-1 mod q (ntt.sv)
+INTT_SCALE = {8: 10753, 512: 12265, 1024: 12277}
+
+
+def bits_to_double(bits):
+    return struct.unpack("<d", struct.pack("<Q", bits))[0]
+
+
+def double_to_bits(value):
+    return struct.unpack("<Q", struct.pack("<d", value))[0]
+
+
+# SamplerZ constants (samplerz.sv, berexp.sv, Falcon reference)
+SIGMA_MIN = {512: bits_to_double(4608433670533905013), 1024: bits_to_double(4608525754002622308)}
+HALF_ISIGMA_MAX_SQR = bits_to_double(4594603506513722306)
+ILN2 = bits_to_double(4609176140021203710)
+LN2 = bits_to_double(4604418534313441775)
+RCDT = [
+    3024686241123004913666, 1564742784480091954050, 636254429462080897535, 199560484645026482916, 47667343854657281903,
+    8595902006365044063, 1163297957344668388, 117656387352093658, 8867391802663976, 496969357462633, 20680885154299,
+    638331848991, 14602316184, 247426747, 3104126, 28824, 198, 1,
+]  # fmt: skip
+EXPM_COEFFICIENTS = [
+    0x00000004741183A3, 0x00000036548CFC06, 0x0000024FDCBF140A, 0x0000171D939DE045, 0x0000D00CF58F6F84, 0x000680681CF796E3,
+    0x002D82D8305B0FEA, 0x011111110E066FD0, 0x0555555555070F00, 0x155555555581FF00, 0x400000000002B400, 0x7FFFFFFFFFFF4800,
+    0x8000000000000000,
+]  # fmt: skip
+CHACHA_CONSTANTS = [0x61707865, 0x3320646E, 0x79622D32, 0x6B206574]
+CHACHA_BLOCKS = 8
+CHACHA_QUARTER_ROUNDS = [(0, 4, 8, 12), (1, 5, 9, 13), (2, 6, 10, 14), (3, 7, 11, 15), (0, 5, 10, 15), (1, 6, 11, 12), (2, 7, 8, 13), (3, 4, 9, 14)]
+
+
+def bit_reverse(value, bits):
+    return int(format(value, f"0{bits}b")[::-1], 2)
+
+
+# Twiddle factors of ntt_twiddle_factor_rom.sv (no Montgomery factor, mult_mod_q_for_ntt computes a*b mod q directly)
+def ntt_twiddle_factors(inverse):
+    g = pow(7, -1, Q) if inverse else 7
+    return np.array([pow(g, bit_reverse(i, 10), Q) for i in range(1024)], dtype=np.int64)
+
+
+NTT_TWIDDLES = ntt_twiddle_factors(inverse=False)
+INTT_TWIDDLES = ntt_twiddle_factors(inverse=True)
+
+
+# (real, imaginary) parts of the FFT twiddle factors from the ROM initialization file of fft_twiddle_factor_rom.sv
+def read_fft_twiddle_factors(filename=FFT_TWIDDLE_FILE):
+    with open(filename) as f:
+        rows = [line.strip() for line in f if line.strip()]
+    bits = np.array([[int(row[:16], 16), int(row[16:], 16)] for row in rows], dtype=np.uint64)
+    floats = bits.view(np.float64)
+    return floats[:, 0].copy(), floats[:, 1].copy()
+
+
+FFT_TWIDDLES = None
+
+
+def fft_twiddle_factors():
+    global FFT_TWIDDLES
+    if FFT_TWIDDLES is None:
+        FFT_TWIDDLES = read_fft_twiddle_factors()
+    return FFT_TWIDDLES
+
+
+# Sign extends [14:0] of each value
+def signed15(values):
+    values = np.asarray(values, dtype=np.uint64) & np.uint64(0x7FFF)
+    return (values.astype(np.int64) ^ 0x4000) - 0x4000
+
+
+# Rows holding one signed 15-bit value each, sign extended to 128 bits like the NTT writes them
+def sign_extended_rows(values):
+    values = np.asarray(values, dtype=np.int64)
+    rows = np.empty((len(values), 2), dtype=np.uint64)
+    rows[:, 0] = np.where(values < 0, np.uint64(MASK64), np.uint64(0))
+    rows[:, 1] = values.astype(np.uint64)
+    return rows
+
+
+# Rows {49'b0, high[14:0], 49'b0, low[14:0]}
+def packed15_rows(high, low):
+    rows = np.empty((len(high), 2), dtype=np.uint64)
+    rows[:, 0] = np.asarray(high, dtype=np.int64).astype(np.uint64) & np.uint64(0x7FFF)
+    rows[:, 1] = np.asarray(low, dtype=np.int64).astype(np.uint64) & np.uint64(0x7FFF)
+    return rows
+
+
+def double_rows(high, low):
+    rows = np.empty((len(high), 2), dtype=np.float64)
+    rows[:, 0] = high
+    rows[:, 1] = low
+    return rows.view(np.uint64)
+
+
+def complex_multiply(a_re, a_im, b_re, b_im):
+    # complex_multiplier.sv: real = ar*br - ai*bi, imag = ar*bi + ai*br
+    return a_re * b_re - a_im * b_im, a_re * b_im + a_im * b_re
+
+
+# mod_add() and mod_sub() of ntt.sv on signed 15-bit values
+def ntt_mod_add(a, b):
+    total = a + b
+    return signed15(np.where(total >= Q, total - Q, total))
+
+
+def ntt_mod_sub(a, b):
+    return signed15(np.where(a >= b, a - b, a + Q - b))
+
+
+# double_to_int.sv: round half away from zero, keep 15 bits of the magnitude and apply the sign
+def double_to_int(values):
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    floor = np.floor(magnitude)
+    rounded = floor + (magnitude - floor >= 0.5)
+    rounded = np.where(rounded < 2**63, rounded, 0).astype(np.uint64) & np.uint64(0x7FFF)
+    return signed15(np.where(np.signbit(values), -rounded.astype(np.int64), rounded.astype(np.int64)))
+
+
+# Falcon coefficient encoding of compress_coefficient.sv: sign, 7 low bits, high bits in unary terminated by a 1
+def compress_coefficient(coefficient):
+    magnitude = -coefficient & 0x7FFF if coefficient < 0 else coefficient
+    sign = "1" if coefficient < 0 else "0"
+    return sign + format(magnitude & 0x7F, "07b") + "0" * ((magnitude >> 7) & 0x7F) + "1"
+
+
+class Prng:
+
+    # seed_rows: 4 rows (high, low) starting at the seed base address
+    def __init__(self, seed_rows):
+        init_state = (seed_rows[3][0] << 64 | seed_rows[3][1]) | (seed_rows[1][0] << 64 | seed_rows[1][1]) << 128 | (seed_rows[2][0] << 64 | seed_rows[2][1]) << 256
+        self.key = [(init_state >> (32 * i)) & 0xFFFFFFFF for i in range(12)]
+        self.counter = seed_rows[0][1]
+        self.refill()
+
+    # prng_refill() of the Falcon reference: 8 ChaCha20 blocks, interleaved 32-bit words
+    def refill(self):
+        key = np.array(self.key, dtype=np.uint32)
+        counters = (self.counter + np.arange(CHACHA_BLOCKS, dtype=np.uint64)) & np.uint64(MASK64)
+        initial = np.empty((16, CHACHA_BLOCKS), dtype=np.uint32)
+        initial[:4] = np.array(CHACHA_CONSTANTS, dtype=np.uint32)[:, None]
+        initial[4:16] = key[:, None]
+        initial[14] ^= (counters & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        initial[15] ^= (counters >> np.uint64(32)).astype(np.uint32)
+
+        state = initial.copy()
+        for _ in range(10):
+            for a, b, c, d in CHACHA_QUARTER_ROUNDS:
+                for x, y, z, rotation in [(a, b, d, 16), (c, d, b, 12), (a, b, d, 8), (c, d, b, 7)]:
+                    state[x] += state[y]
+                    state[z] ^= state[x]
+                    state[z] = (state[z] << np.uint32(rotation)) | (state[z] >> np.uint32(32 - rotation))
+        state += initial
+
+        # Word v of block u is stored at byte (u << 2) + (v << 5)
+        self.buffer = state.astype("<u4").tobytes()
+        self.position = 0
+        self.counter = (self.counter + CHACHA_BLOCKS) & MASK64
+
+    def get_u8(self):
+        value = self.buffer[self.position]
+        self.position += 1
+        if self.position == len(self.buffer):
+            self.refill()
+        return value
+
+    def get_u64(self):
+        if self.position >= len(self.buffer) - 9:
+            self.refill()
+        value = int.from_bytes(self.buffer[self.position : self.position + 8], "little")
+        self.position += 8
+        return value
+
+
+def gaussian0(prng):
+    low = prng.get_u64()
+    high = prng.get_u8()
+    value = high << 64 | low
+    return sum(value < threshold for threshold in RCDT)
+
+
+def expm_p63(x, ccs):
+    y = EXPM_COEFFICIENTS[0]
+    z = (int(x * 2.0**63) << 1) & MASK64
+    for coefficient in EXPM_COEFFICIENTS[1:]:
+        y = (coefficient - ((z * y) >> 64)) & MASK64
+    z = (int(ccs * 2.0**63) << 1) & MASK64
+    return (z * y) >> 64
+
+
+def ber_exp(prng, x, ccs):
+    s = int(x * ILN2)
+    r = x - s * LN2
+    s &= 63  # berexp.sv keeps the low 6 bits of s (reference: min(s, 63))
+    z = (((expm_p63(r, ccs) << 1) - 1) & MASK64) >> s
+    shift = 64
+    while True:
+        shift -= 8
+        difference = prng.get_u8() - ((z >> shift) & 0xFF)
+        if difference != 0 or shift == 0:
+            return difference < 0
+
+
+# Returns (sample, number of iterations of the rejection loop)
+def sample_z(prng, mu, isigma, N):
+    s = math.floor(mu)
+    r = mu - s
+    dss = isigma * isigma * 0.5
+    ccs = isigma * SIGMA_MIN[N]
+    attempts = 0
+    while True:
+        attempts += 1
+        z0 = gaussian0(prng)
+        b = prng.get_u8() & 1
+        z = b + ((b << 1) - 1) * z0
+        x = (z - r) * (z - r) * dss
+        x -= (z0 * z0) * HALF_ISIGMA_MAX_SQR
+        if ber_exp(prng, x, ccs):
+            return float(s + z), attempts
+
+
+class Simulator:
+
+    def __init__(self, N):
+        self.N = N
+        self.banks = [np.zeros((rows, 2), dtype=np.uint64) for rows in BANK_ROWS]
+        self.redirects = {}
+        self.reset()
+
+    # Like reset_algorithm() on the host: clears the state of the control unit and modules, BRAM keeps its content
+    def reset(self):
+        self.accepted = False
+        self.rejected = False
+        self.check_bound_norm = 0
+        self.check_bound_done = False
+        self.prng = None
+        self.executed = 0
+        self.samplerz_attempts = 0  # Rejection loop iterations of all SAMPLERZ instructions since reset, the data-dependent part of the run time
+
+    # 0 = accepted, 1 = rejected, -1 = neither (get_status() in utilities.h)
+    def status(self):
+        if self.accepted:
+            return 0
+        if self.rejected:
+            return 1
+        return -1
+
+    def write_rows(self, bank, first_row, rows):
+        rows = np.asarray(rows, dtype=np.uint64).reshape(-1, 2)
+        self.banks[bank][first_row : first_row + len(rows)] = rows
+
+    def read_rows(self, bank, first_row, count):
+        first_row = self.redirects.get((bank, first_row), first_row)
+        if first_row + count > BANK_ROWS[bank]:
+            raise ValueError(f"Rows {first_row}..{first_row + count - 1} are outside of bank {bank}")
+        return self.banks[bank][first_row : first_row + count].copy()
+
+    def read_doubles(self, bank, first_row, count):
+        rows = self.read_rows(bank, first_row, count).view(np.float64)
+        return rows[:, 0], rows[:, 1]
+
+    def execute(self, instruction):
+        fields = decode_instruction(instruction)
+        redirects = {}  # module -> {(bank, first_row): first_row of the module driving the port}
+        for (module, bank, _, first_row, _, _), resolved in zip(unresolved_accesses(instruction, self.N), instruction_accesses(instruction, self.N)):
+            if resolved[3] != first_row:
+                redirects.setdefault(module, {})[(bank, first_row)] = resolved[3]
+
+        writes = []
+        for module in instruction_modules(instruction):
+            self.redirects = redirects.get(module, {})
+            writes.extend((bank, self.redirects.get((bank, first_row), first_row), rows) for bank, first_row, rows in getattr(self, module.lower())(fields))
+        self.redirects = {}
+        for bank, first_row, rows in writes:
+            if first_row + len(rows) > BANK_ROWS[bank]:
+                raise ValueError(f"Rows {first_row}..{first_row + len(rows) - 1} are outside of bank {bank}")
+            self.banks[bank][first_row : first_row + len(rows)] = rows
+        self.executed += 1
+
+    def run(self, instructions):
+        for instruction in instructions:
+            self.execute(instruction)
+        return self.status()
+
+    # Every module returns list of writes (bank, first_row, rows)
+
+    def copy(self, fields):
+        count = 1 << fields["element_count"]
+        dst = fields["addr1"] if fields["input_output_addr_same"] else fields["addr2"]
+        return [(fields["bank4"], dst, self.read_rows(fields["bank3"], fields["addr1"], count))]
+
+    def hash_to_point(self, fields):
+        N = self.N
+        rows = self.banks[fields["bank3"]]
+        length = int(rows[0, 1]) & 0xFFFF
+        message = rows[1 : 1 + (length + 7) // 8, 1].astype("<u8").tobytes()[:length]
+
+        # 16-bit big-endian words below 5*q are accepted, coefficient is the word mod q
+        output_length = 4 * N
+        while True:
+            words = np.frombuffer(hashlib.shake_256(message).digest(output_length), dtype=">u2").astype(np.int64)
+            coefficients = words[words < 5 * Q][:N] % Q
+            if len(coefficients) == N:
+                break
+            output_length *= 2
+
+        return [(fields["bank4"], 0, packed15_rows(coefficients[: N // 2], coefficients[N // 2 :]))]
+
+    def int_to_double(self, fields):
+        rows = self.read_rows(fields["bank1"], 0, 1 << fields["element_count"])
+        return [(fields["bank2"], 0, double_rows(signed15(rows[:, 0]), signed15(rows[:, 1])))]
+
+    def fft_ifft(self, fields):
+        N = self.N
+        half = N // 2
+        stages = int(math.log2(N)) - 1
+        tw_re, tw_im = fft_twiddle_factors()
+        banks = [(fields["bank1"], fields["addr1"]), (fields["bank2"], fields["addr2"])]
+        re, im = self.read_doubles(fields["bank1"], fields["addr1"], half)
+
+        writes = []
+        if fields["mode1"] == 0:  # FFT
+            t, m = N // 4, 2
+            for u in range(1, stages + 1):
+                re = re.reshape(m // 2, 2, t)
+                im = im.reshape(m // 2, 2, t)
+                w_re = tw_re[m : m + m // 2, None]
+                w_im = tw_im[m : m + m // 2, None]
+                y_re, y_im = complex_multiply(re[:, 1], im[:, 1], w_re, w_im)
+                re = np.stack([re[:, 0] + y_re, re[:, 0] - y_re], axis=1).reshape(half)
+                im = np.stack([im[:, 0] + y_im, im[:, 0] - y_im], axis=1).reshape(half)
+                bank, addr = banks[u % 2]  # Odd stages write bank2, even stages bank1
+                writes.append((bank, addr, double_rows(re, im)))
+                t >>= 1
+                m <<= 1
+        else:  # IFFT
+            t, m = 1, N // 2
+            for u in range(1, stages + 1):
+                re = re.reshape(m // 2, 2, t)
+                im = im.reshape(m // 2, 2, t)
+                w_re = tw_re[m : m + m // 2, None]
+                w_im = -tw_im[m : m + m // 2, None]
+                d_re = re[:, 0] - re[:, 1]
+                d_im = im[:, 0] - im[:, 1]
+                y_re, y_im = complex_multiply(d_re, d_im, w_re, w_im)
+                re = np.stack([re[:, 0] + re[:, 1], y_re], axis=1).reshape(half)
+                im = np.stack([im[:, 0] + im[:, 1], y_im], axis=1).reshape(half)
+                if u == stages - 1:  # fft.sv applies the 2^-(log2(N)-1) scale factor when u_2DP == log2(N)-2
+                    re = re * 2.0**-stages
+                    im = im * 2.0**-stages
+                bank, addr = banks[u % 2]
+                writes.append((bank, addr, double_rows(re, im)))
+                t <<= 1
+                m >>= 1
+        return writes
+
+    def ntt_intt(self, fields):
+        N = self.N
+        bank1 = fields["bank1"]
+        bank2 = fields["bank2"]
+        rows = self.read_rows(bank1, 0, N // 2)
+        coefficients = np.concatenate([signed15(rows[:, 0]), signed15(rows[:, 1])])
+
+        writes = []
+        stages = int(math.log2(N))
+        if fields["mode1"] == 0:  # NTT, reference C algorithm with stage = 1, 2, 4, ... groups
+            for stage_counter in range(stages):
+                m = 1 << stage_counter
+                t = N // (2 * m)
+                groups = coefficients.reshape(m, 2, t)
+                product = groups[:, 1] * NTT_TWIDDLES[m : 2 * m, None] % Q
+                coefficients = np.stack([ntt_mod_add(groups[:, 0], product), ntt_mod_sub(groups[:, 0], product)], axis=1).reshape(N)
+                writes.append((bank2 if stage_counter % 2 == 0 else bank1, 0, sign_extended_rows(coefficients)))
+        else:  # INTT, stage = N, N/2, ... with stride 1, 2, ...
+            for stage_counter in range(stages):
+                t = 1 << stage_counter
+                m = N // (2 * t)
+                groups = coefficients.reshape(m, 2, t)
+                difference = ntt_mod_sub(groups[:, 0], groups[:, 1])
+                product = difference * INTT_TWIDDLES[m : 2 * m, None] % Q
+                coefficients = np.stack([ntt_mod_add(groups[:, 0], groups[:, 1]), product], axis=1).reshape(N)
+                if stage_counter == stages - 1:  # Last stage goes through the scaling pipeline
+                    coefficients = coefficients * INTT_SCALE[N] % Q
+                    writes.append((bank2 if N == 512 else bank1, 0, sign_extended_rows(coefficients)))
+                else:
+                    writes.append((bank2 if stage_counter % 2 == 0 else bank1, 0, sign_extended_rows(coefficients)))
+        return writes
+
+    def complex_mul(self, fields):
+        count = 1 << fields["element_count"]
+        a_re, a_im = self.read_doubles(fields["bank1"], fields["addr1"], count)
+        b_re, b_im = self.read_doubles(fields["bank2"], fields["addr2"], count)
+        return [(fields["bank1"], fields["addr1"], double_rows(*complex_multiply(a_re, a_im, b_re, b_im)))]
+
+    def mul_const(self, fields):
+        constant = -1.0 / 12289.0 if fields["mul_const_constant"] else 1.0 / 12289.0
+        high, low = self.read_doubles(fields["bank3"], 0, 1 << fields["element_count"])
+        return [(fields["bank4"], 0, double_rows(high * constant, low * constant))]
+
+    def split(self, fields):
+        size = 1 << fields["element_count"]
+        if size < 4:
+            raise ValueError("SPLIT needs at least 4 elements")
+        tw_re, tw_im = fft_twiddle_factors()
+        re, im = self.read_doubles(fields["bank1"], fields["addr1"], size // 2)
+        a_re, b_re = re[0::2], re[1::2]
+        a_im, b_im = im[0::2], im[1::2]
+        w_re = tw_re[size // 2 : size // 2 + size // 4]
+        w_im = -tw_im[size // 2 : size // 2 + size // 4]
+        f1_re, f1_im = complex_multiply(a_re - b_re, a_im - b_im, w_re, w_im)
+        re = np.concatenate([(a_re + b_re) * 0.5, f1_re * 0.5])
+        im = np.concatenate([(a_im + b_im) * 0.5, f1_im * 0.5])
+        return [(fields["bank2"], fields["addr2"], double_rows(re, im))]
+
+    def merge(self, fields):
+        size = 1 << fields["element_count"]
+        if size < 4:
+            raise ValueError("MERGE needs at least 4 elements")
+        tw_re, tw_im = fft_twiddle_factors()
+        re, im = self.read_doubles(fields["bank1"], fields["addr1"], size // 2)
+        a_re, b_re = re[: size // 4], re[size // 4 :]
+        a_im, b_im = im[: size // 4], im[size // 4 :]
+        w_re = tw_re[size // 2 : size // 2 + size // 4]
+        w_im = tw_im[size // 2 : size // 2 + size // 4]
+        y_re, y_im = complex_multiply(b_re, b_im, w_re, w_im)
+        re = np.stack([a_re + y_re, a_re - y_re], axis=1).reshape(size // 2)
+        im = np.stack([a_im + y_im, a_im - y_im], axis=1).reshape(size // 2)
+        return [(fields["bank2"], fields["addr2"], double_rows(re, im))]
+
+    def mult_mod_q(self, fields):
+        N = self.N
+        count = 1 << fields["element_count"]
+        a = signed15(self.banks[fields["bank1"]][:N, 1])
+        b = signed15(self.banks[fields["bank2"]][:N, 1])
+        i = np.arange(count)
+        return [(fields["bank3"], 0, packed15_rows(a[i] * b[i] % Q, a[i + N // 2] * b[i + N // 2] % Q))]
+
+    def check_bound(self, fields):
+        N = self.N
+        count = 1 << fields["element_count"]
+        a = self.banks[fields["bank1"]][:count]
+        b = self.banks[fields["bank2"]][:N, 1]
+        c = self.banks[fields["bank3"]][:count]
+        i = np.arange(count)
+
+        norm = 0
+        for a_half, b_half, c_half in [(a[:, 0], b[i], c[:, 0]), (a[:, 1], b[i + N // 2], c[:, 1])]:
+            difference = signed15(a_half) - signed15(b_half)
+            difference = np.where(difference > Q // 2, difference - Q, difference)
+            difference = np.where(difference < -(Q // 2), difference + Q, difference)
+            norm += int(np.sum(difference * difference)) + int(np.sum(signed15(c_half) ** 2))
+
+        # The squared norm and the result are kept until reset
+        self.check_bound_norm += norm
+        if not self.check_bound_done:
+            self.check_bound_done = True
+            self.accepted = self.check_bound_norm <= BOUND2[N]
+            self.rejected = not self.accepted
+        return []
+
+    def decompress(self, fields):
+        N = self.N
+        stream = "".join(format(int(high), "064b") + format(int(low), "064b") for high, low in self.banks[fields["bank5"]])
+        output = self.banks[fields["bank6"]][: N // 2].copy()
+
+        position = 0
+        for index in range(N):
+            sign = stream[position]
+            low = int(stream[position + 1 : position + 8], 2)
+            one = stream.find("1", position + 8, position + 8 + 97)
+            if one == -1:  # cannot_find_high_error stops the decompression
+                break
+            high = one - position - 8
+            if sign == "1" and high == 0 and low == 0:
+                raise ValueError("DECOMPRESS: invalid encoding of zero, the hardware would not finish")
+            position = one + 1
+
+            coefficient = (high << 7) | low
+            coefficient = -coefficient if sign == "1" else coefficient
+            if index < N // 2:
+                output[index] = [coefficient & 0x7FFF, 0]
+            else:
+                output[index - N // 2, 1] = coefficient & 0x7FFF
+
+        return [(fields["bank6"], 0, output), (fields["bank7"], 0, output)]
+
+    def compress(self, fields):
+        N = self.N
+        count = 1 << fields["element_count"]
+        half = N // 2
+        t0 = self.read_rows(fields["bank1"], fields["addr1"], half).view(np.float64)
+        t1 = self.read_rows(fields["bank2"], fields["addr1"], half).view(np.float64)
+        hm = self.read_rows(fields["bank3"], fields["addr2"], half)
+
+        # Coefficients idx < N/2 come from the high halves, the rest from the low halves
+        index = np.arange(count)
+        column = (index >= half).astype(np.int64)
+        row = index % half
+        t0_int = double_to_int(t0[row, column])
+        t1_int = double_to_int(t1[row, column])
+        hm_int = signed15(hm[row, column])
+
+        # compress.sv only sums (hm - t0)^2
+        norm = int(np.sum((hm_int - t0_int) ** 2))
+        stream = "".join(compress_coefficient(int(value)) for value in signed15(-t1_int))
+
+        # Full rows, the row with the remaining bits and zero rows up to the expected signature length
+        length = len(stream)
+        limit = SIGNATURE_LENGTH[N] * 8
+        row_count = length // 128 + 1
+        if length < limit:
+            row_count += max(1, -(-(limit - length) // 128))
+        stream = stream.ljust(row_count * 128, "0")
+        rows = np.array([[int(stream[k : k + 64], 2), int(stream[k + 64 : k + 128], 2)] for k in range(0, len(stream), 128)], dtype=np.uint64)
+
+        self.accepted = norm <= BOUND2[N] and length <= limit
+        self.rejected = not self.accepted
+        return [(fields["bank4"], fields["addr1"], rows)]
+
+    def add_sub(self, fields):
+        count = 1 << fields["element_count"]
+        dst = fields["addr1"] if fields["input_output_addr_same"] else fields["addr2"]
+        a_high, a_low = self.read_doubles(fields["bank4"], dst, count)
+        b_high, b_low = self.read_doubles(fields["bank3"], fields["addr1"], count)
+        if fields["mode2"]:
+            return [(fields["bank4"], dst, double_rows(a_high - b_high, a_low - b_low))]
+        return [(fields["bank4"], dst, double_rows(a_high + b_high, a_low + b_low))]
+
+    def samplerz(self, fields):
+        N = self.N
+        if fields["mode1"] or self.prng is None:  # mode1 restarts the PRNG from the seed
+            seed = self.read_rows(fields["bank4"], seed_base_addr(N), 4)
+            self.prng = Prng([(int(high), int(low)) for high, low in seed])
+
+        mu = self.read_rows(fields["bank1"], fields["addr1"], 1).view(np.float64)[0]
+        isigma = self.read_rows(fields["bank2"], fields["addr2"], 1).view(np.float64)[0, 1 if fields["mode2"] else 0]
+        sample2, attempts2 = sample_z(self.prng, float(mu[1]), float(isigma), N)
+        sample1, attempts1 = sample_z(self.prng, float(mu[0]), float(isigma), N)
+        self.samplerz_attempts += attempts1 + attempts2
+        return [(fields["bank3"], samplerz_output_addr(N), double_rows([sample1], [sample2]))]
+
+
+# Arrays of the host program (sw/falcon/src/constants_<N>.h) as lists of ints
+def read_host_constants(N, filename=None):
+    with open(filename or HOST_CONSTANTS_FILE.format(N=N)) as f:
+        source = f.read()
+    constants = {}
+    for name, body in re.findall(r"uint64_t\s+(\w+)\s*\[[^\]]*\]\s*=\s*\{([^}]*)\}", source):
+        constants[name] = [sum(int(term, 0) for term in item.split("+")) for item in body.split(",") if item.strip()]
+    return constants
+
+
+# Loads BRAM like load_into_bram() in main.c: row i = (src[2i], src[2i+1])
+def load_into_bram(simulator, values, bank, first_row=0):
+    simulator.write_rows(bank, first_row, np.array(values, dtype=np.uint64).reshape(-1, 2))
+
+
+def load_message(simulator, constants, bank):
+    simulator.write_rows(bank, 0, [[0, block] for block in constants["message_blocks"]])
+
+
+# Host inputs of sign() in main.c
+def load_sign_inputs(simulator, constants):
+    N = simulator.N
+    for bank, name in enumerate(["b00", "b01", "b10", "b11"]):
+        load_into_bram(simulator, constants[name], bank)
+    load_message(simulator, constants, 4)
+    load_into_bram(simulator, constants["tree"], 6)
+    simulator.write_rows(3, seed_base_addr(N), SEED)
+
+
+# Signature rows read back by sign() in main.c
+def read_signature(simulator):
+    N = simulator.N
+    return simulator.read_rows(0, N // 2, SIGNATURE_BLOCK_COUNT[N])
+
+
+# Host inputs of verify() in main.c
+def load_verify_inputs(simulator, constants, signature):
+    N = simulator.N
+    public_key = constants["public_key"]
+    simulator.write_rows(0, 0, [[public_key[i], public_key[i + N // 2]] for i in range(N // 2)])
+    simulator.write_rows(1, 0, signature)
+    load_message(simulator, constants, 6)
+
+
+def simulate_sign(instructions, N, constants=None):
+    simulator = Simulator(N)
+    load_sign_inputs(simulator, constants or read_host_constants(N))
+    status = simulator.run(instructions)
+    return status, read_signature(simulator)
+
+
+def simulate_verify(instructions, N, signature, constants=None):
+    simulator = Simulator(N)
+    load_verify_inputs(simulator, constants or read_host_constants(N), signature)
+    return simulator.run(instructions)
+
+
+# Runs both programs on the same inputs and returns whether everything the host reads back (status, signature) is equal
+def equivalent(algorithm, instructions1, instructions2, N, signature=None, constants=None):
+    constants = constants or read_host_constants(N)
+    if algorithm == "sign":
+        status1, signature1 = simulate_sign(instructions1, N, constants)
+        status2, signature2 = simulate_sign(instructions2, N, constants)
+        return status1 == status2 and np.array_equal(signature1, signature2)
+    return simulate_verify(instructions1, N, signature, constants) == simulate_verify(instructions2, N, signature, constants)
+
+
+if __name__ == "__main__":
+    import time
+
+    from copy_elimination import eliminate_copies
+    from cost_model import generate_program
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    constants = read_host_constants(N)
+    programs = {algorithm: generate_program(algorithm, N) for algorithm in ["sign", "verify"]}
+
+    start = time.perf_counter()
+    status, signature = simulate_sign(programs["sign"], N, constants)
+    print(f"sign:   status {status}, {len(programs['sign'])} instructions in {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    status = simulate_verify(programs["verify"], N, signature, constants)
+    print(f"verify: status {status}, {len(programs['verify'])} instructions in {time.perf_counter() - start:.2f} s")
+
+    tampered = signature.copy()
+    tampered[0, 0] ^= np.uint64(1 << 60)
+    print(f"verify of a modified signature: status {simulate_verify(programs['verify'], N, tampered, constants)}")
+
+    print()
+    for algorithm, instructions in programs.items():
+        transformations = {
+            "copy elimination": lambda instructions: eliminate_copies(list(instructions), N)[0],
+        }
+        for name, transform in transformations.items():
+            result = equivalent(algorithm, instructions, transform(instructions), N, signature, constants)
+            print(f"{algorithm:<6} {name:<17} {'equivalent' if result else 'DIFFERENT'}")
@@ -0,0 +1,291 @@
+# Mock of the AXI interface of the accelerator (axi_wrapper.sv), for host-side development without a board
+#
+# Register window (AXI-lite, 32-bit registers at AXI_LITE_BASE in main.h):
+#   CONTROL_REG     (slv_reg0, +0x0): [0] start, [2:1] algorithm (00 = sign, 01 = verify), [3] reset, [31] software BRAM access
+#   OUTPUT_REG      (slv_reg1, +0x4): [0] done, [1] signature accepted, [2] signature rejected (read-only)
+#   CYCLE_COUNT_REG (slv_reg2, +0x8): cycles from start to done (read-only)
+#   INTERRUPT_REG   (slv_reg3, +0xC): [0] done interrupt enable, [1] mode (0 = level, 1 = edge: a pulse when pending is set),
+#                   [2] pending (set when done rises, write 1 to acknowledge, cleared by reset). Done stays set until
+#                   reset, so an acknowledged interrupt is re-armed for the next run.
+# BRAM window (at BRAM_BASE in main.h): 20-bit byte address, [19:17] bank, [16:4] row (13 bits), [3:0] ignored. Every row is a
+# 128-bit word. Like in control_unit.sv, software only reaches BRAM while CONTROL_REG[31] is set, otherwise writes are
+# dropped and reads return 0.
+#
+# Devices implement read32/write32 (register window) and read128/write128 (BRAM window) and count every access, so host
+# code can be benchmarked in MMIO operations:
+# - FunctionalDevice runs the sign/verify program on isa_simulator.Simulator and reports the cycle count of
+#   cost_model.run_cycles(), which includes the data-dependent SAMPLERZ rejection loops of the run. These cycle counts are
+#   estimates of the uncalibrated cost model, not measurements (cycle_counts_estimated). Start only starts the
+#   run: the program is simulated when the algorithm finishes, so host code between start and the done check overlaps
+#   with the run and the simulation time is spent waiting for done, like on the board. The run finishes after busy_reads
+#   reads of OUTPUT_REG that return "not done", or with busy_reads=0 on the first read of OUTPUT_REG, CYCLE_COUNT_REG,
+#   INTERRUPT_REG or BRAM. Like instruction_dispatch.sv, done stays set and start is ignored until reset.
+#   wait_for_interrupt() stands in for sleeping on the done_interrupt line: the running algorithm finishes and the line is
+#   returned.
+# - MmapDevice maps the two windows from a file (or /dev/mem on the board) and has no behavior of its own: registers and
+#   BRAM are plain memory. With uio (a /dev/uioN of the done interrupt on the board), wait_for_interrupt() blocks on it.
+
+import mmap
+import os
+import select
+import struct
+
+import numpy as np
+
+CONTROL_REG = 0x0
+OUTPUT_REG = 0x4
+CYCLE_COUNT_REG = 0x8
+INTERRUPT_REG = 0xC
+REGISTER_WINDOW = 0x10
+
+START = 1 << 0
+ALGORITHM_SHIFT = 1
+ALGORITHM_MASK = 0b11 << ALGORITHM_SHIFT
+RESET = 1 << 3
+BRAM_ACCESS = 1 << 31
+
+ALGORITHM_DONE_MASK = 0b1
+SIGNATURE_ACCEPTED_MASK = 0b10
+SIGNATURE_REJECTED_MASK = 0b100
+
+INTERRUPT_ENABLE = 0b1
+INTERRUPT_EDGE = 0b10
+INTERRUPT_PENDING = 0b100
+
+SIGN = 0b00
+VERIFY = 0b01
+ALGORITHM_NAMES = {SIGN: "sign", VERIFY: "verify"}
+
+BANK_SHIFT = 17
+ROW_SHIFT = 4
+ROW_MASK = (1 << 13) - 1
+BRAM_WINDOW = 1 << 20
+MASK32 = (1 << 32) - 1
+MASK64 = (1 << 64) - 1
+
+
+# (bank, row) of a byte address in the BRAM window
+def bram_location(address):
+    if not 0 <= address < BRAM_WINDOW:
+        raise ValueError(f"Address 0x{address:x} is outside of the 20-bit BRAM window")
+    return address >> BANK_SHIFT, (address >> ROW_SHIFT) & ROW_MASK
+
+
+def bram_address(bank, row):
+    return (bank << BANK_SHIFT) | (row << ROW_SHIFT)
+
+
+def check_register(offset):
+    if offset not in (CONTROL_REG, OUTPUT_REG, CYCLE_COUNT_REG, INTERRUPT_REG):
+        raise ValueError(f"No register at offset 0x{offset:x}")
+
+
+class Device:
+    cycle_counts_estimated = False  # CYCLE_COUNT_REG is a prediction of cost_model.py instead of a count of the hardware
+
+    def __init__(self):
+        self.register_reads = 0
+        self.register_writes = 0
+        self.bram_reads = 0
+        self.bram_writes = 0
+
+    def mmio_operations(self):
+        return self.register_reads + self.register_writes + self.bram_reads + self.bram_writes
+
+    def reset_counters(self):
+        self.register_reads = self.register_writes = self.bram_reads = self.bram_writes = 0
+
+    def read32(self, offset):
+        check_register(offset)
+        self.register_reads += 1
+        return self.load_register(offset)
+
+    def write32(self, offset, value):
+        check_register(offset)
+        self.register_writes += 1
+        self.store_register(offset, value & MASK32)
+
+    def read128(self, address):
+        self.bram_reads += 1
+        return self.load_row(*bram_location(address))
+
+    def write128(self, address, value):
+        self.bram_writes += 1
+        self.store_row(*bram_location(address), value & ((1 << 128) - 1))
+
+
+class FunctionalDevice(Device):
+    cycle_counts_estimated = True
+
+    def __init__(self, N, busy_reads=0):
+        from isa_simulator import Simulator
+
+        super().__init__()
+        self.N = N
+        self.busy_reads = busy_reads
+        self.simulator = Simulator(N)
+        self.programs = {}
+        self.control = 0
+        self.output = 0
+        self.cycle_count = 0
+        self.pending_busy_reads = 0
+        self.running = None  # Algorithm started but not finished yet
+        self.result = None
+        self.interrupt = 0  # slv_reg3[1:0]
+        self.interrupt_pending = False
+        self.interrupt_edge = False  # Edge latched by the interrupt controller until wait_for_interrupt()
+
+    # (instructions, cycles without SAMPLERZ), the cycle count of a run adds the SAMPLERZ rejection loops it took
+    def program(self, algorithm):
+        if algorithm not in self.programs:
+            import contextlib
+            import io
+
+            from cost_model import generate_program, run_cycles
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                instructions = generate_program(ALGORITHM_NAMES[algorithm], self.N)
+            self.programs[algorithm] = (instructions, int(run_cycles(instructions, self.N, 0)))
+        return self.programs[algorithm]
+
+    def load_register(self, offset):
+        if offset == CONTROL_REG:
+            return self.control
+        if offset == OUTPUT_REG:
+            if self.pending_busy_reads:
+                self.pending_busy_reads -= 1
+                if not self.pending_busy_reads:
+                    self.finish()
+                return 0
+            self.settle()
+            return self.output
+        self.settle()
+        if offset == CYCLE_COUNT_REG:
+            return self.cycle_count
+        return self.interrupt | (INTERRUPT_PENDING if self.interrupt_pending else 0)
+
+    def store_register(self, offset, value):
+        if offset == INTERRUPT_REG:
+            self.interrupt = value & (INTERRUPT_ENABLE | INTERRUPT_EDGE)
+            if value & INTERRUPT_PENDING:
+                self.interrupt_pending = False  # Acknowledge
+            return
+        if offset != CONTROL_REG:
+            return  # slv_reg1 and slv_reg2 are read-only
+        previous, self.control = self.control, value
+        if value & RESET and not previous & RESET:
+            self.simulator.reset()
+            self.output = 0
+            self.cycle_count = 0
+            self.pending_busy_reads = 0
+            self.running = None
+            self.result = None
+            self.interrupt_pending = False
+        if value & START and not previous & START and not value & RESET:
+            self.start((value & ALGORITHM_MASK) >> ALGORITHM_SHIFT)
+
+    # Starts a run, the program is simulated when it finishes (finish())
+    def start(self, algorithm):
+        if algorithm not in ALGORITHM_NAMES or self.output & ALGORITHM_DONE_MASK or self.running is not None or self.result is not None:
+            return  # 10 and 11 are not implemented in hardware, done never rises. Start is ignored until reset after a run.
+        self.running = algorithm
+        self.pending_busy_reads = self.busy_reads
+
+    # Finishes a run that has no busy_reads left when the host looks at its result
+    def settle(self):
+        if self.running is not None and not self.pending_busy_reads:
+            self.finish()
+
+    # Runs the program and raises done: the result becomes visible and the interrupt pending
+    def finish(self):
+        from cost_model import SAMPLERZ_ATTEMPT_CYCLES
+
+        instructions, cycles = self.program(self.running)
+        self.running = None
+        self.simulator.reset()
+        status = self.simulator.run(instructions)
+        accepted = SIGNATURE_ACCEPTED_MASK if status == 0 else 0
+        rejected = SIGNATURE_REJECTED_MASK if status == 1 else 0
+        cycles += SAMPLERZ_ATTEMPT_CYCLES * self.simulator.samplerz_attempts
+        self.result = (ALGORITHM_DONE_MASK | accepted | rejected, cycles & MASK32)
+        self.output, self.cycle_count = self.result
+        if self.interrupt & INTERRUPT_ENABLE and self.interrupt & INTERRUPT_EDGE and not self.interrupt_pending:
+            self.interrupt_edge = True
+        self.interrupt_pending = True
+
+    def interrupt_line(self):
+        if not self.interrupt & INTERRUPT_ENABLE:
+            return False
+        return self.interrupt_edge if self.interrupt & INTERRUPT_EDGE else self.interrupt_pending
+
+    # Sleeps until the done interrupt: a running algorithm finishes, returns whether the interrupt was raised. Nothing else
+    # can raise it later, so timeout is not waited for.
+    def wait_for_interrupt(self, timeout=None):
+        if self.running is not None:
+            self.pending_busy_reads = 0
+            self.finish()
+        raised = self.interrupt_line()
+        self.interrupt_edge = False
+        return raised
+
+    def load_row(self, bank, row):
+        self.settle()
+        if not self.control & BRAM_ACCESS or bank >= len(self.simulator.banks) or row >= len(self.simulator.banks[bank]):
+            return 0
+        high, low = self.simulator.banks[bank][row]
+        return (int(high) << 64) | int(low)
+
+    def store_row(self, bank, row, value):
+        self.settle()
+        if not self.control & BRAM_ACCESS or bank >= len(self.simulator.banks) or row >= len(self.simulator.banks[bank]):
+            return
+        self.simulator.banks[bank][row] = (value >> 64, value & MASK64)
+
+
+class MmapDevice(Device):
+
+    # register_offset and bram_offset are AXI_LITE_BASE and BRAM_BASE of main.h for /dev/mem, any page-aligned offsets for a file
+    def __init__(self, filename, register_offset=0, bram_offset=mmap.PAGESIZE, uio=None):
+        super().__init__()
+        self.uio = None if uio is None else os.open(uio, os.O_RDWR)
+        self.fd = os.open(filename, os.O_RDWR | os.O_CREAT)
+        if filename != "/dev/mem":
+            size = max(register_offset + mmap.PAGESIZE, bram_offset + BRAM_WINDOW)
+            if os.fstat(self.fd).st_size < size:
+                os.ftruncate(self.fd, size)
+        self.registers = mmap.mmap(self.fd, mmap.PAGESIZE, offset=register_offset)
+        self.bram = mmap.mmap(self.fd, BRAM_WINDOW, offset=bram_offset)
+        self.register_words = np.frombuffer(self.registers, dtype="<u4", count=REGISTER_WINDOW // 4)
+        self.bram_rows = np.frombuffer(self.bram, dtype="<u8").reshape(-1, 2)
+
+    def load_register(self, offset):
+        return int(self.register_words[offset // 4])
+
+    def store_register(self, offset, value):
+        self.register_words[offset // 4] = value
+
+    def load_row(self, bank, row):
+        low, high = self.bram_rows[bram_address(bank, row) >> ROW_SHIFT]
+        return (int(high) << 64) | int(low)
+
+    def store_row(self, bank, row, value):
+        self.bram_rows[bram_address(bank, row) >> ROW_SHIFT] = (value & MASK64, value >> 64)
+
+    # Blocks until the UIO device reports the done interrupt (re-enabled in the interrupt controller first), returns False on
+    # timeout (seconds)
+    def wait_for_interrupt(self, timeout=None):
+        if self.uio is None:
+            raise ValueError("MmapDevice has no uio device for interrupts")
+        os.write(self.uio, struct.pack("<I", 1))
+        if not select.select([self.uio], [], [], timeout)[0]:
+            return False
+        os.read(self.uio, 4)
+        return True
+
+    def close(self):
+        del self.register_words, self.bram_rows
+        self.registers.close()
+        self.bram.close()
+        os.close(self.fd)
+        if self.uio is not None:
+            os.close(self.uio)
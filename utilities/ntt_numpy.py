@@ -0,0 +1,230 @@
+# Vectorized NTT/INTT for batches of polynomials
+#
+# Computes the same results as ntt_from_reference_C.py (negative-wrapped NTT, twiddle table indexed like GMb/iGMb) and
+# ntt_iter.py (positive-wrapped NTT with bit-reversed input), bit for bit, but every stage is a single NumPy butterfly over
+# an int64 array of shape (batch, n) instead of one Python iteration per butterfly. Twiddle factors of every stage are
+# computed once per (twiddles, n, modulus) and cached.
+#
+# - Inputs can be a single polynomial (shape (n,)) or a batch (shape (batch, n)), the result has the same shape.
+# - Inputs are reduced modulo q first, which doesn't change the result. Coefficients and products have to fit into int64.
+# - montgomery=True keeps twiddle factors in the Montgomery domain (multiplied by R = 2^16 mod q, see
+#   NTT_negative_compute_twiddle_factors.py) and reduces products with Montgomery reduction instead of % q, like a hardware
+#   implementation would. Requires an odd modulus below 2^16, the result is the same.
+#
+# Usage: python ntt_numpy.py [N] [batch]   ... check against the reference implementations and compare run times
+
+import math
+import sys
+
+import numpy as np
+
+from ntt_iter import brv
+
+MONTGOMERY_BITS = 16
+MONTGOMERY_MASK = (1 << MONTGOMERY_BITS) - 1
+
+TWIDDLE_CACHE = {}
+
+
+def cached(key, compute):
+    if key not in TWIDDLE_CACHE:
+        TWIDDLE_CACHE[key] = compute()
+    return TWIDDLE_CACHE[key]
+
+
+def bit_reverse_permutation(n):
+    bits = int(math.log2(n))
+    return cached(("bit_reverse", n), lambda: np.array([brv(i, bits) for i in range(n)], dtype=np.int64))
+
+
+def to_montgomery(values, q):
+    return (np.asarray(values, dtype=np.int64) << MONTGOMERY_BITS) % q
+
+
+# Returns a * b * 2^-16 mod q for 0 <= a * b < q * 2^16
+def montgomery_reduce(x, q):
+    q_inv_neg = (-pow(q, -1, 1 << MONTGOMERY_BITS)) & MONTGOMERY_MASK
+    m = ((x & MONTGOMERY_MASK) * q_inv_neg) & MONTGOMERY_MASK
+    t = (x + m * q) >> MONTGOMERY_BITS
+    return np.where(t >= q, t - q, t)
+
+
+# Returns a * w mod q for a in [0, q) and w already converted with to_montgomery() if montgomery is set
+def multiply(a, w, q, montgomery):
+    if montgomery:
+        return montgomery_reduce(a * w, q)
+    return a * w % q
+
+
+def check_montgomery(q):
+    if q % 2 == 0 or q >= 1 << MONTGOMERY_BITS:
+        raise ValueError(f"Montgomery reduction needs an odd modulus below 2^{MONTGOMERY_BITS}, got {q}")
+
+
+def as_batch(arr, q):
+    arr = np.array(arr, dtype=np.int64, ndmin=1)
+    batch = arr.reshape(-1, arr.shape[-1])
+    if batch.shape[1] & (batch.shape[1] - 1):
+        raise ValueError(f"Polynomial length must be a power of 2, got {batch.shape[1]}")
+    return arr.shape, batch % q
+
+
+# Twiddle table of ntt_from_reference_C.py, twiddles is a function (like in the reference) or a list/array
+def twiddle_table(twiddles, n, q, montgomery):
+    if callable(twiddles):
+        table = np.array([twiddles(i) for i in range(n)], dtype=np.int64) % q
+    else:
+        table = np.asarray(twiddles, dtype=np.int64)[:n] % q
+    return to_montgomery(table, q) if montgomery else table
+
+
+def reference_twiddles(twiddles, n, q, montgomery):
+    if callable(twiddles):
+        return cached(("reference", twiddles, n, q, montgomery), lambda: twiddle_table(twiddles, n, q, montgomery))
+    return twiddle_table(twiddles, n, q, montgomery)
+
+
+# Negative-wrapped NTT of ntt_from_reference_C.ntt()
+def ntt(arr, twiddles, q, montgomery=False):
+    if montgomery:
+        check_montgomery(q)
+    shape, x = as_batch(arr, q)
+    n = x.shape[1]
+    table = reference_twiddles(twiddles, n, q, montgomery)
+
+    stage, stride = 1, n >> 1
+    while stage < n:
+        x = x.reshape(-1, stage, 2, stride)
+        a = x[:, :, 0]
+        b = multiply(x[:, :, 1], table[stage : 2 * stage, None], q, montgomery)
+        x = np.stack([(a + b) % q, (a - b) % q], axis=2)
+        stride >>= 1
+        stage <<= 1
+
+    return x.reshape(shape)
+
+
+# Negative-wrapped INTT of ntt_from_reference_C.intt(), including the scaling by 1/n
+def intt(arr, twiddles, q, montgomery=False):
+    if montgomery:
+        check_montgomery(q)
+    shape, x = as_batch(arr, q)
+    n = x.shape[1]
+    table = reference_twiddles(twiddles, n, q, montgomery)
+
+    stage, stride = n, 1
+    while stage > 1:
+        groups = stage >> 1
+        x = x.reshape(-1, groups, 2, stride)
+        a = x[:, :, 0]
+        b = x[:, :, 1]
+        x = np.stack([(a + b) % q, multiply((a - b) % q, table[groups:stage, None], q, montgomery)], axis=2)
+        stride <<= 1
+        stage >>= 1
+
+    scale = pow(n, -1, q)
+    x = multiply(x.reshape(-1, n), to_montgomery(scale, q) if montgomery else scale, q, montgomery)
+    return x.reshape(shape)
+
+
+# Powers gen^j (j < stride) used by every stage of ntt_iter.py, from stride 1 upwards
+def iter_stage_twiddles(gen, n, modulus, inverse, montgomery):
+    def compute():
+        root = pow(gen, -1, modulus) if inverse else gen
+        nbits = int(math.log2(n))
+        stages = []
+        for k in range(nbits):
+            stride = 1 << k
+            w = pow(root, 1 << (nbits - 1 - k), modulus)
+            powers = np.array([pow(w, j, modulus) for j in range(stride)], dtype=np.int64)
+            stages.append(to_montgomery(powers, modulus) if montgomery else powers)
+        return stages
+
+    return cached(("iter", gen, n, modulus, inverse, montgomery), compute)
+
+
+# Positive-wrapped NTT of ntt_iter.ntt()
+def cyclic_ntt(arr, gen, modulus, montgomery=False):
+    if montgomery:
+        check_montgomery(modulus)
+    shape, x = as_batch(arr, modulus)
+    n = x.shape[1]
+    stages = iter_stage_twiddles(gen, n, modulus, False, montgomery)
+
+    x = x[:, bit_reverse_permutation(n)]
+    for k, powers in enumerate(stages):
+        stride = 1 << k
+        x = x.reshape(-1, n // (2 * stride), 2, stride)
+        a = x[:, :, 0]
+        b = multiply(x[:, :, 1], powers, modulus, montgomery)
+        x = np.stack([(a + b) % modulus, (a - b) % modulus], axis=2)
+
+    return x.reshape(shape)
+
+
+# Positive-wrapped INTT of ntt_iter.intt(), including the scaling by 1/n
+def cyclic_intt(arr, gen, modulus, montgomery=False):
+    if montgomery:
+        check_montgomery(modulus)
+    shape, x = as_batch(arr, modulus)
+    n = x.shape[1]
+    stages = iter_stage_twiddles(gen, n, modulus, True, montgomery)
+
+    for k in reversed(range(len(stages))):
+        stride = 1 << k
+        x = x.reshape(-1, n // (2 * stride), 2, stride)
+        a = x[:, :, 0]
+        b = x[:, :, 1]
+        x = np.stack([(a + b) % modulus, multiply((a - b) % modulus, stages[k], modulus, montgomery)], axis=2)
+
+    scale = pow(n, -1, modulus)
+    x = multiply(x.reshape(-1, n)[:, bit_reverse_permutation(n)], to_montgomery(scale, modulus) if montgomery else scale, modulus, montgomery)
+    return x.reshape(shape)
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
+    import ntt_from_reference_C
+    import ntt_iter
+    from NTT_negative_compute_twiddle_factors import Q, intt_twiddle_factor, ntt_twiddle_factor
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    root = pow(7, (Q - 1) // N, Q)  # Primitive N-th root of unity for ntt_iter
+
+    polynomials = np.random.default_rng(0).integers(0, Q, size=(batch, N))
+    reference_count = min(batch, 10)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference = [
+            (
+                ntt_from_reference_C.ntt(list(map(int, p)), ntt_twiddle_factor, Q),
+                ntt_from_reference_C.intt(list(map(int, p)), intt_twiddle_factor, Q),
+                ntt_iter.ntt(list(map(int, p)), root, Q),
+                ntt_iter.intt(list(map(int, p)), root, Q),
+            )
+            for p in polynomials[:reference_count]
+        ]
+    reference_time = (time.perf_counter() - start) / reference_count
+
+    for montgomery in [False, True]:
+        start = time.perf_counter()
+        results = (
+            ntt(polynomials, ntt_twiddle_factor, Q, montgomery),
+            intt(polynomials, intt_twiddle_factor, Q, montgomery),
+            cyclic_ntt(polynomials, root, Q, montgomery),
+            cyclic_intt(polynomials, root, Q, montgomery),
+        )
+        vectorized_time = (time.perf_counter() - start) / batch
+
+        exact = all(results[k][i].tolist() == reference[i][k] for i in range(reference_count) for k in range(4))
+        roundtrip = np.array_equal(intt(results[0], intt_twiddle_factor, Q, montgomery), polynomials)
+        roundtrip &= np.array_equal(cyclic_intt(results[2], root, Q, montgomery), polynomials)
+        print(f"N={N}, batch={batch}, montgomery={montgomery}")
+        print(f"  Bit-exact with reference: {exact}")
+        print(f"  NTT/INTT roundtrip:       {roundtrip}")
+        print(f"  Time per polynomial:      {vectorized_time * 1e6:.1f} us (reference {reference_time * 1e6:.1f} us, {reference_time / vectorized_time:.0f}x)")
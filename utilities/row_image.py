@@ -0,0 +1,150 @@
+# Binary row images of BRAM preloads (tree, b00..b11, public key)
+#
+# An image is a sequence of sections, each a 16-byte header followed by the rows of one BRAM range. Rows are 128-bit
+# little-endian, i.e. exactly the bytes of the uint128_t the driver writes into BRAM (low 64 bits first), so a section can be
+# copied to the BRAM window with a memcpy. Section header (little-endian):
+#   magic "FBRI" (4 bytes), version (u16), bank (u16), first row (u32), row count (u32)
+# Headers are 16 bytes as well, so the rows of every section stay 16-byte aligned in the file. load_image() of
+# sw/falcon/src/utilities.h loads the same format on the board.
+#
+# Rows are given and returned as (high, low) pairs like in isa_simulator.py, high is src[2i] and low is src[2i + 1] of
+# load_into_bram() in main.c.
+#
+# Usage:
+#   python row_image.py                          ... check that images of constants_<N>.h give the same signatures as the header
+#   python row_image.py constants <N> <dir>      ... write sign_key_<N>.bin (b00..b11, tree) and public_key_<N>.bin
+#   python row_image.py dump <image>             ... list the sections of an image
+
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"FBRI"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+ROW_BYTES = 16
+
+TREE_BANK = 6
+PUBLIC_KEY_BANK = 0
+
+
+# Rows (high, low) from 64-bit words like load_into_bram() in main.c: row i = (words[2i], words[2i + 1])
+def rows_from_words(words):
+    return np.asarray(words, dtype=np.uint64).reshape(-1, 2)
+
+
+# Public key rows like load_public_key() in main.c: row i = (public_key[i], public_key[i + N/2])
+def public_key_rows(public_key):
+    public_key = np.asarray(public_key, dtype=np.uint64)
+    return np.stack([public_key[: len(public_key) // 2], public_key[len(public_key) // 2 :]], axis=1)
+
+
+# Sections of sign(): b00, b01, b10, b11 in banks 0..3 and the tree in bank 6
+def sign_key_sections(constants):
+    sections = [(bank, 0, rows_from_words(constants[name])) for bank, name in enumerate(["b00", "b01", "b10", "b11"])]
+    return sections + [(TREE_BANK, 0, rows_from_words(constants["tree"]))]
+
+
+def public_key_sections(constants):
+    return [(PUBLIC_KEY_BANK, 0, public_key_rows(constants["public_key"]))]
+
+
+def image_bytes(sections):
+    chunks = []
+    for bank, first_row, rows in sections:
+        rows = np.asarray(rows, dtype=np.uint64).reshape(-1, 2)
+        chunks.append(HEADER.pack(MAGIC, VERSION, bank, first_row, len(rows)))
+        chunks.append(np.ascontiguousarray(rows[:, ::-1], dtype="<u8").tobytes())
+    return b"".join(chunks)
+
+
+def write_image(filename, sections):
+    with open(filename, "wb") as f:
+        f.write(image_bytes(sections))
+
+
+# Returns [(bank, first_row, rows)] of an image, rows are (high, low) views into the memory-mapped file (no copy)
+def read_image(filename):
+    if os.path.getsize(filename) == 0:
+        return []
+    data = np.memmap(filename, dtype=np.uint8, mode="r")
+    sections = []
+    offset = 0
+    while offset < len(data):
+        if offset + HEADER.size > len(data):
+            raise ValueError(f"{filename}: truncated section header at byte {offset}")
+        magic, version, bank, first_row, count = HEADER.unpack(data[offset : offset + HEADER.size].tobytes())
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename}: no section header at byte {offset}")
+        offset += HEADER.size
+        end = offset + count * ROW_BYTES
+        if end > len(data):
+            raise ValueError(f"{filename}: section of bank {bank} is truncated")
+        rows = data[offset:end].view("<u8").reshape(-1, 2)[:, ::-1]
+        sections.append((bank, first_row, rows))
+        offset = end
+    return sections
+
+
+# Loads an image into isa_simulator.Simulator like load_image() does on the board
+def load_into_simulator(simulator, filename):
+    for bank, first_row, rows in read_image(filename):
+        simulator.write_rows(bank, first_row, rows)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    if len(sys.argv) > 1 and sys.argv[1] == "constants":
+        from isa_simulator import read_host_constants
+
+        N = int(sys.argv[2])
+        constants = read_host_constants(N)
+        write_image(os.path.join(sys.argv[3], f"sign_key_{N}.bin"), sign_key_sections(constants))
+        write_image(os.path.join(sys.argv[3], f"public_key_{N}.bin"), public_key_sections(constants))
+
+    elif len(sys.argv) > 1 and sys.argv[1] == "dump":
+        print(f"{'Bank':<6} {'First row':<10} {'Rows':<8} {'Bytes'}")
+        for bank, first_row, rows in read_image(sys.argv[2]):
+            print(f"{bank:<6} {first_row:<10} {len(rows):<8} {len(rows) * ROW_BYTES}")
+
+    else:
+        import contextlib
+        import io
+
+        from cost_model import generate_program
+        from isa_simulator import SEED, Simulator, load_message, read_host_constants, read_signature, seed_base_addr, simulate_sign, simulate_verify
+
+        for N in [512, 1024]:
+            constants = read_host_constants(N)
+            with tempfile.TemporaryDirectory() as directory:
+                sign_key = os.path.join(directory, "sign_key.bin")
+                public_key = os.path.join(directory, "public_key.bin")
+                write_image(sign_key, sign_key_sections(constants))
+                write_image(public_key, public_key_sections(constants))
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sign_program = generate_program("sign", N)
+                    verify_program = generate_program("verify", N)
+
+                # Same inputs as load_sign_inputs(), with the key material from the image
+                simulator = Simulator(N)
+                load_into_simulator(simulator, sign_key)
+                load_message(simulator, constants, 4)
+                simulator.write_rows(3, seed_base_addr(N), SEED)
+                status = simulator.run(sign_program)
+                signature = read_signature(simulator)
+                _, expected = simulate_sign(sign_program, N, constants)
+
+                simulator = Simulator(N)
+                load_into_simulator(simulator, public_key)
+                simulator.write_rows(1, 0, signature)
+                load_message(simulator, constants, 6)
+                verify_status = simulator.run(verify_program)
+
+                size = os.path.getsize(sign_key)
+                print(f"N={N}: sign key image {size} bytes, public key image {os.path.getsize(public_key)} bytes")
+                print(f"  Signature with image equals signature with constants_{N}.h: {status == 0 and np.array_equal(signature, expected)}")
+                print(f"  Verify with public key image: status {verify_status} (expected {simulate_verify(verify_program, N, expected, constants)})")
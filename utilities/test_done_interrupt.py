@@ -0,0 +1,160 @@
+# Test of the done interrupt protocol of slv_reg3 (axi_wrapper.sv) on mock_axi.FunctionalDevice and of its use in
+# host_driver.FalconDriver: done sets pending, the acknowledge (write 1) clears it and re-arms the interrupt for the next run.
+#
+# The sign program is replaced by an empty one, so a run only exercises the register protocol.
+#
+# Usage: python -m pytest test_done_interrupt.py   or   python test_done_interrupt.py
+
+from host_driver import FalconDriver
+from mock_axi import (
+    ALGORITHM_DONE_MASK,
+    INTERRUPT_EDGE,
+    INTERRUPT_ENABLE,
+    INTERRUPT_PENDING,
+    INTERRUPT_REG,
+    OUTPUT_REG,
+    SIGN,
+    FunctionalDevice,
+)
+
+N = 512
+CYCLES = 1234
+
+
+def make_device(busy_reads=0):
+    device = FunctionalDevice(N, busy_reads=busy_reads)
+    device.programs[SIGN] = ([], CYCLES)
+    return device
+
+
+def run(driver):
+    driver.reset_algorithm()
+    driver.start_algorithm(SIGN)
+
+
+def pending(device):
+    return bool(device.read32(INTERRUPT_REG) & INTERRUPT_PENDING)
+
+
+def test_level_ack_and_rearm():
+    device = make_device()
+    driver = FalconDriver(device, N)
+    driver.enable_done_interrupt()
+
+    for _ in range(3):
+        run(driver)
+        assert pending(device)
+        assert device.wait_for_interrupt()
+        assert device.wait_for_interrupt(), "level interrupt stays raised until acknowledged"
+
+        driver.acknowledge_done_interrupt()
+        assert not pending(device)
+        assert device.read32(INTERRUPT_REG) == INTERRUPT_ENABLE, "acknowledge keeps enable and mode"
+        assert device.read32(OUTPUT_REG) & ALGORITHM_DONE_MASK, "done stays set until reset"
+        assert not device.wait_for_interrupt(), "acknowledged interrupt is not raised again by the same run"
+
+
+def test_edge_one_pulse_per_run():
+    device = make_device()
+    driver = FalconDriver(device, N)
+    driver.enable_done_interrupt(edge=True)
+
+    run(driver)
+    assert device.wait_for_interrupt()
+    assert not device.wait_for_interrupt(), "edge interrupt is one pulse"
+    assert pending(device), "pending stays set until acknowledged"
+    driver.acknowledge_done_interrupt()
+    assert not pending(device)
+    assert device.read32(INTERRUPT_REG) == INTERRUPT_ENABLE | INTERRUPT_EDGE
+
+    run(driver)
+    assert device.wait_for_interrupt(), "re-armed for the next run"
+
+
+def test_writing_zero_keeps_pending():
+    device = make_device()
+    driver = FalconDriver(device, N)
+
+    run(driver)
+    assert pending(device), "done sets pending while the interrupt is disabled"
+    assert not device.wait_for_interrupt()
+
+    device.write32(INTERRUPT_REG, INTERRUPT_ENABLE)
+    assert pending(device)
+    assert device.wait_for_interrupt(), "enabling the level interrupt raises a pending one"
+
+
+def test_reset_clears_pending():
+    device = make_device()
+    driver = FalconDriver(device, N)
+    driver.enable_done_interrupt()
+
+    run(driver)
+    driver.reset_algorithm()
+    assert not pending(device)
+    assert not device.wait_for_interrupt()
+
+
+def test_start_ignored_until_reset():
+    device = make_device()
+    driver = FalconDriver(device, N)
+    driver.enable_done_interrupt()
+
+    run(driver)
+    driver.acknowledge_done_interrupt()
+    driver.start_algorithm(SIGN)
+    assert not pending(device), "done is sticky, start without reset doesn't run again"
+    assert not device.wait_for_interrupt()
+
+
+def test_driver_sleeps_instead_of_polling():
+    device = make_device(busy_reads=100)
+    driver = FalconDriver(device, N)
+
+    run(driver)
+    device.reset_counters()
+    assert driver.wait_until_done() == 101
+    assert device.register_reads == 101
+
+    driver.enable_done_interrupt()
+    for _ in range(2):
+        run(driver)
+        device.reset_counters()
+        assert driver.wait_until_done() == 0
+        assert device.register_reads == 1 and device.register_writes == 1, "only the acknowledge"
+        assert not pending(device)
+        assert driver.get_cycle_count() == CYCLES
+
+    driver.disable_done_interrupt()
+    run(driver)
+    assert driver.wait_until_done() == 101
+
+
+def test_run_finishes_when_observed():
+    device = make_device()
+    driver = FalconDriver(device, N)
+
+    run(driver)
+    assert device.running == SIGN and device.output == 0, "start only starts the run, host work after it overlaps"
+    assert device.read32(OUTPUT_REG) & ALGORITHM_DONE_MASK
+    assert device.running is None
+    assert driver.get_cycle_count() == CYCLES
+
+
+def test_timeout_without_run():
+    device = make_device()
+    driver = FalconDriver(device, N)
+    driver.enable_done_interrupt()
+    driver.reset_algorithm()
+    try:
+        driver.wait_until_done(timeout=0)
+    except TimeoutError:
+        return
+    raise AssertionError("wait_until_done returned without a done interrupt")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name} passed")